@@ -0,0 +1,238 @@
+"""
+Module contains the classes that are used to run many workflows, or one workflow with many parameter sets, in one
+process.
+"""
+import json
+import re
+import time
+from dataclasses import dataclass, field, asdict
+from logging import Logger
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from workflows_manager.exceptions import InvalidConfiguration
+from workflows_manager.utils.worker_pool import WorkerPool
+
+BATCH_STATUS_SUCCESS = 'success'
+BATCH_STATUS_FAILED = 'failed'
+BATCH_STATUS_INVALID = 'invalid'
+BATCH_STATUS_ERROR = 'error'
+STATUS_FILE_NAME_REGEX = re.compile(r'[^a-zA-Z0-9_.-]')
+
+
+@dataclass
+class BatchItem:
+    """
+    A class to represent the single run of the workflow from the batch file.
+
+    :ivar line: The number of the line in the batch file.
+    :vartype line: int
+    :ivar workflow_name: The name of the workflow to run.
+    :vartype workflow_name: str
+    :ivar parameters: The parameters of the run, they override the parameters provided from command line arguments.
+    :vartype parameters: Dict[str, Any]
+    :ivar status_file: The path to the status file of the run, if not provided, then it is created in the output
+        directory of the batch.
+    :vartype status_file: Optional[Path]
+    """
+    line: int
+    workflow_name: str
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    status_file: Optional[Path] = field(default=None)
+
+    @classmethod
+    def from_dict(cls, line: int, data: Any) -> 'BatchItem':
+        """
+        Create a new instance of the class from the dictionary.
+
+        :param line: The number of the line in the batch file.
+        :type line: int
+        :param data: Dictionary with the 'workflow_name', and optionally the 'parameters' and the 'status_file'.
+        :type data: Any
+        :raise InvalidConfiguration: If the item is not valid.
+        :return: New instance of the class.
+        :rtype: BatchItem
+        """
+        if not isinstance(data, dict):
+            raise InvalidConfiguration(f"Batch item in line {line} must be a JSON object")
+        workflow_name = data.get('workflow_name')
+        if not isinstance(workflow_name, str) or workflow_name == '':
+            raise InvalidConfiguration(f"Batch item in line {line} must contain the 'workflow_name'")
+        parameters = data.get('parameters') or {}
+        if not isinstance(parameters, dict):
+            raise InvalidConfiguration(f"Parameters of the batch item in line {line} must be a JSON object")
+        status_file = data.get('status_file')
+        return cls(line, workflow_name, parameters, Path(status_file) if status_file else None)
+
+
+def load_batch_items(batch_file: Union[str, Path]) -> List[BatchItem]:
+    """
+    Load the items from the batch file. Each non-empty line of the file is a JSON object with a single run.
+
+    :param batch_file: The path to the batch file.
+    :type batch_file: Union[str, Path]
+    :raise InvalidConfiguration: If any line of the file is not a valid batch item.
+    :return: The items in the order of the lines.
+    :rtype: List[BatchItem]
+    """
+    items = []
+    with Path(batch_file).open('r', encoding='utf-8') as file:
+        for line, content in enumerate(file, start=1):
+            if not content.strip():
+                continue
+            try:
+                data = json.loads(content)
+            except ValueError as exception:
+                raise InvalidConfiguration(f"Batch item in line {line} is not valid JSON: {exception}") from exception
+            items.append(BatchItem.from_dict(line, data))
+    return items
+
+
+@dataclass
+class BatchResult:
+    """
+    A class to represent the result of the single run from the batch.
+
+    :ivar line: The number of the line in the batch file.
+    :vartype line: int
+    :ivar workflow_name: The name of the workflow.
+    :vartype workflow_name: str
+    :ivar status: The status of the run ('success', 'failed', 'invalid', or 'error').
+    :vartype status: str
+    :ivar duration: The duration of the run in seconds.
+    :vartype duration: float
+    :ivar status_file: The path to the status file of the run.
+    :vartype status_file: Optional[str]
+    :ivar error: The error that stopped the run before the workflow started.
+    :vartype error: Optional[str]
+    """
+    line: int
+    workflow_name: str
+    status: str
+    duration: float
+    status_file: Optional[str] = field(default=None)
+    error: Optional[str] = field(default=None)
+
+
+class BatchRunner:
+    """
+    A class to run the items of the batch with the limited concurrency, and create the summary of the batch.
+
+    :param logger: The logger used to report the progress of the batch.
+    :type logger: Logger
+    :param items: The items of the batch.
+    :type items: List[BatchItem]
+    :param concurrency: The maximum number of items that run at the same time.
+    :type concurrency: int
+    :param output_directory: The directory for the status files of the items that do not specify the status file.
+    :type output_directory: Optional[Path]
+    :ivar logger: The logger used to report the progress of the batch.
+    :vartype logger: Logger
+    :ivar items: The items of the batch.
+    :vartype items: List[BatchItem]
+    :ivar concurrency: The maximum number of items that run at the same time.
+    :vartype concurrency: int
+    :ivar output_directory: The directory for the status files of the items that do not specify the status file.
+    :vartype output_directory: Optional[Path]
+    :ivar summary_file: The path to the file where the summary of the batch is stored.
+    :vartype summary_file: Optional[Path]
+    """
+    logger: Logger
+    items: List[BatchItem]
+    concurrency: int
+    output_directory: Optional[Path]
+    summary_file: Optional[Path]
+
+    def __init__(self, logger: Logger, items: List[BatchItem], concurrency: int = 1,
+                 output_directory: Optional[Path] = None):
+        self.logger = logger
+        self.items = items
+        self.concurrency = concurrency
+        self.output_directory = output_directory
+        self.summary_file = None
+
+    def get_status_file(self, item: BatchItem) -> Optional[Path]:
+        """
+        A method to get the path to the status file of the item.
+
+        :param item: The item of the batch.
+        :type item: BatchItem
+        :return: The path to the status file, or None if the status file shall not be created.
+        :rtype: Optional[Path]
+        """
+        if item.status_file:
+            return item.status_file
+        if self.output_directory is None:
+            return None
+        name = STATUS_FILE_NAME_REGEX.sub('_', item.workflow_name)
+        return self.output_directory.joinpath(f'{item.line}-{name}.json')
+
+    def __run_item(self, item: BatchItem, run_item: Callable[[BatchItem, Optional[Path]], str]) -> BatchResult:
+        """
+        A method to run the item and measure its duration.
+
+        :param item: The item of the batch.
+        :type item: BatchItem
+        :param run_item: The function that runs the item with the status file, and returns the status of the run.
+        :type run_item: Callable[[BatchItem, Optional[Path]], str]
+        :return: The result of the run.
+        :rtype: BatchResult
+        """
+        status_file = self.get_status_file(item)
+        self.logger.info(f"Running batch item from line {item.line}: {item.workflow_name}")
+        start_time = time.perf_counter()
+        error = None
+        try:
+            status = run_item(item, status_file)
+        except Exception as exception:
+            self.logger.error(f"Batch item from line {item.line} failed: {exception}")
+            status = BATCH_STATUS_ERROR
+            error = str(exception)
+        duration = time.perf_counter() - start_time
+        self.logger.info(f"Batch item from line {item.line} finished with status: {status}")
+        return BatchResult(item.line, item.workflow_name, status, duration, str(status_file) if status_file else None,
+                           error)
+
+    def __generate_summary_file(self, summary: Dict[str, Any]):
+        """
+        A method to generate the summary file.
+
+        :param summary: The summary of the batch.
+        :type summary: Dict[str, Any]
+        """
+        self.logger.info(f"Generating batch summary file: {self.summary_file}")
+        with self.summary_file.open('w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=4)
+
+    def run(self, run_item: Callable[[BatchItem, Optional[Path]], str]) -> Dict[str, Any]:
+        """
+        A method to run all items of the batch.
+
+        :param run_item: The function that runs the item with the status file, and returns the status of the run.
+        :type run_item: Callable[[BatchItem, Optional[Path]], str]
+        :return: The summary of the batch.
+        :rtype: Dict[str, Any]
+        """
+        if self.output_directory is not None:
+            self.output_directory.mkdir(parents=True, exist_ok=True)
+        results: List[Optional[BatchResult]] = [None] * len(self.items)
+
+        def run_task(index: int, item: BatchItem):
+            results[index] = self.__run_item(item, run_item)
+
+        start_time = time.perf_counter()
+        with WorkerPool(self.concurrency) as pool:
+            pool.run_all([lambda index=index, item=item: run_task(index, item)
+                          for index, item in enumerate(self.items)])
+        statuses = [result.status for result in results]
+        summary = {
+            'total': len(results),
+            'succeeded': statuses.count(BATCH_STATUS_SUCCESS),
+            'failed': len(results) - statuses.count(BATCH_STATUS_SUCCESS),
+            'duration': time.perf_counter() - start_time,
+            'items': [asdict(result) for result in results],
+        }
+        self.logger.info(f"Batch finished: {summary['succeeded']} of {summary['total']} items succeeded")
+        if self.summary_file:
+            self.__generate_summary_file(summary)
+        return summary
@@ -27,5 +27,5 @@ class ListWorkflows:
         A method that list all available workflows.
         """
         self.logger.info('Listing workflows')
-        for workflow in self.workflows_configuration.workflows:
-            print(workflow.name)
+        for workflow_name in self.workflows_configuration.workflows.names:
+            print(workflow_name)
@@ -2,16 +2,21 @@
 Module contains additional classes and functions that are used in actions.
 """
 import inspect
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Type, List, Union
+from typing import Any, ClassVar, Type, List, Optional, Tuple, Union
 
 from workflows_manager import workflow
+from workflows_manager.utils.name_index import NameIndex, VersionedList
+from workflows_manager.utils.type_checker import COERCIBLE_TYPES, TypeChecker, TypeCoercer, get_type_checker, \
+    get_type_coercer
 
 
-@dataclass
+@dataclass(frozen=True)
 class InstanceParameter:
     """
-    A class to represent the parameter of the step instance with its default value and type.
+    A class to represent the parameter of the step instance with its default value and type. The parameter is immutable,
+    so it is shared by all lookups of the parameters of the same step class.
 
     :ivar name: The name of the parameter.
     :vartype name: str
@@ -19,10 +24,44 @@ class InstanceParameter:
     :vartype value: Any
     :ivar type: The type of the parameter.
     :vartype type: Type
+    :ivar checker: The checker of the values against the type of the parameter, it is compiled once.
+    :vartype checker: TypeChecker
+    :ivar coercer: The coercer of the string values to the type of the parameter, it is compiled once.
+    :vartype coercer: TypeCoercer
     """
     name: str
     value: Any
     type: Type
+    checker: TypeChecker = field(init=False, repr=False, compare=False)
+    coercer: TypeCoercer = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'checker', get_type_checker(self.type))
+        object.__setattr__(self, 'coercer', get_type_coercer(self.type))
+
+    def match(self, value: Any, coerce: bool = False) -> Tuple[bool, Any]:
+        """
+        A method to check if the value matches the type of the parameter.
+
+        :param value: The value of the parameter.
+        :type value: Any
+        :param coerce: Flag that indicates whether the string value, or the list or dictionary of the string values,
+            shall be coerced to the type of the parameter, if it does not match it, e.g. the value is provided from
+            the command line.
+        :type coerce: bool
+        :return: Flag that indicates whether the value matches the type, and the value, coerced if required.
+        :rtype: Tuple[bool, Any]
+        """
+        if self.checker(value):
+            return True, value
+        if coerce and isinstance(value, COERCIBLE_TYPES):
+            try:
+                coerced_value = self.coercer(value)
+            except ValueError:
+                return False, value
+            if self.checker(coerced_value):
+                return True, coerced_value
+        return False, value
 
 
 @dataclass
@@ -32,36 +71,48 @@ class InstanceParameters:
 
     :ivar parameters: The parameters of the step instance.
     :vartype parameters: List[InstanceParameter]
+    :ivar __index: The index of the parameters by their names, it is rebuilt when the parameters have been changed.
+    :vartype __index: NameIndex
+    :cvar __step_classes: The 'perform' methods of the step classes, whose signatures have been already inspected, and
+        their parameters. The entries are removed with the step classes.
+    :vartype __step_classes: weakref.WeakKeyDictionary
     """
     parameters: List[InstanceParameter] = field(default_factory=list)
+    __index: NameIndex = field(default_factory=NameIndex, init=False, repr=False, compare=False)
+    __step_classes: ClassVar[weakref.WeakKeyDictionary] = weakref.WeakKeyDictionary()
+
+    def __setattr__(self, name: str, value: Any):
+        if name == 'parameters' and not isinstance(value, VersionedList):
+            value = VersionedList(value)
+        super().__setattr__(name, value)
 
     @classmethod
     def from_step(cls, step: workflow.Step) -> 'InstanceParameters':
         """
-        A method to create an instance of the class from the step instance.
+        A method to create an instance of the class from the step instance. The signature of the 'perform' method is
+        inspected once per step class, and again only when the method of the class has been replaced. The parameters are
+        immutable, so they are shared, and only the list of them is created for each call.
 
         :param step: The step instance.
         :type step: workflow.Step
         :return: The instance of the class created from the step instance.
         :rtype: InstanceParameters
         """
-        parameters = inspect.signature(step.perform).parameters
-        instance_parameters = cls()
-        for name, parameter in parameters.items():
-            instance_parameter = InstanceParameter(name, parameter.default, parameter.annotation)
-            instance_parameters.parameters.append(instance_parameter)
-        return instance_parameters
+        perform = type(step).perform
+        cached_perform, step_parameters = cls.__step_classes.get(type(step), (None, ()))
+        if cached_perform is not perform:
+            step_parameters = tuple(InstanceParameter(name, parameter.default, parameter.annotation)
+                                    for name, parameter in inspect.signature(step.perform).parameters.items())
+            cls.__step_classes[type(step)] = (perform, step_parameters)
+        return cls(list(step_parameters))
 
     def __iter__(self):
         return iter(self.parameters)
 
-    def __getitem__(self, item: Union[int, str]):
+    def __getitem__(self, item: Union[int, str]) -> Optional[InstanceParameter]:
         if isinstance(item, int):
             return self.parameters[item]
-        for parameter in self.parameters:
-            if parameter.name == item:
-                return parameter
-        return None
+        return self.__index.get(self.parameters, item)
 
     def __delitem__(self, key):
         for index, parameter in enumerate(self.parameters):
@@ -0,0 +1,255 @@
+"""
+Module contains the execution plan that is compiled from the configuration once and used by many runs of the workflow.
+"""
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from workflows_manager import configuration
+from workflows_manager.configuration import Parameters, StepType, StepUnion, Steps
+from workflows_manager.exceptions import InvalidConfiguration
+from workflows_manager.workflow import StepInformation, StepPath, StepStatus, StepsInformation
+
+Dependencies = Tuple[Tuple[int, ...], ...]
+
+
+def is_template(value: Any) -> bool:
+    """
+    Check whether the value shall be resolved with the parameters before it is used.
+
+    :param value: The value from the configuration.
+    :type value: Any
+    :return: True, if the value is a string with the placeholders or the escaped braces, otherwise False.
+    :rtype: bool
+    """
+    return isinstance(value, str) and ('{' in value or '}' in value)
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """
+    A class to represent the step of the execution plan. It is never modified, the values resolved during the run are
+    kept in the step information of the run.
+
+    :ivar step: The configuration of the step, it is only read.
+    :vartype step: StepUnion
+    :ivar path: The path to the step with the names from the configuration.
+    :vartype path: StepPath
+    :ivar is_static_path: True, if neither the name of the step nor the names of its parents are templates, so the
+        path can be used by all runs, otherwise False.
+    :vartype is_static_path: bool
+    :ivar is_name_template: True, if the name of the step is resolved with the parameters, otherwise False.
+    :vartype is_name_template: bool
+    :ivar target: The ID of the normal step, or the name of the workflow of the workflow step.
+    :vartype target: Optional[str]
+    :ivar is_target_template: True, if the target is resolved with the parameters, otherwise False.
+    :vartype is_target_template: bool
+    :ivar children: The parallel steps, or the steps of the workflow of the workflow step (empty, when the workflow is
+        resolved during the run).
+    :vartype children: Tuple[PlanStep, ...]
+    :ivar dependencies: The indexes of the children each child depends on, or None if the children do not declare their
+        dependencies.
+    :vartype dependencies: Optional[Dependencies]
+    :ivar workflow_names: The names of the workflows that contain the step, used to detect the recursion when the
+        workflow of the workflow step is resolved during the run.
+    :vartype workflow_names: Tuple[str, ...]
+    """
+    step: StepUnion
+    path: StepPath
+    is_static_path: bool
+    is_name_template: bool
+    target: Optional[str] = field(default=None)
+    is_target_template: bool = field(default=False)
+    children: Tuple['PlanStep', ...] = field(default=())
+    dependencies: Optional[Dependencies] = field(default=None)
+    workflow_names: Tuple[str, ...] = field(default=())
+
+    @property
+    def type(self) -> StepType:
+        """
+        A property to get the type of the step.
+        """
+        return self.step.type
+
+
+class ExecutionPlan:
+    """
+    A class to represent the workflow compiled from the configuration. The plan is read-only, so the same plan can be
+    used by many runs, including the concurrent ones, and the configuration is never modified by the runs.
+
+    :param workflows_configuration: The configuration of the workflows.
+    :type workflows_configuration: configuration.Configuration
+    :param workflow_name: The name of the workflow to compile.
+    :type workflow_name: str
+    :raise InvalidConfiguration: If the workflow, or any of the workflows it uses, does not exist, or the workflows
+        reference each other.
+    :ivar workflow_name: The name of the compiled workflow.
+    :vartype workflow_name: str
+    :ivar parameters: The global parameters from the configuration.
+    :vartype parameters: Parameters
+    :ivar workflow_parameters: The parameters of the compiled workflow.
+    :vartype workflow_parameters: Parameters
+    :ivar steps: The steps of the workflow.
+    :vartype steps: Tuple[PlanStep, ...]
+    :ivar dependencies: The indexes of the steps each step depends on, or None if the steps do not declare their
+        dependencies.
+    :vartype dependencies: Optional[Dependencies]
+    """
+    workflow_name: str
+    parameters: Parameters
+    workflow_parameters: Parameters
+    steps: Tuple[PlanStep, ...]
+    dependencies: Optional[Dependencies]
+    __workflows_configuration: configuration.Configuration
+
+    def __init__(self, workflows_configuration: configuration.Configuration, workflow_name: str):
+        self.__workflows_configuration = workflows_configuration
+        workflow_configuration = self.__get_workflow(workflow_name)
+        self.workflow_name = workflow_name
+        self.parameters = workflows_configuration.parameters
+        self.workflow_parameters = workflow_configuration.parameters
+        self.steps, self.dependencies = self.__compile_steps(workflow_configuration.steps, True, None, True,
+                                                             (workflow_name,))
+
+    def __get_workflow(self, workflow_name: str) -> configuration.Workflow:
+        """
+        A method to get the workflow from the configuration.
+
+        :param workflow_name: The name of the workflow.
+        :type workflow_name: str
+        :raise InvalidConfiguration: If the workflow does not exist.
+        :return: The workflow configuration.
+        :rtype: configuration.Workflow
+        """
+        workflow_configuration = self.__workflows_configuration.workflows[workflow_name]
+        if workflow_configuration is None:
+            raise InvalidConfiguration(f"Workflow '{workflow_name}' is not defined in the configuration file")
+        return workflow_configuration
+
+    def __compile_step(self, step: StepUnion, parent_path: Optional[StepPath], is_parent_static: bool,
+                       workflow_names: Tuple[str, ...]) -> PlanStep:
+        """
+        A method to compile the step and its children.
+
+        :param step: The configuration of the step.
+        :type step: StepUnion
+        :param parent_path: The path to the parent step.
+        :type parent_path: Optional[StepPath]
+        :param is_parent_static: True, if the path to the parent step is used by all runs, otherwise False.
+        :type is_parent_static: bool
+        :param workflow_names: The names of the workflows that contain the step, used to detect the recursion.
+        :type workflow_names: Tuple[str, ...]
+        :return: The compiled step.
+        :rtype: PlanStep
+        """
+        is_name_template = is_template(step.name)
+        path = StepPath(parent_path, step.type, step.name)
+        is_static_path = is_parent_static and not is_name_template
+        target = None
+        children = ()
+        dependencies = None
+        if step.type == StepType.NORMAL:
+            target = step.id
+        elif step.type == StepType.PARALLEL:
+            children, dependencies = self.__compile_steps(step.parallels, False, path, is_static_path, workflow_names)
+        elif step.type == StepType.WORKFLOW:
+            target = step.workflow
+            if not is_template(target):
+                children, dependencies = self.compile_workflow(target, path, is_static_path, workflow_names)
+        return PlanStep(step, path, is_static_path, is_name_template, target, is_template(target), children,
+                        dependencies, workflow_names)
+
+    def __compile_steps(self, steps: Steps, sequential: bool, parent_path: Optional[StepPath],
+                        is_parent_static: bool, workflow_names: Tuple[str, ...]
+                        ) -> Tuple[Tuple[PlanStep, ...], Optional[Dependencies]]:
+        """
+        A method to compile the list of steps.
+
+        :param steps: The configuration of the steps.
+        :type steps: Steps
+        :param sequential: True, if the steps are the steps of the workflow, False for the steps of the parallel step.
+        :type sequential: bool
+        :param parent_path: The path to the parent step.
+        :type parent_path: Optional[StepPath]
+        :param is_parent_static: True, if the path to the parent step is used by all runs, otherwise False.
+        :type is_parent_static: bool
+        :param workflow_names: The names of the workflows that contain the steps, used to detect the recursion.
+        :type workflow_names: Tuple[str, ...]
+        :return: The compiled steps and their dependencies.
+        :rtype: Tuple[Tuple[PlanStep, ...], Optional[Dependencies]]
+        """
+        compiled_steps = tuple(self.__compile_step(step, parent_path, is_parent_static, workflow_names)
+                               for step in steps)
+        dependencies = None
+        if steps.has_dependencies:
+            dependencies = tuple(tuple(step_dependencies) for step_dependencies in steps.get_dependencies(sequential))
+        return compiled_steps, dependencies
+
+    def compile_workflow(self, workflow_name: str, parent_path: StepPath, is_parent_static: bool = False,
+                         workflow_names: Tuple[str, ...] = ()) -> Tuple[Tuple[PlanStep, ...], Optional[Dependencies]]:
+        """
+        A method to compile the steps of the workflow used by the workflow step. It is used during the run, when the
+        name of the workflow is resolved from the parameters.
+
+        :param workflow_name: The name of the workflow.
+        :type workflow_name: str
+        :param parent_path: The path to the workflow step.
+        :type parent_path: StepPath
+        :param is_parent_static: True, if the path to the workflow step is used by all runs, otherwise False.
+        :type is_parent_static: bool
+        :param workflow_names: The names of the workflows that contain the workflow step.
+        :type workflow_names: Tuple[str, ...]
+        :raise InvalidConfiguration: If the workflow does not exist, or it is already used by the parent workflows.
+        :return: The compiled steps of the workflow and their dependencies.
+        :rtype: Tuple[Tuple[PlanStep, ...], Optional[Dependencies]]
+        """
+        if workflow_name in workflow_names:
+            raise InvalidConfiguration(f"Workflow '{workflow_name}' cannot use itself: "
+                                       f"{' -> '.join(workflow_names + (workflow_name,))}")
+        workflow_configuration = self.__get_workflow(workflow_name)
+        return self.__compile_steps(workflow_configuration.steps, True, parent_path, is_parent_static,
+                                    workflow_names + (workflow_name,))
+
+    @staticmethod
+    def create_children_information(statuses: StepsInformation, plan_steps: Tuple[PlanStep, ...],
+                                    parent: Optional[StepInformation] = None) -> List[StepInformation]:
+        """
+        A method to create the information of the steps for the run. The paths of the plan are reused when they are
+        static, otherwise each run gets its own paths, as they are renamed during the run.
+
+        :param statuses: The statuses of the steps of the run.
+        :type statuses: StepsInformation
+        :param plan_steps: The steps of the plan.
+        :type plan_steps: Tuple[PlanStep, ...]
+        :param parent: The information of the parent step.
+        :type parent: Optional[StepInformation]
+        :return: The information of the steps, in the same order as the steps of the plan.
+        :rtype: List[StepInformation]
+        """
+        steps_information = []
+        previous_step = None
+        for plan_step in plan_steps:
+            if plan_step.is_static_path:
+                step_path = plan_step.path
+            else:
+                step_path = StepPath(parent.path if parent else None, plan_step.type, plan_step.step.name)
+            step_information = StepInformation(step_path, StepStatus.NOT_STARTED, previous_step=previous_step,
+                                               parent=parent)
+            statuses.steps[step_path] = step_information
+            if plan_step.children:
+                step_information.children = ExecutionPlan.create_children_information(statuses, plan_step.children,
+                                                                                       step_information)
+            if previous_step:
+                previous_step.next_step = step_information
+            steps_information.append(step_information)
+            previous_step = step_information
+        return steps_information
+
+    def create_steps_information(self) -> Tuple[StepsInformation, List[StepInformation]]:
+        """
+        A method to create the information of all steps for the new run.
+
+        :return: The statuses of the steps of the run, and the information of the steps of the workflow.
+        :rtype: Tuple[StepsInformation, List[StepInformation]]
+        """
+        statuses = StepsInformation()
+        return statuses, self.create_children_information(statuses, self.steps)
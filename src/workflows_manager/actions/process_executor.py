@@ -0,0 +1,260 @@
+"""
+Module contains the executor that runs the normal steps in the pool of worker processes.
+"""
+import asyncio
+import contextlib
+import inspect
+import io
+import multiprocessing
+import pickle
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from workflows_manager import workflow
+from workflows_manager.utils.output_capture import FileDescriptorCapture
+from workflows_manager.workflow import StepInformation, StepPath, StepsInformation, StepStatus, WorkflowContext
+
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+@dataclass
+class ProcessStepResult:
+    """
+    A class to represent the result of the step executed in the worker process.
+
+    :ivar status: The status of the step.
+    :vartype status: StepStatus
+    :ivar return_value: The return value of the step.
+    :vartype return_value: Optional[Any]
+    :ivar stdout: The captured standard output of the step.
+    :vartype stdout: Optional[str]
+    :ivar stderr: The captured standard error of the step.
+    :vartype stderr: Optional[str]
+    :ivar error: The error (exception) raised by the step.
+    :vartype error: Optional[Exception]
+    :ivar context_updates: The values set or changed in place in the workflow context by the step.
+    :vartype context_updates: Dict[str, Any]
+    :ivar context_removals: The keys removed from the workflow context by the step.
+    :vartype context_removals: List[str]
+    """
+    status: StepStatus
+    return_value: Optional[Any] = field(default=None)
+    stdout: Optional[str] = field(default=None)
+    stderr: Optional[str] = field(default=None)
+    error: Optional[Exception] = field(default=None)
+    context_updates: Dict[str, Any] = field(default_factory=dict)
+    context_removals: List[str] = field(default_factory=list)
+
+
+def initialize_worker(paths: List[str], modules: List[str]):
+    """
+    Initialize the worker process. It imports the modules with the registered steps, as the worker process does not
+    inherit the memory of the parent process (the 'forkserver' or 'spawn' start method is used).
+
+    :param paths: The paths that shall be present in sys.path.
+    :type paths: List[str]
+    :param modules: The modules that register the steps.
+    :type modules: List[str]
+    """
+    for path in paths:
+        if path not in sys.path:
+            sys.path.append(path)
+    for module in modules:
+        __import__(module)
+
+
+def __get_picklable_error(error: Optional[Exception]) -> Optional[Exception]:
+    """
+    Get the error that can be sent back to the parent process.
+
+    :param error: The error raised by the step.
+    :type error: Optional[Exception]
+    :return: The original error, if it can be pickled, otherwise generic exception with the same message.
+    :rtype: Optional[Exception]
+    """
+    if error is None:
+        return None
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return Exception(str(error))
+
+
+def __get_snapshot(value: Any) -> Optional[bytes]:
+    """
+    Get the snapshot of the value stored in the workflow context, used to detect the changes made in place.
+
+    :param value: The value stored in the workflow context.
+    :type value: Any
+    :return: The pickled value, or None if it cannot be pickled.
+    :rtype: Optional[bytes]
+    """
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
+def perform_step(step_id: str, step_path: StepPath, parameters: Dict[str, Any], context_parameters: Dict[str, Any],
+                 capture_stdout: bool, capture_stderr: bool,
+                 capture_file_descriptors: bool = False) -> ProcessStepResult:
+    """
+    Perform the registered step in the worker process.
+
+    :param step_id: The ID of the registered step.
+    :type step_id: str
+    :param step_path: The path to the step.
+    :type step_path: StepPath
+    :param parameters: The resolved parameters of the step.
+    :type parameters: Dict[str, Any]
+    :param context_parameters: The values stored in the workflow context.
+    :type context_parameters: Dict[str, Any]
+    :param capture_stdout: Flag that indicates whether the stdout should be captured.
+    :type capture_stdout: bool
+    :param capture_stderr: Flag that indicates whether the stderr should be captured.
+    :type capture_stderr: bool
+    :param capture_file_descriptors: Flag that indicates whether the output is captured from the file descriptors, so
+        it includes the output of the subprocesses and the native libraries.
+    :type capture_file_descriptors: bool
+    :return: The result of the step, the values of the workflow context are compared with their snapshots taken before
+        the step, so the values changed in place are sent back as well.
+    :rtype: ProcessStepResult
+    """
+    snapshots = {key: __get_snapshot(value) for key, value in context_parameters.items()}
+    step_information = StepInformation(step_path, StepStatus.RUNNING, parameters=parameters)
+    steps_information = StepsInformation()
+    steps_information.steps[step_path] = step_information
+    workflow_context = WorkflowContext(dict(context_parameters), steps_information)
+    step_instance = workflow.steps.get_instance(step_id)
+    step_instance.workflow_context = workflow_context
+    step_instance.path = step_path
+    step_instance.configure_logger()
+    if capture_file_descriptors:
+        file_descriptor_capture = FileDescriptorCapture(capture_stdout, capture_stderr)
+        captured_stdout, captured_stderr = file_descriptor_capture.stdout, file_descriptor_capture.stderr
+        redirect_stdout = redirect_stderr = False
+    else:
+        file_descriptor_capture = None
+        captured_stdout, captured_stderr = io.StringIO(), io.StringIO()
+        redirect_stdout, redirect_stderr = capture_stdout, capture_stderr
+    with (file_descriptor_capture or contextlib.nullcontext(),
+          contextlib.redirect_stdout(captured_stdout) if redirect_stdout else contextlib.nullcontext(),
+          contextlib.redirect_stderr(captured_stderr) if redirect_stderr else contextlib.nullcontext()):
+        try:
+            if inspect.iscoroutinefunction(step_instance.perform):
+                asyncio.run(step_instance.perform(**parameters))
+            else:
+                step_instance.perform(**parameters)
+        except Exception as exception:
+            step_information.status = StepStatus.FAILED
+            step_information.error = exception
+    stdout = captured_stdout.getvalue() if capture_stdout else None
+    stderr = captured_stderr.getvalue() if capture_stderr else None
+    if file_descriptor_capture is not None:
+        file_descriptor_capture.close()
+    context_updates = {}
+    final_parameters = workflow_context.parameters
+    for key, value in final_parameters.items():
+        snapshot = snapshots.get(key)
+        if snapshot is None or snapshot != __get_snapshot(value):
+            context_updates[key] = value
+    context_removals = [key for key in context_parameters if key not in final_parameters]
+    return ProcessStepResult(
+        status=step_information.status,
+        return_value=step_information.return_value,
+        stdout=stdout,
+        stderr=stderr,
+        error=__get_picklable_error(step_information.error),
+        context_updates=context_updates,
+        context_removals=context_removals,
+    )
+
+
+class ProcessStepExecutor:
+    """
+    A class to run the normal steps in the warm pool of worker processes. The pool is created on the first use and
+    reused by all steps until it is shut down. The worker processes are not forked from the parent process, which runs
+    many threads, they are started with the 'forkserver' start method, or the 'spawn' start method, where the
+    'forkserver' one is not available.
+
+    :param max_workers: The maximum number of worker processes, if not provided, then the number of CPUs is used.
+    :type max_workers: Optional[int]
+    :ivar max_workers: The maximum number of worker processes.
+    :vartype max_workers: Optional[int]
+    """
+    max_workers: Optional[int]
+    __executor: Optional[ProcessPoolExecutor]
+    __lock: threading.Lock
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        """
+        A method to get the pool of worker processes, it is created on the first use.
+
+        :return: The pool of worker processes.
+        :rtype: ProcessPoolExecutor
+        """
+        with self.__lock:
+            if self.__executor is None:
+                modules = sorted({type(step).__module__ for step in workflow.steps.steps_register.values()} -
+                                 {'__main__'})
+                self.__executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                      mp_context=multiprocessing.get_context(START_METHOD),
+                                                      initializer=initialize_worker,
+                                                      initargs=(list(sys.path), modules))
+            return self.__executor
+
+    def run(self, step_id: str, step_status: StepInformation, workflow_context: WorkflowContext,
+            capture_stdout: bool = False, capture_stderr: bool = False, capture_file_descriptors: bool = False):
+        """
+        A method to run the step in the worker process and update the step information with the result.
+
+        :param step_id: The ID of the registered step.
+        :type step_id: str
+        :param step_status: The information about the step, step parameters shall be already resolved.
+        :type step_status: StepInformation
+        :param workflow_context: The context of the workflow, it is updated with the values set, changed in place, or
+            removed by the step.
+        :type workflow_context: WorkflowContext
+        :param capture_stdout: Flag that indicates whether the stdout should be captured.
+        :type capture_stdout: bool
+        :param capture_stderr: Flag that indicates whether the stderr should be captured.
+        :type capture_stderr: bool
+        :param capture_file_descriptors: Flag that indicates whether the output is captured from the file descriptors.
+        :type capture_file_descriptors: bool
+        :raise Exception: If the step fails, it raises the exception of the step.
+        """
+        future = self.__get_executor().submit(perform_step, step_id, step_status.path, step_status.parameters,
+                                              workflow_context.parameters, capture_stdout, capture_stderr,
+                                              capture_file_descriptors)
+        result: ProcessStepResult = future.result()
+        for key, value in result.context_updates.items():
+            workflow_context.set(key, value)
+        for key in result.context_removals:
+            workflow_context.remove(key)
+        step_status.status = result.status
+        step_status.return_value = result.return_value
+        if capture_stdout:
+            step_status.stdout = result.stdout
+        if capture_stderr:
+            step_status.stderr = result.stderr
+        if result.error is not None:
+            step_status.error = result.error
+            raise result.error
+
+    def shutdown(self):
+        """
+        A method to stop the worker processes.
+        """
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
@@ -1,47 +1,32 @@
 """
 Module contains the runner class that is used to run the workflow.
 """
-import contextlib
+import asyncio
+import functools
 import inspect
-import io
-import json
-import sys
+import re
 from logging import Logger
 from pathlib import Path
-from threading import Thread
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from workflows_manager import configuration
 from workflows_manager import workflow
 from workflows_manager.actions.misc import InstanceParameters
-from workflows_manager.configuration import Workflow, Parameters, StepType, StepUnion
-from workflows_manager.exceptions import MissingParameter
+from workflows_manager.actions.plan import Dependencies, ExecutionPlan, PlanStep
+from workflows_manager.actions.process_executor import ProcessStepExecutor
+from workflows_manager.configuration import Parameters, StepType, StepUnion, ExecutorType, CaptureMode
+from workflows_manager.exceptions import InvalidParameter, MissingParameter
+from workflows_manager.utils.event_loop import EventLoopThread
+from workflows_manager.utils.fingerprint import FingerprintDatabase
+from workflows_manager.utils.output_capture import OutputCapture, STDOUT, STDERR
 from workflows_manager.utils.reference_resolver import ReferenceResolver
-from workflows_manager.workflow import StepsInformation, StepStatus, StepInformation, StepPath, WorkflowContext
+from workflows_manager.utils.step_cache import RecordingWorkflowContext, StepCache, StepCacheEntry, \
+    get_code_fingerprint
+from workflows_manager.utils.status_journal import StatusJournal, get_journal_path, load_status, write_status_file
+from workflows_manager.utils.worker_pool import WorkerPool
+from workflows_manager.workflow import StepStatus, StepInformation, WorkflowContext
 
-
-class ExceptionThread(Thread):
-    """
-    A class to run a thread that can catch exceptions.
-
-    :ivar exception: The exception caught by the thread.
-    :vartype exception: Optional[Exception]
-    """
-    exception: Optional[Exception]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.exception = None
-
-    def run(self):
-        """
-        A method to run the thread and catch exceptions.
-        """
-        try:
-            if self._target:
-                self._target(*self._args, **self._kwargs)
-        except Exception as exception:
-            self.exception = exception
+ARCHIVE_FILE_NAME_REGEX = re.compile(r'[^a-zA-Z0-9_.-]')
 
 
 class Runner:
@@ -58,15 +43,55 @@ class Runner:
     :vartype statuses_file: Optional[Path]
     :ivar parameters: The parameters provided to the workflow from command line arguments.
     :vartype parameters: Dict[str, Any]
+    :ivar max_workers: The maximum number of threads used to run the parallel steps.
+    :vartype max_workers: Optional[int]
+    :ivar default_executor: The executor used to run the normal steps that do not specify it.
+    :vartype default_executor: ExecutorType
+    :ivar execution_plan: The workflow compiled from the configuration, if not provided, then it is compiled on run.
+        The same plan can be used by many runners, including the concurrent ones.
+    :vartype execution_plan: Optional[ExecutionPlan]
+    :ivar resume_file: The path to the status file of the previous run, if provided, then the steps that have
+        succeeded in the previous run are not run again.
+    :vartype resume_file: Optional[Path]
+    :ivar step_cache: The cache of the results of the steps with the enabled cache.
+    :vartype step_cache: StepCache
+    :ivar fingerprint_database: The fingerprints of the input and output files of the steps.
+    :vartype fingerprint_database: FingerprintDatabase
+    :ivar process_executor: The pool of processes shared by many runs, if not provided, then the runner creates its own
+        pool and shuts it down when the run finishes.
+    :vartype process_executor: Optional[ProcessStepExecutor]
     :ivar __workflow_context: The context of the workflow.
     :vartype __workflow_context: WorkflowContext
+    :ivar __worker_pool: The pool of threads shared by all parallel steps in the workflow.
+    :vartype __worker_pool: WorkerPool
+    :ivar __process_executor: The pool of processes shared by all normal steps that run in the separate process.
+    :vartype __process_executor: ProcessStepExecutor
+    :ivar __event_loop: The event loop shared by all asynchronous steps in the workflow.
+    :vartype __event_loop: EventLoopThread
+    :ivar __status_journal: The journal of the run, or None if the status file is not generated.
+    :vartype __status_journal: Optional[StatusJournal]
+    :ivar __previous_children: The statuses of the children from the previous run, of the workflow steps whose
+        children are created during the run.
+    :vartype __previous_children: Dict[int, List[Dict[str, Any]]]
     """
     logger: Logger
     workflows_configuration: configuration.Configuration
     workflow_name: str
     status_file: Optional[Path]
     parameters: Dict[str, Any]
+    max_workers: Optional[int]
+    default_executor: ExecutorType
+    execution_plan: Optional[ExecutionPlan]
+    resume_file: Optional[Path]
+    step_cache: StepCache
+    fingerprint_database: FingerprintDatabase
+    process_executor: Optional[ProcessStepExecutor]
     __workflow_context: WorkflowContext
+    __worker_pool: WorkerPool
+    __process_executor: ProcessStepExecutor
+    __event_loop: EventLoopThread
+    __status_journal: Optional[StatusJournal]
+    __previous_children: Dict[int, List[Dict[str, Any]]]
 
     def __init__(self, logger: Logger, workflows_configuration: configuration.Configuration, workflow_name: str,
                  parameters: Dict[str, Any]):
@@ -75,74 +100,36 @@ class Runner:
         self.workflow_name = workflow_name
         self.status_file = None
         self.parameters = parameters
-
-    def __initialize_step_information(self, statuses: StepsInformation, step: StepUnion,
-                                      previous_step: Optional[StepInformation] = None,
-                                      parent: Optional[StepInformation] = None) -> StepInformation:
-        """
-        A method to initialize a step's information.
-
-        :param statuses: The statuses of the steps.
-        :type statuses: StepsInformation
-        :param step: The step configuration.
-        :type step: StepUnion
-        :param previous_step: The previous step in the workflow.
-        :type previous_step: Optional[StepInformation]
-        :param parent: The parent step in the workflow.
-        :type parent: Optional[StepInformation]
-        :return: The status of the step.
-        :rtype: StepInformation
-        """
-        parent_step_path = parent.path if parent else None
-        step_path = StepPath(parent_step_path, step.type, step.name)
-        step_status = StepInformation(step_path, StepStatus.NOT_STARTED, previous_step=previous_step, parent=parent)
-        statuses.steps[step_path] = step_status
-        if step.type == StepType.WORKFLOW:
-            self.__initialize_steps_information(statuses, self.workflows_configuration.workflows[step.workflow].steps,
-                                                None, step_status)
-        elif step.type == StepType.PARALLEL:
-            self.__initialize_steps_information(statuses, step.parallels.elements, None, step_status)
-        if previous_step:
-            previous_step.next_step = step_status
-        if parent:
-            if parent.children is None:
-                parent.children = []
-            parent.children.append(step_status)
-        return step_status
-
-    def __initialize_steps_information(self, statuses: StepsInformation, steps: List[StepUnion],
-                                       previous_step: Optional[StepInformation] = None,
-                                       parent: Optional[StepInformation] = None):
-        """
-        A method to initialize the information of the steps in the workflow.
-
-        :param statuses: The statuses of the steps.
-        :type statuses: StepsInformation
-        :param steps: The steps' configuration.
-        :type steps: List[StepUnion]
-        :param previous_step: The previous step in the workflow.
-        :type previous_step: Optional[StepInformation]
-        :param parent: The parent step in the workflow.
-        :type parent: Optional[StepInformation]
-        """
-        for step in steps:
-            previous_step = self.__initialize_step_information(statuses, step, previous_step, parent)
-
-    def __initialize_workflow_context(self):
+        self.max_workers = None
+        self.default_executor = ExecutorType.THREAD
+        self.execution_plan = None
+        self.resume_file = None
+        self.step_cache = StepCache()
+        self.fingerprint_database = FingerprintDatabase()
+        self.process_executor = None
+        self.__status_journal = None
+        self.__previous_children = {}
+
+    def __initialize_workflow_context(self) -> List[StepInformation]:
         """
         A method to initialize the workflow context.
+
+        :return: The information of the steps of the workflow.
+        :rtype: List[StepInformation]
         """
         self.logger.info("Initializing workflow context")
         self.logger.info("Initializing steps statuses")
-        statuses = StepsInformation()
-        self.__initialize_steps_information(statuses, self.workflows_configuration.workflows[self.workflow_name].steps)
+        statuses, steps_information = self.execution_plan.create_steps_information()
         self.logger.info("Steps statuses initialized")
         self.__workflow_context = WorkflowContext(steps_information=statuses)
         self.logger.info("Workflow context initialized")
+        return steps_information
 
     def __get_step_parameters(self, step: workflow.Step, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
-        A method to get the parameters required by the step instance.
+        A method to get the parameters required by the step instance. The values that do not match the types of the
+        parameters are skipped, except the string values provided to the runner (e.g. from the command line), which are
+        coerced to the types of the parameters.
 
         :param step: The step instance.
         :type step: workflow.Step
@@ -155,15 +142,16 @@ class Runner:
         selected_parameters = {}
         missing_parameters = []
         for instance_parameter in instance_parameters:
-            has_type = instance_parameter.type != inspect.Parameter.empty
-            if instance_parameter.name in self.parameters.keys() and (not has_type or isinstance(
-                    self.parameters[instance_parameter.name], instance_parameter.type)):
-                selected_parameters[instance_parameter.name] = self.parameters[instance_parameter.name]
-                continue
-            if instance_parameter.name in parameters.keys() and (not has_type or isinstance(
-                    parameters[instance_parameter.name], instance_parameter.type)):
-                selected_parameters[instance_parameter.name] = parameters[instance_parameter.name]
-                continue
+            if instance_parameter.name in self.parameters.keys():
+                is_matching, value = instance_parameter.match(self.parameters[instance_parameter.name], coerce=True)
+                if is_matching:
+                    selected_parameters[instance_parameter.name] = value
+                    continue
+            if instance_parameter.name in parameters.keys():
+                is_matching, value = instance_parameter.match(parameters[instance_parameter.name])
+                if is_matching:
+                    selected_parameters[instance_parameter.name] = value
+                    continue
             if instance_parameter.value != inspect.Parameter.empty:
                 selected_parameters[instance_parameter.name] = instance_parameter.value
                 continue
@@ -197,187 +185,764 @@ class Runner:
                 evaluated_parameters[parameter.name] = parameter.value
         return evaluated_parameters
 
-    def __run_normal_step(self, step: configuration.NormalStep, step_status: StepInformation,
-                          parameters: Dict[str, Any]):
+    def __prepare_normal_step(self, step_id: str, step_status: StepInformation,
+                              parameters: Dict[str, Any]) -> workflow.Step:
         """
-        A method to run a normal step.
+        A method to create the step instance for the execution and resolve its parameters.
 
-        :param step: The step configuration.
-        :type step: configuration.NormalStep
+        :param step_id: The ID of the registered step.
+        :type step_id: str
         :param step_status: The status of the step.
         :type step_status: StepInformation
         :param parameters: The parameters provided to the step.
         :type parameters: Dict[str, Any]
+        :return: The step instance ready for the execution.
+        :rtype: workflow.Step
         """
-        self.logger.info(f"Running step: {step.name}")
-        step_instance = workflow.steps.steps_register[step.id]
+        self.logger.info("Running step: %s", step_status.path.name)
+        step_instance = workflow.steps.get_instance(step_id)
         step_instance.workflow_context = self.__workflow_context
         step_instance.path = step_status.path
         step_status.parameters = self.__get_step_parameters(step_instance, parameters)
         step_instance.configure_logger()
-        captured_stdout = io.StringIO() if step.capture_stdout else sys.stdout
-        captured_stderr = io.StringIO() if step.capture_stderr else sys.stderr
+        return step_instance
+
+    def __get_archive_path(self, step_status: StepInformation, stream_name: str) -> Optional[Path]:
+        """
+        A method to get the path to the gzip file with the whole captured output of the step. The files are stored in
+        the directory next to the status file.
+
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param stream_name: The name of the captured stream ('stdout' or 'stderr').
+        :type stream_name: str
+        :return: The path to the gzip file, or None if the status file is not generated.
+        :rtype: Optional[Path]
+        """
+        if not self.status_file:
+            self.logger.warning("Captured output of the step '%s' is not archived, because the status file is not "
+                                "generated", step_status.path.name)
+            return None
+        names = []
+        information = step_status
+        while information is not None:
+            names.insert(0, information.path.name)
+            information = information.parent
+        file_name = ARCHIVE_FILE_NAME_REGEX.sub('_', '.'.join(names))
+        return self.status_file.parent.joinpath(f'{self.status_file.stem}-output', f'{file_name}.{stream_name}.gz')
+
+    @staticmethod
+    def __create_output_capture(step: configuration.NormalStep, step_instance: workflow.Step,
+                                stdout: Optional[str] = None, stderr: Optional[str] = None) -> OutputCapture:
+        """
+        A method to create the capture of the output of the step. In the 'stream' capture mode, the output is sent to
+        the logger of the step, and only its head and its tail are kept for the status file.
+
+        :param step: The step configuration.
+        :type step: configuration.NormalStep
+        :param step_instance: The instance of the step.
+        :type step_instance: workflow.Step
+        :param stdout: The standard output already captured in the worker process.
+        :type stdout: Optional[str]
+        :param stderr: The standard error already captured in the worker process.
+        :type stderr: Optional[str]
+        :return: The capture of the output.
+        :rtype: OutputCapture
+        """
+        logger = step_instance.logger if step.capture_mode == CaptureMode.STREAM else None
+        ring_size = max(step.capture_head or 0, step.capture_tail or 0) or None
+        if stdout is not None or stderr is not None:
+            return OutputCapture.from_output(stdout, stderr, logger=logger, ring_size=ring_size)
+        return OutputCapture(step.capture_stdout, step.capture_stderr, logger=logger, ring_size=ring_size)
+
+    def __store_captured_output(self, step: configuration.NormalStep, output_capture: Optional[OutputCapture],
+                                step_status: StepInformation):
+        """
+        A method to store the captured output in the status of the step, limited to the first and the last characters,
+        if the limits are configured. The buffers of the captured output are closed afterward.
+
+        :param step: The step configuration.
+        :type step: configuration.NormalStep
+        :param output_capture: The captured output of the step, or None if the step has failed before it started.
+        :type output_capture: Optional[OutputCapture]
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        """
+        if output_capture is None:
+            return
         try:
-            with (contextlib.redirect_stdout(captured_stdout) if step.capture_stdout else contextlib.nullcontext(),
-                  contextlib.redirect_stderr(captured_stderr) if step.capture_stderr else contextlib.nullcontext()):
-                step_instance.perform(**step_status.parameters)
-            self.logger.info(f"Step '{step.name}' finished")
+            for stream_name, buffer in ((STDOUT, output_capture.stdout), (STDERR, output_capture.stderr)):
+                if buffer is None:
+                    continue
+                archive_path = self.__get_archive_path(step_status, stream_name) if step.capture_archive else None
+                if archive_path:
+                    buffer.archive(archive_path)
+                setattr(step_status, stream_name, buffer.getvalue(step.capture_head, step.capture_tail))
         finally:
-            if step.capture_stdout:
-                step_status.stdout = captured_stdout.getvalue()
-            if step.capture_stderr:
-                step_status.stderr = captured_stderr.getvalue()
+            output_capture.close()
 
-    def __run_workflow_step(self, step: configuration.WorkflowStep, step_status: StepInformation,
-                            parameters: Dict[str, Any]):
+    @staticmethod
+    def __get_file_patterns(step: configuration.NormalStep,
+                            parameters: Dict[str, Any]) -> Optional[Tuple[List[str], List[str]]]:
         """
-        A method to run a workflow step.
+        A method to get the glob patterns of the input and output files of the step, with the resolved templates.
+
+        :param step: The step configuration.
+        :type step: configuration.NormalStep
+        :param parameters: The parameters provided to the step.
+        :type parameters: Dict[str, Any]
+        :return: The patterns of the input and output files, or None if the step does not declare them.
+        :rtype: Optional[Tuple[List[str], List[str]]]
+        """
+        if step.inputs is None or step.outputs is None:
+            return None
+        reference_resolver = ReferenceResolver(parameters)
+        return ([str(reference_resolver.resolve_element(pattern)) for pattern in step.inputs],
+                [str(reference_resolver.resolve_element(pattern)) for pattern in step.outputs])
+
+    def __skip_up_to_date_step(self, step_id: str, step_status: StepInformation,
+                               file_patterns: Optional[Tuple[List[str], List[str]]]) -> bool:
+        """
+        A method to skip the step, if neither its input nor its output files have changed since it has succeeded.
+
+        :param step_id: The ID of the registered step.
+        :type step_id: str
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param file_patterns: The patterns of the input and output files, or None if the step does not declare them.
+        :type file_patterns: Optional[Tuple[List[str], List[str]]]
+        :return: True if the step has been skipped, otherwise False.
+        :rtype: bool
+        """
+        if file_patterns is None:
+            return False
+        key = self.fingerprint_database.get_key(step_id, step_status.parameters, *file_patterns)
+        if not self.fingerprint_database.is_up_to_date(key, *file_patterns):
+            return False
+        step_status.status = StepStatus.SKIPPED
+        self.logger.info("Step '%s' is up to date, skipping", step_status.path.name)
+        return True
+
+    def __record_fingerprints(self, step_id: str, step_status: StepInformation,
+                              file_patterns: Optional[Tuple[List[str], List[str]]]):
+        """
+        A method to record the fingerprints of the input and output files of the successful step.
+
+        :param step_id: The ID of the registered step.
+        :type step_id: str
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param file_patterns: The patterns of the input and output files, or None if the step does not declare them.
+        :type file_patterns: Optional[Tuple[List[str], List[str]]]
+        """
+        if file_patterns is None or step_status.status == StepStatus.FAILED:
+            return
+        key = self.fingerprint_database.get_key(step_id, step_status.parameters, *file_patterns)
+        self.fingerprint_database.record(key, *file_patterns)
+
+    def __get_cache_key(self, step: configuration.NormalStep, step_id: str, step_instance: workflow.Step,
+                        step_status: StepInformation) -> Optional[str]:
+        """
+        A method to get the key of the cached result of the step. The key depends on the ID of the step, its resolved
+        parameters, the source code of the step class, and the configured version of the step.
 
         :param step: The step configuration.
-        :type step: configuration.WorkflowStep
+        :type step: configuration.NormalStep
+        :param step_id: The ID of the registered step.
+        :type step_id: str
+        :param step_instance: The instance of the step.
+        :type step_instance: workflow.Step
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :return: The key of the cached result, or None if the cache is not enabled for the step.
+        :rtype: Optional[str]
+        """
+        if not step.cache:
+            return None
+        fingerprint = get_code_fingerprint(type(step_instance))
+        if step.cache_version:
+            fingerprint = f'{fingerprint}:{step.cache_version}'
+        return self.step_cache.get_key(step_id, step_status.parameters, fingerprint)
+
+    def __restore_cached_result(self, step: configuration.NormalStep, cache_key: Optional[str],
+                                step_status: StepInformation) -> bool:
+        """
+        A method to restore the cached result of the step: its return value, captured output, and the values it has
+        set in the workflow context.
+
+        :param step: The step configuration.
+        :type step: configuration.NormalStep
+        :param cache_key: The key of the cached result, or None if the cache is not enabled for the step.
+        :type cache_key: Optional[str]
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :return: True if the result has been restored, otherwise False.
+        :rtype: bool
+        """
+        if cache_key is None:
+            return False
+        entry = self.step_cache.load(cache_key, step.cache_ttl)
+        if entry is None:
+            return False
+        for key, value in entry.context_updates.items():
+            self.__workflow_context.set(key, value)
+        for key in entry.context_removals:
+            self.__workflow_context.remove(key)
+        step_status.return_value = entry.return_value
+        step_status.stdout = entry.stdout
+        step_status.stderr = entry.stderr
+        self.logger.info("Step '%s' restored from the cache", step_status.path.name)
+        return True
+
+    def __store_cached_result(self, cache_key: Optional[str], step_instance: workflow.Step,
+                              step_status: StepInformation):
+        """
+        A method to store the result of the successful step in the cache.
+
+        :param cache_key: The key of the cached result, or None if the cache is not enabled for the step.
+        :type cache_key: Optional[str]
+        :param step_instance: The instance of the step, its workflow context records the values set by the step.
+        :type step_instance: workflow.Step
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        """
+        if cache_key is None or step_status.status == StepStatus.FAILED:
+            return
+        entry = StepCacheEntry(step_status.return_value, step_status.stdout, step_status.stderr,
+                               step_instance.workflow_context.context_updates,
+                               context_removals=step_instance.workflow_context.context_removals)
+        self.step_cache.store(cache_key, entry)
+
+    def __get_executor(self, step: configuration.NormalStep) -> ExecutorType:
+        """
+        A method to get the executor of the normal step. The steps capturing the output from the file descriptors are
+        always run in the worker process, as the file descriptors are shared by all threads of the main process.
+
+        :param step: The step configuration.
+        :type step: configuration.NormalStep
+        :return: The executor of the step.
+        :rtype: ExecutorType
+        """
+        if step.capture_mode == CaptureMode.FD:
+            return ExecutorType.PROCESS
+        return step.executor or self.default_executor
+
+    def __run_normal_step(self, step: configuration.NormalStep, step_id: str, step_status: StepInformation,
+                          parameters: Dict[str, Any]):
+        """
+        A method to run a normal step.
+
+        :param step: The step configuration.
+        :type step: configuration.NormalStep
+        :param step_id: The ID of the registered step.
+        :type step_id: str
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param parameters: The parameters provided to the step.
+        :type parameters: Dict[str, Any]
+        """
+        step_instance = self.__prepare_normal_step(step_id, step_status, parameters)
+        file_patterns = self.__get_file_patterns(step, parameters)
+        if self.__skip_up_to_date_step(step_id, step_status, file_patterns):
+            return
+        cache_key = self.__get_cache_key(step, step_id, step_instance, step_status)
+        if self.__restore_cached_result(step, cache_key, step_status):
+            return
+        if cache_key is not None:
+            step_instance.workflow_context = RecordingWorkflowContext(self.__workflow_context)
+        if self.__get_executor(step) == ExecutorType.PROCESS:
+            try:
+                self.__process_executor.run(step_id, step_status, step_instance.workflow_context, step.capture_stdout,
+                                            step.capture_stderr, step.capture_mode == CaptureMode.FD)
+                self.logger.info("Step '%s' finished", step_status.path.name)
+            finally:
+                if step.capture_head is not None or step.capture_tail is not None or step.capture_archive or \
+                        step.capture_mode == CaptureMode.STREAM:
+                    output_capture = self.__create_output_capture(
+                        step, step_instance, step_status.stdout if step.capture_stdout else None,
+                        step_status.stderr if step.capture_stderr else None)
+                    self.__store_captured_output(step, output_capture, step_status)
+            self.__store_cached_result(cache_key, step_instance, step_status)
+            self.__record_fingerprints(step_id, step_status, file_patterns)
+            return
+        output_capture = self.__create_output_capture(step, step_instance)
+        try:
+            if inspect.iscoroutinefunction(step_instance.perform):
+                self.__event_loop.run(output_capture.run(step_instance.perform(**step_status.parameters)))
+            else:
+                with output_capture:
+                    step_instance.perform(**step_status.parameters)
+            self.logger.info("Step '%s' finished", step_status.path.name)
+        finally:
+            self.__store_captured_output(step, output_capture, step_status)
+        self.__store_cached_result(cache_key, step_instance, step_status)
+        self.__record_fingerprints(step_id, step_status, file_patterns)
+
+    async def __run_asynchronous_normal_step(self, plan_step: PlanStep, step_status: StepInformation,
+                                             parameters: Dict[str, Any]):
+        """
+        A method to run a normal step with asynchronous 'perform' method on the event loop. The fingerprints of the
+        files and the cached results are read and written in the worker thread, so the disk I/O does not block the
+        other steps running on the event loop.
+
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
         :param step_status: The status of the step.
         :type step_status: StepInformation
         :param parameters: The parameters provided to the step.
         :type parameters: Dict[str, Any]
         """
-        self.logger.info(f"Running workflow: {step.workflow}")
-        self.__run_steps(self.workflows_configuration.workflows[step.workflow], parameters, step_status.path)
+        if self.__is_resumed_step(step_status):
+            return
+        evaluated_parameters = self.__start_step(plan_step, step_status, parameters)
+        output_capture = None
+        try:
+            evaluated_parameters, step_id = self.__resolve_templates(plan_step, step_status, evaluated_parameters)
+            step_instance = self.__prepare_normal_step(step_id, step_status, evaluated_parameters)
+            file_patterns = self.__get_file_patterns(plan_step.step, evaluated_parameters)
+            cache_key = None
+            if file_patterns is not None or plan_step.step.cache:
+                cache_key = await asyncio.to_thread(self.__get_cache_key, plan_step.step, step_id, step_instance,
+                                                    step_status)
+                if await asyncio.to_thread(self.__skip_up_to_date_step, step_id, step_status, file_patterns) or \
+                        await asyncio.to_thread(self.__restore_cached_result, plan_step.step, cache_key, step_status):
+                    self.__complete_step(step_status)
+                    return
+            if cache_key is not None:
+                step_instance.workflow_context = RecordingWorkflowContext(self.__workflow_context)
+            output_capture = self.__create_output_capture(plan_step.step, step_instance)
+            await output_capture.run(step_instance.perform(**step_status.parameters))
+            self.logger.info("Step '%s' finished", step_status.path.name)
+        except Exception as exception:
+            self.__store_captured_output(plan_step.step, output_capture, step_status)
+            self.__fail_step(plan_step.step, step_status, exception)
+            return
+        self.__store_captured_output(plan_step.step, output_capture, step_status)
+        if file_patterns is not None or cache_key is not None:
+            await asyncio.to_thread(self.__store_cached_result, cache_key, step_instance, step_status)
+            await asyncio.to_thread(self.__record_fingerprints, step_id, step_status, file_patterns)
+        self.__complete_step(step_status)
+
+    def __is_asynchronous_step(self, plan_step: PlanStep) -> bool:
+        """
+        A method to check if the step can be run directly on the event loop, it is possible for normal steps with
+        asynchronous 'perform' method that run in the thread executor. The output is captured per task, so the steps
+        capturing the output can share the event loop.
+
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
+        :return: True if the step can be run on the event loop, otherwise False.
+        :rtype: bool
+        """
+        step = plan_step.step
+        if step.type != StepType.NORMAL or plan_step.is_target_template:
+            return False
+        if self.__get_executor(step) != ExecutorType.THREAD:
+            return False
+        step_instance = workflow.steps.steps_register.get(plan_step.target)
+        return step_instance is not None and inspect.iscoroutinefunction(step_instance.perform)
+
+    def __run_workflow_step(self, plan_step: PlanStep, workflow_name: str, step_status: StepInformation,
+                            parameters: Dict[str, Any]):
+        """
+        A method to run a workflow step.
 
-    def __run_parallel_steps(self, step: configuration.ParallelStep, step_status: StepInformation,
-                             parameters: Dict[str, Any]):
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
+        :param workflow_name: The name of the workflow to run.
+        :type workflow_name: str
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param parameters: The parameters provided to the step.
+        :type parameters: Dict[str, Any]
+        """
+        self.logger.info("Running workflow: %s", workflow_name)
+        children, dependencies = plan_step.children, plan_step.dependencies
+        if plan_step.is_target_template:
+            children, dependencies = self.execution_plan.compile_workflow(workflow_name, step_status.path,
+                                                                          workflow_names=plan_step.workflow_names)
+            step_status.children = ExecutionPlan.create_children_information(
+                self.__workflow_context.steps_information, children, step_status) or None
+            previous_children = self.__previous_children.pop(id(step_status), None)
+            if previous_children:
+                self.__resume_steps(children, step_status.children or [], previous_children)
+            if self.__status_journal is not None:
+                self.__status_journal.record_children(step_status)
+        self.__run_steps(children, step_status.children or [], dependencies, parameters)
+
+    def __run_parallel_steps(self, plan_step: PlanStep, step_status: StepInformation, parameters: Dict[str, Any]):
         """
         A method to run parallel steps.
 
-        :param step: The step configuration.
-        :type step: configuration.ParallelStep
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
         :param step_status: The status of the step.
         :type step_status: StepInformation
         :param parameters: The parameters provided to the step.
         :type parameters: Dict[str, Any]
         """
         self.logger.info("Running parallel steps")
-        parallel_threads = []
-        for parallel_step in step.parallels:
-            thread = ExceptionThread(target=self.__run_step, name=f'{step.name}-{parallel_step.name}',
-                                     args=(parallel_step, step_status.path, parameters))
-            parallel_threads.append(thread)
-            thread.start()
-        for thread in parallel_threads:
-            thread.join()
-            if thread.exception:
-                raise thread.exception
+        max_workers = plan_step.step.max_workers
+        children = list(zip(plan_step.children, step_status.children or []))
+        if plan_step.dependencies is not None:
+            tasks = [functools.partial(self.__run_step, child_plan_step, child_status, parameters)
+                     for child_plan_step, child_status in children]
+            exceptions = self.__worker_pool.run_graph(tasks, plan_step.dependencies, max_workers)
+        elif all(self.__is_asynchronous_step(child_plan_step) for child_plan_step in plan_step.children):
+            exceptions = self.__event_loop.run(self.__gather_asynchronous_steps(children, max_workers, parameters))
+        else:
+            tasks = [functools.partial(self.__run_step, child_plan_step, child_status, parameters)
+                     for child_plan_step, child_status in children]
+            exceptions = self.__worker_pool.run_all(tasks, max_workers)
+        for exception in exceptions:
+            if exception:
+                raise exception
 
-    def __update_step_name(self, step: configuration.Step, step_path: StepPath, parameters: Dict[str, Any]):
+    async def __gather_asynchronous_steps(self, children: List[Tuple[PlanStep, StepInformation]],
+                                          max_workers: Optional[int],
+                                          parameters: Dict[str, Any]) -> List[Optional[Exception]]:
         """
-        A method to update the title of the step.
+        A method to run the asynchronous parallel steps concurrently on the event loop.
 
-        :param step: The step configuration.
-        :type step: configuration.Step
-        :param step_path: The path to the step.
-        :type step_path: StepPath
+        :param children: The parallel steps of the execution plan with their statuses.
+        :type children: List[Tuple[PlanStep, StepInformation]]
+        :param max_workers: The maximum number of steps running at the same time, if not provided, then all steps run
+            at the same time.
+        :type max_workers: Optional[int]
         :param parameters: The parameters provided to the step.
         :type parameters: Dict[str, Any]
+        :return: The exceptions raised by the parallel steps, in the same order as the steps (None, if step succeeded).
+        :rtype: List[Optional[Exception]]
         """
-        step_information = self.__workflow_context.get_step_information(step_path)
-        processed_step_name = str(ReferenceResolver(parameters).resolve_element(step_information.path.name))
-        step_information.path.name = processed_step_name
-        step.name = processed_step_name
-
-    def __update_template_parameters(self, step: configuration.Step, step_path: StepPath, parameters: Dict[str, Any]):
+        semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+
+        async def run_parallel_step(plan_step: PlanStep, step_status: StepInformation):
+            """
+            A function to run the parallel step, respecting the maximum number of concurrently running steps.
+
+            :param plan_step: The step of the execution plan.
+            :type plan_step: PlanStep
+            :param step_status: The status of the step.
+            :type step_status: StepInformation
+            """
+            if semaphore is None:
+                return await self.__run_asynchronous_normal_step(plan_step, step_status, parameters)
+            async with semaphore:
+                return await self.__run_asynchronous_normal_step(plan_step, step_status, parameters)
+
+        results = await asyncio.gather(*[run_parallel_step(plan_step, step_status)
+                                         for plan_step, step_status in children], return_exceptions=True)
+        return [result if isinstance(result, Exception) else None for result in results]
+
+    def __resolve_templates(self, plan_step: PlanStep, step_status: StepInformation,
+                            parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
         """
-        A method to update the title of the step.
+        A method to resolve the parameters, and the name and the target of the step. The resolved values are stored in
+        the status of the step, the plan and the configuration are not modified.
 
-        :param step: The step configuration.
-        :type step: configuration.Step
-        :param step_path: The path to the step.
-        :type step_path: StepPath
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
         :param parameters: The parameters provided to the step.
         :type parameters: Dict[str, Any]
+        :return: The resolved parameters, and the resolved ID of the normal step or name of the workflow.
+        :rtype: Tuple[Dict[str, Any], Optional[str]]
         """
         reference_resolver = ReferenceResolver(parameters.copy())
         parameters = reference_resolver.resolve()
-        self.__update_step_name(step, step_path, parameters)
-        if isinstance(step, configuration.NormalStep):
-            step.id = str(ReferenceResolver(parameters).resolve_element(step.id))
-        if isinstance(step, configuration.WorkflowStep):
-            step.workflow = str(ReferenceResolver(parameters).resolve_element(step.workflow))
-        return parameters
+        if plan_step.is_name_template:
+            step_name = str(ReferenceResolver(parameters).resolve_element(plan_step.step.name))
+            if step_status.path.name != step_name:
+                self.__workflow_context.steps_information.rename_step(step_status.path, step_name)
+        target = plan_step.target
+        if plan_step.is_target_template:
+            target = str(ReferenceResolver(parameters).resolve_element(target))
+        return parameters, target
+
+    def __is_resumed_step(self, step_status: StepInformation) -> bool:
+        """
+        A method to check if the step has succeeded, or has been skipped as up to date, in the previous run, so it is
+        not run again.
 
-    def __run_step(self, step: StepUnion, parent_step_path: Optional[StepPath], parameters: Dict[str, Any]):
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :return: True if the step has succeeded or has been skipped in the previous run, otherwise False.
+        :rtype: bool
         """
-        A method to run a step.
+        if step_status.status not in (StepStatus.SUCCESS, StepStatus.SKIPPED):
+            return False
+        self.logger.info("Step '%s' has succeeded in the previous run, skipping", step_status.path.name)
+        return True
+
+    def __start_step(self, plan_step: PlanStep, step_status: StepInformation,
+                     parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        A method to mark the step as running and evaluate its parameters.
+
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param parameters: The parameters provided to the step.
+        :type parameters: Dict[str, Any]
+        :return: The evaluated parameters of the step.
+        :rtype: Dict[str, Any]
+        """
+        step_status.status = StepStatus.RUNNING
+        self.__record_step(step_status)
+        return self.__evaluate_parameters(plan_step.step.parameters, parameters)
+
+    def __record_step(self, step_status: StepInformation):
+        """
+        A method to append the event of the step to the journal, if the status file is generated.
+
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        """
+        if self.__status_journal is not None:
+            self.__status_journal.record(step_status, self.__workflow_context)
+
+    def __complete_step(self, step_status: StepInformation):
+        """
+        A method to mark the step as successful, if its status has not been set by the step itself.
+
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        """
+        if step_status.status == StepStatus.RUNNING:
+            step_status.status = StepStatus.SUCCESS
+        self.__record_step(step_status)
+
+    def __fail_step(self, step: StepUnion, step_status: StepInformation, exception: Exception):
+        """
+        A method to mark the step as failed.
 
         :param step: The step configuration.
         :type step: StepUnion
-        :param parent_step_path: The path to the parent step.
-        :type parent_step_path: Optional[StepPath]
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param exception: The exception raised by the step.
+        :type exception: Exception
+        :raise Exception: If the workflow shall be stopped on the step error.
+        """
+        if step_status.status == StepStatus.RUNNING:
+            step_status.status = StepStatus.FAILED
+        step_status.error = str(exception)
+        self.__record_step(step_status)
+        self.logger.error("Step '%s' failed", step_status.path.name)
+        if step.stop_on_error:
+            raise exception
+
+    def __run_step(self, plan_step: PlanStep, step_status: StepInformation, parameters: Dict[str, Any]):
+        """
+        A method to run a step.
+
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
         :param parameters: The parameters provided to the step.
         :type parameters: Dict[str, Any]
         """
-        step_path = StepPath(parent_step_path, step.type, step.name)
-        step_status = self.__workflow_context.get_step_information(step_path)
-        step_status.status = StepStatus.RUNNING
-        evaluated_parameters = self.__evaluate_parameters(step.parameters, parameters)
+        if self.__is_resumed_step(step_status):
+            return
+        evaluated_parameters = self.__start_step(plan_step, step_status, parameters)
         try:
-            evaluated_parameters = self.__update_template_parameters(step, step_path, evaluated_parameters)
-            if step.type == StepType.NORMAL:
-                self.__run_normal_step(step, step_status, evaluated_parameters)
-            elif step.type == StepType.WORKFLOW:
-                self.__run_workflow_step(step, step_status, evaluated_parameters)
-            elif step.type == StepType.PARALLEL:
-                self.__run_parallel_steps(step, step_status, evaluated_parameters)
-            if step_status.status == StepStatus.RUNNING:
-                step_status.status = StepStatus.SUCCESS
+            evaluated_parameters, target = self.__resolve_templates(plan_step, step_status, evaluated_parameters)
+            if plan_step.type == StepType.NORMAL:
+                self.__run_normal_step(plan_step.step, target, step_status, evaluated_parameters)
+            elif plan_step.type == StepType.WORKFLOW:
+                self.__run_workflow_step(plan_step, target, step_status, evaluated_parameters)
+            elif plan_step.type == StepType.PARALLEL:
+                self.__run_parallel_steps(plan_step, step_status, evaluated_parameters)
         except Exception as exception:
-            if step_status.status == StepStatus.RUNNING:
-                step_status.status = StepStatus.FAILED
-            step_status.error = str(exception)
-            self.logger.error(f"Step '{step.name}' failed")
-            if step.stop_on_error:
-                raise exception
+            self.__fail_step(plan_step.step, step_status, exception)
+            return
+        self.__complete_step(step_status)
 
-    def __run_steps(self, workflow_configuration: Workflow, parameters: Dict[str, Any],
-                    parent_step_path: Optional[StepPath] = None):
+    def __run_steps(self, plan_steps: Tuple[PlanStep, ...], steps_information: List[StepInformation],
+                    dependencies: Optional[Dependencies], parameters: Dict[str, Any]):
         """
         A method to run the steps in the workflow.
 
-        :param workflow_configuration: The workflow configuration.
-        :type workflow_configuration: Workflow
+        :param plan_steps: The steps of the execution plan.
+        :type plan_steps: Tuple[PlanStep, ...]
+        :param steps_information: The statuses of the steps, in the same order as the steps.
+        :type steps_information: List[StepInformation]
+        :param dependencies: The dependencies between the steps, or None if the steps run one after another.
+        :type dependencies: Optional[Dependencies]
         :param parameters: The parameters provided to the workflow.
         :type parameters: Dict[str, Any]
-        :param parent_step_path: The path to the parent step.
-        :type parent_step_path: Optional[StepPath]
         """
-        for step in workflow_configuration.steps:
+        if dependencies is not None:
+            self.__run_dependent_steps(plan_steps, steps_information, dependencies, parameters)
+            return
+        for plan_step, step_status in zip(plan_steps, steps_information):
             try:
-                self.__run_step(step, parent_step_path, parameters)
+                self.__run_step(plan_step, step_status, parameters)
             except Exception as exception:
-                if step.stop_on_error:
+                if plan_step.step.stop_on_error:
                     self.logger.error("Stopping workflow due to error")
                     raise exception
 
-    def __generate_status_file(self):
+    def __run_dependent_steps(self, plan_steps: Tuple[PlanStep, ...], steps_information: List[StepInformation],
+                              dependencies: Dependencies, parameters: Dict[str, Any]):
         """
-        A method to generate the status file.
+        A method to run the steps in the workflow, where each step starts as soon as the steps it depends on finish.
+
+        :param plan_steps: The steps of the execution plan.
+        :type plan_steps: Tuple[PlanStep, ...]
+        :param steps_information: The statuses of the steps, in the same order as the steps.
+        :type steps_information: List[StepInformation]
+        :param dependencies: The indexes of the steps each step depends on.
+        :type dependencies: Dependencies
+        :param parameters: The parameters provided to the workflow.
+        :type parameters: Dict[str, Any]
+        """
+        self.logger.info("Running steps in the order of their dependencies")
+        tasks = [functools.partial(self.__run_step, plan_step, step_status, parameters)
+                 for plan_step, step_status in zip(plan_steps, steps_information)]
+        exceptions = self.__worker_pool.run_graph(tasks, dependencies)
+        for exception in exceptions:
+            if exception:
+                self.logger.error("Stopping workflow due to error")
+                raise exception
+
+    def __restore_step(self, plan_step: PlanStep, step_status: StepInformation, previous_status: Dict[str, Any]):
+        """
+        A method to restore the step, and all its children, from the status of the previous run.
+
+        :param plan_step: The step of the execution plan.
+        :type plan_step: PlanStep
+        :param step_status: The status of the step.
+        :type step_status: StepInformation
+        :param previous_status: The status of the step from the previous run.
+        :type previous_status: Dict[str, Any]
+        """
+        previous_name = previous_status.get('name')
+        if plan_step.is_name_template and previous_name and previous_name != step_status.path.name:
+            self.__workflow_context.steps_information.rename_step(step_status.path, previous_name)
+        step_status.status = StepStatus(previous_status.get('status', StepStatus.NOT_STARTED.value))
+        step_status.parameters = previous_status.get('parameters')
+        step_status.error = previous_status.get('error')
+        if plan_step.type == StepType.NORMAL:
+            step_status.stdout = previous_status.get('stdout')
+            step_status.stderr = previous_status.get('stderr')
+            step_status.return_value = previous_status.get('return_value')
+        for child_plan_step, child_status, previous_child in zip(plan_step.children, step_status.children or [],
+                                                                 previous_status.get('children') or []):
+            self.__restore_step(child_plan_step, child_status, previous_child)
+
+    def __resume_steps(self, plan_steps: Tuple[PlanStep, ...], steps_information: List[StepInformation],
+                       previous_steps: List[Dict[str, Any]]):
+        """
+        A method to restore the steps that have succeeded in the previous run. The steps are matched by their position,
+        type, and name (unless the name is a template). The parallel and workflow steps that have not succeeded are
+        run again, but only their children that have not succeeded are run.
+
+        :param plan_steps: The steps of the execution plan.
+        :type plan_steps: Tuple[PlanStep, ...]
+        :param steps_information: The statuses of the steps, in the same order as the steps.
+        :type steps_information: List[StepInformation]
+        :param previous_steps: The statuses of the steps from the previous run.
+        :type previous_steps: List[Dict[str, Any]]
+        """
+        for plan_step, step_status, previous_status in zip(plan_steps, steps_information, previous_steps):
+            if previous_status.get('type') != plan_step.type.value or (
+                    not plan_step.is_name_template and previous_status.get('name') != step_status.path.name):
+                self.logger.warning("Step '%s' does not match the previous run, it is run again", step_status.path.name)
+                continue
+            if previous_status.get('status') in (StepStatus.SUCCESS.value, StepStatus.SKIPPED.value):
+                self.__restore_step(plan_step, step_status, previous_status)
+            elif step_status.children:
+                self.__resume_steps(plan_step.children, step_status.children, previous_status.get('children') or [])
+            elif previous_status.get('children'):
+                self.__previous_children[id(step_status)] = previous_status['children']
+
+    def __resume_run(self, steps_information: List[StepInformation]):
         """
-        with self.status_file.open('w', encoding='utf-8') as file:
-            json.dump(self.__workflow_context.steps_information.to_dict(), file, indent=4)
+        A method to restore the statuses of the steps, and the values of the workflow context, from the previous run.
 
-    def run(self):
+        :param steps_information: The information of the steps of the workflow.
+        :type steps_information: List[StepInformation]
+        :raise InvalidParameter: If the status of the previous run cannot be loaded.
+        """
+        self.logger.info("Resuming run from status file: %s", self.resume_file)
+        try:
+            previous_run = load_status(self.resume_file)
+        except (OSError, ValueError) as exception:
+            raise InvalidParameter(f"Cannot resume the run from the status file '{self.resume_file}': "
+                                   f"{exception}") from exception
+        self.__resume_steps(self.execution_plan.steps, steps_information, previous_run.get('steps') or [])
+        for key, value in (previous_run.get('context') or {}).items():
+            self.__workflow_context.set(key, value)
+
+    def __open_status_journal(self):
         """
-        A method to run the workflow.
+        A method to start the journal of the run next to the status file, if the status file is generated.
+        """
+        self.__status_journal = None
+        if not self.status_file:
+            return
+        journal_file = get_journal_path(self.status_file)
+        self.logger.info("Writing status journal: %s", journal_file)
+        self.__status_journal = StatusJournal(journal_file, self.logger)
+        self.__workflow_context.pop_changes()
+        self.__status_journal.open(self.workflow_name, self.__workflow_context.steps_information,
+                                   self.__workflow_context.parameters)
+
+    def __generate_status_file(self, is_successful: bool):
+        """
+        A method to close the journal of the run, and generate the status file from it. The journal is removed once
+        the status file has been written, as the status file contains all its events.
+
+        :param is_successful: Flag that indicates whether the workflow has succeeded.
+        :type is_successful: bool
         """
-        self.__initialize_workflow_context()
-        workflow_configuration = self.workflows_configuration.workflows[self.workflow_name]
-        self.logger.info(f"Running workflow: {workflow_configuration.name}")
-        parameters = self.__evaluate_parameters(self.workflows_configuration.parameters)
-        parameters = self.__evaluate_parameters(workflow_configuration.parameters, parameters)
+        self.__status_journal.close(is_successful, self.__workflow_context.parameters)
+        write_status_file(self.status_file, self.__status_journal.status)
+        get_journal_path(self.status_file).unlink(missing_ok=True)
+        self.__status_journal = None
+
+    def run(self) -> bool:
+        """
+        A method to run the workflow. The execution plan is compiled, when it has not been provided.
+
+        :return: True if the workflow has succeeded, otherwise False (the workflow has been stopped, or any of its
+            steps has failed).
+        :rtype: bool
+        """
+        if self.execution_plan is None or self.execution_plan.workflow_name != self.workflow_name:
+            self.logger.info("Compiling execution plan")
+            self.execution_plan = ExecutionPlan(self.workflows_configuration, self.workflow_name)
+        steps_information = self.__initialize_workflow_context()
+        self.__previous_children = {}
+        if self.resume_file:
+            self.__resume_run(steps_information)
+        self.__open_status_journal()
+        self.logger.info("Running workflow: %s", self.workflow_name)
+        parameters = self.__evaluate_parameters(self.execution_plan.parameters)
+        parameters = self.__evaluate_parameters(self.execution_plan.workflow_parameters, parameters)
+        self.__worker_pool = WorkerPool(self.max_workers)
+        self.__process_executor = self.process_executor or ProcessStepExecutor()
+        self.__event_loop = EventLoopThread()
+        is_successful = True
         try:
-            self.__run_steps(workflow_configuration, parameters)
+            self.__run_steps(self.execution_plan.steps, steps_information, self.execution_plan.dependencies,
+                             parameters)
         except Exception as exception:
-            self.logger.error(f"Workflow failed: {exception}")
+            is_successful = False
+            self.logger.error("Workflow failed: %s", exception)
+        finally:
+            self.__worker_pool.shutdown()
+            if self.__process_executor is not self.process_executor:
+                self.__process_executor.shutdown()
+            self.__event_loop.shutdown()
         self.logger.info("Workflow finished")
+        is_successful = is_successful and all(step.status != StepStatus.FAILED for step in steps_information)
         if self.status_file:
-            self.logger.info(f"Generating status file: {self.status_file}")
-            self.__generate_status_file()
+            self.logger.info("Generating status file: %s", self.status_file)
+            self.__generate_status_file(is_successful)
             self.logger.info("Status file generated")
+        return is_successful
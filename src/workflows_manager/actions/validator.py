@@ -3,13 +3,13 @@ Module contains validator for the workflows configuration.
 """
 import inspect
 from logging import Logger
-from typing import List, Dict, Any, Set
+from typing import Dict, Any, Set
 
 from workflows_manager import configuration
 from workflows_manager import workflow
 from workflows_manager.actions.misc import InstanceParameters
 from workflows_manager.configuration import Workflow, StepType, StepUnion
-from workflows_manager.exceptions import MissingParameter, MissingStep
+from workflows_manager.exceptions import InvalidParameter, MissingParameter, MissingStep
 
 
 class Validator:
@@ -67,20 +67,29 @@ class Validator:
 
     def __validate_normal_step_parameters(self, step_configuration: configuration.NormalStep, parameters: Set[str]):
         """
-        A method to validate the parameters of a normal step.
+        A method to validate the parameters of a normal step. The parameters provided from command line arguments are
+        checked against the types of the parameters of the step, after the string values are coerced to them.
 
         :param step_configuration: The step configuration.
         :type step_configuration: configuration.NormalStep
         :param parameters: The parameters provided to the step from the parent.
         :type parameters: Set[str]
+        :raise MissingParameter: If the step is missing any of its parameters.
+        :raise InvalidParameter: If the parameter provided from command line arguments does not match the type of the
+            parameter of the step, and the step has no other value for it.
         """
         step_instance = workflow.steps.steps_register[step_configuration.id]
         instance_parameters = InstanceParameters.from_step(step_instance)
         initialized_parameters = {}
+        invalid_parameters = {}
         for name in self.parameters:
             instance_parameter = instance_parameters[name]
             if instance_parameter:
-                initialized_parameters[name] = True
+                is_matching, _ = instance_parameter.match(self.parameters[name], coerce=True)
+                if is_matching:
+                    initialized_parameters[name] = True
+                else:
+                    invalid_parameters[name] = instance_parameter.type
         for name in parameters:
             instance_parameter = instance_parameters[name]
             if instance_parameter:
@@ -93,6 +102,11 @@ class Validator:
         for parameter in instance_parameters:
             if not initialized_parameters.get(parameter.name, False):
                 missing_parameters.append(parameter.name)
+        invalid_parameters = [f'{name} (expected: {parameter_type})' for name, parameter_type in
+                              invalid_parameters.items() if name in missing_parameters]
+        if invalid_parameters:
+            raise InvalidParameter(f"Step '{step_name}' has the following parameters of invalid types: "
+                                   f"{invalid_parameters}")
         if missing_parameters:
             raise MissingParameter(f"Step '{step_name}' is missing the following parameters: {missing_parameters}")
 
@@ -126,29 +140,13 @@ class Validator:
         for step_configuration in workflow_configuration.steps:
             self.__validate_step_parameters(step_configuration, step_parameters)
 
-    def __collect_normal_steps(self, steps: configuration.Steps) -> List[configuration.NormalStep]:
-        """
-        A method to collect the normal steps from the provided steps (including embedded into parallel steps).
-
-        :param steps: The list of steps from which it will collect the normal steps.
-        :type steps: configuration.Steps
-        :return: The normal steps.
-        :rtype: List[configuration.NormalStep]
-        """
-        normal_steps = []
-        for step in steps.elements:
-            if step.type == StepType.NORMAL:
-                normal_steps.append(step)
-            elif step.type == StepType.PARALLEL:
-                normal_steps.extend(self.__collect_normal_steps(step.parallels))
-        return normal_steps
-
     def __validate_registered_steps(self):
         """
         A method to validate if all steps from the configuration have been registered in the Steps class.
         """
-        for workflow_configuration in self.workflows_configuration.workflows.elements:
-            normal_steps = self.__collect_normal_steps(workflow_configuration.steps)
+        workflows = self.workflows_configuration.workflows.get_required_workflows(self.workflow_name)
+        for workflow_configuration in workflows:
+            normal_steps = workflow_configuration.steps.get_steps(StepType.NORMAL)
             for normal_step in normal_steps:
                 is_step_present = normal_step.id in workflow.steps.steps_register
                 if not is_step_present:
@@ -36,6 +36,18 @@ def __add_configuration_file_parameter(parser):
                              'current working directory.')
 
 
+def __add_socket_parameter(parser: ArgumentParser, help_text: str):
+    """
+    Add the socket parameter to the parser.
+
+    :param parser: Parser to which the socket parameter will be added.
+    :type parser: ArgumentParser
+    :param help_text: Help message for the socket parameter.
+    :type help_text: str
+    """
+    parser.add_argument('--socket', type=str, help=help_text)
+
+
 def __create_configuration_group(parser: ArgumentParser):
     """
     Create a group of configuration parameters for the subparser.
@@ -51,6 +63,32 @@ def __create_configuration_group(parser: ArgumentParser):
                                           'to always return 0 as an exit status code.')
     configuration_group.add_argument('--disable-current-path-import', action='store_true',
                                      help='Disable automatic import of the modules from the current path.')
+    configuration_group.add_argument('--cache-directory', type=str,
+                                     help='Path to the directory where the cached data is stored. If not provided, '
+                                          'then WORKFLOWS_MANAGER_CACHE_DIRECTORY environment variable or '
+                                          '~/.cache/workflows-manager is used.')
+    configuration_group.add_argument('--disable-configuration-cache', action='store_true',
+                                     help='Disable the cache of the parsed and validated configuration file.')
+    configuration_group.add_argument('--lazy-configuration', action='store_true',
+                                     help='Create and validate only the workflows that are used (the workflow and the '
+                                          'workflows reachable from it), instead of the whole configuration file.')
+    configuration_group.add_argument('--disable-step-index', action='store_true',
+                                     help='Disable the index of the registered steps, and import all modules from the '
+                                          'import paths instead of the modules that register the used steps.')
+    configuration_group.add_argument('--import-include', action='append',
+                                     help='Glob pattern of the module files to import (e.g. "steps/*"). It can be '
+                                          'provided multiple times. If not provided, then all modules are imported.')
+    configuration_group.add_argument('--import-exclude', action='append',
+                                     help='Glob pattern of the files and directories that are not imported (e.g. '
+                                          '"tests"). It can be provided multiple times.')
+    configuration_group.add_argument('--disable-default-import-excludes', action='store_true',
+                                     help='Disable the default exclude patterns (e.g. ".git", ".venv", "node_modules", '
+                                          '"build").')
+    configuration_group.add_argument('--import-workers', type=int,
+                                     help='Maximum number of top-level packages imported concurrently. If not '
+                                          'provided, then the modules are imported sequentially.')
+    configuration_group.add_argument('--import-timings', action='store_true',
+                                     help='Log the report with the import time of each module.')
 
 
 def __create_logging_group(parser: ArgumentParser):
@@ -114,10 +152,39 @@ def __configure_run_action_subparser(parser):
     run_subparser = parser.add_parser('run', help='Run the workflows.', formatter_class=RawTextHelpFormatter)
     run_subparser.add_argument('--status-file', '-sf', type=str,
                                help='Path to the file where the statuses of the particular steps will be stored.')
+    run_subparser.add_argument('--resume', '-r', type=str,
+                               help='Path to the status file of the previous run. If provided, then the steps that '
+                                    'have succeeded in the previous run are not run again.')
+    run_subparser.add_argument('--max-workers', '-mw', type=int,
+                               help='Maximum number of threads shared by all parallel steps in the workflow. If not '
+                                    'provided, then it depends on the number of CPUs.')
+    run_subparser.add_argument('--process-workers', '-pw', type=int,
+                               help='Maximum number of worker processes used to run the steps with the "process" '
+                                    'executor. If not provided, then the number of CPUs is used.')
+    run_subparser.add_argument('--default-executor', '-de', type=str, choices=['thread', 'process'],
+                               default='thread',
+                               help='Executor used to run the normal steps that do not specify it in the '
+                                    'configuration. The "process" executor runs steps in the pool of worker '
+                                    'processes.')
+    run_subparser.add_argument('--step-cache-max-size', '-scs', type=int,
+                               help='Maximum size of the cache of the step results in bytes. The least recently used '
+                                    'results are evicted when it is exceeded. If not provided, then 256 MiB is used.')
     __create_configuration_group(run_subparser)
     __create_logging_group(run_subparser)
     __create_parameters_group(run_subparser)
     __add_workflow_name_parameter(run_subparser, help_text='Name of the workflow to run.')
+    __add_socket_parameter(run_subparser, help_text='Path to the socket of the running server. If provided, then the '
+                                                    'workflow is run by the server.')
+    batch_group = run_subparser.add_argument_group('Batch', 'Run many workflows, or parameter sets, in one process.')
+    batch_group.add_argument('--batch', '-b', type=str,
+                             help='Path to the JSON Lines file, each line contains the "workflow_name", and optionally '
+                                  'the "parameters" and the "status_file" of a single run. If provided, then the '
+                                  'workflow name is ignored and the status file contains the summary of the batch.')
+    batch_group.add_argument('--batch-concurrency', '-bc', type=int,
+                             help='Maximum number of the batch items that run at the same time. By default, the items '
+                                  'run one by one.')
+    batch_group.add_argument('--batch-output-directory', '-bo', type=str,
+                             help='Path to the directory where the status file of each batch item is stored.')
 
 
 def __configure_validate_action_subparser(parser):
@@ -135,6 +202,8 @@ def __configure_validate_action_subparser(parser):
     __create_configuration_group(validate_subparser)
     __create_logging_group(validate_subparser)
     __create_parameters_group(validate_subparser)
+    __add_socket_parameter(validate_subparser, help_text='Path to the socket of the running server. If provided, then '
+                                                         'the workflow is validated by the server.')
 
 
 def __configure_list_action_subparser(parser):
@@ -147,6 +216,39 @@ def __configure_list_action_subparser(parser):
     configuration_group = list_subparser.add_argument_group('Configuration', 'Configuration of the workflows manager.')
     __add_configuration_file_parameter(configuration_group)
     __create_logging_group(list_subparser)
+    __add_socket_parameter(list_subparser, help_text='Path to the socket of the running server. If provided, then the '
+                                                     'workflows are listed by the server.')
+
+
+def __configure_serve_action_subparser(parser):
+    """
+    Configure the subparser for the serve action.
+
+    :param parser: Parser to which the subparser will be added.
+    """
+    serve_subparser = parser.add_parser('serve',
+                                        help='Serve the requests from the clients over the Unix domain socket.',
+                                        formatter_class=RawTextHelpFormatter)
+    __add_socket_parameter(serve_subparser, help_text='Path to the socket. If not provided, then '
+                                                      'WORKFLOWS_MANAGER_SOCKET environment variable, '
+                                                      '$XDG_RUNTIME_DIR/workflows-manager.sock, or the socket in the '
+                                                      'temporary directory is used.')
+    serve_subparser.add_argument('--max-workers', '-mw', type=int,
+                                 help='Maximum number of threads shared by all parallel steps in the workflow. If not '
+                                      'provided, then it depends on the number of CPUs.')
+    serve_subparser.add_argument('--process-workers', '-pw', type=int,
+                                 help='Maximum number of worker processes used to run the steps with the "process" '
+                                      'executor. If not provided, then the number of CPUs is used.')
+    serve_subparser.add_argument('--default-executor', '-de', type=str, choices=['thread', 'process'],
+                                 default='thread',
+                                 help='Executor used to run the normal steps that do not specify it in the '
+                                      'configuration. The "process" executor runs steps in the pool of worker '
+                                      'processes.')
+    serve_subparser.add_argument('--step-cache-max-size', '-scs', type=int,
+                                 help='Maximum size of the cache of the step results in bytes. The least recently used '
+                                      'results are evicted when it is exceeded. If not provided, then 256 MiB is used.')
+    __create_configuration_group(serve_subparser)
+    __create_logging_group(serve_subparser)
 
 
 def __configure_version_action_subparser(parser):
@@ -169,6 +271,7 @@ def __configure_action_subparsers(parser):
     __configure_run_action_subparser(action_subparsers)
     __configure_validate_action_subparser(action_subparsers)
     __configure_list_action_subparser(action_subparsers)
+    __configure_serve_action_subparser(action_subparsers)
     __configure_version_action_subparser(action_subparsers)
 
 
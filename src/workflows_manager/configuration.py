@@ -4,22 +4,52 @@ This module contains the implementation of the base components which are parsed
 import json
 import re
 from collections import Counter
-from dataclasses import field, dataclass
+from dataclasses import field, dataclass, InitVar
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Any, Union, Dict, Callable
+from typing import List, Optional, Any, Union, Dict, Callable, Type, Tuple
 
 import yaml
 
 from workflows_manager.exceptions import InvalidConfiguration
+from workflows_manager.utils.name_index import NameIndex, VersionedList
 
 PARAMETER_NAME_REGEX = re.compile(r'^[a-z0-9_]+$')
 WORKFLOW_NAME_REGEX = re.compile(r'^[a-z0-9_-]+$')
 
 
+def get_yaml_loader() -> Tuple[Type, str]:
+    """
+    Get the safe YAML loader. The C-accelerated loader is preferred, when PyYAML has been built with libyaml, otherwise
+    the pure-Python loader is used.
+
+    :return: The loader class and the name of its backend ('libyaml' or 'python').
+    :rtype: Tuple[Type, str]
+    """
+    loader = getattr(yaml, 'CSafeLoader', None)
+    if loader is None:
+        return yaml.SafeLoader, 'python'
+    return loader, 'libyaml'
+
+
+YAML_LOADER, YAML_BACKEND = get_yaml_loader()
+
+
 StepUnion = Union['NormalStep', 'WorkflowStep', 'ParallelStep']
 
 
+def load_yaml(content: str) -> Any:
+    """
+    Parse the YAML document using the fastest available safe loader.
+
+    :param content: The YAML document.
+    :type content: str
+    :return: The parsed document.
+    :rtype: Any
+    """
+    return yaml.load(content, Loader=YAML_LOADER)
+
+
 @dataclass
 class Parameter:
     """
@@ -114,6 +144,7 @@ class Steps:
     :type elements: List[Step]
     """
     elements: List[Union['NormalStep', 'WorkflowStep', 'ParallelStep']] = field(default_factory=list)
+    __dependencies: Dict[bool, List[List[int]]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __iter__(self):
         return iter(self.elements)
@@ -136,9 +167,101 @@ class Steps:
         except Exception as exception:
             raise InvalidConfiguration(f"Invalid steps configuration: {exception}") from exception
 
-    def validate_all(self):
+    def get_steps(self, step_type: 'StepType') -> List['Step']:
+        """
+        Get the steps of the provided type, including the steps embedded into the parallel steps.
+
+        :param step_type: The type of the steps.
+        :type step_type: StepType
+        :return: The steps of the provided type.
+        :rtype: List[Step]
+        """
+        steps = []
+        for step in self.elements:
+            if step.type == step_type:
+                steps.append(step)
+            if step.type == StepType.PARALLEL:
+                steps.extend(step.parallels.get_steps(step_type))
+        return steps
+
+    @property
+    def has_dependencies(self) -> bool:
+        """
+        Check whether any step in the list declares its dependencies.
+
+        :return: True, if at least one step has 'depends_on' attribute, otherwise False.
+        :rtype: bool
+        """
+        return any(step.depends_on is not None for step in self.elements)
+
+    def get_dependencies(self, sequential: bool = True) -> List[List[int]]:
+        """
+        Get the dependencies of the steps as indexes of the steps in the list. The result is computed on the first call
+        and reused afterward.
+
+        :param sequential: Flag that indicates whether the step without 'depends_on' attribute depends on the previous
+            step in the list (steps of the workflow) or does not depend on any step (steps of the parallel step).
+        :type sequential: bool
+        :raise InvalidConfiguration: If the step depends on a step that does not exist in the same steps context.
+        :return: The list of dependencies for each step, in the same order as the steps.
+        :rtype: List[List[int]]
+        """
+        if sequential in self.__dependencies:
+            return self.__dependencies[sequential]
+        indexes = {step.name: index for index, step in enumerate(self.elements)}
+        dependencies = []
+        for index, step in enumerate(self.elements):
+            if step.depends_on is None:
+                dependencies.append([index - 1] if sequential and index > 0 else [])
+                continue
+            step_dependencies = []
+            for name in step.depends_on:
+                if name not in indexes:
+                    raise InvalidConfiguration(
+                        f"Step '{step.name}' depends on step '{name}' that does not exist within the same steps "
+                        f"context.")
+                if indexes[name] == index:
+                    raise InvalidConfiguration(f"Step '{step.name}' cannot depend on itself.")
+                step_dependencies.append(indexes[name])
+            dependencies.append(step_dependencies)
+        self.__dependencies[sequential] = dependencies
+        return dependencies
+
+    def __validate_dependencies(self, sequential: bool):
+        """
+        Validate the dependencies between the steps. Check if all dependencies exist and there are no cycles.
+
+        :param sequential: Flag that indicates whether the step without 'depends_on' attribute depends on the previous
+            step in the list.
+        :type sequential: bool
+        :raise InvalidConfiguration: If the dependency does not exist or the dependencies contain a cycle.
+        """
+        dependencies = self.get_dependencies(sequential)
+        remaining = [len(set(step_dependencies)) for step_dependencies in dependencies]
+        dependents = [[] for _ in dependencies]
+        for index, step_dependencies in enumerate(dependencies):
+            for dependency in set(step_dependencies):
+                dependents[dependency].append(index)
+        ready = [index for index, count in enumerate(remaining) if count == 0]
+        visited = 0
+        while ready:
+            index = ready.pop()
+            visited += 1
+            for dependent in dependents[index]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if visited != len(dependencies):
+            names = ', '.join(f"'{self.elements[index].name}'" for index, count in enumerate(remaining) if count > 0)
+            raise InvalidConfiguration(f"Dependencies between steps contain a cycle: {names}.")
+
+    def validate_all(self, sequential: bool = True):
         """
         Validate all steps in the list.
+
+        :param sequential: Flag that indicates whether the step without 'depends_on' attribute depends on the previous
+            step in the list.
+        :type sequential: bool
         """
         if len(self.elements) == 0:
             raise InvalidConfiguration("Steps list cannot be empty.")
@@ -148,6 +271,8 @@ class Steps:
                 raise InvalidConfiguration(
                     f"Step with a name '{step.name}' occurs multiple times within the same steps context.")
             step.validate_all()
+        if self.has_dependencies:
+            self.__validate_dependencies(sequential)
 
 
 class StepType(Enum):
@@ -175,6 +300,55 @@ class StepType(Enum):
         raise InvalidConfiguration("Step type must be either 'normal', 'parallel', or 'workflow'.")
 
 
+class ExecutorType(Enum):
+    """
+    Enum class that represents the type of the executor used to run the normal step.
+    """
+    THREAD = 'thread'
+    PROCESS = 'process'
+
+    @staticmethod
+    def from_str(value: str) -> 'ExecutorType':
+        """
+        Convert string to ExecutorType enum.
+
+        :param value: String representation of the executor type.
+        :type value: str
+        :raise InvalidConfigurationException: If the executor type is not valid enum value.
+        :return: ExecutorType enum.
+        :rtype: ExecutorType
+        """
+        for executor_type in ExecutorType:
+            if executor_type.value == value:
+                return executor_type
+        raise InvalidConfiguration("Executor type must be either 'thread' or 'process'.")
+
+
+class CaptureMode(Enum):
+    """
+    Enum class that represents the way the captured output of the normal step is handled.
+    """
+    BUFFER = 'buffer'
+    STREAM = 'stream'
+    FD = 'fd'
+
+    @staticmethod
+    def from_str(value: str) -> 'CaptureMode':
+        """
+        Convert string to CaptureMode enum.
+
+        :param value: String representation of the capture mode.
+        :type value: str
+        :raise InvalidConfigurationException: If the capture mode is not valid enum value.
+        :return: CaptureMode enum.
+        :rtype: CaptureMode
+        """
+        for capture_mode in CaptureMode:
+            if capture_mode.value == value:
+                return capture_mode
+        raise InvalidConfiguration("Capture mode must be either 'buffer', 'stream' or 'fd'.")
+
+
 @dataclass
 class Step:
     """
@@ -186,10 +360,13 @@ class Step:
     :type parameters: Parameters
     :param stop_on_error: Flag that indicates whether the workflow should stop on error.
     :type stop_on_error: bool
+    :param depends_on: Names of the steps within the same steps context that must finish before the step starts.
+    :type depends_on: Optional[List[str]]
     """
     name: str
     parameters: Parameters = field(default_factory=Parameters)
     stop_on_error: bool = field(default=True)
+    depends_on: Optional[List[str]] = field(default=None)
     type: StepType = field(init=False)
 
     @classmethod
@@ -227,6 +404,10 @@ class Step:
         Validate the step. Check if the type is valid and if the step has all required attributes.
         """
         self.parameters.validate_all()
+        if self.depends_on is not None and (
+                not isinstance(self.depends_on, list) or
+                not all(isinstance(name, str) and name != '' for name in self.depends_on)):
+            raise InvalidConfiguration("Dependencies of the step must be a list of step names.")
 
 
 @dataclass
@@ -240,16 +421,52 @@ class NormalStep(Step):
     :type parameters: Parameters
     :param stop_on_error: Flag that indicates whether the workflow should stop on error.
     :type stop_on_error: bool
+    :param depends_on: Names of the steps within the same steps context that must finish before the step starts.
+    :type depends_on: Optional[List[str]]
     :param id: ID of the step (name of the step used when registering the step).
     :type id: Optional[str]
     :param capture_stdout: Flag that indicates whether the stdout should be captured.
     :type capture_stdout: bool
     :param capture_stderr: Flag that indicates whether the stderr should be captured.
     :type capture_stderr: bool
+    :param executor: Type of the executor used to run the step, if not provided, then the default executor is used.
+    :type executor: Optional[ExecutorType]
+    :param capture_head: Number of the first characters of the captured output stored in the status file.
+    :type capture_head: Optional[int]
+    :param capture_tail: Number of the last characters of the captured output stored in the status file.
+    :type capture_tail: Optional[int]
+    :param capture_archive: Flag that indicates whether the whole captured output should be stored in the gzip file
+        next to the status file.
+    :type capture_archive: bool
+    :param capture_mode: The way the captured output is handled, it is either stored in the status file, streamed to
+        the logger of the step, or captured from the file descriptors in the worker process.
+    :type capture_mode: CaptureMode
+    :param cache: Flag that indicates whether the result of the step should be cached, and reused by the runs with the
+        same parameters.
+    :type cache: bool
+    :param cache_ttl: Number of seconds the cached result is valid for, if not provided, then it never expires.
+    :type cache_ttl: Optional[float]
+    :param cache_version: Version of the step, changing it invalidates the cached results.
+    :type cache_version: Optional[str]
+    :param inputs: Glob patterns of the files read by the step.
+    :type inputs: Optional[List[str]]
+    :param outputs: Glob patterns of the files produced by the step, the step is skipped when neither its input nor
+        its output files have changed since it has succeeded.
+    :type outputs: Optional[List[str]]
     """
     id: Optional[str] = field(default=None)
     capture_stdout: bool = field(default=False)
     capture_stderr: bool = field(default=False)
+    executor: Optional[ExecutorType] = field(default=None)
+    capture_head: Optional[int] = field(default=None)
+    capture_tail: Optional[int] = field(default=None)
+    capture_archive: bool = field(default=False)
+    capture_mode: CaptureMode = field(default=CaptureMode.BUFFER)
+    cache: bool = field(default=False)
+    cache_ttl: Optional[float] = field(default=None)
+    cache_version: Optional[str] = field(default=None)
+    inputs: Optional[List[str]] = field(default=None)
+    outputs: Optional[List[str]] = field(default=None)
 
     def __post_init__(self):
         self.type = StepType.NORMAL
@@ -271,9 +488,20 @@ class NormalStep(Step):
                 'name': data.get('name'),
                 'parameters': Parameters.from_dict(data.get('parameters', [])),
                 'stop_on_error': data.get('stop_on_error', True),
+                'depends_on': data.get('depends_on'),
                 'id': data.get('step'),
                 'capture_stdout': data.get('capture_stdout', False),
                 'capture_stderr': data.get('capture_stderr', False),
+                'executor': ExecutorType.from_str(data['executor']) if data.get('executor') else None,
+                'capture_head': data.get('capture_head'),
+                'capture_tail': data.get('capture_tail'),
+                'capture_archive': data.get('capture_archive', False),
+                'capture_mode': CaptureMode.from_str(data.get('capture_mode', CaptureMode.BUFFER.value)),
+                'cache': data.get('cache', False),
+                'cache_ttl': data.get('cache_ttl'),
+                'cache_version': data.get('cache_version'),
+                'inputs': data.get('inputs'),
+                'outputs': data.get('outputs'),
             })
         except Exception as exception:
             raise InvalidConfiguration(f"Invalid step configuration: {exception}") from exception
@@ -285,6 +513,27 @@ class NormalStep(Step):
         super().validate_all()
         if self.id is None or self.id == '':
             raise InvalidConfiguration("Step ID cannot be empty.")
+        for name, limit in (('capture_head', self.capture_head), ('capture_tail', self.capture_tail)):
+            if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 0):
+                raise InvalidConfiguration(f"Step '{name}' must be a non-negative integer.")
+        if self.capture_mode == CaptureMode.STREAM and self.capture_archive:
+            raise InvalidConfiguration("Step with the 'stream' capture mode keeps only the head and the tail of the "
+                                       "output, so it cannot use 'capture_archive'.")
+        if self.capture_mode == CaptureMode.FD and self.executor == ExecutorType.THREAD:
+            raise InvalidConfiguration("Step with the 'fd' capture mode is run in the worker process, so it cannot use "
+                                       "the 'thread' executor.")
+        if self.cache_ttl is not None and (not isinstance(self.cache_ttl, (int, float)) or
+                                           isinstance(self.cache_ttl, bool) or self.cache_ttl < 0):
+            raise InvalidConfiguration("Step 'cache_ttl' must be a non-negative number.")
+        if self.cache and self.capture_archive:
+            raise InvalidConfiguration("Step with the cache does not archive the output of the cached results, so it "
+                                       "cannot use 'capture_archive'.")
+        for name, patterns in (('inputs', self.inputs), ('outputs', self.outputs)):
+            if patterns is not None and (not isinstance(patterns, list) or not patterns or
+                                         not all(isinstance(pattern, str) and pattern for pattern in patterns)):
+                raise InvalidConfiguration(f"Step '{name}' must be a non-empty list of glob patterns.")
+        if (self.inputs is None) != (self.outputs is None):
+            raise InvalidConfiguration("Step 'inputs' and 'outputs' must be provided together.")
 
 
 @dataclass
@@ -298,6 +547,8 @@ class WorkflowStep(Step):
     :type parameters: Parameters
     :param stop_on_error: Flag that indicates whether the workflow should stop on error.
     :type stop_on_error: bool
+    :param depends_on: Names of the steps within the same steps context that must finish before the step starts.
+    :type depends_on: Optional[List[str]]
     :param workflow: Name of the workflow that should be executed.
     :type workflow: Optional[str]
     """
@@ -323,6 +574,7 @@ class WorkflowStep(Step):
                 'name': data.get('name'),
                 'parameters': Parameters.from_dict(data.get('parameters', [])),
                 'stop_on_error': data.get('stop_on_error', True),
+                'depends_on': data.get('depends_on'),
                 'workflow': data.get('workflow'),
             })
         except Exception as exception:
@@ -348,10 +600,15 @@ class ParallelStep(Step):
     :type parameters: Parameters
     :param stop_on_error: Flag that indicates whether the workflow should stop on error.
     :type stop_on_error: bool
+    :param depends_on: Names of the steps within the same steps context that must finish before the step starts.
+    :type depends_on: Optional[List[str]]
     :param parallels: List of parallel steps.
     :type parallels: Steps
+    :param max_workers: Maximum number of parallel steps that can run at the same time.
+    :type max_workers: Optional[int]
     """
     parallels: Steps = field(default_factory=Steps)
+    max_workers: Optional[int] = field(default=None)
 
     def __post_init__(self):
         self.type = StepType.PARALLEL
@@ -371,7 +628,9 @@ class ParallelStep(Step):
                 'name': data.get('name'),
                 'parameters': Parameters.from_dict(data.get('parameters', [])),
                 'stop_on_error': data.get('stop_on_error', True),
+                'depends_on': data.get('depends_on'),
                 'parallels': Steps.from_dict(data.get('parallels', [])),
+                'max_workers': data.get('max_workers'),
             })
         except Exception as exception:
             raise InvalidConfiguration(f"Invalid step configuration: {exception}") from exception
@@ -381,7 +640,10 @@ class ParallelStep(Step):
         Validate the step. Check if the type is valid and if the step has all required attributes.
         """
         super().validate_all()
-        self.parallels.validate_all()
+        if self.max_workers is not None and (
+                isinstance(self.max_workers, bool) or not isinstance(self.max_workers, int) or self.max_workers < 1):
+            raise InvalidConfiguration("Maximum number of workers must be a positive integer.")
+        self.parallels.validate_all(sequential=False)
 
 
 @dataclass
@@ -433,44 +695,208 @@ class Workflow:
 @dataclass
 class Workflows:
     """
-    Class that represents a list of workflows.
+    Class that represents a list of workflows. When the workflows are loaded lazily, they are kept as raw dictionaries,
+    each workflow is created and validated on the first access.
 
     :param elements: List of workflows.
     :type elements: List[Workflow]
+    :param raw_workflows: The raw workflows by their names, when provided, the workflows are loaded lazily.
+    :type raw_workflows: Optional[Dict[str, Any]]
     """
     elements: List[Workflow]
+    raw_workflows: InitVar[Optional[Dict[str, Any]]] = None
+    __index: NameIndex = field(default_factory=NameIndex, init=False, repr=False, compare=False)
+    __raw_workflows: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    __lazy: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self, raw_workflows: Optional[Dict[str, Any]]):
+        self.__raw_workflows = dict(raw_workflows or {})
+        self.__lazy = raw_workflows is not None
+
+    def __setattr__(self, name: str, value: Any):
+        if name == 'elements' and not isinstance(value, VersionedList):
+            value = VersionedList(value)
+        super().__setattr__(name, value)
+
+    @property
+    def lazy(self) -> bool:
+        """
+        Check whether the workflows are loaded lazily.
+
+        :return: True, if the workflows are created on the first access, otherwise False.
+        :rtype: bool
+        """
+        return self.__lazy
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Get the names of all workflows, without creating the lazily loaded workflows.
+
+        :return: The names of the workflows, in the order of their definition.
+        :rtype: List[str]
+        """
+        names = list(self.__raw_workflows)
+        names.extend(workflow.name for workflow in self.elements if workflow.name not in self.__raw_workflows)
+        return names
+
+    def __materialize(self, name: str) -> Workflow:
+        """
+        Create and validate the lazily loaded workflow.
+
+        :param name: Name of the workflow.
+        :type name: str
+        :raise InvalidConfiguration: If the workflow configuration is invalid.
+        :return: The created workflow.
+        :rtype: Workflow
+        """
+        with self.__index.lock:
+            workflow = self.__index.get(self.elements, name)
+            if workflow is not None:
+                return workflow
+            try:
+                workflow = Workflow.from_dict(self.__raw_workflows[name])
+            except Exception as exception:
+                raise InvalidConfiguration(f"Invalid workflows configuration: {exception}") from exception
+            workflow.validate_all()
+            self.append(workflow)
+            return workflow
+
+    def __materialize_all(self):
+        """
+        Create and validate all lazily loaded workflows, the workflows are ordered as in the configuration.
+        """
+        if all(self.__index.get(self.elements, name) is not None for name in self.__raw_workflows):
+            return
+        for name in self.__raw_workflows:
+            self.__get_workflow(name)
+        positions = {name: position for position, name in enumerate(self.__raw_workflows)}
+        self.elements.sort(key=lambda workflow: positions.get(workflow.name, len(positions)))
+
+    def __get_workflow(self, name: str) -> Optional[Workflow]:
+        """
+        Get the workflow by its name, the lazily loaded workflow is created on the first access.
+
+        :param name: Name of the workflow.
+        :type name: str
+        :return: The workflow with the given name, or None if it does not exist.
+        :rtype: Optional[Workflow]
+        """
+        workflow = self.__index.get(self.elements, name)
+        if workflow is None and name in self.__raw_workflows:
+            workflow = self.__materialize(name)
+        return workflow
 
     def __iter__(self):
+        self.__materialize_all()
         return iter(self.elements)
 
     def __getitem__(self, item: Union[str, int]):
         if isinstance(item, int):
+            self.__materialize_all()
             return self.elements[item]
-        for workflow in self.elements:
-            if workflow.name == item:
-                return workflow
-        return None
+        return self.__get_workflow(item)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.__raw_workflows or self.__get_workflow(item) is not None
+
+    def append(self, workflow: Workflow):
+        """
+        Add the workflow to the end of the list.
+
+        :param workflow: The workflow to add.
+        :type workflow: Workflow
+        """
+        self.__index.append(self.elements, workflow)
+
+    def get_reachable_workflows(self, name: str) -> Optional[List[Workflow]]:
+        """
+        Get the workflow and the workflows reachable from it through the workflow steps. The workflows loaded lazily are
+        created only when they are reachable.
+
+        :param name: Name of the workflow.
+        :type name: str
+        :return: The reachable workflows, or None if at least one of the used workflows is not defined (e.g. the name
+            of the workflow is resolved from the parameters).
+        :rtype: Optional[List[Workflow]]
+        """
+        reachable_workflows = []
+        visited_workflows = set()
+        pending_workflows = [name]
+        while pending_workflows:
+            workflow_name = pending_workflows.pop()
+            if workflow_name in visited_workflows:
+                continue
+            visited_workflows.add(workflow_name)
+            workflow = self.__get_workflow(workflow_name)
+            if workflow is None:
+                return None
+            reachable_workflows.append(workflow)
+            pending_workflows.extend(step.workflow for step in workflow.steps.get_steps(StepType.WORKFLOW))
+        return reachable_workflows
+
+    def get_required_workflows(self, name: Optional[str]) -> List[Workflow]:
+        """
+        Get the workflows required to validate and run the workflow. When the workflows are loaded lazily and the name
+        of the workflow is provided, only the reachable workflows are required, otherwise all workflows.
+
+        :param name: Name of the workflow.
+        :type name: Optional[str]
+        :return: The required workflows.
+        :rtype: List[Workflow]
+        """
+        if name and self.__lazy:
+            reachable_workflows = self.get_reachable_workflows(name)
+            if reachable_workflows is not None:
+                return reachable_workflows
+        return list(self)
+
+    def remove(self, name: str):
+        """
+        Remove the workflow with the given name from the list.
+
+        :param name: Name of the workflow.
+        :type name: str
+        :raise KeyError: If the workflow does not exist.
+        """
+        is_declared = self.__raw_workflows.pop(name, None) is not None
+        workflow = self.__get_workflow(name)
+        if workflow is None and not is_declared:
+            raise KeyError(name)
+        if workflow is not None:
+            self.elements.remove(workflow)
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'Workflows':
+    def from_dict(cls, data: dict, lazy: bool = False) -> 'Workflows':
         """
         Create a new instance of the class from the dictionary.
 
         :param data: Dictionary with workflows data.
         :type data: dict
+        :param lazy: Flag that indicates whether the workflows should be created and validated on the first access.
+        :type lazy: bool
         :return: New instance of the class.
         :rtype: Workflows
         """
         try:
-            return cls([Workflow.from_dict({'name': workflow, **data[workflow]}) for workflow in data])
+            if not lazy:
+                return cls([Workflow.from_dict({'name': workflow, **data[workflow]}) for workflow in data])
+            raw_workflows = {}
+            for workflow in data:
+                workflow_data = data[workflow]
+                if isinstance(workflow_data, dict):
+                    workflow_data = {'name': workflow, **workflow_data}
+                    workflow = workflow_data['name']
+                raw_workflows.setdefault(workflow, workflow_data)
+            return cls([], raw_workflows)
         except Exception as exception:
             raise InvalidConfiguration(f"Invalid workflows configuration: {exception}") from exception
 
     def validate_all(self):
         """
-        Validate all workflows in the list.
+        Validate all workflows in the list. The lazily loaded workflows are validated on the first access.
         """
-        if len(self.elements) == 0:
+        if len(self.elements) == 0 and len(self.__raw_workflows) == 0:
             raise InvalidConfiguration("Workflows list cannot be empty.")
         for workflow in self.elements:
             workflow.validate_all()
@@ -490,25 +916,28 @@ class Configuration:
     parameters: Parameters = field(default_factory=Parameters)
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'Configuration':
+    def from_dict(cls, data: dict, lazy: bool = False) -> 'Configuration':
         """
         A method that creates a new instance of the class from the dictionary.
 
         :param data: Dictionary with configuration data.
         :type data: dict
+        :param lazy: Flag that indicates whether the workflows should be created and validated on the first access.
+        :type lazy: bool
         :return: New instance of the class.
         :rtype: Configuration
         """
         try:
             return cls(**{
-                'workflows': Workflows.from_dict(data['workflows']),
+                'workflows': Workflows.from_dict(data['workflows'], lazy),
                 'parameters': Parameters.from_dict(data.get('parameters', []))
             })
         except Exception as exception:
             raise InvalidConfiguration(f"Invalid configuration file: {exception}") from exception
 
     @classmethod
-    def __from_file(cls, file_path: Union[str, Path], parser: Callable[[Any], dict]) -> 'Configuration':
+    def __from_file(cls, file_path: Union[str, Path], parser: Callable[[Any], dict],
+                    lazy: bool = False) -> 'Configuration':
         """
         A method that creates a new instance of the class from the file.
 
@@ -516,6 +945,8 @@ class Configuration:
         :type file_path: Union[str, Path]
         :param parser: Function that parses the file.
         :type parser: Callable[[Any], dict]
+        :param lazy: Flag that indicates whether the workflows should be created and validated on the first access.
+        :type lazy: bool
         :return: New instance of the class.
         :rtype: Configuration
         """
@@ -523,31 +954,35 @@ class Configuration:
             file_path = Path(file_path).absolute()
         with Path(file_path).open('r', encoding='utf-8') as file:
             data = parser(file.read())
-            return cls.from_dict(data)
+            return cls.from_dict(data, lazy)
 
     @classmethod
-    def from_yaml(cls, file_path: Union[str, Path]) -> 'Configuration':
+    def from_yaml(cls, file_path: Union[str, Path], lazy: bool = False) -> 'Configuration':
         """
         A method that creates a new instance of the class from the YAML file.
 
         :param file_path: Path to the YAML file.
         :type file_path: Union[str, Path]
+        :param lazy: Flag that indicates whether the workflows should be created and validated on the first access.
+        :type lazy: bool
         :return: New instance of the class.
         :rtype: Configuration
         """
-        return cls.__from_file(file_path, yaml.safe_load)
+        return cls.__from_file(file_path, load_yaml, lazy)
 
     @classmethod
-    def from_json(cls, file_path: Union[str, Path]) -> 'Configuration':
+    def from_json(cls, file_path: Union[str, Path], lazy: bool = False) -> 'Configuration':
         """
         A method that creates a new instance of the class from the JSON file.
 
         :param file_path: Path to the JSON file.
         :type file_path: Union[str, Path]
+        :param lazy: Flag that indicates whether the workflows should be created and validated on the first access.
+        :type lazy: bool
         :return: New instance of the class.
         :rtype: Configuration
         """
-        return cls.__from_file(file_path, json.loads)
+        return cls.__from_file(file_path, json.loads, lazy)
 
     def validate_all(self):
         """
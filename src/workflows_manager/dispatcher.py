@@ -1,22 +1,37 @@
 """
 This module contains the classes and functions to dispatch and run workflows.
 """
-import importlib
+import copy
 import os
-import sys
 from enum import Enum
 from logging import getLogger, Logger
 from pathlib import Path
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Set
 
 from workflows_manager import configuration
 from workflows_manager import workflow
+from workflows_manager.configuration import Configuration, ExecutorType
+from workflows_manager.actions.batch import BatchItem, BatchRunner, load_batch_items, BATCH_STATUS_SUCCESS, \
+    BATCH_STATUS_FAILED, BATCH_STATUS_INVALID
 from workflows_manager.actions.list import ListWorkflows
+from workflows_manager.actions.plan import ExecutionPlan
+from workflows_manager.actions.process_executor import ProcessStepExecutor
 from workflows_manager.actions.runner import Runner
 from workflows_manager.actions.validator import Validator
-from workflows_manager.exceptions import UnknownOption, InvalidConfiguration
+from workflows_manager.exceptions import UnknownOption, InvalidConfiguration, InvalidParameter
+from workflows_manager.server import WorkflowServer, RESPONSE_STATUS_SUCCESS
+from workflows_manager.utils.cache import FileCache, get_content_key
+from workflows_manager.utils.fingerprint import FingerprintDatabase
+from workflows_manager.utils.step_cache import DEFAULT_MAX_SIZE, StepCache
+from workflows_manager.utils.module_loader import DEFAULT_EXCLUDE_PATTERNS, ModuleLoader, add_import_path, \
+    collect_module_files, get_combined_patterns, get_module_name
+from workflows_manager.utils.step_index import StepIndex
 
 MODULE_IMPORTS_ENVIRONMENT_VARIABLE = 'WORKFLOWS_MANAGER_IMPORTS'
+MODULE_IMPORTS_INCLUDE_ENVIRONMENT_VARIABLE = 'WORKFLOWS_MANAGER_IMPORTS_INCLUDE'
+MODULE_IMPORTS_EXCLUDE_ENVIRONMENT_VARIABLE = 'WORKFLOWS_MANAGER_IMPORTS_EXCLUDE'
+CONFIGURATION_CACHE_NAMESPACE = 'configurations'
+LAZY_CONFIGURATION_CACHE_NAMESPACE = 'lazy-configurations'
 
 
 class DispatcherAction(Enum):
@@ -26,6 +41,7 @@ class DispatcherAction(Enum):
     VALIDATE = 'validate'
     RUN = 'run'
     LIST = 'list'
+    SERVE = 'serve'
 
     @staticmethod
     def from_str(action: str) -> 'DispatcherAction':
@@ -53,62 +69,107 @@ class WorkflowDispatcher:
     :ivar imports: The paths to the packages with modules.
     :vartype imports: List[Path]
     :ivar configuration: The configuration of the workflows.
-    :vartype configuration: configuration.Configuration
+    :vartype configuration: Configuration
     :ivar workflow_name: The name of the workflow to run.
     :vartype workflow_name: str
     :ivar status_file: The path to the file where the statuses of the particular steps will be stored.
     :vartype status_file: Path
+    :ivar parameters: The parameters provided to the workflow from command line arguments.
+    :vartype parameters: Dict[str, Any]
+    :ivar max_workers: The maximum number of threads used to run the parallel steps.
+    :vartype max_workers: Optional[int]
+    :ivar default_executor: The executor used to run the normal steps that do not specify it.
+    :vartype default_executor: ExecutorType
+    :ivar cache_directory: The path to the directory where the step index is cached.
+    :vartype cache_directory: Optional[Path]
+    :ivar disable_step_index: True if all modules from the import paths should be imported, instead of the modules
+        that register the required steps.
+    :vartype disable_step_index: bool
+    :ivar import_include_patterns: The glob patterns of the module files to import, if not provided, then all module
+        files are imported.
+    :vartype import_include_patterns: Optional[List[str]]
+    :ivar import_exclude_patterns: The glob patterns of the files and directories that are not imported.
+    :vartype import_exclude_patterns: Optional[List[str]]
+    :ivar import_workers: The maximum number of top-level packages imported concurrently, if not provided, then the
+        modules are imported sequentially.
+    :vartype import_workers: Optional[int]
+    :ivar import_timings: True if the report with the import time of each module should be logged, otherwise False.
+    :vartype import_timings: bool
+    :ivar socket_path: The path to the socket used by the serve action, if not provided, then the default path is used.
+    :vartype socket_path: Optional[Path]
+    :ivar execution_plans: The compiled workflows by their names, shared by all requests handled by the server. If not
+        provided, then the workflow is compiled by the runner.
+    :vartype execution_plans: Optional[Dict[str, ExecutionPlan]]
+    :ivar batch_items: The workflows with their parameters run by the run action instead of the single workflow.
+    :vartype batch_items: Optional[List[BatchItem]]
+    :ivar batch_concurrency: The maximum number of the batch items that run at the same time.
+    :vartype batch_concurrency: int
+    :ivar batch_output_directory: The directory for the status files of the batch items.
+    :vartype batch_output_directory: Optional[Path]
+    :ivar resume_file: The status file of the previous run, the steps that have succeeded in it are not run again.
+    :vartype resume_file: Optional[Path]
+    :ivar step_cache: The cache of the results of the steps, shared by all runs of the dispatcher. If not provided, then
+        the runner uses the default cache.
+    :vartype step_cache: Optional[StepCache]
+    :ivar fingerprint_database: The fingerprints of the input and output files of the steps, shared by all runs of the
+        dispatcher. If not provided, then the runner uses the default database.
+    :vartype fingerprint_database: Optional[FingerprintDatabase]
+    :ivar process_executor: The warm pool of worker processes, shared by all runs of the dispatcher (e.g. the requests
+        handled by the server and the items of the batch). If not provided, then each run creates its own pool.
+    :vartype process_executor: Optional[ProcessStepExecutor]
     """
     logger: Logger
     imports: List[Path]
-    configuration: configuration.Configuration
+    configuration: Configuration
     workflow_name: str
     status_file: Optional[Path]
     parameters: Dict[str, Any]
-
-    @staticmethod
-    def __collect_modules_from_path(path: Path) -> List[str]:
-        """
-        A method to collect the modules from the provided path.
+    max_workers: Optional[int]
+    default_executor: ExecutorType
+    cache_directory: Optional[Path]
+    disable_step_index: bool
+    import_include_patterns: Optional[List[str]]
+    import_exclude_patterns: Optional[List[str]]
+    import_workers: Optional[int]
+    import_timings: bool
+    socket_path: Optional[Path]
+    execution_plans: Optional[Dict[str, ExecutionPlan]]
+    batch_items: Optional[List[BatchItem]]
+    batch_concurrency: int
+    batch_output_directory: Optional[Path]
+    resume_file: Optional[Path]
+    step_cache: Optional[StepCache]
+    fingerprint_database: Optional[FingerprintDatabase]
+    process_executor: Optional[ProcessStepExecutor]
+
+    def __collect_modules_from_path(self, path: Path) -> List[str]:
+        """
+        A method to collect the modules from the provided path, that match the import patterns.
 
         :param path: The path to the package with modules.
         :type path: Path
         :return: The modules from the provided path.
         :rtype: List[str]
         """
-        modules = []
-        for root, _, files in os.walk(path):
-            for file in files:
-                full_path = Path(root, file)
-                if full_path.suffix != '.py':
-                    continue
-                relative_path = str(full_path.relative_to(path))
-                relative_path = relative_path.replace('.py', '')
-                module_path = relative_path.replace(os.sep, '.')
-                modules.append(module_path)
-        return modules
-
-    def __load_modules(self, package_path: Path):
-        """
-        A method to load the modules from the provided path.
-
-        :param package_path: The path to the package with modules.
-        :type package_path: Path
-        """
-        if not package_path.exists():
-            self.logger.warning(f"Path {str(package_path)} does not exist, skipping it")
-            return
-        if not package_path.is_dir():
-            self.logger.warning(f"Path {str(package_path)} is not a directory, skipping it")
-            return
-        if str(package_path) not in sys.path:
-            self.logger.info(f"Adding {package_path} to sys.path")
-            sys.path.append(str(package_path))
-        self.logger.info(f"Importing modules from {package_path}")
-        for module in self.__collect_modules_from_path(package_path):
-            self.logger.info(f"Importing module {module}")
-            importlib.import_module(module)
-        self.logger.info(f"All modules from {package_path} have been imported")
+        module_files = collect_module_files(path, self.import_include_patterns, self.import_exclude_patterns)
+        return [get_module_name(module_file) for module_file in module_files]
+
+    def __import_modules(self, modules: List[str]):
+        """
+        A method to import the modules. When the import timings are enabled, the report with the slowest imports is
+        logged after the import.
+
+        :param modules: The names of the modules.
+        :type modules: List[str]
+        """
+        module_loader = ModuleLoader(self.logger, self.import_workers)
+        try:
+            module_loader.import_modules(list(dict.fromkeys(modules)))
+        finally:
+            if self.import_timings:
+                self.logger.info("Import timings (slowest first):")
+                for line in module_loader.report():
+                    self.logger.info("  %s", line)
 
     def __load_packages(self, import_paths: List[Path]):
         """
@@ -118,31 +179,183 @@ class WorkflowDispatcher:
         :type import_paths: List[Path]
         """
         self.logger.info("Importing packages")
+        modules = []
         for import_path in import_paths:
-            self.__load_modules(import_path)
+            if not add_import_path(import_path, self.logger):
+                continue
+            self.logger.info("Collecting modules from %s", import_path)
+            modules.extend(self.__collect_modules_from_path(import_path))
+        self.__import_modules(modules)
         self.logger.info("All packages have been imported")
 
-    def validate(self):
+    def __collect_required_steps(self, action: DispatcherAction) -> Set[str]:
+        """
+        A method to collect the names of the steps required by the action, that have not been registered yet (neither
+        directly nor through the entry points).
+
+        :param action: The action to perform.
+        :type action: DispatcherAction
+        :return: The names of the steps.
+        :rtype: Set[str]
+        """
+        if action not in (DispatcherAction.VALIDATE, DispatcherAction.RUN, DispatcherAction.SERVE):
+            return set()
+        step_names = set()
+        workflow_names = [self.workflow_name]
+        if self.batch_items is not None:
+            workflow_names = sorted({item.workflow_name for item in self.batch_items})
+        for workflow_name in workflow_names:
+            for workflow_configuration in self.configuration.workflows.get_required_workflows(workflow_name):
+                for step in workflow_configuration.steps.get_steps(configuration.StepType.NORMAL):
+                    step_names.add(step.id)
+        return {step_name for step_name in step_names if step_name not in workflow.steps.steps_register}
+
+    def __load_indexed_packages(self, import_paths: List[Path], step_names: Set[str]):
+        """
+        A method to load only the modules that register the required steps. The modules are found using the step
+        index, if any of the steps cannot be found, then all modules from the provided paths are loaded.
+
+        :param import_paths: The paths to the packages with modules.
+        :type import_paths: List[Path]
+        :param step_names: The names of the required steps.
+        :type step_names: Set[str]
+        """
+        if not step_names:
+            self.logger.info("All required steps have been registered, skipping import of packages")
+            return
+        modules = []
+        missing_steps = set(step_names)
+        for import_path in import_paths:
+            if not add_import_path(import_path, self.logger):
+                continue
+            self.logger.info("Indexing steps from %s", import_path)
+            step_index = StepIndex(import_path, self.cache_directory, self.logger, self.import_include_patterns,
+                                   self.import_exclude_patterns).build()
+            path_modules, path_missing_steps = step_index.find_modules(step_names)
+            modules.extend(path_modules)
+            missing_steps.intersection_update(path_missing_steps)
+        if missing_steps:
+            self.logger.info("Steps %s have not been found in the step index, importing all modules",
+                             sorted(missing_steps))
+            self.__load_packages(import_paths)
+            return
+        self.__import_modules(modules)
+        self.logger.info("All required modules have been imported")
+
+    def validate(self) -> bool:
         """
         A method to validate the configuration provided to the dispatcher.
+
+        :return: True if the configuration is valid, otherwise False.
+        :rtype: bool
         """
         validator = Validator(self.logger.getChild('validator'), self.configuration, self.workflow_name,
                               self.parameters)
         return validator.validate()
 
-    def run(self):
+    def run_workflow(self) -> bool:
         """
-        A method to run the workflow.
+        A method to run the validated workflow.
+
+        :return: True if the workflow has succeeded, otherwise False.
+        :rtype: bool
         """
-        is_valid = self.validate()
-        if not is_valid:
-            self.logger.error('Dispatcher cannot be started due to validation errors')
-            return
         runner = Runner(self.logger.getChild(workflow.Step.DEFAULT_LOGGER_PREFIX), self.configuration,
                         self.workflow_name, self.parameters)
         if self.status_file:
             runner.status_file = self.status_file
-        runner.run()
+        runner.resume_file = self.resume_file
+        if self.step_cache is not None:
+            runner.step_cache = self.step_cache
+        if self.fingerprint_database is not None:
+            runner.fingerprint_database = self.fingerprint_database
+        runner.max_workers = self.max_workers
+        runner.process_executor = self.process_executor
+        runner.default_executor = self.default_executor
+        if self.execution_plans is not None:
+            runner.execution_plan = self.execution_plans.get(self.workflow_name)
+        is_successful = runner.run()
+        if self.execution_plans is not None:
+            self.execution_plans[self.workflow_name] = runner.execution_plan
+        return is_successful
+
+    def run(self) -> bool:
+        """
+        A method to run the workflow, or all workflows from the batch.
+
+        :return: True if the workflow has succeeded, otherwise False (validation errors or failed workflow).
+        :rtype: bool
+        """
+        if self.batch_items is not None:
+            return self.run_batch()
+        is_valid = self.validate()
+        if not is_valid:
+            self.logger.error('Dispatcher cannot be started due to validation errors')
+            return False
+        return self.run_workflow()
+
+    def __create_request_dispatcher(self, workflow_name: Optional[str], parameters: Dict[str, Any],
+                                    status_file: Optional[Union[str, Path]],
+                                    resume_file: Optional[Union[str, Path]] = None) -> 'WorkflowDispatcher':
+        """
+        A method to create the copy of the dispatcher for the single request. The imported modules, the parsed
+        configuration, and the compiled workflows are shared, as the runs do not modify them.
+
+        :param workflow_name: The name of the workflow.
+        :type workflow_name: Optional[str]
+        :param parameters: The parameters of the workflow.
+        :type parameters: Dict[str, Any]
+        :param status_file: The path to the status file.
+        :type status_file: Optional[Union[str, Path]]
+        :param resume_file: The path to the status file of the previous run.
+        :type resume_file: Optional[Union[str, Path]]
+        :raise InvalidConfiguration: If the workflow does not exist in the configuration.
+        :return: The copy of the dispatcher.
+        :rtype: WorkflowDispatcher
+        """
+        if workflow_name and workflow_name not in self.configuration.workflows:
+            raise InvalidConfiguration(f"Workflow '{workflow_name}' is not defined in the configuration file")
+        request_dispatcher = copy.copy(self)
+        request_dispatcher.imports = []
+        request_dispatcher.batch_items = None
+        request_dispatcher.workflow_name = workflow_name
+        request_dispatcher.parameters = parameters
+        request_dispatcher.status_file = Path(status_file) if status_file else None
+        request_dispatcher.resume_file = Path(resume_file) if resume_file else None
+        return request_dispatcher
+
+    def __run_batch_item(self, item: BatchItem, status_file: Optional[Path]) -> str:
+        """
+        A method to validate and run the workflow of the batch item.
+
+        :param item: The batch item.
+        :type item: BatchItem
+        :param status_file: The path to the status file of the item.
+        :type status_file: Optional[Path]
+        :return: The status of the batch item.
+        :rtype: str
+        """
+        item_dispatcher = self.__create_request_dispatcher(item.workflow_name, {**self.parameters, **item.parameters},
+                                                           status_file)
+        if not item_dispatcher.validate():
+            return BATCH_STATUS_INVALID
+        return BATCH_STATUS_SUCCESS if item_dispatcher.run_workflow() else BATCH_STATUS_FAILED
+
+    def run_batch(self) -> bool:
+        """
+        A method to run the workflows from the batch. The parameters of the batch item override the parameters of the
+        dispatcher, the summary of the batch is stored in the status file.
+
+        :return: True if all batch items have succeeded, otherwise False.
+        :rtype: bool
+        """
+        if self.execution_plans is None:
+            self.execution_plans = {}
+        batch_runner = BatchRunner(self.logger.getChild('batch'), self.batch_items, self.batch_concurrency,
+                                   self.batch_output_directory)
+        batch_runner.summary_file = self.status_file
+        summary = batch_runner.run(self.__run_batch_item)
+        return summary['failed'] == 0
 
     def list(self):
         """
@@ -151,22 +364,74 @@ class WorkflowDispatcher:
         list_workflows = ListWorkflows(self.logger.getChild('list'), self.configuration)
         list_workflows.list()
 
-    def dispatch(self, action: DispatcherAction):
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        A method to handle the request received by the server. Each request is dispatched by its own copy of the
+        dispatcher.
+
+        :param request: The request with the action, and optionally the workflow name, parameters, status file and
+            resume file.
+        :type request: Dict[str, Any]
+        :raise UnknownOption: If the action cannot be requested.
+        :raise InvalidConfiguration: If the workflow does not exist in the configuration.
+        :return: The response with the result of the action.
+        :rtype: Dict[str, Any]
+        """
+        action = DispatcherAction.from_str(request.get('action', ''))
+        self.logger.info("Received %s request", action.value)
+        if action == DispatcherAction.SERVE:
+            raise UnknownOption(f"Action cannot be requested: {action.value}")
+        if action == DispatcherAction.LIST:
+            return {'status': RESPONSE_STATUS_SUCCESS, 'result': self.configuration.workflows.names}
+        request_dispatcher = self.__create_request_dispatcher(request.get('workflow_name'),
+                                                              request.get('parameters') or {},
+                                                              request.get('status_file'),
+                                                              request.get('resume_file'))
+        return {'status': RESPONSE_STATUS_SUCCESS, 'result': request_dispatcher.dispatch(action)}
+
+    def serve(self):
+        """
+        A method to serve the requests over the Unix domain socket until the server is stopped.
+        """
+        if self.execution_plans is None:
+            self.execution_plans = {}
+        server = WorkflowServer(self.handle_request, self.socket_path, self.logger.getChild('server'))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.logger.info("Server interrupted")
+
+    def close(self):
+        """
+        A method to release the resources shared by all runs of the dispatcher (e.g. stop the worker processes).
+        """
+        if self.process_executor is not None:
+            self.process_executor.shutdown()
+
+    def dispatch(self, action: DispatcherAction) -> Optional[bool]:
         """
         A method to dispatch the workflow.
 
         :param action: The action to perform.
         :type action: DispatcherAction
+        :return: The result of the validate and run actions, otherwise None.
+        :rtype: Optional[bool]
         """
-        self.__load_packages(self.imports)
+        if self.disable_step_index:
+            self.__load_packages(self.imports)
+        else:
+            self.__load_indexed_packages(self.imports, self.__collect_required_steps(action))
         if action == DispatcherAction.VALIDATE:
-            self.validate()
-        elif action == DispatcherAction.RUN:
-            self.run()
-        elif action == DispatcherAction.LIST:
+            return self.validate()
+        if action == DispatcherAction.RUN:
+            return self.run()
+        if action == DispatcherAction.LIST:
             self.list()
+        elif action == DispatcherAction.SERVE:
+            self.serve()
         else:
             self.logger.error(f"Unknown action: {action}")
+        return None
 
 
 class ConfigurationFormat(Enum):
@@ -189,9 +454,45 @@ class WorkflowDispatcherBuilder:
     __workflow_name: str
     __status_file: Optional[Path]
     __parameters: Dict[str, Any]
+    __max_workers: Optional[int]
+    __process_workers: Optional[int]
+    __default_executor: configuration.ExecutorType
+    __cache_directory: Optional[Path]
+    __disable_configuration_cache: bool
+    __lazy_configuration: bool
+    __disable_step_index: bool
+    __import_include_patterns: List[str]
+    __import_exclude_patterns: List[str]
+    __disable_default_import_excludes: bool
+    __import_workers: Optional[int]
+    __import_timings: bool
+    __socket_path: Optional[Path]
+    __batch_items: Optional[List[BatchItem]]
+    __batch_concurrency: int
+    __batch_output_directory: Optional[Path]
+    __resume_file: Optional[Path]
+    __step_cache_max_size: int
 
     def __init__(self):
         self.__logger = getLogger(__name__)
+        self.__max_workers = None
+        self.__process_workers = None
+        self.__default_executor = configuration.ExecutorType.THREAD
+        self.__cache_directory = None
+        self.__disable_configuration_cache = False
+        self.__lazy_configuration = False
+        self.__disable_step_index = False
+        self.__import_include_patterns = []
+        self.__import_exclude_patterns = []
+        self.__disable_default_import_excludes = False
+        self.__import_workers = None
+        self.__import_timings = False
+        self.__socket_path = None
+        self.__batch_items = None
+        self.__batch_concurrency = 1
+        self.__batch_output_directory = None
+        self.__resume_file = None
+        self.__step_cache_max_size = DEFAULT_MAX_SIZE
 
     def logger(self, logger: Logger) -> 'WorkflowDispatcherBuilder':
         """
@@ -311,6 +612,260 @@ class WorkflowDispatcherBuilder:
         self.__parameters = parameters
         return self
 
+    def max_workers(self, max_workers: Optional[int]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the maximum number of threads used to run the parallel steps.
+
+        :param max_workers: The maximum number of threads, if not provided, then the default pool size is used.
+        :type max_workers: Optional[int]
+        :raise InvalidParameter: If the maximum number of threads is not a positive integer.
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if max_workers is not None and max_workers < 1:
+            raise InvalidParameter("Maximum number of workers must be a positive integer.")
+        self.__max_workers = max_workers
+        return self
+
+    def process_workers(self, process_workers: Optional[int]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the maximum number of worker processes used to run the steps with the 'process' executor.
+
+        :param process_workers: The maximum number of worker processes, if not provided, then the number of CPUs is
+            used.
+        :type process_workers: Optional[int]
+        :raise InvalidParameter: If the maximum number of worker processes is not a positive integer.
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if process_workers is not None and process_workers < 1:
+            raise InvalidParameter("Maximum number of worker processes must be a positive integer.")
+        self.__process_workers = process_workers
+        return self
+
+    def step_cache_max_size(self, max_size: Optional[int]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the maximum size of the cache of the step results, the least recently used results are evicted
+        when it is exceeded.
+
+        :param max_size: The maximum size in bytes, if not provided, then the default size is used.
+        :type max_size: Optional[int]
+        :raise InvalidParameter: If the maximum size is not a positive integer.
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if max_size is not None and max_size < 1:
+            raise InvalidParameter("Maximum size of the step cache must be a positive integer.")
+        self.__step_cache_max_size = max_size or DEFAULT_MAX_SIZE
+        return self
+
+    def default_executor(self, default_executor: Optional[str]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the executor used to run the normal steps that do not specify it.
+
+        :param default_executor: The type of the executor ('thread' or 'process'), if not provided, then the steps
+            are run in threads.
+        :type default_executor: Optional[str]
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if default_executor is None:
+            self.__default_executor = configuration.ExecutorType.THREAD
+        else:
+            self.__default_executor = configuration.ExecutorType.from_str(default_executor)
+        return self
+
+    def cache_directory(self, cache_directory: Optional[Union[str, Path]]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the directory where the cached data is stored.
+
+        :param cache_directory: The path to the cache directory, if not provided, then the default cache directory is
+            used.
+        :type cache_directory: Optional[Union[str, Path]]
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if isinstance(cache_directory, str):
+            cache_directory = Path(cache_directory).absolute().resolve()
+        self.__cache_directory = cache_directory
+        return self
+
+    def disable_configuration_cache(self, disable: bool) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to disable the cache of the parsed and validated configuration.
+
+        :param disable: True if the configuration cache should be disabled, otherwise False.
+        :type disable: bool
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__disable_configuration_cache = disable
+        return self
+
+    def lazy_configuration(self, lazy: bool) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to enable the lazy loading of the workflows. Only the workflows that are accessed (e.g. the workflow to
+        run and the workflows reachable from it) are created and validated.
+
+        :param lazy: True if the workflows should be loaded lazily, otherwise False.
+        :type lazy: bool
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__lazy_configuration = lazy
+        return self
+
+    def disable_step_index(self, disable: bool) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to disable the step index. When the step index is disabled, all modules from the import paths are
+        imported, instead of the modules that register the required steps.
+
+        :param disable: True if the step index should be disabled, otherwise False.
+        :type disable: bool
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__disable_step_index = disable
+        return self
+
+    def import_include(self, patterns: Optional[List[str]]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the glob patterns of the module files to import.
+
+        :param patterns: The glob patterns of the module files, if not provided, then all module files are imported.
+        :type patterns: Optional[List[str]]
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__import_include_patterns = list(patterns or [])
+        return self
+
+    def import_exclude(self, patterns: Optional[List[str]]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the glob patterns of the files and directories that are not imported. The patterns are used in
+        addition to the default exclude patterns.
+
+        :param patterns: The glob patterns of the files and directories.
+        :type patterns: Optional[List[str]]
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__import_exclude_patterns = list(patterns or [])
+        return self
+
+    def disable_default_import_excludes(self, disable: bool) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to disable the default exclude patterns (e.g. '.git', '.venv', 'node_modules', 'build').
+
+        :param disable: True if the default exclude patterns should not be used, otherwise False.
+        :type disable: bool
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__disable_default_import_excludes = disable
+        return self
+
+    def import_workers(self, import_workers: Optional[int]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the maximum number of top-level packages imported concurrently.
+
+        :param import_workers: The maximum number of top-level packages imported concurrently, if not provided, then
+            the modules are imported sequentially.
+        :type import_workers: Optional[int]
+        :raise InvalidParameter: If the number of import workers is lower than 1.
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if import_workers is not None and import_workers < 1:
+            raise InvalidParameter(f"Number of import workers must be greater than 0, got: {import_workers}")
+        self.__import_workers = import_workers
+        return self
+
+    def import_timings(self, enable: bool) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to enable the report with the import time of each module.
+
+        :param enable: True if the report should be logged, otherwise False.
+        :type enable: bool
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__import_timings = enable
+        return self
+
+    def socket_path(self, socket_path: Optional[Union[str, Path]]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the path to the socket used by the serve action.
+
+        :param socket_path: The path to the socket, if not provided, then the default path is used.
+        :type socket_path: Optional[Union[str, Path]]
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if isinstance(socket_path, str):
+            socket_path = Path(socket_path).absolute()
+        self.__socket_path = socket_path
+        return self
+
+    def batch_file(self, batch_file: Optional[Union[str, Path]]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the batch file with the workflows to run. Each line of the file is a JSON object with the
+        'workflow_name', and optionally the 'parameters' and the 'status_file' of the run.
+
+        :param batch_file: The path to the batch file, if not provided, then the single workflow is run.
+        :type batch_file: Optional[Union[str, Path]]
+        :raise InvalidConfiguration: If any line of the batch file is not a valid batch item.
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        self.__batch_items = load_batch_items(batch_file) if batch_file else None
+        return self
+
+    def batch_concurrency(self, batch_concurrency: Optional[int]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the maximum number of the batch items that run at the same time.
+
+        :param batch_concurrency: The maximum number of the batch items that run at the same time, if not provided,
+            then the items run one by one.
+        :type batch_concurrency: Optional[int]
+        :raise InvalidParameter: If the batch concurrency is lower than 1.
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if batch_concurrency is not None and batch_concurrency < 1:
+            raise InvalidParameter(f"Batch concurrency must be greater than 0, got: {batch_concurrency}")
+        self.__batch_concurrency = batch_concurrency or 1
+        return self
+
+    def batch_output_directory(self, batch_output_directory: Optional[Union[str, Path]]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the directory for the status files of the batch items.
+
+        :param batch_output_directory: The path to the directory, if not provided, then only the batch items with the
+            'status_file' create the status files.
+        :type batch_output_directory: Optional[Union[str, Path]]
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if isinstance(batch_output_directory, str):
+            batch_output_directory = Path(batch_output_directory).absolute()
+        self.__batch_output_directory = batch_output_directory
+        return self
+
+    def resume_file(self, resume_file: Optional[Union[str, Path]]) -> 'WorkflowDispatcherBuilder':
+        """
+        A method to set the status file of the previous run, the steps that have succeeded in it are not run again.
+
+        :param resume_file: The path to the status file of the previous run, if not provided, then all steps are run.
+        :type resume_file: Optional[Union[str, Path]]
+        :return: WorkflowDispatcherBuilder instance.
+        :rtype: WorkflowDispatcherBuilder
+        """
+        if isinstance(resume_file, str):
+            resume_file = Path(resume_file).absolute()
+        self.__resume_file = resume_file
+        return self
+
     def __get_combined_imports(self) -> List[Path]:
         """
         A method to get the combined imports (current path, imports from the environment, and provided imports).
@@ -331,41 +886,105 @@ class WorkflowDispatcherBuilder:
             import_paths.append(import_path)
         return import_paths
 
+    def __parse_configuration(self) -> configuration.Configuration:
+        """
+        A method to parse and validate the configuration file.
+
+        :raise UnknownOption: If the configuration file format is unknown.
+        :return: The validated configuration.
+        :rtype: configuration.Configuration
+        """
+        if self.__configuration_file_format == ConfigurationFormat.JSON:
+            workflows_configuration = configuration.Configuration.from_json(self.__configuration_file,
+                                                                            lazy=self.__lazy_configuration)
+        elif self.__configuration_file_format == ConfigurationFormat.YAML:
+            self.__logger.debug("Parsing YAML configuration using %s loader", configuration.YAML_BACKEND)
+            workflows_configuration = configuration.Configuration.from_yaml(self.__configuration_file,
+                                                                            lazy=self.__lazy_configuration)
+        else:
+            raise UnknownOption(f"Unknown configuration file format: {self.__configuration_file_format}")
+        workflows_configuration.validate_all()
+        return workflows_configuration
+
+    def __load_configuration(self) -> configuration.Configuration:
+        """
+        A method to load the configuration. If the configuration file has not changed since the last run, then the
+        configuration is loaded from the cache, skipping the parsing and the validation.
+
+        :raise UnknownOption: If the configuration file format is unknown.
+        :return: The validated configuration.
+        :rtype: configuration.Configuration
+        """
+        if self.__disable_configuration_cache or not isinstance(self.__configuration_file_format, ConfigurationFormat):
+            return self.__parse_configuration()
+        namespace = LAZY_CONFIGURATION_CACHE_NAMESPACE if self.__lazy_configuration else CONFIGURATION_CACHE_NAMESPACE
+        cache = FileCache(namespace, self.__cache_directory, self.__logger)
+        key = get_content_key(Path(self.__configuration_file).read_bytes())
+        workflows_configuration = cache.load(self.__configuration_file, key)
+        if workflows_configuration is not None:
+            self.__logger.debug("Configuration loaded from the cache: %s", cache.directory)
+            return workflows_configuration
+        workflows_configuration = self.__parse_configuration()
+        cache.store(self.__configuration_file, key, workflows_configuration)
+        return workflows_configuration
+
     @staticmethod
     def __check_workflow_exists(dispatcher: WorkflowDispatcher):
         """
-        A method to check if the workflow exists in the configuration.
+        A method to check if the workflow, and the workflows of the batch, exist in the configuration.
 
         :param dispatcher: The workflow dispatcher.
         :type dispatcher: WorkflowDispatcher
         :raise InvalidConfiguration: If the workflow does not exist in the configuration.
         """
-        available_workflows = [workflow_configuration.name for workflow_configuration in
-                               dispatcher.configuration.workflows.elements]
-        if dispatcher.workflow_name and dispatcher.workflow_name not in available_workflows:
+        if dispatcher.workflow_name and dispatcher.workflow_name not in dispatcher.configuration.workflows:
             raise InvalidConfiguration(
                 f"Workflow '{dispatcher.workflow_name}' is not defined in the configuration file")
+        for item in dispatcher.batch_items or []:
+            if item.workflow_name not in dispatcher.configuration.workflows:
+                raise InvalidConfiguration(f"Workflow '{item.workflow_name}' from line {item.line} of the batch file "
+                                           f"is not defined in the configuration file")
 
     def build(self) -> WorkflowDispatcher:
         """
         A method to build the workflow dispatcher.
 
         :raise InvalidConfiguration: If the workflow does not exist in the configuration.
+        :raise InvalidParameter: If the resume file is provided together with the batch file.
         :return: WorkflowDispatcher instance.
         :rtype: WorkflowDispatcher
         """
+        if self.__resume_file is not None and self.__batch_items is not None:
+            raise InvalidParameter("Resume file cannot be used with the batch file")
         dispatcher = WorkflowDispatcher()
         dispatcher.logger = self.__logger
         dispatcher.imports = self.__get_combined_imports()
-        if self.__configuration_file_format == ConfigurationFormat.JSON:
-            dispatcher.configuration = configuration.Configuration.from_json(self.__configuration_file)
-        elif self.__configuration_file_format == ConfigurationFormat.YAML:
-            dispatcher.configuration = configuration.Configuration.from_yaml(self.__configuration_file)
-        else:
-            raise UnknownOption(f"Unknown configuration file format: {self.__configuration_file_format}")
-        dispatcher.configuration.validate_all()
+        dispatcher.configuration = self.__load_configuration()
         dispatcher.status_file = self.__status_file
         dispatcher.workflow_name = self.__workflow_name
         dispatcher.parameters = self.__parameters
+        dispatcher.max_workers = self.__max_workers
+        dispatcher.default_executor = self.__default_executor
+        dispatcher.cache_directory = self.__cache_directory
+        dispatcher.disable_step_index = self.__disable_step_index
+        dispatcher.import_include_patterns = get_combined_patterns(
+            MODULE_IMPORTS_INCLUDE_ENVIRONMENT_VARIABLE, self.__import_include_patterns) or None
+        dispatcher.import_exclude_patterns = get_combined_patterns(
+            MODULE_IMPORTS_EXCLUDE_ENVIRONMENT_VARIABLE, self.__import_exclude_patterns)
+        if not self.__disable_default_import_excludes:
+            dispatcher.import_exclude_patterns = DEFAULT_EXCLUDE_PATTERNS + dispatcher.import_exclude_patterns
+        dispatcher.import_workers = self.__import_workers
+        dispatcher.import_timings = self.__import_timings
+        dispatcher.socket_path = self.__socket_path
+        dispatcher.execution_plans = None
+        dispatcher.batch_items = self.__batch_items
+        dispatcher.batch_concurrency = self.__batch_concurrency
+        dispatcher.batch_output_directory = self.__batch_output_directory
+        dispatcher.resume_file = self.__resume_file
+        dispatcher.step_cache = StepCache(self.__cache_directory, self.__step_cache_max_size, self.__logger)
+        dispatcher.fingerprint_database = FingerprintDatabase(self.__cache_directory, self.__logger)
+        dispatcher.process_executor = ProcessStepExecutor(self.__process_workers)
+        if self.__batch_items is not None:
+            dispatcher.workflow_name = None
         self.__check_workflow_exists(dispatcher)
         return dispatcher
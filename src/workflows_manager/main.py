@@ -5,11 +5,14 @@ the workflows.
 import logging
 import sys
 from argparse import Namespace, ArgumentParser
+from pathlib import Path
 
 from workflows_manager import __version__
 from workflows_manager.command_arguments import get_args, get_parameters
 from workflows_manager.dispatcher import WorkflowDispatcherBuilder, DispatcherAction
+from workflows_manager.exceptions import InvalidConfiguration, InvalidParameter
 from workflows_manager.logger import get_logger
+from workflows_manager.server import send_request, RESPONSE_STATUS_SUCCESS
 
 DEFAULT_STATUS_CODE = 0
 DEFAULT_ERROR_STATUS_CODE = 1
@@ -18,6 +21,45 @@ EXCEPTION_TO_STATUS_CODE = {
 }
 
 
+def run_client(arguments: Namespace, logger: logging.Logger) -> int:
+    """
+    Send the action to the running server instead of dispatching it in the current process.
+
+    :param arguments: Arguments passed to the application.
+    :type arguments: Namespace
+    :param logger: Logger of the application.
+    :type logger: logging.Logger
+    :raise InvalidParameter: If the batch file is provided, as the batch is run only in the current process.
+    :raise InvalidConfiguration: If the server failed to handle the request.
+    :return: Exit status code of the application, the error status code when the server failed to validate or run the
+        workflow.
+    :rtype: int
+    """
+    if getattr(arguments, 'batch', None):
+        raise InvalidParameter("Batch mode cannot be used with the server socket")
+    status_file = getattr(arguments, 'status_file', None)
+    resume_file = getattr(arguments, 'resume', None)
+    request = {
+        'action': arguments.action,
+        'workflow_name': getattr(arguments, 'workflow_name', None),
+        'parameters': get_parameters(arguments),
+        'status_file': str(Path(status_file).absolute()) if status_file else None,
+        'resume_file': str(Path(resume_file).absolute()) if resume_file else None,
+    }
+    logger.info(f"Sending {arguments.action} request to the server: {arguments.socket}")
+    response = send_request(request, arguments.socket)
+    if response.get('status') != RESPONSE_STATUS_SUCCESS:
+        raise InvalidConfiguration(f"Server failed to handle the request: {response.get('error')}")
+    if arguments.action == 'list':
+        for workflow_name in response.get('result') or []:
+            print(workflow_name)
+    elif response.get('result') is False:
+        logger.error(f"Server failed to {arguments.action} the workflow")
+        if not getattr(arguments, 'disable_error_codes', False):
+            return DEFAULT_ERROR_STATUS_CODE
+    return DEFAULT_STATUS_CODE
+
+
 def main(arguments: Namespace) -> int:
     """
     Main function of the application (entrypoint).
@@ -31,6 +73,8 @@ def main(arguments: Namespace) -> int:
                         arguments.file_log_format)
     try:
         logger.info('Starting the workflow engine')
+        if getattr(arguments, 'socket', None) and arguments.action != 'serve':
+            return run_client(arguments, logger)
         dispatcher = (WorkflowDispatcherBuilder()
                       .logger(logger)
                       .disable_current_path_import(arguments.disable_current_path_import)
@@ -39,8 +83,29 @@ def main(arguments: Namespace) -> int:
                       .workflow_name(getattr(arguments, 'workflow_name', None))
                       .status_file(getattr(arguments, 'status_file', None))
                       .parameters(get_parameters(arguments))
+                      .max_workers(getattr(arguments, 'max_workers', None))
+                      .process_workers(getattr(arguments, 'process_workers', None))
+                      .step_cache_max_size(getattr(arguments, 'step_cache_max_size', None))
+                      .default_executor(getattr(arguments, 'default_executor', None))
+                      .cache_directory(getattr(arguments, 'cache_directory', None))
+                      .disable_configuration_cache(getattr(arguments, 'disable_configuration_cache', False))
+                      .lazy_configuration(getattr(arguments, 'lazy_configuration', False))
+                      .disable_step_index(getattr(arguments, 'disable_step_index', False))
+                      .import_include(getattr(arguments, 'import_include', None))
+                      .import_exclude(getattr(arguments, 'import_exclude', None))
+                      .disable_default_import_excludes(getattr(arguments, 'disable_default_import_excludes', False))
+                      .import_workers(getattr(arguments, 'import_workers', None))
+                      .import_timings(getattr(arguments, 'import_timings', False))
+                      .socket_path(getattr(arguments, 'socket', None))
+                      .batch_file(getattr(arguments, 'batch', None))
+                      .batch_concurrency(getattr(arguments, 'batch_concurrency', None))
+                      .batch_output_directory(getattr(arguments, 'batch_output_directory', None))
+                      .resume_file(getattr(arguments, 'resume', None))
                       .build())
-        dispatcher.dispatch(DispatcherAction.from_str(arguments.action))
+        try:
+            dispatcher.dispatch(DispatcherAction.from_str(arguments.action))
+        finally:
+            dispatcher.close()
         logger.info('Stop the workflow engine.')
         return DEFAULT_STATUS_CODE
     except Exception as exception:
@@ -49,7 +114,7 @@ def main(arguments: Namespace) -> int:
         else:
             logger.error(exception)
         status_code = EXCEPTION_TO_STATUS_CODE.get(type(exception), DEFAULT_ERROR_STATUS_CODE)
-        if arguments.disable_error_codes:
+        if getattr(arguments, 'disable_error_codes', False):
             status_code = DEFAULT_STATUS_CODE
         return status_code
 
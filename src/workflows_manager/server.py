@@ -0,0 +1,196 @@
+"""
+This module contains the server that keeps the workflows manager running and accepts the requests over the Unix domain
+socket, and the client that sends the requests to the server. Each request and response is a single line of JSON.
+"""
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from workflows_manager.exceptions import UnknownOption
+
+SOCKET_ENVIRONMENT_VARIABLE = 'WORKFLOWS_MANAGER_SOCKET'
+SOCKET_FILE_PREFIX = 'workflows-manager'
+SOCKET_PERMISSIONS = 0o600
+ENCODING = 'utf-8'
+RESPONSE_STATUS_SUCCESS = 'success'
+RESPONSE_STATUS_ERROR = 'error'
+
+
+def get_default_socket_path() -> Path:
+    """
+    Get the default path to the socket. It is taken from the WORKFLOWS_MANAGER_SOCKET environment variable, if it is not
+    set, then the socket is created in the XDG_RUNTIME_DIR (or the temporary directory).
+
+    :return: The path to the socket.
+    :rtype: Path
+    """
+    socket_path = os.getenv(SOCKET_ENVIRONMENT_VARIABLE)
+    if socket_path:
+        return Path(socket_path)
+    runtime_directory = os.getenv('XDG_RUNTIME_DIR')
+    if runtime_directory:
+        return Path(runtime_directory).joinpath(f'{SOCKET_FILE_PREFIX}.sock')
+    user_id = os.getuid() if hasattr(os, 'getuid') else os.getpid()
+    return Path(tempfile.gettempdir()).joinpath(f'{SOCKET_FILE_PREFIX}-{user_id}.sock')
+
+
+def send_request(request: Dict[str, Any], socket_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Send the request to the server and wait for the response.
+
+    :param request: The request to send.
+    :type request: Dict[str, Any]
+    :param socket_path: The path to the socket of the server, if not provided, then the default path is used.
+    :type socket_path: Optional[Union[str, Path]]
+    :raise ConnectionError: If the server is not running or the response is empty.
+    :return: The response of the server.
+    :rtype: Dict[str, Any]
+    """
+    socket_path = Path(socket_path) if socket_path else get_default_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        client_socket.connect(str(socket_path))
+        client_socket.sendall(f'{json.dumps(request)}\n'.encode(ENCODING))
+        with client_socket.makefile('rb') as stream:
+            response = stream.readline()
+    if not response:
+        raise ConnectionError(f"Server at {socket_path} closed the connection without response")
+    return json.loads(response)
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """
+    A class to handle a single connection to the server. The connection contains a single request.
+    """
+    server: 'RequestServer'
+
+    def handle(self):
+        """
+        A method to read the request, pass it to the request handler of the server, and write the response.
+        """
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError(f"Request must be a JSON object, got: {type(request).__name__}")
+            response = self.server.handle_request(request)
+        except Exception as exception:
+            self.server.logger.error(f"Request failed: {exception}")
+            response = {'status': RESPONSE_STATUS_ERROR, 'error': str(exception)}
+        self.wfile.write(f'{json.dumps(response, default=str)}\n'.encode(ENCODING))
+
+
+class RequestServer(getattr(socketserver, 'ThreadingUnixStreamServer', socketserver.ThreadingTCPServer)):
+    """
+    A class to accept the connections on the Unix domain socket, each connection is handled in its own thread. On the
+    platforms without the Unix domain sockets, the class exists, but it is not supported.
+
+    :param socket_path: The path to the socket.
+    :type socket_path: str
+    :param handle_request: The function that handles the request and returns the response.
+    :type handle_request: Callable[[Dict[str, Any]], Dict[str, Any]]
+    :param logger: The logger used to report the failed requests.
+    :type logger: Logger
+    :ivar is_supported: Flag that indicates whether the platform supports the Unix domain sockets.
+    :vartype is_supported: bool
+    """
+    is_supported: bool = hasattr(socketserver, 'ThreadingUnixStreamServer')
+    daemon_threads = True
+    handle_request: Callable[[Dict[str, Any]], Dict[str, Any]]
+    logger: Logger
+
+    def __init__(self, socket_path: str, handle_request: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 logger: Logger):
+        self.handle_request = handle_request
+        self.logger = logger
+        super().__init__(socket_path, RequestHandler)
+
+
+class WorkflowServer:
+    """
+    A class to serve the requests over the Unix domain socket.
+
+    :param handle_request: The function that handles the request and returns the response.
+    :type handle_request: Callable[[Dict[str, Any]], Dict[str, Any]]
+    :param socket_path: The path to the socket, if not provided, then the default path is used.
+    :type socket_path: Optional[Union[str, Path]]
+    :param logger: The logger used to report the state of the server.
+    :type logger: Optional[Logger]
+    :ivar socket_path: The path to the socket.
+    :vartype socket_path: Path
+    :ivar logger: The logger used to report the state of the server.
+    :vartype logger: Logger
+    """
+    socket_path: Path
+    logger: Logger
+    __handle_request: Callable[[Dict[str, Any]], Dict[str, Any]]
+    __server: Optional['RequestServer']
+
+    def __init__(self, handle_request: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 socket_path: Optional[Union[str, Path]] = None, logger: Optional[Logger] = None):
+        self.socket_path = Path(socket_path) if socket_path else get_default_socket_path()
+        self.logger = logger or getLogger(__name__)
+        self.__handle_request = handle_request
+        self.__server = None
+
+    def __remove_stale_socket(self):
+        """
+        A method to remove the socket left by the server that is not running anymore.
+
+        :raise OSError: If the socket is used by the running server.
+        """
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            try:
+                client_socket.connect(str(self.socket_path))
+            except OSError:
+                self.logger.info(f"Removing stale socket {self.socket_path}")
+                self.socket_path.unlink()
+                return
+        raise OSError(f"Socket {self.socket_path} is used by another server")
+
+    def start(self) -> 'WorkflowServer':
+        """
+        A method to bind the socket, the socket is accessible only by the owner.
+
+        :raise UnknownOption: If the Unix domain sockets are not supported by the platform.
+        :return: The workflow server.
+        :rtype: WorkflowServer
+        """
+        if not RequestServer.is_supported:
+            raise UnknownOption("Serve action requires the Unix domain sockets, which are not supported by the "
+                                "platform")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.__remove_stale_socket()
+        self.__server = RequestServer(str(self.socket_path), self.__handle_request, self.logger)
+        os.chmod(self.socket_path, SOCKET_PERMISSIONS)
+        self.logger.info(f"Listening on {self.socket_path}")
+        return self
+
+    def serve_forever(self):
+        """
+        A method to handle the requests until the server is shut down, the socket is removed afterward.
+        """
+        if self.__server is None:
+            self.start()
+        try:
+            self.__server.serve_forever()
+        finally:
+            self.__server.server_close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            self.logger.info("Server stopped")
+
+    def shutdown(self):
+        """
+        A method to stop the server, it must be called from another thread than the one running serve_forever.
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
@@ -0,0 +1,162 @@
+"""
+Module contains the on-disk cache for the values derived from the files (e.g. parsed configuration).
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from contextlib import contextmanager
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
+
+from workflows_manager.__version__ import __version__
+
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = 'WORKFLOWS_MANAGER_CACHE_DIRECTORY'
+CACHE_DIRECTORY_NAME = 'workflows-manager'
+CACHE_FILE_SUFFIX = '.pickle'
+
+
+def get_default_cache_directory() -> Path:
+    """
+    Get the default cache directory. It is taken from the WORKFLOWS_MANAGER_CACHE_DIRECTORY environment variable, if it
+    is not set, then the directory inside XDG_CACHE_HOME (or ~/.cache) is used.
+
+    :return: The path to the default cache directory.
+    :rtype: Path
+    """
+    cache_directory = os.getenv(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE)
+    if cache_directory:
+        return Path(cache_directory)
+    cache_home = os.getenv('XDG_CACHE_HOME')
+    if cache_home:
+        return Path(cache_home).joinpath(CACHE_DIRECTORY_NAME)
+    return Path.home().joinpath('.cache', CACHE_DIRECTORY_NAME)
+
+
+def get_content_key(content: bytes) -> str:
+    """
+    Get the key of the content. The key also depends on the version of the package and the version of Python, so the
+    cached values are invalidated when any of them changes.
+
+    :param content: The content of the source file.
+    :type content: bytes
+    :return: The key of the content.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{__version__}:{sys.version_info.major}.{sys.version_info.minor}:'.encode('utf-8'))
+    digest.update(content)
+    return digest.hexdigest()
+
+
+@contextmanager
+def atomic_write(file_path: Path, mode: str = 'wb', encoding: Optional[str] = None) -> Iterator[IO]:
+    """
+    Open the temporary file next to the file, and replace the file with it when the block succeeds, so the file is
+    never left half-written. The temporary file is removed when the block fails.
+
+    :param file_path: The path to the file.
+    :type file_path: Path
+    :param mode: The mode of the temporary file, either 'wb' or 'w'.
+    :type mode: str
+    :param encoding: The encoding of the temporary file opened in the text mode.
+    :type encoding: Optional[str]
+    :return: The temporary file.
+    :rtype: Iterator[IO]
+    """
+    temporary_file = None
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(mode, encoding=encoding, dir=file_path.parent, prefix='.', suffix='.tmp',
+                                         delete=False) as file:
+            temporary_file = Path(file.name)
+            yield file
+        os.replace(temporary_file, file_path)
+    except BaseException:
+        if temporary_file is not None:
+            temporary_file.unlink(missing_ok=True)
+        raise
+
+
+class FileCache:
+    """
+    A class to store the values derived from the source files on disk. Each source file has a single cache entry, that
+    is valid only for the key it has been stored with.
+
+    :param namespace: The name of the subdirectory inside the cache directory, that separates different kinds of values.
+    :type namespace: str
+    :param cache_directory: The path to the cache directory, if not provided, then the default cache directory is used.
+    :type cache_directory: Optional[Union[str, Path]]
+    :param logger: The logger used to report the cache errors.
+    :type logger: Optional[Logger]
+    :ivar directory: The path to the directory with the cache entries.
+    :vartype directory: Path
+    :ivar logger: The logger used to report the cache errors.
+    :vartype logger: Logger
+    """
+    directory: Path
+    logger: Logger
+
+    def __init__(self, namespace: str, cache_directory: Optional[Union[str, Path]] = None,
+                 logger: Optional[Logger] = None):
+        if cache_directory is None:
+            cache_directory = get_default_cache_directory()
+        self.directory = Path(cache_directory).joinpath(namespace)
+        self.logger = logger or getLogger(__name__)
+
+    def __get_cache_file(self, source_path: Union[str, Path]) -> Path:
+        """
+        A method to get the path to the cache entry of the source file.
+
+        :param source_path: The path to the source file.
+        :type source_path: Union[str, Path]
+        :return: The path to the cache entry.
+        :rtype: Path
+        """
+        source_hash = hashlib.sha256(str(Path(source_path).absolute()).encode('utf-8')).hexdigest()
+        return self.directory.joinpath(f'{source_hash}{CACHE_FILE_SUFFIX}')
+
+    def load(self, source_path: Union[str, Path], key: str) -> Optional[Any]:
+        """
+        A method to load the cached value of the source file.
+
+        :param source_path: The path to the source file.
+        :type source_path: Union[str, Path]
+        :param key: The key of the source file content.
+        :type key: str
+        :return: The cached value, or None if there is no valid cache entry for the key.
+        :rtype: Optional[Any]
+        """
+        cache_file = self.__get_cache_file(source_path)
+        try:
+            with cache_file.open('rb') as file:
+                cached_key, value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as exception:
+            self.logger.debug(f"Unable to read the cache entry '{cache_file}': {exception}")
+            return None
+        if cached_key != key:
+            return None
+        return value
+
+    def store(self, source_path: Union[str, Path], key: str, value: Any):
+        """
+        A method to store the value of the source file. The cache entry is replaced atomically, errors are logged and
+        ignored, as the cache is only an optimization.
+
+        :param source_path: The path to the source file.
+        :type source_path: Union[str, Path]
+        :param key: The key of the source file content.
+        :type key: str
+        :param value: The value to store.
+        :type value: Any
+        """
+        cache_file = self.__get_cache_file(source_path)
+        try:
+            with atomic_write(cache_file) as file:
+                pickle.dump((key, value), file, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exception:
+            self.logger.debug(f"Unable to write the cache entry '{cache_file}': {exception}")
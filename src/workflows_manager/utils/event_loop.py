@@ -0,0 +1,63 @@
+"""
+Module contains the event loop that runs in the background thread and is shared by all asynchronous steps.
+"""
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+THREAD_NAME = 'workflows-manager-event-loop'
+
+
+class EventLoopThread:
+    """
+    A class to run the coroutines on the single event loop that lives in the background thread. The loop is started on
+    the first use, so workflows without asynchronous steps do not pay for it.
+    """
+    __loop: Optional[asyncio.AbstractEventLoop]
+    __thread: Optional[threading.Thread]
+    __lock: threading.Lock
+
+    def __init__(self):
+        self.__loop = None
+        self.__thread = None
+        self.__lock = threading.Lock()
+
+    def __get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        A method to get the event loop, it is created and started on the first use.
+
+        :return: The running event loop.
+        :rtype: asyncio.AbstractEventLoop
+        """
+        with self.__lock:
+            if self.__loop is None:
+                self.__loop = asyncio.new_event_loop()
+                self.__thread = threading.Thread(target=self.__loop.run_forever, name=THREAD_NAME, daemon=True)
+                self.__thread.start()
+            return self.__loop
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        A method to run the coroutine on the event loop and wait for its result. It can be called from any thread
+        except the thread of the event loop.
+
+        :param coroutine: The coroutine to run.
+        :type coroutine: Coroutine
+        :raise Exception: If the coroutine raises an exception, it is propagated to the caller.
+        :return: The result of the coroutine.
+        :rtype: Any
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.__get_loop()).result()
+
+    def shutdown(self):
+        """
+        A method to stop the event loop and its thread.
+        """
+        with self.__lock:
+            if self.__loop is None:
+                return
+            self.__loop.call_soon_threadsafe(self.__loop.stop)
+            self.__thread.join()
+            self.__loop.close()
+            self.__loop = None
+            self.__thread = None
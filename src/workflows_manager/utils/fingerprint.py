@@ -0,0 +1,202 @@
+"""
+Module contains the database of the fingerprints of the input and output files of the steps. The step is up to date,
+when its input and output files have not changed since the step has succeeded, so it does not need to be run again.
+"""
+import glob
+import hashlib
+import json
+import os
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from workflows_manager.utils.cache import atomic_write, get_content_key, get_default_cache_directory
+
+FINGERPRINT_NAMESPACE = 'fingerprints'
+FINGERPRINT_FILE_SUFFIX = '.json'
+ENCODING = 'utf-8'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def expand_patterns(patterns: List[str]) -> Optional[List[str]]:
+    """
+    Get the files matching the glob patterns, the '**' pattern matches any files and directories recursively.
+
+    :param patterns: The glob patterns.
+    :type patterns: List[str]
+    :return: The sorted absolute paths to the matching files, or None if any of the patterns does not match any file.
+    :rtype: Optional[List[str]]
+    """
+    files = set()
+    for pattern in patterns:
+        matches = [path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path)]
+        if not matches:
+            return None
+        files.update(os.path.abspath(path) for path in matches)
+    return sorted(files)
+
+
+def get_content_hash(path: Union[str, Path]) -> str:
+    """
+    Get the hash of the content of the file.
+
+    :param path: The path to the file.
+    :type path: Union[str, Path]
+    :return: The SHA-256 hash of the content of the file.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_file_fingerprint(path: Union[str, Path]) -> List[Any]:
+    """
+    Get the fingerprint of the file.
+
+    :param path: The path to the file.
+    :type path: Union[str, Path]
+    :return: The modification time in nanoseconds, the size, and the hash of the content of the file.
+    :rtype: List[Any]
+    """
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size, get_content_hash(path)]
+
+
+def is_file_unchanged(path: Union[str, Path], fingerprint: List[Any]) -> bool:
+    """
+    Check if the file has not changed since its fingerprint has been taken. The modification time and the size are
+    compared first, the content is hashed only when the modification time has changed and the size has not.
+
+    :param path: The path to the file.
+    :type path: Union[str, Path]
+    :param fingerprint: The fingerprint of the file.
+    :type fingerprint: List[Any]
+    :return: True if the file has not changed, otherwise False.
+    :rtype: bool
+    """
+    modification_time, size, content_hash = fingerprint
+    try:
+        stat = os.stat(path)
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns == modification_time:
+            return True
+        return get_content_hash(path) == content_hash
+    except OSError:
+        return False
+
+
+class FingerprintDatabase:
+    """
+    A class to store the fingerprints of the input and output files of the steps on disk. Each step has its own file
+    in the database, addressed by the key of the step.
+
+    :param cache_directory: The path to the cache directory, if not provided, then the default cache directory is used.
+    :type cache_directory: Optional[Union[str, Path]]
+    :param logger: The logger used to report the database errors.
+    :type logger: Optional[Logger]
+    :ivar directory: The path to the directory with the fingerprints.
+    :vartype directory: Path
+    :ivar logger: The logger used to report the database errors.
+    :vartype logger: Logger
+    """
+    directory: Path
+    logger: Logger
+
+    def __init__(self, cache_directory: Optional[Union[str, Path]] = None, logger: Optional[Logger] = None):
+        if cache_directory is None:
+            cache_directory = get_default_cache_directory()
+        self.directory = Path(cache_directory).joinpath(FINGERPRINT_NAMESPACE)
+        self.logger = logger or getLogger(__name__)
+
+    @staticmethod
+    def get_key(step_id: str, parameters: Dict[str, Any], inputs: List[str], outputs: List[str]) -> str:
+        """
+        A method to get the key of the step, the steps with different parameters or files have separate fingerprints.
+
+        :param step_id: The ID of the registered step.
+        :type step_id: str
+        :param parameters: The resolved parameters of the step.
+        :type parameters: Dict[str, Any]
+        :param inputs: The glob patterns of the input files.
+        :type inputs: List[str]
+        :param outputs: The glob patterns of the output files.
+        :type outputs: List[str]
+        :return: The key of the step.
+        :rtype: str
+        """
+        content = json.dumps([step_id, parameters, inputs, outputs, os.getcwd()], sort_keys=True, default=repr)
+        return get_content_key(content.encode(ENCODING))
+
+    def __get_fingerprint_file(self, key: str) -> Path:
+        """
+        A method to get the path to the file with the fingerprints of the step.
+
+        :param key: The key of the step.
+        :type key: str
+        :return: The path to the file with the fingerprints.
+        :rtype: Path
+        """
+        return self.directory.joinpath(f'{key}{FINGERPRINT_FILE_SUFFIX}')
+
+    def is_up_to_date(self, key: str, inputs: List[str], outputs: List[str]) -> bool:
+        """
+        A method to check if the step is up to date. It is, when the same input files match the patterns as when the
+        step has succeeded, and neither the input files nor the output files have changed since then.
+
+        :param key: The key of the step.
+        :type key: str
+        :param inputs: The glob patterns of the input files.
+        :type inputs: List[str]
+        :param outputs: The glob patterns of the output files.
+        :type outputs: List[str]
+        :return: True if the step is up to date, otherwise False.
+        :rtype: bool
+        """
+        fingerprint_file = self.__get_fingerprint_file(key)
+        try:
+            with fingerprint_file.open('r', encoding=ENCODING) as file:
+                fingerprints = json.load(file)
+        except FileNotFoundError:
+            return False
+        except Exception as exception:
+            self.logger.debug("Unable to read the fingerprints '%s': %s", fingerprint_file, exception)
+            return False
+        for patterns, recorded_files in ((inputs, fingerprints['inputs']), (outputs, fingerprints['outputs'])):
+            files = expand_patterns(patterns)
+            if files is None or files != sorted(recorded_files):
+                return False
+            if not all(is_file_unchanged(path, recorded_files[path]) for path in files):
+                return False
+        return True
+
+    def record(self, key: str, inputs: List[str], outputs: List[str]):
+        """
+        A method to store the fingerprints of the input and output files of the succeeded step. The file is replaced
+        atomically, errors are logged and ignored, as the database is only an optimization.
+
+        :param key: The key of the step.
+        :type key: str
+        :param inputs: The glob patterns of the input files.
+        :type inputs: List[str]
+        :param outputs: The glob patterns of the output files.
+        :type outputs: List[str]
+        """
+        fingerprint_file = self.__get_fingerprint_file(key)
+        try:
+            fingerprints = {}
+            for name, patterns in (('inputs', inputs), ('outputs', outputs)):
+                files = expand_patterns(patterns)
+                if files is None:
+                    self.logger.warning("Fingerprints are not recorded, as the %s do not match any file: %s", name,
+                                        patterns)
+                    fingerprint_file.unlink(missing_ok=True)
+                    return
+                fingerprints[name] = {path: get_file_fingerprint(path) for path in files}
+            with atomic_write(fingerprint_file, 'w', ENCODING) as file:
+                json.dump(fingerprints, file)
+        except Exception as exception:
+            self.logger.debug("Unable to write the fingerprints '%s': %s", fingerprint_file, exception)
@@ -0,0 +1,212 @@
+"""
+Module contains the functions to find the modules in the import paths and the loader that imports them.
+"""
+import importlib
+import os
+import sys
+import time
+from fnmatch import fnmatch
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import List, Optional, Iterable, Dict
+
+from workflows_manager.utils.worker_pool import WorkerPool
+
+DEFAULT_EXCLUDE_PATTERNS = [
+    '.git',
+    '.hg',
+    '.svn',
+    '.venv',
+    'venv',
+    '.tox',
+    '.nox',
+    '__pycache__',
+    'node_modules',
+    'site-packages',
+    'build',
+    'dist',
+    '*.egg-info',
+]
+
+
+def matches_patterns(relative_path: str, patterns: Iterable[str]) -> bool:
+    """
+    Check whether the path matches any of the glob patterns. The pattern matches when it matches the whole path
+    relative to the import path (e.g. 'tests/*'), or the name of the file or directory (e.g. 'test_*.py').
+
+    :param relative_path: The path relative to the import path, with '/' as a separator.
+    :type relative_path: str
+    :param patterns: The glob patterns.
+    :type patterns: Iterable[str]
+    :return: True if the path matches any of the patterns, otherwise False.
+    :rtype: bool
+    """
+    name = relative_path.rsplit('/', 1)[-1]
+    return any(fnmatch(relative_path, pattern) or fnmatch(name, pattern) for pattern in patterns)
+
+
+def get_module_name(relative_path: str) -> str:
+    """
+    Get the name of the module from the path to its file.
+
+    :param relative_path: The path to the module file relative to the import path, with '/' as a separator.
+    :type relative_path: str
+    :return: The name of the module.
+    :rtype: str
+    """
+    return relative_path[:-len('.py')].replace('/', '.')
+
+
+def get_combined_patterns(environment_variable: str, patterns: List[str]) -> List[str]:
+    """
+    Get the combined patterns (patterns from the environment and provided patterns).
+
+    :param environment_variable: The name of the environment variable with the patterns separated by the path
+        separator.
+    :type environment_variable: str
+    :param patterns: The provided patterns.
+    :type patterns: List[str]
+    :return: The combined patterns.
+    :rtype: List[str]
+    """
+    environment_patterns = os.getenv(environment_variable, '')
+    combined_patterns = [pattern for pattern in environment_patterns.split(os.path.pathsep) if pattern]
+    combined_patterns.extend(pattern for pattern in patterns if pattern not in combined_patterns)
+    return combined_patterns
+
+
+def add_import_path(package_path: Path, logger: Logger) -> bool:
+    """
+    Check the provided path and add it to the sys.path.
+
+    :param package_path: The path to the package with modules.
+    :type package_path: Path
+    :param logger: The logger used to report the skipped paths.
+    :type logger: Logger
+    :return: True if the modules can be imported from the path, otherwise False.
+    :rtype: bool
+    """
+    if not package_path.exists():
+        logger.warning(f"Path {str(package_path)} does not exist, skipping it")
+        return False
+    if not package_path.is_dir():
+        logger.warning(f"Path {str(package_path)} is not a directory, skipping it")
+        return False
+    if str(package_path) not in sys.path:
+        logger.info(f"Adding {package_path} to sys.path")
+        sys.path.append(str(package_path))
+    return True
+
+
+def collect_module_files(path: Path, include_patterns: Optional[List[str]] = None,
+                         exclude_patterns: Optional[List[str]] = None) -> List[str]:
+    """
+    Collect the module files from the path. The excluded directories are not visited at all.
+
+    :param path: The path to the package with modules.
+    :type path: Path
+    :param include_patterns: The glob patterns of the module files to collect, if not provided, then all module files
+        are collected.
+    :type include_patterns: Optional[List[str]]
+    :param exclude_patterns: The glob patterns of the files and directories to skip.
+    :type exclude_patterns: Optional[List[str]]
+    :return: The paths to the module files relative to the path, with '/' as a separator.
+    :rtype: List[str]
+    """
+    exclude_patterns = exclude_patterns or []
+    module_files = []
+    for root, directories, files in os.walk(path):
+        relative_root = os.path.relpath(root, str(path)).replace(os.sep, '/')
+        prefix = '' if relative_root == '.' else f'{relative_root}/'
+        if directories:
+            directories[:] = [directory for directory in directories
+                              if not matches_patterns(f'{prefix}{directory}', exclude_patterns)]
+        for file in files:
+            if not file.endswith('.py'):
+                continue
+            relative_path = f'{prefix}{file}'
+            if include_patterns and not matches_patterns(relative_path, include_patterns):
+                continue
+            if matches_patterns(relative_path, exclude_patterns):
+                continue
+            module_files.append(relative_path)
+    return module_files
+
+
+class ModuleLoader:
+    """
+    A class to import the modules and measure the time of each import. The modules from different top-level packages
+    can be imported concurrently, the modules from the same top-level package are always imported in order.
+
+    :param logger: The logger used to report the imported modules.
+    :type logger: Optional[Logger]
+    :param max_workers: The maximum number of top-level packages imported at the same time, if not provided, then the
+        modules are imported sequentially.
+    :type max_workers: Optional[int]
+    :ivar logger: The logger used to report the imported modules.
+    :vartype logger: Logger
+    :ivar max_workers: The maximum number of top-level packages imported at the same time.
+    :vartype max_workers: int
+    :ivar timings: The time of the import in seconds by the name of the module.
+    :vartype timings: Dict[str, float]
+    """
+    logger: Logger
+    max_workers: int
+    timings: Dict[str, float]
+
+    def __init__(self, logger: Optional[Logger] = None, max_workers: Optional[int] = None):
+        self.logger = logger or getLogger(__name__)
+        self.max_workers = max_workers or 1
+        self.timings = {}
+
+    def __import_module(self, module: str):
+        """
+        A method to import the module and store the time of the import. The time includes the modules imported by
+        the module for the first time.
+
+        :param module: The name of the module.
+        :type module: str
+        """
+        self.logger.info(f"Importing module {module}")
+        start_time = time.perf_counter()
+        importlib.import_module(module)
+        self.timings[module] = time.perf_counter() - start_time
+
+    def import_modules(self, modules: List[str]):
+        """
+        A method to import the modules.
+
+        :param modules: The names of the modules.
+        :type modules: List[str]
+        :raise Exception: If any of the modules cannot be imported, the first exception is raised after all imports.
+        """
+        if self.max_workers <= 1:
+            for module in modules:
+                self.__import_module(module)
+            return
+        packages: Dict[str, List[str]] = {}
+        for module in modules:
+            packages.setdefault(module.split('.', 1)[0], []).append(module)
+
+        def import_package(package_modules: List[str]):
+            for package_module in package_modules:
+                self.__import_module(package_module)
+
+        with WorkerPool(self.max_workers) as pool:
+            exceptions = pool.run_all([lambda package_modules=package_modules: import_package(package_modules)
+                                       for package_modules in packages.values()])
+        for exception in exceptions:
+            if exception is not None:
+                raise exception
+
+    def report(self, limit: Optional[int] = None) -> List[str]:
+        """
+        A method to create the report with the import times, the slowest modules are first.
+
+        :param limit: The maximum number of modules in the report, if not provided, then all modules are reported.
+        :type limit: Optional[int]
+        :return: The lines of the report.
+        :rtype: List[str]
+        """
+        timings = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [f"{timing:.3f}s {module}" for module, timing in timings]
@@ -0,0 +1,142 @@
+"""
+Module contains the index of the named elements of the list, that maps the names of the elements to their positions.
+The list counts its modifications, so the index is rebuilt only when the list has been changed outside of it.
+"""
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+MUTATING_METHODS = ('append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse', '__setitem__',
+                    '__delitem__', '__iadd__', '__imul__')
+
+
+class VersionedList(list):
+    """
+    A list that counts its modifications, so the values derived from it (e.g. the index) can detect that they are
+    outdated.
+
+    :param iterable: The initial elements of the list.
+    :type iterable: Iterable[Any]
+    :ivar version: The number of modifications of the list.
+    :vartype version: int
+    """
+    version: int
+
+    def __init__(self, iterable: Iterable[Any] = ()):
+        super().__init__(iterable)
+        self.version = 0
+
+    def __reduce__(self):
+        return self.__class__, (list(self),), {'version': self.version}
+
+
+def _count_modification(method_name: str):
+    """
+    Create the method of the versioned list, that increments the version of the list before the modification.
+
+    :param method_name: The name of the list method that modifies the list.
+    :type method_name: str
+    :return: The method that counts the modification.
+    :rtype: Callable
+    """
+    method = getattr(list, method_name)
+
+    def modify(self: VersionedList, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    modify.__name__ = method_name
+    modify.__doc__ = method.__doc__
+    return modify
+
+
+for _method_name in MUTATING_METHODS:
+    setattr(VersionedList, _method_name, _count_modification(_method_name))
+
+
+class NameIndex:
+    """
+    A class to index the positions of the elements of the list by their names. When the name occurs multiple times, the
+    first element is indexed. The index is kept up to date by the elements added through it, and it is rebuilt only when
+    the list has been modified directly, or when the indexed element has been renamed in place.
+
+    :ivar lock: The lock that guards the index and the changes of the list made through it.
+    :vartype lock: threading.RLock
+    """
+    lock: threading.RLock
+    __positions: Dict[str, int]
+    __elements: Optional[VersionedList]
+    __version: int
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.__positions = {}
+        self.__elements = None
+        self.__version = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'positions': self.__positions}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__()
+        self.__positions = state['positions']
+
+    def __is_current(self, elements: VersionedList) -> bool:
+        """
+        Check whether the index has been built from the current state of the list.
+
+        :param elements: The list of the elements.
+        :type elements: VersionedList
+        :return: True, if the list has not been modified since the index was built, otherwise False.
+        :rtype: bool
+        """
+        return elements is self.__elements and elements.version == self.__version
+
+    def rebuild(self, elements: VersionedList):
+        """
+        Build the index from the list of the elements.
+
+        :param elements: The list of the elements.
+        :type elements: VersionedList
+        """
+        with self.lock:
+            positions = {}
+            for position, element in enumerate(elements):
+                positions.setdefault(element.name, position)
+            self.__positions = positions
+            self.__elements = elements
+            self.__version = elements.version
+
+    def get(self, elements: VersionedList, name: str) -> Optional[Any]:
+        """
+        Get the element by its name.
+
+        :param elements: The list of the elements.
+        :type elements: VersionedList
+        :param name: The name of the element.
+        :type name: str
+        :return: The element with the given name, or None if it does not exist in the list.
+        :rtype: Optional[Any]
+        """
+        if not self.__is_current(elements):
+            self.rebuild(elements)
+        position = self.__positions.get(name)
+        if position is not None and elements[position].name != name:
+            self.rebuild(elements)
+            position = self.__positions.get(name)
+        return elements[position] if position is not None else None
+
+    def append(self, elements: VersionedList, element: Any):
+        """
+        Add the element to the end of the list, and to the index.
+
+        :param elements: The list of the elements.
+        :type elements: VersionedList
+        :param element: The element to add.
+        :type element: Any
+        """
+        with self.lock:
+            is_current = self.__is_current(elements)
+            elements.append(element)
+            if is_current:
+                self.__positions.setdefault(element.name, len(elements) - 1)
+                self.__version = elements.version
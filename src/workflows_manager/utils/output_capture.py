@@ -0,0 +1,635 @@
+"""
+Module contains the capture of the standard output and the standard error of the steps. The standard streams are
+replaced once by the routers, which send each write to the buffer of the step running in the current thread or the
+current asynchronous task, so the steps running at the same time never see each other's output. The threads started by
+the step are captured only when they run in the copy of the step's context (e.g. with 'contextvars.copy_context().run'),
+the output of the other threads is sent to the original stream.
+
+The captured output is kept in memory only up to the limit, the larger output is moved to the temporary file. In the
+streaming mode, the captured lines are sent to the logger as they are written, and only the tail of the output is kept.
+
+The output written directly to the file descriptors (e.g. by the subprocesses or the native libraries) is captured by
+replacing the file descriptors with the pipes, which is done only in the worker processes, as the file descriptors are
+shared by all threads of the process.
+"""
+import codecs
+import gzip
+import io
+import os
+import shutil
+import sys
+import logging
+import tempfile
+import threading
+from collections import deque
+from contextvars import ContextVar, Token
+from logging import Logger
+from pathlib import Path
+from typing import Any, Coroutine, Deque, Dict, List, Optional, TextIO, Union
+
+STDOUT = 'stdout'
+STDERR = 'stderr'
+ENCODING = 'utf-8'
+SPOOL_MAX_SIZE = 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+TRUNCATION_MARKER = '\n... [{omitted} characters omitted] ...\n'
+CAPTURE_TARGETS: Dict[str, ContextVar] = {
+    STDOUT: ContextVar('workflows_manager_stdout', default=None),
+    STDERR: ContextVar('workflows_manager_stderr', default=None),
+}
+STREAM_LOG_LEVELS = {
+    STDOUT: logging.INFO,
+    STDERR: logging.WARNING,
+}
+FILE_DESCRIPTORS = {
+    STDOUT: 1,
+    STDERR: 2,
+}
+
+
+class OutputRouter(io.TextIOBase):
+    """
+    A class to replace the standard stream. The writes are sent to the buffer of the current step, or to the original
+    stream, if the output of the current thread or task is not captured.
+
+    :param name: The name of the stream ('stdout' or 'stderr').
+    :type name: str
+    :param stream: The original stream.
+    :type stream: TextIO
+    :ivar name: The name of the stream ('stdout' or 'stderr').
+    :vartype name: str
+    :ivar stream: The original stream.
+    :vartype stream: TextIO
+    """
+    name: str
+    stream: TextIO
+
+    def __init__(self, name: str, stream: TextIO):
+        super().__init__()
+        self.name = name
+        self.stream = stream
+
+    @property
+    def target(self) -> TextIO:
+        """
+        A property to get the stream that receives the writes of the current thread or task.
+        """
+        return CAPTURE_TARGETS[self.name].get() or self.stream
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """
+        A property to get the encoding of the original stream.
+        """
+        return getattr(self.stream, 'encoding', None)
+
+    @property
+    def errors(self) -> Optional[str]:
+        """
+        A property to get the error handling of the original stream.
+        """
+        return getattr(self.stream, 'errors', None)
+
+    def writable(self) -> bool:
+        """
+        A method to check whether the stream is writable.
+
+        :return: Always True.
+        :rtype: bool
+        """
+        return True
+
+    def write(self, text: str) -> int:
+        """
+        A method to write the text to the stream of the current thread or task.
+
+        :param text: The text to write.
+        :type text: str
+        :return: The number of written characters.
+        :rtype: int
+        """
+        return self.target.write(text)
+
+    def flush(self):
+        """
+        A method to flush the stream of the current thread or task.
+        """
+        self.target.flush()
+
+    def isatty(self) -> bool:
+        """
+        A method to check whether the stream of the current thread or task is connected to the terminal.
+
+        :return: True if the stream is connected to the terminal, otherwise False.
+        :rtype: bool
+        """
+        return self.target.isatty()
+
+    def fileno(self) -> int:
+        """
+        A method to get the file descriptor of the original stream.
+
+        :return: The file descriptor.
+        :rtype: int
+        """
+        return self.stream.fileno()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+class CaptureBuffer:
+    """
+    A class to store the captured output. The output is kept in memory until it exceeds the limit, then it is moved to
+    the temporary file, which is removed when the buffer is closed.
+
+    :param max_memory_size: The maximum number of characters kept in memory.
+    :type max_memory_size: int
+    :ivar size: The number of the captured characters.
+    :vartype size: int
+    """
+    size: int
+    __file: tempfile.SpooledTemporaryFile
+
+    def __init__(self, max_memory_size: int = SPOOL_MAX_SIZE):
+        self.size = 0
+        self.__file = tempfile.SpooledTemporaryFile(max_memory_size, mode='w+', encoding=ENCODING, newline='')
+
+    def write(self, text: str) -> int:
+        """
+        A method to write the text to the buffer.
+
+        :param text: The text to write.
+        :type text: str
+        :return: The number of written characters.
+        :rtype: int
+        """
+        self.__file.write(text)
+        self.size += len(text)
+        return len(text)
+
+    def flush(self):
+        """
+        A method to flush the buffer.
+        """
+        self.__file.flush()
+
+    def isatty(self) -> bool:
+        """
+        A method to check whether the buffer is connected to the terminal.
+
+        :return: Always False.
+        :rtype: bool
+        """
+        return False
+
+    def getvalue(self, head: Optional[int] = None, tail: Optional[int] = None) -> str:
+        """
+        A method to get the captured output. When the limits are provided, and the output is longer than the limits,
+        then only the first and the last characters are returned, separated by the marker with the number of omitted
+        characters.
+
+        :param head: The number of the first characters to return.
+        :type head: Optional[int]
+        :param tail: The number of the last characters to return.
+        :type tail: Optional[int]
+        :return: The captured output.
+        :rtype: str
+        """
+        self.__file.seek(0)
+        if head is None and tail is None:
+            return self.__file.read()
+        head = head or 0
+        tail = tail or 0
+        if self.size <= head + tail:
+            return self.__file.read()
+        head_text = self.__file.read(head) if head else ''
+        tail_text = ''
+        chunk = self.__file.read(READ_CHUNK_SIZE)
+        while chunk:
+            tail_text = (tail_text + chunk)[-tail:] if tail else ''
+            chunk = self.__file.read(READ_CHUNK_SIZE)
+        return head_text + TRUNCATION_MARKER.format(omitted=self.size - head - tail) + tail_text
+
+    def archive(self, path: Path):
+        """
+        A method to store the whole captured output in the gzip file.
+
+        :param path: The path to the gzip file.
+        :type path: Path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.__file.seek(0)
+        with gzip.open(path, 'wt', encoding=ENCODING, newline='') as file:
+            shutil.copyfileobj(self.__file, file, READ_CHUNK_SIZE)
+
+    def close(self):
+        """
+        A method to release the memory, or remove the temporary file, of the buffer.
+        """
+        self.__file.close()
+
+
+class StreamBuffer:
+    """
+    A class to send the captured output to the logger line by line, as it is written. Only the first characters and the
+    last characters of the output are kept, up to the size of the ring buffer, the other characters are dropped.
+
+    :param logger: The logger that receives the captured lines.
+    :type logger: Logger
+    :param level: The logging level of the captured lines.
+    :type level: int
+    :param ring_size: The number of the first and the last characters kept, if not provided, then no output is kept.
+    :type ring_size: Optional[int]
+    :ivar logger: The logger that receives the captured lines.
+    :vartype logger: Logger
+    :ivar level: The logging level of the captured lines.
+    :vartype level: int
+    :ivar ring_size: The number of the first and the last characters kept.
+    :vartype ring_size: int
+    :ivar size: The number of the captured characters.
+    :vartype size: int
+    """
+    logger: Logger
+    level: int
+    ring_size: int
+    size: int
+    __line: str
+    __head: str
+    __ring: Deque[str]
+    __ring_length: int
+    __is_logging: bool
+
+    def __init__(self, logger: Logger, level: int = logging.INFO, ring_size: Optional[int] = None):
+        self.logger = logger
+        self.level = level
+        self.ring_size = ring_size or 0
+        self.size = 0
+        self.__line = ''
+        self.__head = ''
+        self.__ring = deque()
+        self.__ring_length = 0
+        self.__is_logging = False
+
+    def __keep(self, text: str):
+        """
+        A method to keep the first characters of the output, add the text to the ring buffer, and drop the oldest
+        characters above the size of the ring buffer.
+
+        :param text: The captured text.
+        :type text: str
+        """
+        if self.ring_size == 0:
+            return
+        if len(self.__head) < self.ring_size:
+            self.__head += text[:self.ring_size - len(self.__head)]
+        text = text[-self.ring_size:]
+        self.__ring.append(text)
+        self.__ring_length += len(text)
+        while self.__ring_length - len(self.__ring[0]) >= self.ring_size:
+            self.__ring_length -= len(self.__ring.popleft())
+
+    def __log(self, line: str):
+        """
+        A method to send the line to the logger. The output written by the handlers of the logger is not logged again.
+
+        :param line: The line without the line break.
+        :type line: str
+        """
+        self.__is_logging = True
+        try:
+            self.logger.log(self.level, line)
+        finally:
+            self.__is_logging = False
+
+    def write(self, text: str) -> int:
+        """
+        A method to send the complete lines of the text to the logger, and keep the text in the ring buffer.
+
+        :param text: The text to write.
+        :type text: str
+        :return: The number of written characters.
+        :rtype: int
+        """
+        self.size += len(text)
+        self.__keep(text)
+        if self.__is_logging:
+            return len(text)
+        lines = (self.__line + text).split('\n')
+        self.__line = lines.pop()
+        for line in lines:
+            self.__log(line)
+        return len(text)
+
+    def flush(self):
+        """
+        A method to flush the buffer, the incomplete line is kept until the line break is written, or the buffer is
+        closed.
+        """
+
+    def isatty(self) -> bool:
+        """
+        A method to check whether the buffer is connected to the terminal.
+
+        :return: Always False.
+        :rtype: bool
+        """
+        return False
+
+    def getvalue(self, head: Optional[int] = None, tail: Optional[int] = None) -> str:
+        """
+        A method to get the kept characters of the captured output. When the limits are provided, then only the first
+        and the last characters are returned, up to the size of the ring buffer. The returned characters are separated
+        by the marker with the number of omitted characters, if any character has been omitted.
+
+        :param head: The number of the first characters to return.
+        :type head: Optional[int]
+        :param tail: The number of the last characters to return.
+        :type tail: Optional[int]
+        :return: The kept characters of the captured output.
+        :rtype: str
+        """
+        text = ''.join(self.__ring)[-self.ring_size:] if self.ring_size else ''
+        if head is None and tail is None:
+            head_text, tail_text = '', text
+        else:
+            head_text = (text if len(text) == self.size else self.__head)[:head or 0]
+            tail_text = text[-tail:] if tail else ''
+        omitted = self.size - len(head_text) - len(tail_text)
+        if omitted <= 0:
+            return head_text + tail_text[-omitted:]
+        return head_text + TRUNCATION_MARKER.format(omitted=omitted) + tail_text
+
+    def close(self):
+        """
+        A method to send the incomplete line to the logger, and release the ring buffer.
+        """
+        if self.__line:
+            line, self.__line = self.__line, ''
+            self.__log(line)
+        self.__head = ''
+        self.__ring.clear()
+        self.__ring_length = 0
+
+
+class OutputCapture:
+    """
+    A class to capture the standard output and the standard error of the current thread, or the current asynchronous
+    task. The routers are installed while any capture is active, and the original streams are restored afterward.
+
+    :param capture_stdout: Flag that indicates whether the standard output should be captured.
+    :type capture_stdout: bool
+    :param capture_stderr: Flag that indicates whether the standard error should be captured.
+    :type capture_stderr: bool
+    :param max_memory_size: The maximum number of characters of each stream kept in memory.
+    :type max_memory_size: int
+    :param logger: The logger that receives the captured lines, if provided, then the output is streamed instead of
+        stored.
+    :type logger: Optional[Logger]
+    :param ring_size: The number of the last characters of each streamed output kept for the status file.
+    :type ring_size: Optional[int]
+    :ivar stdout: The captured standard output, or None if it is not captured.
+    :vartype stdout: Optional[Union[CaptureBuffer, StreamBuffer]]
+    :ivar stderr: The captured standard error, or None if it is not captured.
+    :vartype stderr: Optional[Union[CaptureBuffer, StreamBuffer]]
+    """
+    stdout: Optional[Union[CaptureBuffer, StreamBuffer]]
+    stderr: Optional[Union[CaptureBuffer, StreamBuffer]]
+    __tokens: Dict[str, Token]
+    __lock = threading.Lock()
+    __active_captures = 0
+    __original_streams: Dict[str, TextIO] = {}
+
+    def __init__(self, capture_stdout: bool, capture_stderr: bool, max_memory_size: int = SPOOL_MAX_SIZE,
+                 logger: Optional[Logger] = None, ring_size: Optional[int] = None):
+        self.stdout = self.__create_buffer(STDOUT, max_memory_size, logger, ring_size) if capture_stdout else None
+        self.stderr = self.__create_buffer(STDERR, max_memory_size, logger, ring_size) if capture_stderr else None
+        self.__tokens = {}
+
+    @staticmethod
+    def __create_buffer(name: str, max_memory_size: int, logger: Optional[Logger],
+                        ring_size: Optional[int]) -> Union[CaptureBuffer, StreamBuffer]:
+        """
+        A method to create the buffer of the captured stream.
+
+        :param name: The name of the stream ('stdout' or 'stderr').
+        :type name: str
+        :param max_memory_size: The maximum number of characters kept in memory.
+        :type max_memory_size: int
+        :param logger: The logger that receives the captured lines, if the output is streamed.
+        :type logger: Optional[Logger]
+        :param ring_size: The number of the last characters of the streamed output kept for the status file.
+        :type ring_size: Optional[int]
+        :return: The buffer of the captured stream.
+        :rtype: Union[CaptureBuffer, StreamBuffer]
+        """
+        if logger is not None:
+            return StreamBuffer(logger, STREAM_LOG_LEVELS[name], ring_size)
+        return CaptureBuffer(max_memory_size)
+
+    @classmethod
+    def from_output(cls, stdout: Optional[str], stderr: Optional[str], logger: Optional[Logger] = None,
+                    ring_size: Optional[int] = None) -> 'OutputCapture':
+        """
+        Create a new instance of the class with the output captured elsewhere (e.g. in the worker process).
+
+        :param stdout: The captured standard output, or None if it is not captured.
+        :type stdout: Optional[str]
+        :param stderr: The captured standard error, or None if it is not captured.
+        :type stderr: Optional[str]
+        :param logger: The logger that receives the captured lines, if the output is streamed.
+        :type logger: Optional[Logger]
+        :param ring_size: The number of the last characters of the streamed output kept for the status file.
+        :type ring_size: Optional[int]
+        :return: New instance of the class.
+        :rtype: OutputCapture
+        """
+        output_capture = cls(stdout is not None, stderr is not None, logger=logger, ring_size=ring_size)
+        if stdout is not None:
+            output_capture.stdout.write(stdout)
+        if stderr is not None:
+            output_capture.stderr.write(stderr)
+        return output_capture
+
+    def close(self):
+        """
+        A method to close the buffers of the captured output.
+        """
+        for buffer in (self.stdout, self.stderr):
+            if buffer is not None:
+                buffer.close()
+
+    @classmethod
+    def __install_routers(cls):
+        """
+        A method to replace the standard streams with the routers, when the first capture starts.
+        """
+        with cls.__lock:
+            if cls.__active_captures == 0:
+                for name in CAPTURE_TARGETS:
+                    stream = getattr(sys, name)
+                    if not isinstance(stream, OutputRouter):
+                        cls.__original_streams[name] = stream
+                        setattr(sys, name, OutputRouter(name, stream))
+            cls.__active_captures += 1
+
+    @classmethod
+    def __uninstall_routers(cls):
+        """
+        A method to restore the original standard streams, when the last capture ends. The stream is not restored, if
+        it has been replaced by someone else in the meantime.
+        """
+        with cls.__lock:
+            cls.__active_captures -= 1
+            if cls.__active_captures > 0:
+                return
+            for name, stream in cls.__original_streams.items():
+                router = getattr(sys, name)
+                if isinstance(router, OutputRouter) and router.stream is stream:
+                    setattr(sys, name, stream)
+            cls.__original_streams.clear()
+
+    def __enter__(self) -> 'OutputCapture':
+        buffers = {STDOUT: self.stdout, STDERR: self.stderr}
+        if self.stdout is None and self.stderr is None:
+            return self
+        self.__install_routers()
+        for name, buffer in buffers.items():
+            if buffer is not None:
+                self.__tokens[name] = CAPTURE_TARGETS[name].set(buffer)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self.__tokens:
+            return
+        for name, token in self.__tokens.items():
+            CAPTURE_TARGETS[name].reset(token)
+        self.__tokens = {}
+        self.__uninstall_routers()
+
+    async def run(self, coroutine: Coroutine) -> Any:
+        """
+        A method to await the coroutine with the captured output. The capture must be started in the task that runs
+        the coroutine, as each task has its own context.
+
+        :param coroutine: The coroutine to run.
+        :type coroutine: Coroutine
+        :return: The result of the coroutine.
+        :rtype: Any
+        """
+        with self:
+            return await coroutine
+
+
+class FileDescriptorCapture:
+    """
+    A class to capture the output written to the file descriptors of the standard output and the standard error,
+    including the output of the subprocesses and the native libraries. Each file descriptor is replaced by the pipe,
+    which is read by the separate thread into the buffer.
+
+    The file descriptors are shared by all threads of the process, so only one capture is active in the process at the
+    same time, and the output of the other threads is captured as well. That is why it is used only in the worker
+    processes, which run one step at a time.
+
+    :param capture_stdout: Flag that indicates whether the standard output should be captured.
+    :type capture_stdout: bool
+    :param capture_stderr: Flag that indicates whether the standard error should be captured.
+    :type capture_stderr: bool
+    :param max_memory_size: The maximum number of characters of each stream kept in memory.
+    :type max_memory_size: int
+    :ivar stdout: The captured standard output, or None if it is not captured.
+    :vartype stdout: Optional[CaptureBuffer]
+    :ivar stderr: The captured standard error, or None if it is not captured.
+    :vartype stderr: Optional[CaptureBuffer]
+    """
+    stdout: Optional[CaptureBuffer]
+    stderr: Optional[CaptureBuffer]
+    __saved_descriptors: Dict[str, int]
+    __readers: List[threading.Thread]
+    __lock = threading.Lock()
+
+    def __init__(self, capture_stdout: bool, capture_stderr: bool, max_memory_size: int = SPOOL_MAX_SIZE):
+        self.stdout = CaptureBuffer(max_memory_size) if capture_stdout else None
+        self.stderr = CaptureBuffer(max_memory_size) if capture_stderr else None
+        self.__saved_descriptors = {}
+        self.__readers = []
+
+    @staticmethod
+    def __read_pipe(descriptor: int, buffer: CaptureBuffer):
+        """
+        A method to read the pipe into the buffer until all its write ends are closed.
+
+        :param descriptor: The read end of the pipe.
+        :type descriptor: int
+        :param buffer: The buffer of the captured stream.
+        :type buffer: CaptureBuffer
+        """
+        decoder = codecs.getincrementaldecoder(ENCODING)(errors='replace')
+        try:
+            while True:
+                data = os.read(descriptor, READ_CHUNK_SIZE)
+                if not data:
+                    break
+                buffer.write(decoder.decode(data))
+            buffer.write(decoder.decode(b'', final=True))
+        finally:
+            os.close(descriptor)
+
+    @staticmethod
+    def __flush_stream(name: str):
+        """
+        A method to flush the Python stream, so its buffered output is written to the right file descriptor.
+
+        :param name: The name of the stream ('stdout' or 'stderr').
+        :type name: str
+        """
+        stream = getattr(sys, name)
+        if stream is not None:
+            stream.flush()
+
+    def __restore_descriptors(self):
+        """
+        A method to restore the original file descriptors, and wait until the pipes are read.
+        """
+        for name, saved_descriptor in self.__saved_descriptors.items():
+            self.__flush_stream(name)
+            os.dup2(saved_descriptor, FILE_DESCRIPTORS[name])
+            os.close(saved_descriptor)
+        self.__saved_descriptors = {}
+        for reader in self.__readers:
+            reader.join()
+        self.__readers = []
+
+    def close(self):
+        """
+        A method to close the buffers of the captured output.
+        """
+        for buffer in (self.stdout, self.stderr):
+            if buffer is not None:
+                buffer.close()
+
+    def __enter__(self) -> 'FileDescriptorCapture':
+        self.__lock.acquire()
+        try:
+            for name, buffer in ((STDOUT, self.stdout), (STDERR, self.stderr)):
+                if buffer is None:
+                    continue
+                self.__flush_stream(name)
+                read_descriptor, write_descriptor = os.pipe()
+                self.__saved_descriptors[name] = os.dup(FILE_DESCRIPTORS[name])
+                os.dup2(write_descriptor, FILE_DESCRIPTORS[name])
+                os.close(write_descriptor)
+                reader = threading.Thread(target=self.__read_pipe, args=(read_descriptor, buffer), daemon=True)
+                reader.start()
+                self.__readers.append(reader)
+        except Exception:
+            self.__restore_descriptors()
+            self.__lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self.__restore_descriptors()
+        finally:
+            self.__lock.release()
@@ -0,0 +1,378 @@
+"""
+Module contains the journal of the workflow run. The events of the steps are appended to the journal file as the run
+progresses, so the statuses of the finished steps are not lost when the process is killed. The final status file is
+derived from the same events, and it is replaced atomically, so it is never left half-written. The changes of the
+workflow context are written with the events of the finished steps, so the context can be restored from the journal as
+well.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Union
+
+from workflows_manager.configuration import StepType
+from workflows_manager.workflow import StepInformation, StepsInformation, StepStatus, WorkflowContext
+
+ENCODING = 'utf-8'
+JOURNAL_FILE_SUFFIX = '-journal.ndjson'
+EVENT_WORKFLOW_STARTED = 'workflow_started'
+EVENT_WORKFLOW_FINISHED = 'workflow_finished'
+EVENT_STEP_STARTED = 'step_started'
+EVENT_STEP_FINISHED = 'step_finished'
+EVENT_STEP_FAILED = 'step_failed'
+EVENT_STEP_CHILDREN_CREATED = 'step_children_created'
+CONTEXT_UPDATES_FIELD = 'context_updates'
+CONTEXT_REMOVALS_FIELD = 'context_removals'
+EVENT_FIELDS = ('event', 'timestamp', 'step', CONTEXT_UPDATES_FIELD, CONTEXT_REMOVALS_FIELD)
+
+
+def get_journal_path(status_file: Path) -> Path:
+    """
+    Get the path to the journal file of the status file.
+
+    :param status_file: The path to the status file.
+    :type status_file: Path
+    :return: The path to the journal file, it is placed next to the status file.
+    :rtype: Path
+    """
+    return status_file.parent.joinpath(f'{status_file.stem}{JOURNAL_FILE_SUFFIX}')
+
+
+def write_status_file(status_file: Path, status: Dict[str, Any]):
+    """
+    Write the status to the temporary file next to the status file, and then replace the status file with it.
+
+    :param status_file: The path to the status file.
+    :type status_file: Path
+    :param status: The statuses of the steps.
+    :type status: Dict[str, Any]
+    """
+    descriptor, temporary_path = tempfile.mkstemp(prefix=f'.{status_file.name}.', suffix='.tmp',
+                                                  dir=status_file.parent)
+    try:
+        with os.fdopen(descriptor, 'w', encoding=ENCODING) as file:
+            json.dump(status, file, indent=4, default=str)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, status_file)
+    except BaseException:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
+
+
+def flatten_steps(steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Get the steps of the status and all their children in the pre-order, the position in the list is the index of the
+    step used by the events of the journal.
+
+    :param steps: The steps of the status.
+    :type steps: List[Dict[str, Any]]
+    :return: The steps and their children.
+    :rtype: List[Dict[str, Any]]
+    """
+    flat_steps = []
+    for step in steps:
+        flat_steps.append(step)
+        flat_steps.extend(flatten_steps(step.get('children') or []))
+    return flat_steps
+
+
+def apply_event(flat_steps: List[Dict[str, Any]], event: Dict[str, Any]):
+    """
+    Apply the event of the step to the status of the step. The children created during the run (e.g. of the workflow
+    step with the templated workflow name) are indexed after all steps known so far.
+
+    :param flat_steps: The steps of the status, the children created during the run are appended to them.
+    :type flat_steps: List[Dict[str, Any]]
+    :param event: The event of the step.
+    :type event: Dict[str, Any]
+    """
+    step = flat_steps[event['step']]
+    if event['event'] == EVENT_STEP_CHILDREN_CREATED:
+        flat_steps.extend(flatten_steps(event['children']))
+    for key, value in event.items():
+        if key not in EVENT_FIELDS:
+            step[key] = value
+
+
+def apply_context_changes(status: Dict[str, Any], event: Dict[str, Any]):
+    """
+    Apply the changes of the workflow context written with the event to the context of the status.
+
+    :param status: The statuses of the steps, and the values of the workflow context.
+    :type status: Dict[str, Any]
+    :param event: The event with the changed and removed values of the workflow context.
+    :type event: Dict[str, Any]
+    """
+    context = status.setdefault('context', {})
+    context.update(event.get(CONTEXT_UPDATES_FIELD) or {})
+    for key in event.get(CONTEXT_REMOVALS_FIELD) or []:
+        context.pop(key, None)
+
+
+def read_journal(journal_file: Path) -> Dict[str, Any]:
+    """
+    Rebuild the status from the journal file, e.g. when the run has been killed before the status file was written.
+    The last line is ignored, if it has not been written completely.
+
+    :param journal_file: The path to the journal file.
+    :type journal_file: Path
+    :raise ValueError: If the journal does not start with the event of the started workflow.
+    :return: The statuses of the steps.
+    :rtype: Dict[str, Any]
+    """
+    status = None
+    flat_steps = []
+    with journal_file.open('r', encoding=ENCODING) as file:
+        for line in file:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                break
+            if event['event'] == EVENT_WORKFLOW_STARTED:
+                status = event['status']
+                flat_steps = flatten_steps(status['steps'])
+            elif status is None:
+                raise ValueError(f"Journal file '{journal_file}' does not start with the '{EVENT_WORKFLOW_STARTED}' "
+                                 f"event")
+            elif 'step' in event:
+                apply_event(flat_steps, event)
+            apply_context_changes(status, event)
+    if status is None:
+        raise ValueError(f"Journal file '{journal_file}' does not start with the '{EVENT_WORKFLOW_STARTED}' event")
+    return status
+
+
+def load_status(status_file: Path) -> Dict[str, Any]:
+    """
+    Load the status of the previous run from the status file. When the status file does not exist (e.g. the run has
+    been killed), the status is rebuilt from its journal.
+
+    :param status_file: The path to the status file.
+    :type status_file: Path
+    :raise FileNotFoundError: If neither the status file nor its journal exist.
+    :raise ValueError: If the status file is not a valid JSON file, or the journal is not valid.
+    :return: The statuses of the steps, and the values of the workflow context.
+    :rtype: Dict[str, Any]
+    """
+    journal_file = get_journal_path(status_file)
+    if not status_file.exists() and journal_file.exists():
+        return read_journal(journal_file)
+    with status_file.open('r', encoding=ENCODING) as file:
+        return json.load(file)
+
+
+class StatusJournal:
+    """
+    A class to append the events of the steps to the journal file, one JSON object per line. The status of the run is
+    kept in memory by applying the same events, so it is ready when the run finishes. Only the values of the workflow
+    context that can be written as JSON are kept, the other values are skipped with a warning.
+
+    :param path: The path to the journal file.
+    :type path: Path
+    :param logger: The logger used to report the skipped values of the workflow context.
+    :type logger: Optional[Logger]
+    :ivar path: The path to the journal file.
+    :vartype path: Path
+    :ivar status: The statuses of the steps, derived from the events of the journal.
+    :vartype status: Dict[str, Any]
+    :ivar logger: The logger used to report the skipped values of the workflow context.
+    :vartype logger: Logger
+    """
+    path: Path
+    status: Dict[str, Any]
+    logger: Logger
+    __file: Optional[TextIO]
+    __lock: threading.Lock
+    __flat_steps: List[Dict[str, Any]]
+    __indexes: Dict[int, int]
+    __written_context: Dict[str, str]
+    __skipped_context_keys: Set[str]
+
+    def __init__(self, path: Path, logger: Optional[Logger] = None):
+        self.path = path
+        self.status = {}
+        self.logger = logger or getLogger(__name__)
+        self.__file = None
+        self.__lock = threading.Lock()
+        self.__flat_steps = []
+        self.__indexes = {}
+        self.__written_context = {}
+        self.__skipped_context_keys = set()
+
+    def __index_steps(self, steps: List[StepInformation]):
+        """
+        A method to assign the indexes to the steps and their children, in the same order as the steps of the status are
+        flattened, after all steps indexed so far.
+
+        :param steps: The information of the steps.
+        :type steps: List[StepInformation]
+        """
+        for step in steps:
+            self.__indexes[id(step)] = len(self.__indexes)
+            self.__index_steps(step.children or [])
+
+    def __get_context_changes(self, updates: Dict[str, Any], removals: Iterable[str]) -> Dict[str, Any]:
+        """
+        A method to get the values of the workflow context changed or removed since they were written last time, only
+        the provided values are serialized. The values that cannot be written as JSON are skipped, the warning is
+        logged once for each of them.
+
+        :param updates: The values set in the workflow context.
+        :type updates: Dict[str, Any]
+        :param removals: The keys removed from the workflow context.
+        :type removals: Iterable[str]
+        :return: The fields of the event with the changed values and the removed keys, if there are any.
+        :rtype: Dict[str, Any]
+        """
+        changed_values = {}
+        removed_keys = list(removals)
+        for key, value in updates.items():
+            try:
+                serialized_value = json.dumps(value)
+            except (TypeError, ValueError) as exception:
+                if key not in self.__skipped_context_keys:
+                    self.__skipped_context_keys.add(key)
+                    self.logger.warning(f"Workflow context value '{key}' is not written to the status, it is not "
+                                        f"JSON serializable: {exception}")
+                removed_keys.append(key)
+                continue
+            if self.__written_context.get(key) != serialized_value:
+                self.__written_context[key] = serialized_value
+                changed_values[key] = value
+        removed_keys = [key for key in removed_keys if self.__written_context.pop(key, None) is not None]
+        changes = {}
+        if changed_values:
+            changes[CONTEXT_UPDATES_FIELD] = changed_values
+        if removed_keys:
+            changes[CONTEXT_REMOVALS_FIELD] = removed_keys
+        return changes
+
+    def __append(self, event: Dict[str, Any], children: Optional[List[StepInformation]] = None,
+                 context: Optional[Union[Dict[str, Any], WorkflowContext]] = None):
+        """
+        A method to append the event to the journal file, and apply it to the status.
+
+        :param event: The event.
+        :type event: Dict[str, Any]
+        :param children: The information of the children created by the event, they are indexed at the same time.
+        :type children: Optional[List[StepInformation]]
+        :param context: The workflow context, whose values set or removed since the previous event are written with the
+            event, or all values stored in the workflow context, which are compared with the written values.
+        :type context: Optional[Union[Dict[str, Any], WorkflowContext]]
+        """
+        event['timestamp'] = time.time()
+        with self.__lock:
+            if isinstance(context, WorkflowContext):
+                event.update(self.__get_context_changes(*context.pop_changes()))
+            elif context is not None:
+                event.update(self.__get_context_changes(
+                    context, [key for key in self.__written_context if key not in context]))
+            line = json.dumps(event, default=str)
+            self.__file.write(f'{line}\n')
+            self.__file.flush()
+            apply_context_changes(self.status, event)
+            if 'step' in event:
+                apply_event(self.__flat_steps, event)
+            if children:
+                self.__index_steps(children)
+
+    def open(self, workflow_name: str, steps_information: StepsInformation, context: Optional[Dict[str, Any]] = None):
+        """
+        A method to create the journal file, and write the event with the initial statuses of the steps and the initial
+        values of the workflow context.
+
+        :param workflow_name: The name of the workflow.
+        :type workflow_name: str
+        :param steps_information: The information of the steps of the workflow.
+        :type steps_information: StepsInformation
+        :param context: The values stored in the workflow context, e.g. restored from the previous run. The changes
+            tracked by the workflow context before the journal is opened shall be discarded, as all values are written.
+        :type context: Optional[Dict[str, Any]]
+        """
+        steps = []
+        step = steps_information.first_step
+        while step is not None:
+            steps.append(step)
+            step = step.next_step
+        self.status = {**steps_information.to_dict(), 'context': {}}
+        self.__flat_steps = flatten_steps(self.status['steps'])
+        self.__indexes = {}
+        self.__written_context = {}
+        self.__index_steps(steps)
+        self.__file = self.path.open('w', encoding=ENCODING)
+        self.__append({'event': EVENT_WORKFLOW_STARTED, 'workflow_name': workflow_name, 'status': self.status},
+                      context=context or {})
+
+    def record(self, step_status: StepInformation, workflow_context: Optional[WorkflowContext] = None):
+        """
+        A method to append the event of the step, depending on its status. The values set or removed in the workflow
+        context since the previous event are written with the event of the finished or failed step, the other values
+        are not serialized again.
+
+        :param step_status: The information of the step.
+        :type step_status: StepInformation
+        :param workflow_context: The workflow context, which tracks the changed values.
+        :type workflow_context: Optional[WorkflowContext]
+        """
+        index = self.__indexes.get(id(step_status))
+        if index is None or self.__file is None:
+            return
+        if step_status.status == StepStatus.RUNNING:
+            event_name = EVENT_STEP_STARTED
+        elif step_status.status == StepStatus.FAILED:
+            event_name = EVENT_STEP_FAILED
+        else:
+            event_name = EVENT_STEP_FINISHED
+        event = {
+            'event': event_name,
+            'step': index,
+            'name': step_status.path.name,
+            'status': step_status.status.value,
+        }
+        if event_name != EVENT_STEP_STARTED:
+            event.update({
+                'parameters': step_status.parameters,
+                'error': str(step_status.error) if step_status.error else None,
+            })
+            if step_status.path.type == StepType.NORMAL:
+                event.update({
+                    'stdout': step_status.stdout,
+                    'stderr': step_status.stderr,
+                    'return_value': step_status.return_value,
+                })
+        self.__append(event, context=None if event_name == EVENT_STEP_STARTED else workflow_context)
+
+    def record_children(self, step_status: StepInformation):
+        """
+        A method to append the event with the children of the step created during the run.
+
+        :param step_status: The information of the step.
+        :type step_status: StepInformation
+        """
+        index = self.__indexes.get(id(step_status))
+        if index is None or self.__file is None or not step_status.children:
+            return
+        self.__append({'event': EVENT_STEP_CHILDREN_CREATED, 'step': index,
+                       'children': step_status.children[0].to_dict()}, step_status.children)
+
+    def close(self, is_successful: bool, context: Dict[str, Any]):
+        """
+        A method to write the event of the finished workflow with the last changes of the workflow context, and close
+        the journal file. All values of the workflow context are compared with the written values, so the values
+        modified in place are written as well.
+
+        :param is_successful: Flag that indicates whether the workflow has succeeded.
+        :type is_successful: bool
+        :param context: The values stored in the workflow context, they are kept in the status to resume the run.
+        :type context: Dict[str, Any]
+        """
+        if self.__file is None:
+            return
+        self.__append({'event': EVENT_WORKFLOW_FINISHED, 'successful': is_successful}, context=context)
+        self.__file.close()
+        self.__file = None
@@ -0,0 +1,319 @@
+"""
+Module contains the on-disk cache of the results of the normal steps. The results are addressed by the key derived from
+the ID of the step, its resolved parameters, and the fingerprint of its code, so the step with the same inputs is not
+performed again. The least recently used results are evicted when the cache exceeds its maximum size.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass, field
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from workflows_manager.utils.cache import CACHE_FILE_SUFFIX, atomic_write, get_content_key, get_default_cache_directory
+from workflows_manager.workflow import StepInformation, StepPath, StepsInformation, WorkflowContext
+
+STEP_CACHE_NAMESPACE = 'steps'
+STEP_CACHE_FORMAT_VERSION = 2
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+SOURCE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_code_fingerprint(step_class: type) -> str:
+    """
+    Get the fingerprint of the code of the step class, so the cached results are invalidated when the step changes.
+    The source code is read by one thread at a time, as the source of the class is found by parsing the whole module,
+    and the parser must not be run concurrently by the steps running in the worker threads.
+
+    :param step_class: The class of the step.
+    :type step_class: type
+    :return: The hash of the source code of the class, or its qualified name if the source code is not available.
+    :rtype: str
+    """
+    try:
+        with SOURCE_LOCK:
+            source = inspect.getsource(step_class)
+    except (OSError, TypeError):
+        source = f'{step_class.__module__}.{step_class.__qualname__}'
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class StepCacheEntry:
+    """
+    A class to represent the cached result of the step.
+
+    :param return_value: The return value of the step.
+    :type return_value: Any
+    :param stdout: The captured standard output of the step.
+    :type stdout: Optional[str]
+    :param stderr: The captured standard error of the step.
+    :type stderr: Optional[str]
+    :param context_updates: The values set by the step in the workflow context.
+    :type context_updates: Dict[str, Any]
+    :param context_removals: The keys removed by the step from the workflow context.
+    :type context_removals: List[str]
+    :param created: The time when the result has been stored.
+    :type created: float
+    """
+    return_value: Any = field(default=None)
+    stdout: Optional[str] = field(default=None)
+    stderr: Optional[str] = field(default=None)
+    context_updates: Dict[str, Any] = field(default_factory=dict)
+    created: float = field(default_factory=time.time)
+    context_removals: List[str] = field(default_factory=list)
+
+
+class RecordingWorkflowContext(WorkflowContext):
+    """
+    A class to record the values set by the single step in the workflow context. All calls are passed to the context
+    of the workflow, so the step sees the same values as the other steps.
+
+    :param workflow_context: The context of the workflow.
+    :type workflow_context: WorkflowContext
+    :ivar context_updates: The values set by the step.
+    :vartype context_updates: Dict[str, Any]
+    :ivar context_removals: The keys removed by the step.
+    :vartype context_removals: List[str]
+    """
+    context_updates: Dict[str, Any]
+    context_removals: List[str]
+    __workflow_context: WorkflowContext
+
+    def __init__(self, workflow_context: WorkflowContext):
+        super().__init__()
+        self.__workflow_context = workflow_context
+        self.context_updates = {}
+        self.context_removals = []
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        A method to get a value from the context of the workflow.
+
+        :param key: The key of the value to get from the context.
+        :type key: str
+        :param default: The default value to return if the key is not found in the context.
+        :type default: Any
+        :return: Value from the context, if the key is found, otherwise the default value.
+        :rtype: Any
+        """
+        return self.__workflow_context.get(key, default)
+
+    def set(self, key: str, value: Any):
+        """
+        A method to set a value to the context of the workflow, and record it.
+
+        :param key: The key of the value to set in the context.
+        :type key: str
+        :param value: The value to set in the context.
+        :type value: Any
+        """
+        self.context_updates[key] = value
+        if key in self.context_removals:
+            self.context_removals.remove(key)
+        self.__workflow_context.set(key, value)
+
+    def remove(self, key: str):
+        """
+        A method to remove a value from the context of the workflow, and record it.
+
+        :param key: The key of the value to remove from the context.
+        :type key: str
+        """
+        self.context_updates.pop(key, None)
+        if key not in self.context_removals:
+            self.context_removals.append(key)
+        self.__workflow_context.remove(key)
+
+    def get_step_information(self, step: StepPath) -> StepInformation:
+        """
+        A method to get the status of a step in the workflow.
+
+        :param step: The path to the step.
+        :type step: StepPath
+        :return: The status of the step.
+        :rtype: StepInformation
+        """
+        return self.__workflow_context.get_step_information(step)
+
+    @property
+    def parameters(self) -> Dict:
+        """
+        A property to get the copy of the values stored in the context of the workflow.
+        """
+        return self.__workflow_context.parameters
+
+    @property
+    def steps_information(self) -> StepsInformation:
+        """
+        A property to get the status of all steps in the workflow.
+        """
+        return self.__workflow_context.steps_information
+
+    @property
+    def global_lock(self) -> threading.Lock:
+        """
+        A property to get the global lock of the workflow.
+        """
+        return self.__workflow_context.global_lock
+
+
+class StepCache:
+    """
+    A class to store the results of the steps on disk. Each result is stored in its own file, named after its key. The
+    file is touched when the result is used, and the least recently used files are removed when the total size of the
+    cache exceeds the maximum size. The total size is scanned once, and then it is estimated from the stored results, so
+    the cache directory is scanned again only when the estimate exceeds the maximum size.
+
+    :param cache_directory: The path to the cache directory, if not provided, then the default cache directory is used.
+    :type cache_directory: Optional[Union[str, Path]]
+    :param max_size: The maximum size of the cache in bytes.
+    :type max_size: int
+    :param logger: The logger used to report the cache errors.
+    :type logger: Optional[Logger]
+    :ivar directory: The path to the directory with the cached results.
+    :vartype directory: Path
+    :ivar max_size: The maximum size of the cache in bytes.
+    :vartype max_size: int
+    :ivar logger: The logger used to report the cache errors.
+    :vartype logger: Logger
+    """
+    directory: Path
+    max_size: int
+    logger: Logger
+    __lock: threading.Lock
+    __size: Optional[int]
+
+    def __init__(self, cache_directory: Optional[Union[str, Path]] = None, max_size: int = DEFAULT_MAX_SIZE,
+                 logger: Optional[Logger] = None):
+        if cache_directory is None:
+            cache_directory = get_default_cache_directory()
+        self.directory = Path(cache_directory).joinpath(STEP_CACHE_NAMESPACE)
+        self.max_size = max_size
+        self.logger = logger or getLogger(__name__)
+        self.__lock = threading.Lock()
+        self.__size = None
+
+    @staticmethod
+    def get_key(step_id: str, parameters: Dict[str, Any], fingerprint: str) -> str:
+        """
+        A method to get the key of the result of the step. The key depends on the format version of the cached
+        results, so the results stored in the previous format are not found.
+
+        :param step_id: The ID of the registered step.
+        :type step_id: str
+        :param parameters: The resolved parameters of the step.
+        :type parameters: Dict[str, Any]
+        :param fingerprint: The fingerprint of the code of the step, and its configured version.
+        :type fingerprint: str
+        :return: The key of the result.
+        :rtype: str
+        """
+        content = json.dumps([STEP_CACHE_FORMAT_VERSION, step_id, fingerprint, parameters], sort_keys=True,
+                             default=repr)
+        return get_content_key(content.encode('utf-8'))
+
+    def __get_cache_file(self, key: str) -> Path:
+        """
+        A method to get the path to the file with the result.
+
+        :param key: The key of the result.
+        :type key: str
+        :return: The path to the file with the result.
+        :rtype: Path
+        """
+        return self.directory.joinpath(f'{key}{CACHE_FILE_SUFFIX}')
+
+    def load(self, key: str, ttl: Optional[float] = None) -> Optional[StepCacheEntry]:
+        """
+        A method to load the result of the step. The expired result is removed.
+
+        :param key: The key of the result.
+        :type key: str
+        :param ttl: The number of seconds the result is valid for, if not provided, then it never expires.
+        :type ttl: Optional[float]
+        :return: The cached result, or None if there is no valid result for the key.
+        :rtype: Optional[StepCacheEntry]
+        """
+        cache_file = self.__get_cache_file(key)
+        try:
+            with cache_file.open('rb') as file:
+                entry: StepCacheEntry = pickle.load(file)
+            if ttl is not None and time.time() - entry.created > ttl:
+                cache_file.unlink(missing_ok=True)
+                return None
+            os.utime(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as exception:
+            self.logger.debug(f"Unable to read the cached result '{cache_file}': {exception}")
+            return None
+        return entry
+
+    def store(self, key: str, entry: StepCacheEntry):
+        """
+        A method to store the result of the step, and evict the least recently used results. The file is replaced
+        atomically, errors are logged and ignored, as the cache is only an optimization.
+
+        :param key: The key of the result.
+        :type key: str
+        :param entry: The result of the step.
+        :type entry: StepCacheEntry
+        """
+        cache_file = self.__get_cache_file(key)
+        try:
+            previous_size = cache_file.stat().st_size if cache_file.exists() else 0
+            with atomic_write(cache_file) as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.__evict(cache_file.stat().st_size - previous_size)
+        except Exception as exception:
+            self.logger.debug(f"Unable to write the cached result '{cache_file}': {exception}")
+
+    def __get_files(self) -> List[Tuple[float, int, Path]]:
+        """
+        A method to get the files with the cached results.
+
+        :return: The modification time, the size, and the path of each file.
+        :rtype: List[Tuple[float, int, Path]]
+        """
+        files = []
+        for cache_file in self.directory.glob(f'*{CACHE_FILE_SUFFIX}'):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, cache_file))
+        return files
+
+    def __evict(self, size_change: int):
+        """
+        A method to update the estimated size of the cache, and remove the least recently used results, until the total
+        size of the cache does not exceed the maximum size. The files are scanned only when the estimate exceeds the
+        maximum size, as the other processes may share the cache directory.
+
+        :param size_change: The change of the size of the cache caused by the stored result.
+        :type size_change: int
+        """
+        with self.__lock:
+            if self.__size is None:
+                self.__size = sum(size for _, size, _ in self.__get_files())
+            else:
+                self.__size += size_change
+            if self.__size <= self.max_size:
+                return
+            files = self.__get_files()
+            total_size = sum(size for _, size, _ in files)
+            for _, size, cache_file in sorted(files, key=lambda item: item[0]):
+                if total_size <= self.max_size:
+                    break
+                cache_file.unlink(missing_ok=True)
+                total_size -= size
+                self.logger.debug(f"Cached result evicted: {cache_file}")
+            self.__size = total_size
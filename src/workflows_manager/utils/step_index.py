@@ -0,0 +1,183 @@
+"""
+Module contains the index of the steps, that maps the names of the registered steps to the modules that register them.
+The index is built by scanning the source code of the modules, so the modules do not have to be imported.
+"""
+import ast
+from dataclasses import dataclass, field
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import Dict, List, Optional, Union, Iterable, Set, Tuple
+
+from workflows_manager.utils.cache import FileCache, get_content_key
+from workflows_manager.utils.module_loader import collect_module_files, get_module_name
+
+STEP_INDEX_CACHE_NAMESPACE = 'step-index'
+REGISTER_METHOD_NAME = 'register'
+REGISTER_NAME_ARGUMENT = 'name'
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """
+    A class to represent the indexed module.
+
+    :ivar module: The name of the module relative to the import path.
+    :vartype module: str
+    :ivar modification_time: The modification time of the module file in nanoseconds.
+    :vartype modification_time: int
+    :ivar size: The size of the module file in bytes.
+    :vartype size: int
+    :ivar steps: The names of the steps registered by the module.
+    :vartype steps: List[str]
+    :ivar dynamic: True if the module registers the steps that cannot be found without importing it (e.g. the name of
+        the step is not a string literal, or the module cannot be parsed), otherwise False.
+    :vartype dynamic: bool
+    """
+    module: str
+    modification_time: int
+    size: int
+    steps: List[str] = field(default_factory=list)
+    dynamic: bool = False
+
+
+def find_registered_steps(source: str) -> Optional[List[str]]:
+    """
+    Find the names of the steps registered in the source code. The step is considered registered when the source code
+    contains a call to the register method with a string literal name (e.g. `@steps.register(name='step')`).
+
+    :param source: The source code of the module.
+    :type source: str
+    :return: The names of the registered steps, or None if at least one of the names is not a string literal.
+    :rtype: Optional[List[str]]
+    """
+    if REGISTER_METHOD_NAME not in source:
+        return []
+    registered_steps = []
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.Call):
+            continue
+        function = node.func
+        function_name = function.attr if isinstance(function, ast.Attribute) else getattr(function, 'id', None)
+        if function_name != REGISTER_METHOD_NAME:
+            continue
+        arguments = [keyword.value for keyword in node.keywords if keyword.arg == REGISTER_NAME_ARGUMENT]
+        arguments.extend(node.args[:1])
+        if len(arguments) != 1:
+            return None
+        argument = arguments[0]
+        if not isinstance(argument, ast.Constant) or not isinstance(argument.value, str):
+            return None
+        registered_steps.append(argument.value)
+    return registered_steps
+
+
+class StepIndex:
+    """
+    A class to index the steps registered by the modules from the import path. The index is cached on disk, only the
+    modules with changed modification time or size are scanned again.
+
+    :param import_path: The path to the package with modules.
+    :type import_path: Union[str, Path]
+    :param cache_directory: The path to the cache directory, if not provided, then the default cache directory is used.
+    :type cache_directory: Optional[Union[str, Path]]
+    :param logger: The logger used to report the scanning errors.
+    :type logger: Optional[Logger]
+    :param include_patterns: The glob patterns of the module files to index, if not provided, then all module files
+        are indexed.
+    :type include_patterns: Optional[List[str]]
+    :param exclude_patterns: The glob patterns of the files and directories to skip.
+    :type exclude_patterns: Optional[List[str]]
+    :ivar import_path: The path to the package with modules.
+    :vartype import_path: Path
+    :ivar entries: The indexed modules by the paths of their files relative to the import path.
+    :vartype entries: Dict[str, IndexEntry]
+    :ivar logger: The logger used to report the scanning errors.
+    :vartype logger: Logger
+    :ivar include_patterns: The glob patterns of the module files to index.
+    :vartype include_patterns: Optional[List[str]]
+    :ivar exclude_patterns: The glob patterns of the files and directories to skip.
+    :vartype exclude_patterns: Optional[List[str]]
+    """
+    import_path: Path
+    entries: Dict[str, IndexEntry]
+    logger: Logger
+    include_patterns: Optional[List[str]]
+    exclude_patterns: Optional[List[str]]
+    __cache: FileCache
+
+    def __init__(self, import_path: Union[str, Path], cache_directory: Optional[Union[str, Path]] = None,
+                 logger: Optional[Logger] = None, include_patterns: Optional[List[str]] = None,
+                 exclude_patterns: Optional[List[str]] = None):
+        self.import_path = Path(import_path)
+        self.entries = {}
+        self.logger = logger or getLogger(__name__)
+        self.include_patterns = include_patterns
+        self.exclude_patterns = exclude_patterns
+        self.__cache = FileCache(STEP_INDEX_CACHE_NAMESPACE, cache_directory, self.logger)
+
+    def __scan(self, relative_path: str, modification_time: int, size: int) -> IndexEntry:
+        """
+        A method to scan the module file for the registered steps.
+
+        :param relative_path: The path to the module file relative to the import path.
+        :type relative_path: str
+        :param modification_time: The modification time of the module file in nanoseconds.
+        :type modification_time: int
+        :param size: The size of the module file in bytes.
+        :type size: int
+        :return: The indexed module.
+        :rtype: IndexEntry
+        """
+        file_path = self.import_path.joinpath(relative_path)
+        module = get_module_name(relative_path)
+        try:
+            registered_steps = find_registered_steps(file_path.read_text(encoding='utf-8'))
+        except Exception as exception:
+            self.logger.debug(f"Unable to scan the module '{file_path}': {exception}")
+            registered_steps = None
+        if registered_steps is None:
+            return IndexEntry(module, modification_time, size, dynamic=True)
+        return IndexEntry(module, modification_time, size, registered_steps)
+
+    def build(self) -> 'StepIndex':
+        """
+        A method to build the index. The modules that have not changed since the last build are taken from the cache.
+
+        :return: The step index.
+        :rtype: StepIndex
+        """
+        key = get_content_key(str(self.import_path.absolute()).encode('utf-8'))
+        cached_entries = self.__cache.load(self.import_path, key) or {}
+        entries = {}
+        for relative_path in collect_module_files(self.import_path, self.include_patterns, self.exclude_patterns):
+            try:
+                stat = self.import_path.joinpath(relative_path).stat()
+            except OSError:
+                continue
+            entry = cached_entries.get(relative_path)
+            if entry is None or entry.modification_time != stat.st_mtime_ns or entry.size != stat.st_size:
+                entry = self.__scan(relative_path, stat.st_mtime_ns, stat.st_size)
+            entries[relative_path] = entry
+        self.entries = entries
+        if entries != cached_entries:
+            self.__cache.store(self.import_path, key, entries)
+        return self
+
+    def find_modules(self, step_names: Iterable[str]) -> Tuple[List[str], Set[str]]:
+        """
+        A method to find the modules that have to be imported to register the steps. The modules that register the
+        steps dynamically are always included.
+
+        :param step_names: The names of the steps.
+        :type step_names: Iterable[str]
+        :return: The names of the modules, and the names of the steps that are not registered by any indexed module.
+        :rtype: Tuple[List[str], Set[str]]
+        """
+        missing_steps = set(step_names)
+        modules = []
+        for entry in self.entries.values():
+            if entry.dynamic or missing_steps.intersection(entry.steps):
+                modules.append(entry.module)
+        for entry in self.entries.values():
+            missing_steps.difference_update(entry.steps)
+        return modules, missing_steps
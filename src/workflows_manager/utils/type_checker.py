@@ -0,0 +1,434 @@
+"""
+Module contains the type checkers and coercers of the step parameters. Each type annotation is compiled once into the
+function that checks the values against it, including the typing generics, unions and literals, and the compiled
+functions are cached, so the annotations are not interpreted again on each step run. The coercers convert the string
+values, and the lists and dictionaries of the string values (e.g. the parameters from the command line), to the
+annotated types.
+"""
+import collections.abc
+import functools
+import inspect
+import json
+import types
+import typing
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+TypeChecker = Callable[[Any], bool]
+TypeCoercer = Callable[[Any], Any]
+COERCIBLE_TYPES = (str, list, dict)
+
+NoneType = type(None)
+UNION_TYPES = tuple(union_type for union_type in (typing.Union, getattr(types, 'UnionType', None)) if union_type)
+LIST_DELIMITER = ','
+TRUE_VALUES = ('true', 'yes', '1')
+FALSE_VALUES = ('false', 'no', '0')
+NONE_VALUES = ('none', 'null')
+SEQUENCE_TYPES = (list, set, frozenset, collections.abc.Sequence, collections.abc.MutableSequence,
+                  collections.abc.Set, collections.abc.MutableSet, collections.abc.Collection,
+                  collections.abc.Iterable)
+MAPPING_TYPES = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+
+def _accept_any(_: Any) -> bool:
+    """
+    Accept any value.
+
+    :param _: The value to check.
+    :type _: Any
+    :return: Always True.
+    :rtype: bool
+    """
+    return True
+
+
+def _is_any(annotation: Any) -> bool:
+    """
+    Check if the annotation accepts any value, e.g. it is missing, it is a type variable, or it is a forward reference
+    that cannot be resolved.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: True if the annotation accepts any value, otherwise False.
+    :rtype: bool
+    """
+    return (annotation is Any or annotation is inspect.Parameter.empty or annotation is object
+            or isinstance(annotation, (str, typing.TypeVar, typing.ForwardRef)))
+
+
+def _unwrap(annotation: Any) -> Any:
+    """
+    Get the type wrapped by the annotated type or the new type.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: The wrapped type, or the annotation if it does not wrap any type.
+    :rtype: Any
+    """
+    while True:
+        if typing.get_origin(annotation) is typing.Annotated:
+            annotation = typing.get_args(annotation)[0]
+        elif hasattr(annotation, '__supertype__'):
+            annotation = annotation.__supertype__
+        else:
+            return annotation
+
+
+def _check_class(annotation: type) -> TypeChecker:
+    """
+    Compile the checker of the class. Following the numeric tower, the integers are accepted by the float.
+
+    :param annotation: The class.
+    :type annotation: type
+    :return: The checker of the values.
+    :rtype: TypeChecker
+    """
+    if annotation is float:
+        return lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)
+    if annotation is complex:
+        return lambda value: isinstance(value, (int, float, complex)) and not isinstance(value, bool)
+    return lambda value: isinstance(value, annotation)
+
+
+def _compile_checker(annotation: Any) -> TypeChecker:
+    """
+    Compile the checker of the values against the type annotation.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: The checker of the values.
+    :rtype: TypeChecker
+    """
+    annotation = _unwrap(annotation)
+    if _is_any(annotation):
+        return _accept_any
+    if annotation is None or annotation is NoneType:
+        return lambda value: value is None
+    origin = typing.get_origin(annotation)
+    arguments = typing.get_args(annotation)
+    if origin in UNION_TYPES:
+        checkers = tuple(get_type_checker(argument) for argument in arguments)
+        return lambda value: any(checker(value) for checker in checkers)
+    if origin is typing.Literal:
+        return lambda value: any(value == literal and type(value) is type(literal) for literal in arguments)
+    if origin is type:
+        if not arguments or _is_any(arguments[0]):
+            return lambda value: isinstance(value, type)
+        return lambda value: isinstance(value, type) and issubclass(value, arguments[0])
+    if origin is collections.abc.Callable:
+        return callable
+    if origin is tuple:
+        if not arguments:
+            return lambda value: isinstance(value, tuple)
+        if len(arguments) == 2 and arguments[1] is Ellipsis:
+            item_checker = get_type_checker(arguments[0])
+            return lambda value: isinstance(value, tuple) and all(item_checker(item) for item in value)
+        item_checkers = tuple(get_type_checker(argument) for argument in arguments)
+        return lambda value: (isinstance(value, tuple) and len(value) == len(item_checkers)
+                              and all(checker(item) for checker, item in zip(item_checkers, value)))
+    if origin in MAPPING_TYPES and arguments:
+        key_checker = get_type_checker(arguments[0])
+        value_checker = get_type_checker(arguments[1])
+        return lambda value: isinstance(value, origin) and all(
+            key_checker(key) and value_checker(item) for key, item in value.items())
+    if origin in SEQUENCE_TYPES and arguments:
+        item_checker = get_type_checker(arguments[0])
+        return lambda value: isinstance(value, origin) and not isinstance(value, (str, bytes)) and all(
+            item_checker(item) for item in value)
+    if origin is not None:
+        annotation = origin
+    if not isinstance(annotation, type):
+        return _accept_any
+    return _check_class(annotation)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_type_checker(annotation: Any) -> TypeChecker:
+    """
+    Get the compiled checker of the type annotation from the cache.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: The checker of the values.
+    :rtype: TypeChecker
+    """
+    return _compile_checker(annotation)
+
+
+def get_type_checker(annotation: Any) -> TypeChecker:
+    """
+    Get the checker of the values against the type annotation, it is compiled once per annotation. The missing
+    annotations, the type variables and the unresolved forward references accept any value.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: The checker of the values.
+    :rtype: TypeChecker
+    """
+    try:
+        return _get_cached_type_checker(annotation)
+    except TypeError:
+        return _compile_checker(annotation)
+
+
+def _coerce_boolean(value: str) -> bool:
+    """
+    Coerce the string to the boolean.
+
+    :param value: The string value.
+    :type value: str
+    :raise ValueError: If the string is not a boolean value.
+    :return: The boolean value.
+    :rtype: bool
+    """
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+    raise ValueError(f"Value '{value}' is not a boolean, expected one of: {TRUE_VALUES + FALSE_VALUES}")
+
+
+def _coerce_none(value: str) -> None:
+    """
+    Coerce the string to None.
+
+    :param value: The string value.
+    :type value: str
+    :raise ValueError: If the string is not a None value.
+    """
+    if value.lower() not in NONE_VALUES:
+        raise ValueError(f"Value '{value}' is not None, expected one of: {NONE_VALUES}")
+
+
+def _from_string(coercer: Callable[[str], Any]) -> TypeCoercer:
+    """
+    Get the coercer that accepts only the string values.
+
+    :param coercer: The coercer of the string values.
+    :type coercer: Callable[[str], Any]
+    :return: The coercer that raises ValueError if the value is not a string.
+    :rtype: TypeCoercer
+    """
+    def coerce(value: Any) -> Any:
+        if not isinstance(value, str):
+            raise ValueError(f"Value '{value}' is not a string")
+        return coercer(value)
+
+    return coerce
+
+
+def _coerce_item(item: Any, checker: TypeChecker, coercer: TypeCoercer) -> Any:
+    """
+    Coerce the item of the collection, if it does not match its type already.
+
+    :param item: The item of the collection.
+    :type item: Any
+    :param checker: The checker of the type of the item.
+    :type checker: TypeChecker
+    :param coercer: The coercer of the type of the item.
+    :type coercer: TypeCoercer
+    :raise ValueError: If the item cannot be coerced.
+    :return: The item.
+    :rtype: Any
+    """
+    if checker(item):
+        return item
+    if isinstance(item, COERCIBLE_TYPES):
+        return coercer(item)
+    raise ValueError(f"Value '{item}' does not match the type")
+
+
+def _split_items(value: Union[str, List[Any]]) -> List[Any]:
+    """
+    Split the string to the items, it is either the JSON array or the list of the items separated by the delimiter.
+
+    :param value: The string value, or the list of the items.
+    :type value: Union[str, List[Any]]
+    :raise ValueError: If the value is neither the string nor the list, or the JSON array is not valid.
+    :return: The items.
+    :rtype: List[Any]
+    """
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"Value '{value}' is neither a string nor a list")
+    if value.lstrip().startswith('['):
+        items = json.loads(value)
+        if not isinstance(items, list):
+            raise ValueError(f"Value '{value}' is not a JSON array")
+        return items
+    return value.split(LIST_DELIMITER) if value else []
+
+
+def _load_mapping(value: Union[str, Dict[Any, Any]]) -> Dict[Any, Any]:
+    """
+    Load the mapping from the JSON object.
+
+    :param value: The string value, or the mapping.
+    :type value: Union[str, Dict[Any, Any]]
+    :raise ValueError: If the value is neither the mapping nor the JSON object.
+    :return: The mapping.
+    :rtype: Dict[Any, Any]
+    """
+    if isinstance(value, dict):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"Value '{value}' is neither a string nor a dictionary")
+    mapping = json.loads(value)
+    if not isinstance(mapping, dict):
+        raise ValueError(f"Value '{value}' is not a JSON object")
+    return mapping
+
+
+def _get_collection_class(origin: Any) -> type:
+    """
+    Get the class used to create the collection of the annotated type.
+
+    :param origin: The origin of the annotated type.
+    :type origin: Any
+    :return: The concrete class of the collection.
+    :rtype: type
+    """
+    if origin in (set, frozenset):
+        return origin
+    if origin in (collections.abc.Set, collections.abc.MutableSet):
+        return set
+    return list
+
+
+def _coerce_union(value: Any, annotations: Tuple[Any, ...]) -> Any:
+    """
+    Coerce the value to the first type of the union it can be coerced to.
+
+    :param value: The string value, or the list or dictionary of the string values.
+    :type value: Any
+    :param annotations: The types of the union.
+    :type annotations: Tuple[Any, ...]
+    :raise ValueError: If the value cannot be coerced to any type of the union.
+    :return: The coerced value.
+    :rtype: Any
+    """
+    for annotation in annotations:
+        try:
+            return get_type_coercer(annotation)(value)
+        except ValueError:
+            continue
+    raise ValueError(f"Value '{value}' cannot be coerced to any of: {annotations}")
+
+
+def _coerce_literal(value: str, literals: Tuple[Any, ...]) -> Any:
+    """
+    Coerce the string to the literal, whose string representation is equal to it.
+
+    :param value: The string value.
+    :type value: str
+    :param literals: The allowed literals.
+    :type literals: Tuple[Any, ...]
+    :raise ValueError: If the string is not equal to any literal.
+    :return: The literal.
+    :rtype: Any
+    """
+    for literal in literals:
+        if value == str(literal) or (isinstance(literal, bool) and value.lower() == str(literal).lower()):
+            return literal
+    raise ValueError(f"Value '{value}' is not one of: {literals}")
+
+
+def _coerce_class(value: str, annotation: type) -> Any:
+    """
+    Coerce the string to the instance of the class, by passing it to the constructor of the class.
+
+    :param value: The string value.
+    :type value: str
+    :param annotation: The class.
+    :type annotation: type
+    :raise ValueError: If the class cannot be created from the string.
+    :return: The instance of the class.
+    :rtype: Any
+    """
+    try:
+        return annotation(value)
+    except Exception as exception:
+        raise ValueError(f"Value '{value}' cannot be coerced to '{annotation.__name__}': {exception}") from exception
+
+
+def _compile_coercer(annotation: Any) -> TypeCoercer:
+    """
+    Compile the coercer of the values to the type annotation.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: The coercer of the string values.
+    :rtype: TypeCoercer
+    """
+    annotation = _unwrap(annotation)
+    if _is_any(annotation) or annotation is str:
+        return lambda value: value
+    if annotation is None or annotation is NoneType:
+        return _from_string(_coerce_none)
+    if annotation is bool:
+        return _from_string(_coerce_boolean)
+    if annotation in (int, float, complex):
+        return _from_string(annotation)
+    origin = typing.get_origin(annotation)
+    arguments = typing.get_args(annotation)
+    if origin in UNION_TYPES:
+        return lambda value: _coerce_union(value, arguments)
+    if origin is typing.Literal:
+        return _from_string(lambda value: _coerce_literal(value, arguments))
+    if annotation in MAPPING_TYPES or origin in MAPPING_TYPES:
+        if not arguments:
+            return _load_mapping
+        key_checker, value_checker = get_type_checker(arguments[0]), get_type_checker(arguments[1])
+        key_coercer, value_coercer = get_type_coercer(arguments[0]), get_type_coercer(arguments[1])
+        return lambda value: {
+            _coerce_item(key, key_checker, key_coercer): _coerce_item(item, value_checker, value_coercer)
+            for key, item in _load_mapping(value).items()}
+    if annotation is tuple or origin is tuple:
+        if not arguments or (len(arguments) == 2 and arguments[1] is Ellipsis):
+            item_annotation = arguments[0] if arguments else Any
+            item_checker, item_coercer = get_type_checker(item_annotation), get_type_coercer(item_annotation)
+            return lambda value: tuple(_coerce_item(item, item_checker, item_coercer) for item in _split_items(value))
+        item_checkers = tuple(get_type_checker(argument) for argument in arguments)
+        item_coercers = tuple(get_type_coercer(argument) for argument in arguments)
+        return lambda value: tuple(_coerce_item(item, checker, coercer) for item, checker, coercer in zip(
+            _split_items(value), item_checkers, item_coercers))
+    if annotation in SEQUENCE_TYPES or origin in SEQUENCE_TYPES:
+        collection_class = _get_collection_class(origin or annotation)
+        item_annotation = arguments[0] if arguments else Any
+        item_checker, item_coercer = get_type_checker(item_annotation), get_type_coercer(item_annotation)
+        return lambda value: collection_class(
+            _coerce_item(item, item_checker, item_coercer) for item in _split_items(value))
+    if origin is not None or not isinstance(annotation, type):
+        return lambda value: value
+    return _from_string(lambda value: _coerce_class(value, annotation))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_type_coercer(annotation: Any) -> TypeCoercer:
+    """
+    Get the compiled coercer of the type annotation from the cache.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: The coercer of the string values.
+    :rtype: TypeCoercer
+    """
+    return _compile_coercer(annotation)
+
+
+def get_type_coercer(annotation: Any) -> TypeCoercer:
+    """
+    Get the coercer of the string values to the type annotation, it is compiled once per annotation. The lists, sets
+    and tuples are either the JSON arrays or the items separated by commas, and the dictionaries are the JSON objects.
+    The other classes are created by passing the string to their constructors. The lists and dictionaries already
+    parsed from the command line are accepted as well, and their string items are coerced.
+
+    :param annotation: The type annotation.
+    :type annotation: Any
+    :return: The coercer of the values, it raises ValueError if the value cannot be coerced.
+    :rtype: TypeCoercer
+    """
+    try:
+        return _get_cached_type_coercer(annotation)
+    except TypeError:
+        return _compile_coercer(annotation)
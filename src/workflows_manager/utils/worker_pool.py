@@ -0,0 +1,170 @@
+"""
+Module contains the worker pool that is used to run the tasks on the bounded number of reusable threads.
+"""
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Any
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+THREAD_NAME_PREFIX = 'workflows-manager-worker'
+
+
+class WorkerPool:
+    """
+    A class to run the tasks on the shared pool of threads. The thread that submits the tasks also participates in
+    their execution, so nested submissions (e.g. parallel step inside another parallel step) never wait for a free
+    thread and cannot deadlock the pool.
+
+    :param max_workers: The maximum number of threads in the pool.
+    :type max_workers: Optional[int]
+    :ivar max_workers: The maximum number of threads in the pool.
+    :vartype max_workers: int
+    """
+    max_workers: int
+    __executor: Optional[ThreadPoolExecutor]
+    __lock: threading.Lock
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        """
+        A method to get the executor, it is created on the first use.
+
+        :return: The executor of the pool.
+        :rtype: ThreadPoolExecutor
+        """
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                     thread_name_prefix=THREAD_NAME_PREFIX)
+            return self.__executor
+
+    def run_all(self, tasks: List[Callable[[], Any]], max_workers: Optional[int] = None) -> List[Optional[Exception]]:
+        """
+        A method to run the tasks concurrently and wait until all of them finish.
+
+        :param tasks: The tasks to run.
+        :type tasks: List[Callable[[], Any]]
+        :param max_workers: The maximum number of tasks from the list that can run at the same time, if not provided,
+            then the size of the pool is used.
+        :type max_workers: Optional[int]
+        :return: The exceptions raised by the tasks, in the same order as the tasks (None, if task succeeded).
+        :rtype: List[Optional[Exception]]
+        """
+        exceptions: List[Optional[Exception]] = [None] * len(tasks)
+        if not tasks:
+            return exceptions
+        pending_tasks = iter(enumerate(tasks))
+        pending_tasks_lock = threading.Lock()
+
+        def lane():
+            """
+            A function that takes the pending tasks one by one and runs them until there is nothing left.
+            """
+            while True:
+                with pending_tasks_lock:
+                    item = next(pending_tasks, None)
+                if item is None:
+                    return
+                index, task = item
+                try:
+                    task()
+                except Exception as exception:
+                    exceptions[index] = exception
+
+        lanes_number = min(len(tasks), max_workers or self.max_workers)
+        executor = self.__get_executor()
+        futures = [executor.submit(lane) for _ in range(lanes_number - 1)]
+        lane()
+        for future in futures:
+            if not future.cancel():
+                future.result()
+        return exceptions
+
+    def run_graph(self, tasks: List[Callable[[], Any]], dependencies: List[List[int]],
+                  max_workers: Optional[int] = None) -> List[Optional[Exception]]:
+        """
+        A method to run the tasks as soon as all their dependencies finish and wait until all of them finish. When any
+        task raises an exception, no further tasks are started, the tasks that are already running are completed.
+
+        :param tasks: The tasks to run.
+        :type tasks: List[Callable[[], Any]]
+        :param dependencies: The indexes of the tasks that must finish before the task starts, for each task. The
+            dependencies must not contain cycles.
+        :type dependencies: List[List[int]]
+        :param max_workers: The maximum number of tasks from the list that can run at the same time, if not provided,
+            then the size of the pool is used.
+        :type max_workers: Optional[int]
+        :return: The exceptions raised by the tasks, in the same order as the tasks (None, if task succeeded or has not
+            been started).
+        :rtype: List[Optional[Exception]]
+        """
+        exceptions: List[Optional[Exception]] = [None] * len(tasks)
+        if not tasks:
+            return exceptions
+        remaining = [len(set(task_dependencies)) for task_dependencies in dependencies]
+        dependents: List[List[int]] = [[] for _ in tasks]
+        for index, task_dependencies in enumerate(dependencies):
+            for dependency in set(task_dependencies):
+                dependents[dependency].append(index)
+        ready_tasks = deque(index for index, count in enumerate(remaining) if count == 0)
+        condition = threading.Condition()
+        running_tasks = 0
+        stopped = False
+
+        def lane():
+            """
+            A function that takes the tasks whose dependencies have finished and runs them until there is nothing left.
+            """
+            nonlocal running_tasks, stopped
+            while True:
+                with condition:
+                    while not ready_tasks and running_tasks > 0 and not stopped:
+                        condition.wait()
+                    if stopped or not ready_tasks:
+                        return
+                    index = ready_tasks.popleft()
+                    running_tasks += 1
+                try:
+                    tasks[index]()
+                except Exception as exception:
+                    exceptions[index] = exception
+                with condition:
+                    running_tasks -= 1
+                    if exceptions[index] is not None:
+                        stopped = True
+                    else:
+                        for dependent in dependents[index]:
+                            remaining[dependent] -= 1
+                            if remaining[dependent] == 0:
+                                ready_tasks.append(dependent)
+                    condition.notify_all()
+
+        lanes_number = min(len(tasks), max_workers or self.max_workers)
+        executor = self.__get_executor()
+        futures = [executor.submit(lane) for _ in range(lanes_number - 1)]
+        lane()
+        for future in futures:
+            if not future.cancel():
+                future.result()
+        return exceptions
+
+    def shutdown(self):
+        """
+        A method to stop the threads of the pool.
+        """
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+
+    def __enter__(self) -> 'WorkerPool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -1,17 +1,24 @@
 """
 This module contains the implementation of the base components which are Workflow and Step classes.
 """
+import copy
 import functools
+import inspect
+from importlib import metadata
+import sys
 import threading
+import types
 from dataclasses import dataclass, field
 from enum import Enum
 from logging import Logger, getLogger, DEBUG
 from threading import Lock
-from typing import Any, Dict, Optional, List, Type, Callable
+from typing import Any, Dict, Optional, List, Type, Callable, Tuple
 
 from workflows_manager.configuration import StepType
 from workflows_manager.logger import APPLICATION_NAME
 
+STEPS_ENTRY_POINT_GROUP = 'workflows_manager.steps'
+
 
 class StepStatus(Enum):
     """
@@ -22,21 +29,25 @@ class StepStatus(Enum):
     RUNNING = 'running'
     SUCCESS = 'success'
     FAILED = 'failed'
+    SKIPPED = 'skipped'
 
 
 class StepPath:
     """
-    A class to represent the path to a step in a workflow.
+    A class to represent the path to a step in a workflow. The hash of the path is computed once and cached, the names
+    of the steps are interned, so the paths can be efficiently used as dictionary keys.
     """
 
     __path: Optional['StepPath']
     __step_type: StepType
     __step_name: str
+    __hash: Optional[int]
 
     def __init__(self, path: Optional['StepPath'], step_type: StepType, step_name: str):
         self.__path = path
         self.__step_type = step_type
-        self.__step_name = step_name
+        self.__step_name = sys.intern(step_name) if isinstance(step_name, str) else step_name
+        self.__hash = None
 
     @property
     def type(self) -> StepType:
@@ -55,14 +66,27 @@ class StepPath:
     @name.setter
     def name(self, step_name: str):
         """
-        A property to set the name of the step.
+        A property to set the name of the step. If the path is used as a key in
+        [StepsInformation][workflows_manager.workflow.StepsInformation], then
+        [rename_step][workflows_manager.workflow.StepsInformation.rename_step] shall be used instead.
         """
-        self.__step_name = step_name
+        self.__step_name = sys.intern(step_name) if isinstance(step_name, str) else step_name
+        self.__hash = None
+
+    def reset_hash(self):
+        """
+        A method to drop the cached hash of the path, it is required when the name of any parent step has changed.
+        """
+        self.__hash = None
 
     def __hash__(self):
-        return hash((self.__path, self.__step_type, self.__step_name))
+        if self.__hash is None:
+            self.__hash = hash((self.__path, self.__step_type, self.__step_name))
+        return self.__hash
 
     def __eq__(self, other: Optional['StepPath']) -> bool:
+        if self is other:
+            return True
         if self is None or other is None:
             return False
         is_path_match = self.__path == other.__path
@@ -70,6 +94,16 @@ class StepPath:
         is_step_name_match = self.__step_name == other.__step_name
         return is_path_match and is_step_type_match and is_step_name_match
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_StepPath__hash'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        if isinstance(self.__step_name, str):
+            self.__step_name = sys.intern(self.__step_name)
+
 
 @dataclass
 class StepInformation:
@@ -169,10 +203,37 @@ class StepsInformation:
         :return: The status of the step.
         :rtype: StepInformation
         """
-        for key, step_information in self.steps.items():
-            if key == step_path:
-                return step_information
-        return StepInformation(path=step_path, status=StepStatus.UNKNOWN)
+        step_information = self.steps.get(step_path)
+        if step_information is None:
+            return StepInformation(path=step_path, status=StepStatus.UNKNOWN)
+        return step_information
+
+    def rename_step(self, step_path: StepPath, step_name: str):
+        """
+        A method to change the name of the step. The step and all its children are re-indexed, as the name is a part of
+        their paths.
+
+        :param step_path: The path to the step.
+        :type step_path: StepPath
+        :param step_name: The new name of the step.
+        :type step_name: str
+        """
+        step_information = self.steps.get(step_path)
+        if step_information is None:
+            step_path.name = step_name
+            return
+        subtree = [step_information]
+        index = 0
+        while index < len(subtree):
+            subtree.extend(subtree[index].children or [])
+            index += 1
+        for step in subtree:
+            self.steps.pop(step.path, None)
+        step_path.name = step_name
+        for step in subtree:
+            step.path.reset_hash()
+        for step in subtree:
+            self.steps[step.path] = step
 
     @property
     def first_step(self) -> Optional[StepInformation]:
@@ -212,9 +273,11 @@ class WorkflowContext:
     __lock: Lock
     __workflow_parameters: Dict
     __steps_information: StepsInformation
+    __changed_keys: Dict[str, None]
 
     def __init__(self, parameters: Optional[Dict] = None, steps_information: Optional[StepsInformation] = None):
         self.__lock = threading.Lock()
+        self.__changed_keys = {}
         if parameters is None:
             parameters = {}
         self.__workflow_parameters = parameters
@@ -246,6 +309,33 @@ class WorkflowContext:
         """
         with self.__lock:
             self.__workflow_parameters[key] = value
+            self.__changed_keys[key] = None
+
+    def remove(self, key: str):
+        """
+        A method to remove a value from the context.
+
+        :param key: The key of the value to remove from the context, it is ignored if the key is not found.
+        :type key: str
+        """
+        with self.__lock:
+            self.__workflow_parameters.pop(key, None)
+            self.__changed_keys[key] = None
+
+    def pop_changes(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        A method to get the values set and the keys removed since the previous call, e.g. to write only the changed
+        values of the context. The values modified in place, without setting them again, are not reported.
+
+        :return: The values set in the context, and the keys removed from the context.
+        :rtype: Tuple[Dict[str, Any], List[str]]
+        """
+        with self.__lock:
+            changed_keys, self.__changed_keys = self.__changed_keys, {}
+            updates = {key: self.__workflow_parameters[key] for key in changed_keys
+                       if key in self.__workflow_parameters}
+            removals = [key for key in changed_keys if key not in self.__workflow_parameters]
+        return updates, removals
 
     def get_step_information(self, step: StepPath) -> StepInformation:
         """
@@ -258,6 +348,13 @@ class WorkflowContext:
         """
         return self.__steps_information.get_step_information(step)
 
+    @property
+    def parameters(self) -> Dict:
+        """
+        A property to get the copy of the values stored in the context.
+        """
+        return dict(self.__workflow_parameters)
+
     @property
     def steps_information(self) -> StepsInformation:
         """
@@ -352,14 +449,115 @@ class Step:
         self.__update_status(StepStatus.FAILED)
 
 
+def get_entry_points(group: str) -> Dict[str, metadata.EntryPoint]:
+    """
+    Get the entry points of the installed packages from the group. When the name occurs multiple times, the first entry
+    point is used.
+
+    :param group: The name of the entry points group.
+    :type group: str
+    :return: The entry points by their names.
+    :rtype: Dict[str, metadata.EntryPoint]
+    """
+    all_entry_points = metadata.entry_points()
+    if hasattr(all_entry_points, 'select'):
+        group_entry_points = all_entry_points.select(group=group)
+    else:
+        group_entry_points = all_entry_points.get(group, [])
+    entry_points = {}
+    for entry_point in group_entry_points:
+        entry_points.setdefault(entry_point.name, entry_point)
+    return entry_points
+
+
+class StepsRegister(dict):
+    """
+    A class to store the registered steps by their names. Besides the steps registered directly, it provides the steps
+    from the 'workflows_manager.steps' entry points group of the installed packages, each entry point maps the name of
+    the step to the step class ('module:Class'). The entry points are discovered on the first lookup of the step that
+    has not been registered, and the step class is imported and registered on its first use.
+
+    :param register_step: The function used to register the step class loaded from the entry point.
+    :type register_step: Callable[[str, Type[Step]], None]
+    :param entry_point_group: The name of the entry points group with the steps.
+    :type entry_point_group: str
+    """
+    __register_step: Callable[[str, Type['Step']], None]
+    __entry_point_group: str
+    __entry_points: Optional[Dict[str, metadata.EntryPoint]]
+    __lock: threading.RLock
+
+    def __init__(self, register_step: Callable[[str, Type['Step']], None],
+                 entry_point_group: str = STEPS_ENTRY_POINT_GROUP):
+        super().__init__()
+        self.__register_step = register_step
+        self.__entry_point_group = entry_point_group
+        self.__entry_points = None
+        self.__lock = threading.RLock()
+
+    @property
+    def entry_points(self) -> Dict[str, metadata.EntryPoint]:
+        """
+        Get the entry points with the steps, they are discovered on the first use.
+
+        :return: The entry points by the names of the steps.
+        :rtype: Dict[str, metadata.EntryPoint]
+        """
+        with self.__lock:
+            if self.__entry_points is None:
+                self.__entry_points = get_entry_points(self.__entry_point_group)
+            return self.__entry_points
+
+    def __missing__(self, name: str) -> 'Step':
+        entry_point = self.entry_points.get(name)
+        if entry_point is None:
+            raise KeyError(name)
+        with self.__lock:
+            if not super().__contains__(name):
+                step_class = entry_point.load()
+                if not super().__contains__(name):
+                    self.__register_step(name, step_class)
+            return super().__getitem__(name)
+
+    def __contains__(self, name: object) -> bool:
+        return super().__contains__(name) or name in self.entry_points
+
+    def get(self, name: str, default: Optional['Step'] = None) -> Optional['Step']:
+        """
+        Get the registered step by its name, the step from the entry point is loaded on the first use.
+
+        :param name: The name of the step.
+        :type name: str
+        :param default: The value returned when the step is not registered.
+        :type default: Optional[Step]
+        :return: The registered step, or the default value.
+        :rtype: Optional[Step]
+        """
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+
 class Steps:
     """
     A class to manage the steps in the workflow.
     """
-    steps_register: Dict[str, Step]
+    steps_register: StepsRegister
 
     def __init__(self):
-        self.steps_register = {}
+        self.steps_register = StepsRegister(self.__register_step)
+
+    def __register_step(self, name: str, step_class: Type[Step]):
+        """
+        A method to register the step class loaded from the entry point.
+
+        :param name: The name of the step.
+        :type name: str
+        :param step_class: The class of the step.
+        :type step_class: Type[Step]
+        """
+        self.register(name)(step_class)
 
     def register(self, name: str) -> Callable[[Type[Step]], None]:
         """
@@ -385,6 +583,23 @@ class Steps:
 
         return class_wrapper
 
+    def get_instance(self, name: str) -> Step:
+        """
+        A method to create a copy of the registered step for a single execution. Each execution gets its own path,
+        context and logger, so the same step can be executed concurrently.
+
+        :param name: The name of the registered step.
+        :type name: str
+        :raise KeyError: If the step is not registered.
+        :return: The copy of the registered step.
+        :rtype: Step
+        """
+        registered_instance = self.steps_register[name]
+        instance = copy.copy(registered_instance)
+        perform = types.MethodType(type(registered_instance).perform, instance)
+        instance.perform = self.wrap_step(instance)(perform)
+        return instance
+
     @staticmethod
     def wrap_step(self: Step):
         """
@@ -405,6 +620,51 @@ class Steps:
             :rtype: Any
             """
 
+            def on_success(return_value: Any):
+                """
+                A function to set the return value of the step and the status to 'success'.
+
+                :param return_value: The return value of the step.
+                :type return_value: Any
+                """
+                self.information.return_value = return_value
+                if self.information.status not in [StepStatus.FAILED, StepStatus.SUCCESS]:
+                    self.information.status = StepStatus.SUCCESS
+
+            def on_failure(exception: Exception):
+                """
+                A function to set the error of the step and the status to 'failed'.
+
+                :param exception: The exception raised by the step.
+                :type exception: Exception
+                """
+                if self.logger.level == DEBUG:
+                    self.logger.exception(exception)
+                if self.information.status not in [StepStatus.FAILED, StepStatus.SUCCESS]:
+                    self.information.status = StepStatus.FAILED
+                self.information.error = exception
+
+            if inspect.iscoroutinefunction(function):
+                @functools.wraps(function)
+                async def async_wrapper(*args, **kwargs):
+                    """
+                    A function to wrap the execution of the asynchronous step. It sets the status of the step to
+                    'success' if the step completes successfully, otherwise it sets the status of the step to 'failed'.
+
+                    :param args: The positional arguments of the step.
+                    :param kwargs: The keyword arguments of the step.
+                    :raise Exception: If step fails, it raises an exception.
+                    :return: The return value of the step.
+                    :rtype: Any
+                    """
+                    try:
+                        on_success(await function(*args, **kwargs))
+                    except Exception as exception:
+                        on_failure(exception)
+                        raise exception
+
+                return async_wrapper
+
             @functools.wraps(function)
             def wrapper(*args, **kwargs):
                 """
@@ -418,15 +678,9 @@ class Steps:
                 :rtype: Any
                 """
                 try:
-                    self.information.return_value = function(*args, **kwargs)
-                    if self.information.status not in [StepStatus.FAILED, StepStatus.SUCCESS]:
-                        self.information.status = StepStatus.SUCCESS
+                    on_success(function(*args, **kwargs))
                 except Exception as exception:
-                    if self.logger.level == DEBUG:
-                        self.logger.exception(exception)
-                    if self.information.status not in [StepStatus.FAILED, StepStatus.SUCCESS]:
-                        self.information.status = StepStatus.FAILED
-                    self.information.error = exception
+                    on_failure(exception)
                     raise exception
 
             return wrapper
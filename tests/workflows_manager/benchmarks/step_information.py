@@ -0,0 +1,79 @@
+"""
+Benchmark of the step information lookup. It measures the average time of
+[get_step_information][workflows_manager.workflow.StepsInformation.get_step_information] for workflows of different
+sizes, the time per lookup shall stay flat when the number of steps grows.
+
+Usage: python tests/workflows_manager/benchmarks/step_information.py [--steps 100 1000 10000] [--depth 3]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from workflows_manager.configuration import StepType
+from workflows_manager.workflow import StepInformation, StepPath, StepsInformation, StepStatus
+
+
+def build_steps_information(steps_number: int, depth: int) -> Tuple[StepsInformation, List[StepPath]]:
+    """
+    Build the steps information with the given number of normal steps, nested in the workflow steps.
+
+    :param steps_number: The number of normal steps.
+    :type steps_number: int
+    :param depth: The number of workflow steps above each normal step.
+    :type depth: int
+    :return: The steps information and the paths to the normal steps.
+    :rtype: Tuple[StepsInformation, List[StepPath]]
+    """
+    steps_information = StepsInformation()
+    parent_path = None
+    for level in range(depth):
+        parent_path = StepPath(parent_path, StepType.WORKFLOW, f'workflow-{level}')
+        steps_information.steps[parent_path] = StepInformation(parent_path, StepStatus.NOT_STARTED)
+    step_paths = []
+    for index in range(steps_number):
+        step_path = StepPath(parent_path, StepType.NORMAL, f'step-{index}')
+        steps_information.steps[step_path] = StepInformation(step_path, StepStatus.NOT_STARTED)
+        step_paths.append(step_path)
+    return steps_information, step_paths
+
+
+def measure(steps_number: int, depth: int, lookups: int) -> float:
+    """
+    Measure the average time of the lookup of the step information.
+
+    :param steps_number: The number of normal steps.
+    :type steps_number: int
+    :param depth: The number of workflow steps above each normal step.
+    :type depth: int
+    :param lookups: The number of lookups to perform.
+    :type lookups: int
+    :return: The average time of the lookup in microseconds.
+    :rtype: float
+    """
+    steps_information, step_paths = build_steps_information(steps_number, depth)
+    random_generator = random.Random(0)
+    lookup_paths = [random_generator.choice(step_paths) for _ in range(lookups)]
+    start = time.perf_counter()
+    for step_path in lookup_paths:
+        steps_information.get_step_information(step_path)
+    return (time.perf_counter() - start) / lookups * 1_000_000
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark of the step information lookup.')
+    parser.add_argument('--steps', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='Numbers of steps in the workflow.')
+    parser.add_argument('--depth', type=int, default=3, help='Number of workflow steps above each normal step.')
+    parser.add_argument('--lookups', type=int, default=100000, help='Number of lookups per measurement.')
+    arguments = parser.parse_args()
+    print(f"{'steps':>10} | {'lookup (us)':>12}")
+    for steps_number in arguments.steps:
+        print(f"{steps_number:>10} | {measure(steps_number, arguments.depth, arguments.lookups):>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark of the YAML configuration parsing. It generates configurations of increasing size and compares the
+pure-Python safe loader with the C-accelerated (libyaml) safe loader, when it is available.
+
+Usage: python tests/workflows_manager/benchmarks/yaml_parsing.py [--workflows 10 100 1000] [--steps 10] [--repeat 3]
+"""
+import argparse
+import time
+from typing import Type
+
+import yaml
+
+
+def generate_configuration(workflows_number: int, steps_number: int) -> str:
+    """
+    Generate the YAML configuration with the given number of workflows and steps.
+
+    :param workflows_number: The number of workflows.
+    :type workflows_number: int
+    :param steps_number: The number of steps in each workflow.
+    :type steps_number: int
+    :return: The YAML configuration.
+    :rtype: str
+    """
+    workflows = {}
+    for workflow_index in range(workflows_number):
+        workflows[f'workflow-{workflow_index}'] = {
+            'parameters': [{'name': 'parameter', 'value': workflow_index}],
+            'steps': [
+                {
+                    'name': f'step-{step_index}',
+                    'step': 'registered-step',
+                    'capture_stdout': True,
+                    'parameters': [
+                        {'name': 'message', 'value': f'Message ${{parameter}} {step_index}'},
+                        {'name': 'items', 'value': list(range(5))},
+                    ],
+                }
+                for step_index in range(steps_number)
+            ],
+        }
+    return yaml.dump({'workflows': workflows}, sort_keys=False)
+
+
+def measure(content: str, loader: Type, repeat: int) -> float:
+    """
+    Measure the best time of parsing the configuration.
+
+    :param content: The YAML configuration.
+    :type content: str
+    :param loader: The loader class.
+    :type loader: Type
+    :param repeat: The number of measurements.
+    :type repeat: int
+    :return: The best time of parsing in milliseconds.
+    :rtype: float
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        yaml.load(content, Loader=loader)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    """
+    Run the benchmark and print the results.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark of the YAML configuration parsing.')
+    parser.add_argument('--workflows', type=int, nargs='+', default=[10, 100, 1000],
+                        help='Numbers of workflows in the configuration.')
+    parser.add_argument('--steps', type=int, default=10, help='Number of steps in each workflow.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of measurements, the best one is reported.')
+    arguments = parser.parse_args()
+    c_loader = getattr(yaml, 'CSafeLoader', None)
+    if c_loader is None:
+        print('PyYAML has been built without libyaml, only the pure-Python loader is measured.')
+    print(f"{'workflows':>10} | {'size (KiB)':>10} | {'python (ms)':>12} | {'libyaml (ms)':>12} | {'speedup':>8}")
+    for workflows_number in arguments.workflows:
+        content = generate_configuration(workflows_number, arguments.steps)
+        python_time = measure(content, yaml.SafeLoader, arguments.repeat)
+        row = f"{workflows_number:>10} | {len(content.encode('utf-8')) / 1024:>10.1f} | {python_time:>12.1f}"
+        if c_loader is not None:
+            c_time = measure(content, c_loader, arguments.repeat)
+            row += f" | {c_time:>12.1f} | {python_time / c_time:>7.1f}x"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
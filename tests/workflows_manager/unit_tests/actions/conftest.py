@@ -154,5 +154,6 @@ def test_expected_status() -> Dict:
                 'status': 'failed',
                 'type': 'workflow',
             }
-        ]
+        ],
+        'context': {'error': 'error message'},
     }
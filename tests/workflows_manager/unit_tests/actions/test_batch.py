@@ -0,0 +1,113 @@
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from conftest import TEST_LOGGER_NAME
+from workflows_manager.actions.batch import BatchItem, BatchRunner, load_batch_items
+from workflows_manager.exceptions import InvalidConfiguration
+
+
+class TestBatchItem:
+    @pytest.mark.parametrize('data, expected', [
+        ({'workflow_name': 'workflow'}, BatchItem(1, 'workflow')),
+        ({'workflow_name': 'workflow', 'parameters': {'key': 'value'}, 'status_file': 'status.json'},
+         BatchItem(1, 'workflow', {'key': 'value'}, Path('status.json'))),
+    ], ids=[
+        'workflow name only',
+        'all fields',
+    ])
+    def test_from_dict(self, data: dict, expected: BatchItem):
+        assert BatchItem.from_dict(1, data) == expected
+
+    @pytest.mark.parametrize('data', [
+        ['workflow'],
+        {'parameters': {}},
+        {'workflow_name': 'workflow', 'parameters': ['key']},
+    ], ids=[
+        'not an object',
+        'missing workflow name',
+        'invalid parameters',
+    ])
+    def test_from_dict_error(self, data):
+        with pytest.raises(InvalidConfiguration):
+            BatchItem.from_dict(1, data)
+
+
+class TestBatchFunctions:
+    def test_load_batch_items(self, tmp_path: Path):
+        batch_file = tmp_path.joinpath('batch.jsonl')
+        batch_file.write_text('{"workflow_name": "first"}\n\n{"workflow_name": "second", "parameters": {"key": 1}}\n')
+        assert load_batch_items(batch_file) == [BatchItem(1, 'first'), BatchItem(3, 'second', {'key': 1})]
+
+    def test_load_batch_items_error(self, tmp_path: Path):
+        batch_file = tmp_path.joinpath('batch.jsonl')
+        batch_file.write_text('{"workflow_name": "first"}\nnot json\n')
+        with pytest.raises(InvalidConfiguration, match='line 2'):
+            load_batch_items(batch_file)
+
+
+class TestBatchRunner:
+    @pytest.mark.parametrize('item, output_directory, expected', [
+        (BatchItem(1, 'workflow', status_file=Path('custom.json')), Path('statuses'), Path('custom.json')),
+        (BatchItem(2, 'my workflow/1'), Path('statuses'), Path('statuses', '2-my_workflow_1.json')),
+        (BatchItem(3, 'workflow'), None, None),
+    ], ids=[
+        'item status file',
+        'output directory',
+        'no status file',
+    ])
+    def test_get_status_file(self, item: BatchItem, output_directory: Optional[Path], expected: Optional[Path]):
+        batch_runner = BatchRunner(logging.getLogger(TEST_LOGGER_NAME), [item], output_directory=output_directory)
+        assert batch_runner.get_status_file(item) == expected
+
+    def test_run(self, tmp_path: Path):
+        items = [BatchItem(1, 'success'), BatchItem(2, 'failed'), BatchItem(3, 'error')]
+        batch_runner = BatchRunner(logging.getLogger(TEST_LOGGER_NAME), items, 2, tmp_path.joinpath('statuses'))
+        batch_runner.summary_file = tmp_path.joinpath('summary.json')
+        status_files = {}
+
+        def run_item(item: BatchItem, status_file: Optional[Path]) -> str:
+            status_files[item.line] = status_file
+            if item.workflow_name == 'error':
+                raise InvalidConfiguration('Workflow not found')
+            return item.workflow_name
+
+        summary = batch_runner.run(run_item)
+        assert tmp_path.joinpath('statuses').is_dir()
+        assert status_files[1] == tmp_path.joinpath('statuses', '1-success.json')
+        assert (summary['total'], summary['succeeded'], summary['failed']) == (3, 1, 2)
+        assert [item['status'] for item in summary['items']] == ['success', 'failed', 'error']
+        assert summary['items'][2]['error'] == 'Workflow not found'
+        assert json.loads(batch_runner.summary_file.read_text()) == summary
+
+    @pytest.mark.parametrize('concurrency, expected_maximum', [
+        (1, 1),
+        (3, 3),
+    ], ids=[
+        'sequential',
+        'concurrent',
+    ])
+    def test_run_concurrency(self, concurrency: int, expected_maximum: int):
+        items = [BatchItem(line, 'workflow') for line in range(1, 7)]
+        batch_runner = BatchRunner(logging.getLogger(TEST_LOGGER_NAME), items, concurrency)
+        lock = threading.Lock()
+        barrier = threading.Barrier(concurrency, timeout=5)
+        running = []
+        maximum = []
+
+        def run_item(_: BatchItem, __: Optional[Path]) -> str:
+            with lock:
+                running.append(1)
+                maximum.append(len(running))
+            barrier.wait()
+            with lock:
+                running.pop()
+            return 'success'
+
+        summary = batch_runner.run(run_item)
+        assert summary['succeeded'] == 6
+        assert max(maximum) == expected_maximum
@@ -14,9 +14,12 @@ class TestListWorkflows:
         (Configuration.from_dict({'workflows': {'workflow': {'steps': []}}}), 'workflow\n'),
         (Configuration.from_dict({'workflows': {'workflow1': {'steps': []}, 'workflow2': {'steps': []}}}),
          'workflow1\nworkflow2\n'),
+        (Configuration.from_dict({'workflows': {'workflow1': {'steps': []}, 'workflow2': {'steps': []}}}, lazy=True),
+         'workflow1\nworkflow2\n'),
     ], ids=[
         'single workflow',
         'multiple workflows',
+        'lazy workflows',
     ])
     def test_list(self, workflows_configuration: Configuration, expected_output: str):
         logger = logging.getLogger(TEST_LOGGER_NAME)
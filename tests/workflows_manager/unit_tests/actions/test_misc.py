@@ -1,7 +1,12 @@
+import dataclasses
 import inspect
+from typing import List
+from unittest.mock import patch
+
+import pytest
 
 from workflows_manager.actions.misc import InstanceParameter, InstanceParameters
-from workflows_manager.workflow import steps
+from workflows_manager.workflow import Step, steps
 
 
 class TestInstanceParameter:
@@ -11,6 +16,15 @@ class TestInstanceParameter:
         assert parameter.value == 'value'
         assert parameter.type == str
 
+    def test_match(self):
+        parameter = InstanceParameter(name='name', value=None, type=List[int])
+        assert parameter.match([1, 2]) == (True, [1, 2])
+        assert parameter.match('1,2') == (False, '1,2')
+        assert parameter.match('1,2', coerce=True) == (True, [1, 2])
+        assert parameter.match('1,two', coerce=True) == (False, '1,two')
+        assert parameter.match(['1', '2'], coerce=True) == (True, [1, 2])
+        assert parameter.match(1, coerce=True) == (False, 1)
+
 
 class TestInstanceParameters:
     def test(self):
@@ -32,6 +46,30 @@ class TestInstanceParameters:
         expected_parameters.parameters.append(InstanceParameter('optional', None, inspect.Parameter.empty))
         assert parameters == expected_parameters
 
+    def test_from_step_cached(self):
+        first_parameters = InstanceParameters.from_step(steps.get_instance('new-step'))
+        with patch('workflows_manager.actions.misc.inspect.signature') as mock_signature:
+            second_parameters = InstanceParameters.from_step(steps.get_instance('new-step'))
+        mock_signature.assert_not_called()
+        assert second_parameters == first_parameters
+        assert second_parameters['key'] is first_parameters['key']
+        del first_parameters['string']
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first_parameters['key'].value = 'changed'
+        parameters = InstanceParameters.from_step(steps.get_instance('new-step'))
+        assert parameters['string'] is not None
+        assert parameters['key'].value is inspect.Parameter.empty
+
+    def test_from_step_replaced_perform(self):
+        class ReplacedStep(Step):
+            def perform(self, first: str):
+                pass
+
+        step = ReplacedStep()
+        assert [parameter.name for parameter in InstanceParameters.from_step(step)] == ['first']
+        ReplacedStep.perform = lambda self, second: None
+        assert [parameter.name for parameter in InstanceParameters.from_step(step)] == ['second']
+
     def test_iter(self):
         parameter = InstanceParameter(name='name', value='value', type=str)
         parameters = InstanceParameters([
@@ -47,11 +85,24 @@ class TestInstanceParameters:
         ])
         assert parameters[0] == parameter
         assert parameters[parameter.name] == parameter
+        assert parameters['missing'] is None
+        added_parameter = InstanceParameter(name='added', value=None, type=str)
+        parameters.parameters.append(added_parameter)
+        assert parameters['added'] == added_parameter
+        replaced_parameter = InstanceParameter(name='replaced', value=None, type=str)
+        parameters.parameters[0] = replaced_parameter
+        assert parameters['name'] is None
+        assert parameters['replaced'] == replaced_parameter
+        parameters.parameters = [parameter]
+        assert parameters['name'] == parameter
+        assert parameters['added'] is None
 
     def test_delitem(self):
         parameter = InstanceParameter(name='name', value='value', type=str)
         parameters = InstanceParameters([
             parameter,
         ])
+        assert parameters['name'] == parameter
         del parameters['name']
         assert len(parameters.parameters) == 0
+        assert parameters['name'] is None
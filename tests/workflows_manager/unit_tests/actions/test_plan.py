@@ -0,0 +1,119 @@
+import pytest
+
+from workflows_manager import configuration
+from conftest import WORKFLOW_NAME
+from workflows_manager.actions.plan import ExecutionPlan, is_template
+from workflows_manager.configuration import StepType
+from workflows_manager.exceptions import InvalidConfiguration
+from workflows_manager.workflow import StepStatus
+
+
+def create_configuration(workflows: dict) -> configuration.Configuration:
+    return configuration.Configuration.from_dict({'workflows': workflows})
+
+
+class TestPlanFunctions:
+    @pytest.mark.parametrize('value, expected', [
+        ('step', False),
+        ('step-{name}', True),
+        ('step-{{escaped}}', True),
+        (None, False),
+    ], ids=[
+        'static value',
+        'placeholder',
+        'escaped braces',
+        'not a string',
+    ])
+    def test_is_template(self, value, expected: bool):
+        assert is_template(value) == expected
+
+
+class TestExecutionPlan:
+    def test_compile(self, test_configuration: configuration.Configuration):
+        plan = ExecutionPlan(test_configuration, WORKFLOW_NAME)
+        assert plan.workflow_name == WORKFLOW_NAME
+        assert plan.dependencies is None
+        assert [step.path.name for step in plan.steps] == ['Workflow Step', 'Another Workflow Step']
+        workflow_step = plan.steps[0]
+        assert workflow_step.type == StepType.WORKFLOW
+        assert workflow_step.target == 'test-workflow'
+        assert workflow_step.is_static_path
+        parallel_step = workflow_step.children[0]
+        assert parallel_step.path.name == 'Parallel Step'
+        normal_step = parallel_step.children[0]
+        assert normal_step.target == 'new-step'
+        assert normal_step.path == plan.steps[0].children[0].children[0].path
+        assert normal_step.path != plan.steps[1].children[0].children[0].path
+
+    def test_compile_templates(self):
+        plan = ExecutionPlan(create_configuration({
+            WORKFLOW_NAME: {'steps': [
+                {'name': 'parallel-{suffix}', 'parallels': [{'name': 'child', 'step': 'step-{suffix}'}]},
+                {'name': 'workflow', 'workflow': 'workflow-{suffix}'},
+            ]},
+        }), WORKFLOW_NAME)
+        parallel_step, workflow_step = plan.steps
+        assert parallel_step.is_name_template
+        assert not parallel_step.is_static_path
+        assert not parallel_step.children[0].is_static_path
+        assert parallel_step.children[0].is_target_template
+        assert workflow_step.is_static_path
+        assert workflow_step.is_target_template
+        assert workflow_step.children == ()
+
+    def test_compile_dependencies(self):
+        plan = ExecutionPlan(create_configuration({
+            WORKFLOW_NAME: {'steps': [
+                {'name': 'first', 'step': 'step'},
+                {'name': 'second', 'step': 'step', 'depends_on': []},
+                {'name': 'third', 'step': 'step', 'depends_on': ['first', 'second']},
+            ]},
+        }), WORKFLOW_NAME)
+        assert plan.dependencies == ((), (), (0, 1))
+
+    @pytest.mark.parametrize('workflows', [
+        {WORKFLOW_NAME: {'steps': [{'name': 'workflow', 'workflow': 'missing'}]}},
+        {WORKFLOW_NAME: {'steps': [{'name': 'workflow', 'workflow': 'other'}]},
+         'other': {'steps': [{'name': 'workflow', 'workflow': WORKFLOW_NAME}]}},
+    ], ids=[
+        'missing workflow',
+        'recursive workflow',
+    ])
+    def test_compile_error(self, workflows: dict):
+        with pytest.raises(InvalidConfiguration):
+            ExecutionPlan(create_configuration(workflows), WORKFLOW_NAME)
+
+    def test_compile_workflow_recursive_template(self):
+        plan = ExecutionPlan(create_configuration({
+            WORKFLOW_NAME: {'steps': [{'name': 'workflow', 'workflow': 'other'}]},
+            'other': {'steps': [{'name': 'workflow', 'workflow': '{workflow_name}'}]},
+        }), WORKFLOW_NAME)
+        workflow_step = plan.steps[0]
+        template_step = workflow_step.children[0]
+        assert workflow_step.workflow_names == (WORKFLOW_NAME,)
+        assert template_step.workflow_names == (WORKFLOW_NAME, 'other')
+        with pytest.raises(InvalidConfiguration) as exception:
+            plan.compile_workflow(WORKFLOW_NAME, template_step.path, workflow_names=template_step.workflow_names)
+        assert str(exception.value) == (f"Workflow '{WORKFLOW_NAME}' cannot use itself: "
+                                        f"{WORKFLOW_NAME} -> other -> {WORKFLOW_NAME}")
+
+    def test_create_steps_information(self):
+        plan = ExecutionPlan(create_configuration({
+            WORKFLOW_NAME: {'steps': [
+                {'name': 'static', 'step': 'step'},
+                {'name': 'parallel-{suffix}', 'parallels': [{'name': 'child', 'step': 'step'}]},
+            ]},
+        }), WORKFLOW_NAME)
+        first_statuses, first_steps = plan.create_steps_information()
+        second_statuses, second_steps = plan.create_steps_information()
+        assert len(first_statuses.steps) == 3
+        assert first_steps[0] is not second_steps[0]
+        assert first_steps[0].path is plan.steps[0].path
+        assert first_steps[1].path is not plan.steps[1].path
+        assert first_steps[1].path is not second_steps[1].path
+        assert first_steps[1].children[0].parent is first_steps[1]
+        assert first_steps[0].next_step is first_steps[1]
+        assert all(step.status == StepStatus.NOT_STARTED for step in first_statuses.steps.values())
+        first_statuses.rename_step(first_steps[1].path, 'parallel-renamed')
+        assert plan.steps[1].path.name == 'parallel-{suffix}'
+        assert second_steps[1].path.name == 'parallel-{suffix}'
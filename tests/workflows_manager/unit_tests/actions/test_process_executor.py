@@ -0,0 +1,100 @@
+import copy
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+from workflows_manager import workflow
+from workflows_manager.actions.process_executor import ProcessStepExecutor, perform_step, ProcessStepResult
+from workflows_manager.configuration import StepType
+from workflows_manager.workflow import steps, StepInformation, StepPath, StepStatus, WorkflowContext
+
+
+@steps.register(name='process-step')
+class ProcessStep(workflow.Step):
+    def perform(self, value: int):
+        print(value)
+        self.workflow_context.set('result', value * 2)
+        if value < 0:
+            raise ValueError('negative value')
+        return value + 1
+
+
+@steps.register(name='in-place-step')
+class InPlaceStep(workflow.Step):
+    def perform(self, item: str):
+        self.workflow_context.get('items').append(item)
+        self.workflow_context.get('options')['item'] = item
+        self.workflow_context.remove('removed')
+
+
+@steps.register(name='subprocess-step')
+class SubprocessStep(workflow.Step):
+    def perform(self, message: str):
+        subprocess.run([sys.executable, '-c', f'print({message!r})'], check=True)
+        os.write(2, f'error: {message}\n'.encode())
+
+
+class TestProcessExecutor:
+    def test_perform_step(self):
+        step_path = StepPath(None, StepType.NORMAL, 'step')
+        result = perform_step('process-step', step_path, {'value': 1}, {'key': 'value'}, True, False)
+        assert result == ProcessStepResult(status=StepStatus.SUCCESS, return_value=2, stdout='1\n',
+                                           context_updates={'result': 2})
+
+    def test_perform_step_in_place_changes(self):
+        step_path = StepPath(None, StepType.NORMAL, 'step')
+        context_parameters = {'items': ['first'], 'options': {}, 'unchanged': [1], 'removed': 1}
+        result = perform_step('in-place-step', step_path, {'item': 'second'}, context_parameters, False, False)
+        assert result.status == StepStatus.SUCCESS
+        assert result.context_updates == {'items': ['first', 'second'], 'options': {'item': 'second'}}
+        assert result.context_removals == ['removed']
+
+    def test_perform_step_file_descriptors(self):
+        step_path = StepPath(None, StepType.NORMAL, 'step')
+        result = perform_step('subprocess-step', step_path, {'message': 'message'}, {}, True, True, True)
+        assert result.status == StepStatus.SUCCESS
+        assert result.stdout == 'message\n'
+        assert result.stderr == 'error: message\n'
+
+    def test_perform_step_error(self):
+        step_path = StepPath(None, StepType.NORMAL, 'step')
+        result = perform_step('process-step', step_path, {'value': -1}, {}, False, False)
+        assert result.status == StepStatus.FAILED
+        assert str(result.error) == 'negative value'
+        assert result.stdout is None
+
+    def test_perform_step_unwrapped_error(self):
+        step_instance = copy.copy(steps.steps_register['process-step'])
+        step_instance.perform = type(step_instance).perform.__get__(step_instance)
+        with patch.object(steps, 'get_instance', return_value=step_instance):
+            result = perform_step('process-step', StepPath(None, StepType.NORMAL, 'step'), {'value': -1}, {}, False,
+                                  False)
+        assert result.status == StepStatus.FAILED
+        assert str(result.error) == 'negative value'
+
+    def test_run(self):
+        step_status = StepInformation(StepPath(None, StepType.NORMAL, 'step'), StepStatus.RUNNING,
+                                      parameters={'value': 2})
+        workflow_context = WorkflowContext()
+        executor = ProcessStepExecutor(1)
+        try:
+            executor.run('process-step', step_status, workflow_context, capture_stdout=True)
+        finally:
+            executor.shutdown()
+        assert step_status.status == StepStatus.SUCCESS
+        assert step_status.return_value == 3
+        assert step_status.stdout == '2\n'
+        assert step_status.stderr is None
+        assert workflow_context.get('result') == 4
+
+    def test_run_in_place_changes(self):
+        step_status = StepInformation(StepPath(None, StepType.NORMAL, 'step'), StepStatus.RUNNING,
+                                      parameters={'item': 'second'})
+        workflow_context = WorkflowContext({'items': ['first'], 'options': {}, 'removed': 1})
+        executor = ProcessStepExecutor(1)
+        try:
+            executor.run('in-place-step', step_status, workflow_context)
+        finally:
+            executor.shutdown()
+        assert workflow_context.parameters == {'items': ['first', 'second'], 'options': {'item': 'second'}}
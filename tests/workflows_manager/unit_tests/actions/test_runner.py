@@ -1,11 +1,92 @@
+import asyncio
+import copy
+import gzip
+import json
 import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Literal, Optional
 from unittest.mock import patch, mock_open
 
+import pytest
+
 from workflows_manager import configuration, dispatcher
 from conftest import TEST_LOGGER_NAME, WORKFLOW_NAME, PARAMETERS
-from workflows_manager.configuration import Parameters
+from workflows_manager.actions.plan import ExecutionPlan
+from workflows_manager.actions.process_executor import ProcessStepExecutor
+from workflows_manager.configuration import Parameters, ExecutorType
+from workflows_manager.exceptions import InvalidParameter
+from workflows_manager.utils.status_journal import get_journal_path, read_journal
+from workflows_manager.utils.fingerprint import FingerprintDatabase
+from workflows_manager.utils.step_cache import StepCache
+from workflows_manager.workflow import steps, Step
+
+
+@steps.register(name='async-step')
+class AsyncStep(Step):
+    async def perform(self, delay: float, fail: bool = False):
+        await asyncio.sleep(delay)
+        if fail:
+            raise ValueError('async error')
+        return threading.current_thread().name
+
+
+@steps.register(name='print-step')
+class PrintStep(Step):
+    def perform(self, message: str):
+        for _ in range(3):
+            print(message)
+            print(f'error: {message}', file=sys.stderr)
+            time.sleep(0.01)
+
+
+@steps.register(name='subprocess-print-step')
+class SubprocessPrintStep(Step):
+    def perform(self, message: str):
+        for _ in range(3):
+            subprocess.run([sys.executable, '-c', f'print({message!r})'], check=True)
+
+
+@steps.register(name='cache-step')
+class CacheStep(Step):
+    def perform(self, key: str):
+        value = uuid.uuid4().hex
+        print(value)
+        self.workflow_context.set(key, value)
+        return value
+
+
+@steps.register(name='copy-step')
+class CopyStep(Step):
+    def perform(self, source: str, target: str):
+        Path(target).write_text(Path(source).read_text())
+        return source
+
+
+@steps.register(name='typed-step')
+class TypedStep(Step):
+    def perform(self, count: int, names: List[str], options: Optional[Dict[str, int]] = None,
+                mode: Literal['fast', 'slow'] = 'fast'):
+        return {'count': count, 'names': names, 'options': options, 'mode': mode}
+
+
+RESUME_CALLS = []
+
+
+@steps.register(name='resume-step')
+class ResumeStep(Step):
+    def perform(self, name: str, token=None, failing=None):
+        RESUME_CALLS.append((name, token))
+        if name == 'first':
+            self.workflow_context.set('token', 'secret')
+        if name in (failing or []):
+            raise Exception('resume error')
+        return name
 
 
 class TestRunner:
@@ -20,21 +101,21 @@ class TestRunner:
         assert runner.status_file == path
         assert runner.parameters == PARAMETERS
 
-    @patch('json.dump')
+    @patch('workflows_manager.actions.runner.write_status_file')
     @patch('pathlib.Path.open', new_callable=mock_open)
-    def test_run(self, mock_file_open, mock_dump, test_configuration: configuration.Configuration,
+    def test_run(self, mock_file_open, mock_write_status_file, test_configuration: configuration.Configuration,
                  test_expected_status: Dict):
         path = Path('test.json')
         logger = logging.getLogger(TEST_LOGGER_NAME)
         runner = dispatcher.Runner(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
         runner.status_file = path
-        runner.run()
-        assert mock_dump.call_args[0][0] == test_expected_status
-        assert mock_dump.call_args[0][1] == mock_file_open()
+        assert runner.run() is False
+        assert mock_write_status_file.call_args[0][1] == test_expected_status
+        assert mock_write_status_file.call_args[0][0] == path
 
-    @patch('json.dump')
+    @patch('workflows_manager.actions.runner.write_status_file')
     @patch('pathlib.Path.open', new_callable=mock_open)
-    def test_run_error_missing_parameters(self, mock_file_open, mock_dump,
+    def test_run_error_missing_parameters(self, mock_file_open, mock_write_status_file,
                                           test_configuration: configuration.Configuration,
                                           test_expected_status: Dict):
         test_configuration.workflows['test-workflow'].steps[0].parallels[0].parameters = \
@@ -66,17 +147,18 @@ class TestRunner:
         test_expected_status['steps'][1]['children'][0]['status'] = 'not_started'
         test_expected_status['steps'][1]['error'] = None
         test_expected_status['steps'][1]['status'] = 'not_started'
+        test_expected_status['context'] = {}
         path = Path('test.json')
         logger = logging.getLogger(TEST_LOGGER_NAME)
         runner = dispatcher.Runner(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
         runner.status_file = path
         runner.run()
-        assert mock_dump.call_args[0][0] == test_expected_status
-        assert mock_dump.call_args[0][1] == mock_file_open()
+        assert mock_write_status_file.call_args[0][1] == test_expected_status
+        assert mock_write_status_file.call_args[0][0] == path
 
-    @patch('json.dump')
+    @patch('workflows_manager.actions.runner.write_status_file')
     @patch('pathlib.Path.open', new_callable=mock_open)
-    def test_run_error_workflow_fail(self, mock_file_open, mock_dump,
+    def test_run_error_workflow_fail(self, mock_file_open, mock_write_status_file,
                                      test_configuration: configuration.Configuration,
                                      test_expected_status: Dict):
         test_configuration.workflows[WORKFLOW_NAME].steps[1].stop_on_error = True
@@ -91,5 +173,480 @@ class TestRunner:
         runner = dispatcher.Runner(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
         runner.status_file = path
         runner.run()
-        assert mock_dump.call_args[0][0] == test_expected_status
-        assert mock_dump.call_args[0][1] == mock_file_open()
+        assert mock_write_status_file.call_args[0][1] == test_expected_status
+        assert mock_write_status_file.call_args[0][0] == path
+
+    @patch('workflows_manager.actions.runner.write_status_file')
+    @patch('pathlib.Path.open', new_callable=mock_open)
+    def test_run_process_executor(self, mock_file_open, mock_write_status_file,
+                                  test_configuration: configuration.Configuration, test_expected_status: Dict):
+        path = Path('test.json')
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
+        runner.status_file = path
+        runner.default_executor = ExecutorType.PROCESS
+        runner.run()
+        assert mock_write_status_file.call_args[0][1] == test_expected_status
+
+    @patch('workflows_manager.actions.runner.write_status_file')
+    @patch('pathlib.Path.open', new_callable=mock_open)
+    def test_run_shared_process_executor(self, mock_file_open, mock_write_status_file,
+                                         test_configuration: configuration.Configuration, test_expected_status: Dict):
+        process_executor = ProcessStepExecutor(1)
+        try:
+            for _ in range(2):
+                runner = dispatcher.Runner(logging.getLogger(TEST_LOGGER_NAME), test_configuration, WORKFLOW_NAME,
+                                           PARAMETERS)
+                runner.status_file = Path('test.json')
+                runner.default_executor = ExecutorType.PROCESS
+                runner.process_executor = process_executor
+                with patch.object(process_executor, 'shutdown') as mock_shutdown:
+                    runner.run()
+                mock_shutdown.assert_not_called()
+                assert mock_write_status_file.call_args[0][1] == test_expected_status
+        finally:
+            process_executor.shutdown()
+
+    @pytest.mark.parametrize('capture_stdout', [False, True], ids=[
+        'gathered on event loop',
+        'run in worker pool',
+    ])
+    @patch('workflows_manager.actions.runner.write_status_file')
+    @patch('pathlib.Path.open', new_callable=mock_open)
+    def test_run_async_parallel_steps(self, mock_file_open, mock_write_status_file, capture_stdout: bool):
+        parallels = [
+            {'name': f'async-{index}', 'step': 'async-step', 'capture_stdout': capture_stdout,
+             'parameters': [{'name': 'delay', 'value': 0.01}, {'name': 'fail', 'value': index == 3}]}
+            for index in range(5)
+        ]
+        async_configuration = configuration.Configuration.from_dict({
+            'workflows': {
+                WORKFLOW_NAME: {
+                    'steps': [
+                        {'name': 'parallel', 'stop_on_error': False, 'parallels': parallels},
+                    ]
+                }
+            }
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, async_configuration, WORKFLOW_NAME, {})
+        runner.status_file = Path('test.json')
+        runner.run()
+        status = mock_write_status_file.call_args[0][1]['steps'][0]
+        children = status['children']
+        assert status['status'] == 'failed'
+        assert [child['status'] for child in children] == ['success', 'success', 'success', 'failed', 'success']
+        assert children[3]['error'] == 'async error'
+        assert {child['return_value'] for child in children if child['return_value']} == {
+            'workflows-manager-event-loop'}
+
+    def test_run_async_parallel_steps_disk_io(self, tmp_path: Path):
+        class ThreadRecordingStepCache(StepCache):
+            def load(self, key, ttl=None):
+                threads.append(threading.current_thread().name)
+                return super().load(key, ttl)
+
+            def store(self, key, entry):
+                threads.append(threading.current_thread().name)
+                super().store(key, entry)
+
+        class ThreadRecordingFingerprintDatabase(FingerprintDatabase):
+            def is_up_to_date(self, key, inputs, outputs):
+                threads.append(threading.current_thread().name)
+                return super().is_up_to_date(key, inputs, outputs)
+
+            def record(self, key, inputs, outputs):
+                threads.append(threading.current_thread().name)
+                super().record(key, inputs, outputs)
+
+        threads = []
+        source = tmp_path.joinpath('source.txt')
+        source.write_text('source')
+        parallels = [
+            {'name': f'async-{index}', 'step': 'async-step', 'cache': True, 'inputs': [str(source)],
+             'outputs': [str(source)], 'parameters': [{'name': 'delay', 'value': 0.01 * index}]}
+            for index in range(3)
+        ]
+        async_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [{'name': 'parallel', 'parallels': parallels}]}}
+        })
+        runner = dispatcher.Runner(logging.getLogger(TEST_LOGGER_NAME), async_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('status.json')
+        runner.step_cache = ThreadRecordingStepCache(tmp_path.joinpath('cache'))
+        runner.fingerprint_database = ThreadRecordingFingerprintDatabase(tmp_path.joinpath('cache'))
+        assert runner.run()
+        assert len(threads) == 12
+        assert 'workflows-manager-event-loop' not in threads
+
+    @pytest.mark.parametrize('step_id', ['print-step', 'async-step'], ids=[
+        'worker threads',
+        'event loop',
+    ])
+    @patch('workflows_manager.actions.runner.write_status_file')
+    @patch('pathlib.Path.open', new_callable=mock_open)
+    def test_run_parallel_captured_output(self, mock_file_open, mock_write_status_file, step_id: str):
+        def step_parameters(index: int) -> list:
+            if step_id == 'print-step':
+                return [{'name': 'message', 'value': f'step-{index}'}]
+            return [{'name': 'delay', 'value': 0.01}]
+
+        parallels = [
+            {'name': f'step-{index}', 'step': step_id, 'capture_stdout': True, 'capture_stderr': True,
+             'parameters': step_parameters(index)}
+            for index in range(4)
+        ]
+        capture_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [{'name': 'parallel', 'parallels': parallels}]}}
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, capture_configuration, WORKFLOW_NAME, {})
+        runner.status_file = Path('test.json')
+        runner.max_workers = 4
+        original_stdout = sys.stdout
+        assert runner.run()
+        assert sys.stdout is original_stdout
+        children = mock_write_status_file.call_args[0][1]['steps'][0]['children']
+        for index, child in enumerate(children):
+            if step_id == 'print-step':
+                assert child['stdout'] == f'step-{index}\n' * 3
+                assert child['stderr'] == f'error: step-{index}\n' * 3
+            else:
+                assert child['stdout'] == ''
+                assert child['return_value'] == 'workflows-manager-event-loop'
+
+    @pytest.mark.parametrize('executor', ['thread', 'process'])
+    def test_run_capture_limits(self, tmp_path: Path, executor: str):
+        limits_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [
+                {'name': 'print step', 'step': 'print-step', 'executor': executor, 'capture_stdout': True,
+                 'capture_head': 6, 'capture_tail': 6, 'capture_archive': True,
+                 'parameters': [{'name': 'message', 'value': 'message'}]},
+            ]}}
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, limits_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('status.json')
+        assert runner.run()
+        status = json.loads(runner.status_file.read_text())['steps'][0]
+        assert status['stdout'] == 'messag\n... [12 characters omitted] ...\nssage\n'
+        assert status['stderr'] is None
+        with gzip.open(tmp_path.joinpath('status-output', 'print_step.stdout.gz'), 'rt') as file:
+            assert file.read() == 'message\n' * 3
+
+    def test_run_capture_stream(self, caplog, tmp_path: Path):
+        stream_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [
+                {'name': 'print step', 'step': 'print-step', 'capture_stdout': True, 'capture_stderr': True,
+                 'capture_mode': 'stream', 'capture_head': 3, 'capture_tail': 8,
+                 'parameters': [{'name': 'message', 'value': 'message'}]},
+            ]}}
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, stream_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('status.json')
+        with caplog.at_level(logging.INFO):
+            assert runner.run()
+        records = [(record.levelno, record.getMessage()) for record in caplog.records
+                   if 'message' in record.getMessage()]
+        assert records == [(logging.INFO, 'message'), (logging.WARNING, 'error: message')] * 3
+        status = json.loads(runner.status_file.read_text())['steps'][0]
+        assert status['stdout'] == 'mes\n... [13 characters omitted] ...\nmessage\n'
+        assert status['stderr'] == 'err\n... [34 characters omitted] ...\nmessage\n'
+
+    def test_run_capture_file_descriptors(self, tmp_path: Path):
+        fd_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [
+                {'name': 'subprocess step', 'step': 'subprocess-print-step', 'capture_stdout': True,
+                 'capture_mode': 'fd', 'capture_tail': 8, 'parameters': [{'name': 'message', 'value': 'message'}]},
+            ]}}
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, fd_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('status.json')
+        assert runner.run()
+        status = json.loads(runner.status_file.read_text())['steps'][0]
+        assert status['stdout'] == '\n... [16 characters omitted] ...\nmessage\n'
+        assert status['stderr'] is None
+
+    @pytest.mark.parametrize('executor', ['thread', 'process'])
+    def test_run_cache(self, tmp_path: Path, executor: str):
+        def cache_step(name: str, key: str, **options) -> dict:
+            return {'name': name, 'step': 'cache-step', 'capture_stdout': True, 'executor': executor,
+                    'parameters': [{'name': 'key', 'value': key}], **options}
+
+        cache_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [
+                cache_step('cached', 'first', cache=True),
+                cache_step('other parameters', 'second', cache=True),
+                cache_step('not cached', 'first'),
+            ]}}
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        statuses = []
+        for index in range(2):
+            runner = dispatcher.Runner(logger, cache_configuration, WORKFLOW_NAME, {})
+            runner.status_file = tmp_path.joinpath(f'status-{index}.json')
+            runner.step_cache = StepCache(tmp_path.joinpath('cache'))
+            assert runner.run()
+            statuses.append(json.loads(runner.status_file.read_text()))
+        first_run, second_run = [[step['return_value'] for step in status['steps']] for status in statuses]
+        assert second_run[:2] == first_run[:2]
+        assert second_run[2] != first_run[2]
+        assert statuses[1]['steps'][0]['stdout'] == f'{first_run[0]}\n'
+        assert statuses[1]['context'] == {'first': second_run[2], 'second': first_run[1]}
+        assert len(list(tmp_path.joinpath('cache', 'steps').iterdir())) == 2
+
+    def test_run_up_to_date_steps(self, tmp_path: Path):
+        source, target = tmp_path.joinpath('source.txt'), tmp_path.joinpath('target.txt')
+        source.write_text('first')
+        copy_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [
+                {'name': 'copy', 'step': 'copy-step', 'inputs': ['{source}'], 'outputs': ['{target}'],
+                 'parameters': [{'name': 'source', 'value': str(source)}, {'name': 'target', 'value': str(target)}]},
+            ]}}
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+
+        def run() -> str:
+            runner = dispatcher.Runner(logger, copy_configuration, WORKFLOW_NAME, {})
+            runner.status_file = tmp_path.joinpath('status.json')
+            runner.fingerprint_database = FingerprintDatabase(tmp_path.joinpath('cache'))
+            assert runner.run()
+            return json.loads(runner.status_file.read_text())['steps'][0]['status']
+
+        assert run() == 'success'
+        assert run() == 'skipped'
+        os.utime(source, ns=(source.stat().st_mtime_ns + 10 ** 9,) * 2)
+        assert run() == 'skipped'
+        source.write_text('second')
+        assert run() == 'success'
+        assert target.read_text() == 'second'
+        target.unlink()
+        assert run() == 'success'
+
+    def test_run_coerced_parameters(self, tmp_path: Path):
+        typed_configuration = configuration.Configuration.from_dict({
+            'workflows': {WORKFLOW_NAME: {'steps': [
+                {'name': 'typed', 'step': 'typed-step', 'parameters': [{'name': 'count', 'value': 1}]},
+            ]}}
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, typed_configuration, WORKFLOW_NAME, {
+            'count': 'many', 'names': 'first,second', 'options': '{"limit": 2}', 'mode': 'slow'})
+        runner.status_file = tmp_path.joinpath('status.json')
+        assert runner.run()
+        status = json.loads(runner.status_file.read_text())['steps'][0]
+        assert status['return_value'] == {'count': 1, 'names': ['first', 'second'], 'options': {'limit': 2},
+                                          'mode': 'slow'}
+
+    def test_run_status_journal(self, tmp_path: Path):
+        journal_configuration = configuration.Configuration.from_dict({
+            'workflows': {
+                'child': {'steps': [{'name': 'step', 'step': 'async-step', 'parameters': [
+                    {'name': 'delay', 'value': 0.01}, {'name': 'fail', 'value': True}]}]},
+                WORKFLOW_NAME: {'steps': [
+                    {'name': 'workflow', 'workflow': '{workflow_name}', 'stop_on_error': False,
+                     'parameters': [{'name': 'workflow_name', 'value': 'child'}]},
+                ]},
+            }
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, journal_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('status.json')
+        assert not runner.run()
+        status = json.loads(runner.status_file.read_text())
+        assert status['steps'][0]['children'][0]['status'] == 'failed'
+        assert not get_journal_path(runner.status_file).exists()
+
+    @patch('workflows_manager.actions.runner.write_status_file', side_effect=OSError('disk full'))
+    def test_run_status_journal_kept(self, _mock_write_status_file, tmp_path: Path):
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        journal_configuration = configuration.Configuration.from_dict({'workflows': {WORKFLOW_NAME: {'steps': [
+            {'name': 'step', 'step': 'async-step', 'parameters': [{'name': 'delay', 'value': 0.01}]}]}}})
+        runner = dispatcher.Runner(logger, journal_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('status.json')
+        with pytest.raises(OSError):
+            runner.run()
+        status = read_journal(get_journal_path(runner.status_file))
+        assert status['steps'][0]['status'] == 'success'
+
+    def test_run_resume(self, tmp_path: Path):
+        def resume_step(name: str) -> dict:
+            return {'name': name, 'step': 'resume-step', 'parameters': [
+                {'name': 'name', 'value': name}, {'name': 'token', 'from_context': 'token'}]}
+
+        resume_configuration = configuration.Configuration.from_dict({
+            'parameters': [{'name': 'suffix', 'value': 'run'}, {'name': 'workflow_name', 'value': 'child'}],
+            'workflows': {
+                'child': {'steps': [resume_step('inner-ok'), resume_step('inner-fail')]},
+                WORKFLOW_NAME: {'steps': [
+                    resume_step('first'),
+                    {'name': 'parallel-{suffix}', 'stop_on_error': False,
+                     'parallels': [resume_step('child-ok'), resume_step('child-fail')]},
+                    {'name': 'nested', 'workflow': '{workflow_name}', 'stop_on_error': False},
+                ]},
+            }
+        })
+        resume_configuration.validate_all()
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, resume_configuration, WORKFLOW_NAME,
+                                   {'failing': ['child-fail', 'inner-fail']})
+        runner.status_file = tmp_path.joinpath('first.json')
+        RESUME_CALLS.clear()
+        assert not runner.run()
+        assert len(RESUME_CALLS) == 5
+        RESUME_CALLS.clear()
+        runner = dispatcher.Runner(logger, resume_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('second.json')
+        runner.resume_file = tmp_path.joinpath('first.json')
+        assert runner.run()
+        assert sorted(RESUME_CALLS) == [('child-fail', 'secret'), ('inner-fail', 'secret')]
+        status = json.loads(runner.status_file.read_text())
+        first, parallel, nested = status['steps']
+        assert (first['status'], first['return_value']) == ('success', 'first')
+        assert parallel['name'] == 'parallel-run'
+        assert [child['status'] for child in parallel['children']] == ['success', 'success']
+        assert [child['return_value'] for child in nested['children']] == ['inner-ok', 'inner-fail']
+        assert status['context'] == {'token': 'secret'}
+
+    def test_run_resume_killed(self, tmp_path: Path):
+        resume_configuration = configuration.Configuration.from_dict({'workflows': {WORKFLOW_NAME: {'steps': [
+            {'name': 'first', 'step': 'resume-step', 'parameters': [{'name': 'name', 'value': 'first'}]},
+            {'name': 'second', 'step': 'resume-step', 'parameters': [
+                {'name': 'name', 'value': 'second'}, {'name': 'token', 'from_context': 'token'}]},
+        ]}}})
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, resume_configuration, WORKFLOW_NAME, {'failing': ['second']})
+        runner.status_file = tmp_path.joinpath('first.json')
+        with patch('workflows_manager.actions.runner.write_status_file', side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                runner.run()
+        journal_file = get_journal_path(runner.status_file)
+        journal_file.write_text(''.join(journal_file.read_text().splitlines(keepends=True)[:-1]))
+        RESUME_CALLS.clear()
+        runner = dispatcher.Runner(logger, resume_configuration, WORKFLOW_NAME, {})
+        runner.resume_file = tmp_path.joinpath('first.json')
+        assert runner.run()
+        assert RESUME_CALLS == [('second', 'secret')]
+
+    def test_run_resume_error(self, tmp_path: Path, test_configuration: configuration.Configuration):
+        runner = dispatcher.Runner(logging.getLogger(TEST_LOGGER_NAME), test_configuration, WORKFLOW_NAME, {})
+        runner.resume_file = tmp_path.joinpath('missing.json')
+        with pytest.raises(InvalidParameter):
+            runner.run()
+
+    @pytest.mark.parametrize('fail, expected_statuses', [
+        (False, ['success', 'success', 'success', 'success']),
+        (True, ['success', 'failed', 'not_started', 'not_started']),
+    ], ids=[
+        'all steps succeed',
+        'dependency fails',
+    ])
+    @patch('workflows_manager.actions.runner.write_status_file')
+    @patch('pathlib.Path.open', new_callable=mock_open)
+    def test_run_dependent_steps(self, mock_file_open, mock_write_status_file, fail: bool, expected_statuses: list):
+        def async_step(name: str, delay: float, depends_on=None, step_fail: bool = False):
+            step = {'name': name, 'step': 'async-step',
+                    'parameters': [{'name': 'delay', 'value': delay}, {'name': 'fail', 'value': step_fail}]}
+            if depends_on is not None:
+                step['depends_on'] = depends_on
+            return step
+
+        dependent_configuration = configuration.Configuration.from_dict({
+            'workflows': {
+                WORKFLOW_NAME: {
+                    'steps': [
+                        async_step('slow', 0.1),
+                        async_step('fast', 0.01, [], fail),
+                        async_step('after-fast', 0.01, ['fast']),
+                        async_step('last', 0.01),
+                    ]
+                }
+            }
+        })
+        dependent_configuration.validate_all()
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, dependent_configuration, WORKFLOW_NAME, {})
+        runner.status_file = Path('test.json')
+        assert runner.run() is not fail
+        statuses = mock_write_status_file.call_args[0][1]['steps']
+        assert [status['status'] for status in statuses] == expected_statuses
+
+    @patch('workflows_manager.actions.runner.write_status_file')
+    @patch('pathlib.Path.open', new_callable=mock_open)
+    def test_run_configuration_reused(self, mock_file_open, mock_write_status_file,
+                                      test_configuration: configuration.Configuration, test_expected_status: Dict):
+        expected_configuration = copy.deepcopy(test_configuration)
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
+        runner.status_file = Path('test.json')
+        runner.run()
+        execution_plan = runner.execution_plan
+        runner = dispatcher.Runner(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
+        runner.status_file = Path('test.json')
+        runner.execution_plan = execution_plan
+        runner.run()
+        assert runner.execution_plan is execution_plan
+        assert mock_write_status_file.call_count == 2
+        assert mock_write_status_file.call_args_list[0][0][1] == test_expected_status
+        assert mock_write_status_file.call_args_list[1][0][1] == test_expected_status
+        assert test_configuration == expected_configuration
+
+    def test_run_recursive_template_workflow(self, tmp_path: Path):
+        recursive_configuration = configuration.Configuration.from_dict({
+            'workflows': {
+                WORKFLOW_NAME: {'steps': [
+                    {'name': 'workflow', 'workflow': '{workflow_name}',
+                     'parameters': [{'name': 'workflow_name', 'value': WORKFLOW_NAME}]},
+                ]},
+            }
+        })
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        runner = dispatcher.Runner(logger, recursive_configuration, WORKFLOW_NAME, {})
+        runner.status_file = tmp_path.joinpath('status.json')
+        assert not runner.run()
+        status = json.loads(runner.status_file.read_text())
+        assert status['steps'][0]['status'] == 'failed'
+        assert 'cannot use itself' in status['steps'][0]['error']
+
+    @patch('workflows_manager.actions.runner.write_status_file')
+    @patch('pathlib.Path.open', new_callable=mock_open)
+    def test_run_templates_concurrently(self, mock_file_open, mock_write_status_file):
+        def workflow_step(suffix: str) -> dict:
+            return {'name': 'workflow-{suffix}', 'workflow': '{workflow_name}',
+                    'parameters': [{'name': 'suffix', 'value': suffix}]}
+
+        template_configuration = configuration.Configuration.from_dict({
+            'parameters': [{'name': 'step_id', 'value': 'async-step'}, {'name': 'workflow_name', 'value': 'child'}],
+            'workflows': {
+                'child': {
+                    'steps': [{'name': 'step-{suffix}', 'step': '{step_id}', 'parameters': [
+                        {'name': 'delay', 'value': 0.05}]}]
+                },
+                WORKFLOW_NAME: {
+                    'steps': [{'name': 'parallel', 'parallels': [workflow_step('first'), workflow_step('second')]}]
+                },
+            }
+        })
+        expected_configuration = copy.deepcopy(template_configuration)
+        execution_plan = ExecutionPlan(template_configuration, WORKFLOW_NAME)
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+
+        def run():
+            runner = dispatcher.Runner(logger, template_configuration, WORKFLOW_NAME, {})
+            runner.status_file = Path('test.json')
+            runner.execution_plan = execution_plan
+            runner.run()
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert mock_write_status_file.call_count == 2
+        for call in mock_write_status_file.call_args_list:
+            children = call[0][1]['steps'][0]['children']
+            assert [(child['name'], child['children'][0]['name'], child['children'][0]['status'])
+                    for child in children] == [('workflow-first', 'step-first', 'success'),
+                                               ('workflow-second', 'step-second', 'success')]
+        assert template_configuration == expected_configuration
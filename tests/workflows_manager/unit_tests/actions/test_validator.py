@@ -31,3 +31,31 @@ class TestValidator:
         test_configuration.workflows[WORKFLOW_NAME].steps[0].parameters = Parameters([])
         validator = dispatcher.Validator(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
         assert validator.validate() == False
+
+    def test_validate_error_invalid_parameter_type(self, test_configuration: configuration.Configuration):
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        normal_step = test_configuration.workflows['test-workflow'].steps[0].parallels[0]
+        normal_step.parameters = Parameters(normal_step.parameters[:2])
+        validator = dispatcher.Validator(logger, test_configuration, WORKFLOW_NAME, {**PARAMETERS, 'integer': '1'})
+        assert validator.validate() == True
+        validator = dispatcher.Validator(logger, test_configuration, WORKFLOW_NAME, {**PARAMETERS, 'integer': 'one'})
+        assert validator.validate() == False
+
+    def test_validate_lazy_unreachable_workflow(self, test_configuration: configuration.Configuration):
+        logger = logging.getLogger(TEST_LOGGER_NAME)
+        lazy_configuration = configuration.Configuration.from_dict({
+            'workflows': {
+                WORKFLOW_NAME: {'steps': [{'name': 'Workflow Step', 'type': 'workflow', 'workflow': 'used'}]},
+                'used': {'steps': [{'name': 'Normal Step', 'step': 'new-step', 'parameters': [
+                    {'name': 'string', 'value': 'test'},
+                    {'name': 'boolean', 'value': True},
+                    {'name': 'integer', 'value': 1},
+                ]}]},
+                'unused': {'steps': [{'name': 'Missing Step', 'step': 'missing-step'}]},
+            }
+        }, lazy=True)
+        validator = dispatcher.Validator(logger, lazy_configuration, WORKFLOW_NAME, PARAMETERS)
+        assert validator.validate() == True
+        assert [workflow.name for workflow in lazy_configuration.workflows.elements] == [WORKFLOW_NAME, 'used']
+        validator = dispatcher.Validator(logger, lazy_configuration, 'unused', PARAMETERS)
+        assert validator.validate() == False
@@ -23,6 +23,19 @@ class Test:
                 configuration_file=None,
                 disable_error_codes=False,
                 disable_current_path_import=False,
+                cache_directory=None,
+                disable_configuration_cache=False,
+                lazy_configuration=False,
+                disable_step_index=False,
+                import_include=None,
+                import_exclude=None,
+                disable_default_import_excludes=False,
+                import_workers=None,
+                import_timings=False,
+                socket=None,
+                batch=None,
+                batch_concurrency=None,
+                batch_output_directory=None,
                 parameter=None,
                 string_parameter=None,
                 integer_parameter=None,
@@ -31,11 +44,86 @@ class Test:
                 list_parameter=None,
                 dict_parameter=None,
                 status_file=None,
+                resume=None,
+                max_workers=None,
+                process_workers=None,
+                default_executor='thread',
+                step_cache_max_size=None,
                 action='run',
                 workflow_name='workflow-name',
             )
             assert args == expected
 
+    def test_get_args_run_subcommand_with_max_workers(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--max-workers', '4']):
+            args = get_args()
+            assert args.max_workers == 4
+
+    def test_get_args_run_subcommand_with_process_workers(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--process-workers', '2']):
+            args = get_args()
+            assert args.process_workers == 2
+
+    def test_get_args_run_subcommand_with_step_cache_max_size(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--step-cache-max-size', '1024']):
+            args = get_args()
+            assert args.step_cache_max_size == 1024
+
+    def test_get_args_run_subcommand_with_resume(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--resume', 'status.json']):
+            args = get_args()
+            assert args.resume == 'status.json'
+
+    def test_get_args_run_subcommand_with_cache_arguments(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--cache-directory', '/tmp/cache',
+                                '--disable-configuration-cache']):
+            args = get_args()
+            assert args.cache_directory == '/tmp/cache'
+            assert args.disable_configuration_cache is True
+
+    def test_get_args_run_subcommand_with_lazy_configuration(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--lazy-configuration']):
+            args = get_args()
+            assert args.lazy_configuration is True
+
+    def test_get_args_run_subcommand_with_disable_step_index(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--disable-step-index']):
+            args = get_args()
+            assert args.disable_step_index is True
+
+    def test_get_args_run_subcommand_with_import_options(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--import-include', 'steps/*', '--import-include', 'main.py',
+                                '--import-exclude', 'tests', '--disable-default-import-excludes',
+                                '--import-workers', '4', '--import-timings']):
+            args = get_args()
+            assert args.import_include == ['steps/*', 'main.py']
+            assert args.import_exclude == ['tests']
+            assert args.disable_default_import_excludes is True
+            assert args.import_workers == 4
+            assert args.import_timings is True
+
+    def test_get_args_run_subcommand_with_socket(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--socket', '/tmp/workflows-manager.sock']):
+            args = get_args()
+            assert args.socket == '/tmp/workflows-manager.sock'
+
+    def test_get_args_run_subcommand_with_batch(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--batch', 'batch.jsonl', '--batch-concurrency', '4',
+                                '--batch-output-directory', 'statuses']):
+            args = get_args()
+            assert args.batch == 'batch.jsonl'
+            assert args.batch_concurrency == 4
+            assert args.batch_output_directory == 'statuses'
+
+    def test_get_args_subcommand_serve(self):
+        with patch('sys.argv', [self.PROGRAM_NAME, 'serve', '--socket', '/tmp/workflows-manager.sock',
+                                '--max-workers', '2', '--configuration-file', 'workflows.yaml']):
+            args = get_args()
+            assert args.action == 'serve'
+            assert args.socket == '/tmp/workflows-manager.sock'
+            assert args.max_workers == 2
+            assert args.configuration_file == 'workflows.yaml'
+
     def test_get_args_log_level_argument(self):
         with patch('sys.argv', [self.PROGRAM_NAME, 'run', '--log-level', 'debug', '--workflow-name', 'workflow-name']):
             args = get_args()
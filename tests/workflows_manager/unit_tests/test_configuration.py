@@ -1,12 +1,41 @@
+import pickle
 from pathlib import Path
-from typing import Type
+from typing import Type, Optional, List
 from unittest.mock import patch, mock_open
 
 import pytest
+import yaml
 
+from workflows_manager import configuration
 from workflows_manager.configuration import Parameter, Parameters, Steps, Step, StepType, Workflow, Workflows, \
-    Configuration, NormalStep, WorkflowStep, ParallelStep
+    Configuration, NormalStep, WorkflowStep, ParallelStep, ExecutorType, CaptureMode, get_yaml_loader, \
+    load_yaml
 from workflows_manager.exceptions import InvalidConfiguration
+from workflows_manager.utils.name_index import VersionedList
+
+
+class TestYamlLoader:
+    def test_get_yaml_loader(self):
+        loader, backend = get_yaml_loader()
+        if hasattr(yaml, 'CSafeLoader'):
+            assert (loader, backend) == (yaml.CSafeLoader, 'libyaml')
+        else:
+            assert (loader, backend) == (yaml.SafeLoader, 'python')
+
+    def test_get_yaml_loader_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+        assert get_yaml_loader() == (yaml.SafeLoader, 'python')
+
+    @pytest.mark.parametrize('loader', [yaml.SafeLoader, getattr(yaml, 'CSafeLoader', yaml.SafeLoader)],
+                             ids=['python loader', 'libyaml loader'])
+    def test_load_yaml(self, loader: Type):
+        content = 'workflows:\n  workflow:\n    steps:\n      - name: step\n        step: step-id\n'
+        with patch.object(configuration, 'YAML_LOADER', loader):
+            assert load_yaml(content) == yaml.safe_load(content)
+
+    def test_load_yaml_unsafe_tag(self):
+        with pytest.raises(yaml.YAMLError):
+            load_yaml('!!python/object/apply:os.system ["echo"]')
 
 
 class TestParameter:
@@ -178,6 +207,61 @@ class TestSteps:
             assert str(exception) == expected_error
 
 
+    @pytest.mark.parametrize('steps, sequential, expected', [
+        (Steps([NormalStep('a', id='id'), NormalStep('b', id='id'), NormalStep('c', id='id', depends_on=['a'])]),
+         True, [[], [0], [0]]),
+        (Steps([NormalStep('a', id='id'), NormalStep('b', id='id'), NormalStep('c', id='id', depends_on=['a'])]),
+         False, [[], [], [0]]),
+        (Steps([NormalStep('a', id='id', depends_on=['b', 'c']), NormalStep('b', id='id', depends_on=[]),
+                NormalStep('c', id='id', depends_on=[])]), True, [[1, 2], [], []]),
+    ], ids=[
+        'workflow steps',
+        'parallel steps',
+        'explicit dependencies',
+    ])
+    def test_get_dependencies(self, steps: Steps, sequential: bool, expected: List[List[int]]):
+        assert steps.has_dependencies
+        assert steps.get_dependencies(sequential) == expected
+
+    def test_has_dependencies(self):
+        steps = Steps([NormalStep('a', id='id'), NormalStep('b', id='id')])
+        assert not steps.has_dependencies
+
+    def test_get_steps(self):
+        nested_step = NormalStep('nested', id='nested-id')
+        workflow_step = WorkflowStep('workflow', workflow='workflow')
+        steps = Steps([NormalStep('a', id='id'), ParallelStep('parallel', parallels=Steps([nested_step, workflow_step]))])
+        assert steps.get_steps(StepType.NORMAL) == [steps[0], nested_step]
+        assert steps.get_steps(StepType.WORKFLOW) == [workflow_step]
+        assert steps.get_steps(StepType.PARALLEL) == [steps[1]]
+
+    @pytest.mark.parametrize('steps, sequential, expected_error', [
+        (Steps([NormalStep('a', id='id', depends_on=['missing'])]), True,
+         "Step 'a' depends on step 'missing' that does not exist within the same steps context."),
+        (Steps([NormalStep('a', id='id', depends_on=['a'])]), True, "Step 'a' cannot depend on itself."),
+        (Steps([NormalStep('a', id='id', depends_on=['b']), NormalStep('b', id='id', depends_on=['a'])]), True,
+         "Dependencies between steps contain a cycle: 'a', 'b'."),
+        (Steps([NormalStep('a', id='id', depends_on=['b']), NormalStep('b', id='id')]), True,
+         "Dependencies between steps contain a cycle: 'a', 'b'."),
+        (Steps([NormalStep('a', id='id', depends_on='b'), NormalStep('b', id='id')]), True,
+         "Dependencies of the step must be a list of step names."),
+    ], ids=[
+        'missing dependency',
+        'self dependency',
+        'explicit cycle',
+        'cycle with previous step',
+        'dependencies are not a list',
+    ])
+    def test_validate_all_dependencies(self, steps: Steps, sequential: bool, expected_error: str):
+        with pytest.raises(InvalidConfiguration) as exception:
+            steps.validate_all(sequential)
+        assert str(exception.value) == expected_error
+
+    def test_validate_all_parallel_dependencies(self):
+        steps = Steps([NormalStep('a', id='id', depends_on=['b']), NormalStep('b', id='id')])
+        steps.validate_all(sequential=False)
+
+
 class TestStepType:
     @pytest.mark.parametrize('type_name, expected_type', [
         ('normal', StepType.NORMAL),
@@ -275,6 +359,9 @@ class TestNormalStep:
         assert step.parameters == Parameters()
         assert step.capture_stdout is False
         assert step.capture_stderr is False
+        assert step.capture_head is None
+        assert step.capture_tail is None
+        assert step.capture_archive is False
 
     def test_from_dict(self):
         elements = {
@@ -284,7 +371,10 @@ class TestNormalStep:
                 {'name': 'name', 'value': 'value', 'from_context': 'from_context'}
             ],
             'capture_stdout': True,
-            'capture_stderr': True
+            'capture_stderr': True,
+            'capture_head': 100,
+            'capture_tail': 200,
+            'capture_archive': True,
         }
         step = NormalStep.from_dict(elements)
         assert step.name == elements['name']
@@ -294,6 +384,9 @@ class TestNormalStep:
         assert step.parameters.elements[0].from_context == elements['parameters'][0]['from_context']
         assert step.capture_stdout is True
         assert step.capture_stderr is True
+        assert step.capture_head == 100
+        assert step.capture_tail == 200
+        assert step.capture_archive is True
 
     def test_from_dict_error(self):
         try:
@@ -319,6 +412,113 @@ class TestNormalStep:
             assert str(
                 exception) == "Step ID cannot be empty."
 
+    @pytest.mark.parametrize('capture_head, capture_tail', [
+        (-1, None),
+        (None, 'all'),
+        (True, None),
+    ], ids=[
+        'negative head',
+        'string tail',
+        'boolean head',
+    ])
+    def test_validate_all_capture_limits_error(self, capture_head, capture_tail):
+        step = NormalStep('name', id='id', capture_head=capture_head, capture_tail=capture_tail)
+        with pytest.raises(InvalidConfiguration):
+            step.validate_all()
+
+    @pytest.mark.parametrize('executor, expected', [
+        (None, None),
+        ('thread', ExecutorType.THREAD),
+        ('process', ExecutorType.PROCESS),
+    ], ids=[
+        'default executor',
+        'thread executor',
+        'process executor',
+    ])
+    def test_from_dict_executor(self, executor: Optional[str], expected: Optional[ExecutorType]):
+        step = NormalStep.from_dict({'name': 'name', 'step': 'id', 'executor': executor})
+        assert step.executor == expected
+
+    @pytest.mark.parametrize('capture_mode, expected', [
+        (None, CaptureMode.BUFFER),
+        ('buffer', CaptureMode.BUFFER),
+        ('stream', CaptureMode.STREAM),
+        ('fd', CaptureMode.FD),
+    ], ids=[
+        'default capture mode',
+        'buffer capture mode',
+        'stream capture mode',
+        'fd capture mode',
+    ])
+    def test_from_dict_capture_mode(self, capture_mode: Optional[str], expected: CaptureMode):
+        data = {'name': 'name', 'step': 'id'}
+        if capture_mode:
+            data['capture_mode'] = capture_mode
+        assert NormalStep.from_dict(data).capture_mode == expected
+
+    def test_from_dict_capture_mode_error(self):
+        with pytest.raises(InvalidConfiguration):
+            NormalStep.from_dict({'name': 'name', 'step': 'id', 'capture_mode': 'unknown'})
+
+    def test_validate_all_stream_capture_mode(self):
+        step = NormalStep('name', id='id', capture_mode=CaptureMode.STREAM, capture_head=10, capture_tail=10)
+        step.validate_all()
+
+    def test_validate_all_stream_capture_mode_error(self):
+        step = NormalStep('name', id='id', capture_mode=CaptureMode.STREAM, capture_archive=True)
+        with pytest.raises(InvalidConfiguration):
+            step.validate_all()
+
+    def test_validate_all_fd_capture_mode_error(self):
+        step = NormalStep('name', id='id', capture_mode=CaptureMode.FD, executor=ExecutorType.THREAD)
+        with pytest.raises(InvalidConfiguration):
+            step.validate_all()
+
+    def test_from_dict_cache(self):
+        step = NormalStep.from_dict({'name': 'name', 'step': 'id', 'cache': True, 'cache_ttl': 60,
+                                     'cache_version': '2'})
+        assert (step.cache, step.cache_ttl, step.cache_version) == (True, 60, '2')
+
+    @pytest.mark.parametrize('cache_ttl, capture_archive', [
+        (-1, False),
+        ('1h', False),
+        (None, True),
+    ], ids=[
+        'negative ttl',
+        'string ttl',
+        'archive',
+    ])
+    def test_validate_all_cache_error(self, cache_ttl, capture_archive: bool):
+        step = NormalStep('name', id='id', cache=True, cache_ttl=cache_ttl, capture_archive=capture_archive)
+        with pytest.raises(InvalidConfiguration):
+            step.validate_all()
+
+    def test_from_dict_files(self):
+        step = NormalStep.from_dict({'name': 'name', 'step': 'id', 'inputs': ['src/*.py'], 'outputs': ['build']})
+        assert (step.inputs, step.outputs) == (['src/*.py'], ['build'])
+
+    @pytest.mark.parametrize('inputs, outputs', [
+        (['src/*.py'], None),
+        ([], ['build']),
+        ('src/*.py', ['build']),
+        (['src/*.py'], ['']),
+    ], ids=[
+        'inputs only',
+        'empty inputs',
+        'string inputs',
+        'empty pattern',
+    ])
+    def test_validate_all_files_error(self, inputs, outputs):
+        step = NormalStep('name', id='id', inputs=inputs, outputs=outputs)
+        with pytest.raises(InvalidConfiguration):
+            step.validate_all()
+
+    def test_from_dict_executor_error(self):
+        with pytest.raises(InvalidConfiguration) as exception:
+            NormalStep.from_dict({'name': 'name', 'step': 'id', 'executor': 'unknown'})
+        assert str(exception.value) == ("Invalid step configuration: Executor type must be either 'thread' or "
+                                        "'process'.")
+
 
 class TestWorkflowStep:
     def test(self):
@@ -435,6 +635,22 @@ class TestParallelStep:
             assert str(
                 exception) == "Steps list cannot be empty."
 
+    def test_from_dict_max_workers(self):
+        step = ParallelStep.from_dict({'name': 'name', 'max_workers': 2, 'parallels': [{'name': 'name', 'step': 'id'}]})
+        assert step.max_workers == 2
+
+    @pytest.mark.parametrize('max_workers', [0, -1, 'two', True], ids=[
+        'zero workers',
+        'negative workers',
+        'string workers',
+        'boolean workers',
+    ])
+    def test_validate_all_invalid_max_workers(self, max_workers):
+        step = ParallelStep('name', parallels=Steps([NormalStep('name', id='id')]), max_workers=max_workers)
+        with pytest.raises(InvalidConfiguration) as exception:
+            step.validate_all()
+        assert str(exception.value) == "Maximum number of workers must be a positive integer."
+
 
 class TestWorkflow:
     def test(self):
@@ -527,6 +743,62 @@ class TestWorkflows:
         workflows = Workflows([Workflow('name', Steps([NormalStep('name', id='id')]))])
         assert workflows['missing'] is None
 
+    def test_getitem_duplicated_name(self):
+        first_workflow = Workflow('name', Steps([NormalStep('first', id='id')]))
+        workflows = Workflows([first_workflow, Workflow('name', Steps([NormalStep('second', id='id')]))])
+        assert workflows['name'] is first_workflow
+
+    def test_getitem_modified_elements(self):
+        workflows = Workflows([Workflow('name', Steps([NormalStep('name', id='id')]))])
+        new_workflow = Workflow('new', Steps([NormalStep('name', id='id')]))
+        workflows.elements.append(new_workflow)
+        assert workflows['new'] is new_workflow
+        workflows.elements[0].name = 'renamed'
+        assert workflows['name'] is None
+        assert workflows['renamed'] is workflows.elements[0]
+        replaced_workflow = Workflow('replaced', Steps([NormalStep('name', id='id')]))
+        workflows.elements[0] = replaced_workflow
+        assert workflows['replaced'] is replaced_workflow
+        assert workflows['renamed'] is None
+        same_name_workflow = Workflow('replaced', Steps([NormalStep('other', id='id')]))
+        workflows.elements[0] = same_name_workflow
+        assert workflows['replaced'] is same_name_workflow
+        workflows.elements[1].name = 'new-name'
+        assert workflows['new'] is None
+        assert workflows['new-name'] is new_workflow
+        del workflows.elements[0]
+        assert workflows['replaced'] is None
+        assert workflows['new-name'] is new_workflow
+
+    def test_getitem_replaced_elements(self):
+        workflows = Workflows([Workflow('name', Steps([NormalStep('name', id='id')]))])
+        assert workflows['name'] is workflows.elements[0]
+        new_workflow = Workflow('new', Steps([NormalStep('name', id='id')]))
+        workflows.elements = [new_workflow]
+        assert isinstance(workflows.elements, VersionedList)
+        assert workflows['name'] is None
+        assert workflows['new'] is new_workflow
+
+    def test_contains(self):
+        workflows = Workflows([Workflow('name', Steps([NormalStep('name', id='id')]))])
+        assert 'name' in workflows
+        assert 'missing' not in workflows
+
+    def test_append(self):
+        workflows = Workflows([Workflow('name', Steps([NormalStep('name', id='id')]))])
+        new_workflow = Workflow('new', Steps([NormalStep('name', id='id')]))
+        workflows.append(new_workflow)
+        assert workflows.elements[-1] is new_workflow
+        assert workflows['new'] is new_workflow
+
+    def test_remove(self):
+        workflows = Workflows([Workflow('name', Steps([NormalStep('name', id='id')]))])
+        workflows.remove('name')
+        assert workflows.elements == []
+        assert workflows['name'] is None
+        with pytest.raises(KeyError):
+            workflows.remove('name')
+
     def test_from_dict(self):
         elements = {
             'workflow': {
@@ -580,6 +852,104 @@ class TestWorkflows:
             assert str(exception) == "Workflows list cannot be empty."
 
 
+class TestLazyWorkflows:
+    DATA = {
+        'first': {'steps': [{'name': 'step', 'step': 'id'}]},
+        'second': {'steps': [{'name': 'step', 'step': 'id'}]},
+        'invalid': {'steps': []},
+    }
+
+    def test_from_dict(self):
+        workflows = Workflows.from_dict(self.DATA, lazy=True)
+        assert workflows.lazy
+        assert workflows.elements == []
+        assert workflows.names == ['first', 'second', 'invalid']
+        assert 'second' in workflows
+        assert 'missing' not in workflows
+        assert workflows.elements == []
+
+    def test_getitem(self):
+        workflows = Workflows.from_dict(self.DATA, lazy=True)
+        workflow = workflows['second']
+        assert workflow.name == 'second'
+        assert workflows['second'] is workflow
+        assert workflows.elements == [workflow]
+        assert workflows['missing'] is None
+
+    def test_getitem_invalid(self):
+        workflows = Workflows.from_dict(self.DATA, lazy=True)
+        with pytest.raises(InvalidConfiguration):
+            workflows['invalid']
+
+    def test_getitem_workflow_name(self):
+        workflows = Workflows.from_dict({'key': {'name': 'name', 'steps': [{'name': 'step', 'step': 'id'}]}},
+                                        lazy=True)
+        assert workflows.names == ['name']
+        assert workflows['name'] is workflows['name']
+        assert len(workflows.elements) == 1
+
+    def test_iter(self):
+        data = {name: workflow for name, workflow in self.DATA.items() if name != 'invalid'}
+        workflows = Workflows.from_dict(data, lazy=True)
+        workflows['second']
+        assert [workflow.name for workflow in workflows] == ['first', 'second']
+        assert workflows[0].name == 'first'
+
+    def test_validate_all(self):
+        workflows = Workflows.from_dict(self.DATA, lazy=True)
+        workflows.validate_all()
+        with pytest.raises(InvalidConfiguration) as exception:
+            Workflows.from_dict({}, lazy=True).validate_all()
+        assert str(exception.value) == "Workflows list cannot be empty."
+
+    def test_get_reachable_workflows(self):
+        workflows = Workflows.from_dict({
+            'main': {'steps': [{'name': 'parallel', 'type': 'parallel', 'parallels': [
+                {'name': 'nested', 'type': 'workflow', 'workflow': 'nested'}]}]},
+            'nested': {'steps': [{'name': 'main', 'type': 'workflow', 'workflow': 'main'}]},
+            'templated': {'steps': [{'name': 'step', 'type': 'workflow', 'workflow': '{{ name }}'}]},
+            'invalid': {'steps': []},
+        }, lazy=True)
+        assert [workflow.name for workflow in workflows.get_reachable_workflows('main')] == ['main', 'nested']
+        assert workflows.get_reachable_workflows('templated') is None
+        assert [workflow.name for workflow in workflows.get_required_workflows('main')] == ['main', 'nested']
+        with pytest.raises(InvalidConfiguration):
+            workflows.get_required_workflows('templated')
+
+    def test_get_required_workflows(self):
+        data = {name: workflow for name, workflow in self.DATA.items() if name != 'invalid'}
+        workflows = Workflows.from_dict(data)
+        assert [workflow.name for workflow in workflows.get_required_workflows('first')] == ['first', 'second']
+        assert [workflow.name for workflow in workflows.get_required_workflows(None)] == ['first', 'second']
+
+    def test_remove(self):
+        workflows = Workflows.from_dict(self.DATA, lazy=True)
+        workflows.remove('invalid')
+        workflows['first']
+        workflows.remove('first')
+        assert workflows.names == ['second']
+        assert workflows.elements == []
+
+    def test_init(self):
+        workflows = Workflows([], {'first': self.DATA['first']})
+        assert workflows.lazy
+        assert workflows.names == ['first']
+        assert not Workflows([]).lazy
+
+    def test_pickle(self):
+        workflows = Workflows.from_dict(self.DATA, lazy=True)
+        workflows['first']
+        restored_workflows = pickle.loads(pickle.dumps(workflows))
+        assert restored_workflows.lazy
+        assert restored_workflows['first'] == workflows['first']
+        assert restored_workflows['second'].name == 'second'
+
+    def test_configuration_from_dict(self):
+        configuration = Configuration.from_dict({'workflows': self.DATA}, lazy=True)
+        assert configuration.workflows.lazy
+        assert configuration.workflows.names == ['first', 'second', 'invalid']
+
+
 class TestConfiguration:
     def test(self):
         parameters = Parameters([Parameter('name', 'value', 'from_context')])
@@ -1,18 +1,21 @@
 import inspect
+import json
 import logging
 import os
 import sys
 from pathlib import Path
 from typing import Dict, Optional
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
 
 import pytest
 
 from workflows_manager import configuration, workflow, dispatcher
 from workflows_manager.configuration import Configuration, Workflows, Workflow, Steps, Step, NormalStep
+from workflows_manager.actions.batch import BatchItem
 from workflows_manager.dispatcher import DispatcherAction, WorkflowDispatcher, WorkflowDispatcherBuilder, \
     ConfigurationFormat
-from workflows_manager.exceptions import UnknownOption, InvalidConfiguration
+from workflows_manager.exceptions import UnknownOption, InvalidConfiguration, InvalidParameter
+from workflows_manager.utils import step_cache
 from actions.conftest import WORKFLOW_NAME, PARAMETERS, test_configuration
 from workflows_manager.workflow import steps
 
@@ -30,13 +33,37 @@ class NewStep(workflow.Step):
         return integer
 
 
+def create_workflow_dispatcher() -> WorkflowDispatcher:
+    workflow_dispatcher = WorkflowDispatcher()
+    workflow_dispatcher.max_workers = None
+    workflow_dispatcher.default_executor = configuration.ExecutorType.THREAD
+    workflow_dispatcher.cache_directory = None
+    workflow_dispatcher.disable_step_index = False
+    workflow_dispatcher.import_include_patterns = None
+    workflow_dispatcher.import_exclude_patterns = None
+    workflow_dispatcher.import_workers = None
+    workflow_dispatcher.import_timings = False
+    workflow_dispatcher.socket_path = None
+    workflow_dispatcher.execution_plans = None
+    workflow_dispatcher.batch_items = None
+    workflow_dispatcher.batch_concurrency = 1
+    workflow_dispatcher.batch_output_directory = None
+    workflow_dispatcher.resume_file = None
+    workflow_dispatcher.step_cache = None
+    workflow_dispatcher.fingerprint_database = None
+    workflow_dispatcher.process_executor = None
+    return workflow_dispatcher
+
+
 class TestDispatcherAction:
     @pytest.mark.parametrize('action, expected', [
         ('validate', DispatcherAction.VALIDATE),
         ('run', DispatcherAction.RUN),
+        ('serve', DispatcherAction.SERVE),
     ], ids=[
         'validate action',
         'run action',
+        'serve action',
     ])
     def test_from_str(self, action: str, expected: DispatcherAction):
         assert DispatcherAction.from_str(action) == expected
@@ -59,7 +86,7 @@ class TestWorkflowDispatcher:
                       expected_validation_result: bool):
         mock_validator.return_value = expected_validation_result
         logger = logging.getLogger('validator')
-        workflow_dispatcher = WorkflowDispatcher()
+        workflow_dispatcher = create_workflow_dispatcher()
         workflow_dispatcher.logger = logger
         workflow_dispatcher.imports = []
         workflow_dispatcher.configuration = test_configuration
@@ -81,17 +108,17 @@ class TestWorkflowDispatcher:
     def test_run(self, mock_validator, mock_runner, test_configuration: configuration.Configuration,
                  validation_result: bool):
         mock_validator.return_value = validation_result
-        with patch.object(mock_runner.return_value, 'run') as mock_run:
+        with patch.object(mock_runner.return_value, 'run', return_value=True) as mock_run:
             root_logger = logging.getLogger('workflows-manager')
             logger = root_logger.getChild(workflow.Step.DEFAULT_LOGGER_PREFIX)
-            workflow_dispatcher = WorkflowDispatcher()
+            workflow_dispatcher = create_workflow_dispatcher()
             workflow_dispatcher.logger = root_logger
             workflow_dispatcher.imports = []
             workflow_dispatcher.configuration = test_configuration
             workflow_dispatcher.workflow_name = WORKFLOW_NAME
             workflow_dispatcher.status_file = Path('test.json')
             workflow_dispatcher.parameters = PARAMETERS
-            workflow_dispatcher.run()
+            assert workflow_dispatcher.run() == validation_result
             if validation_result:
                 mock_runner.assert_called_once_with(logger, test_configuration, WORKFLOW_NAME, PARAMETERS)
                 assert mock_runner.return_value.status_file == workflow_dispatcher.status_file
@@ -100,10 +127,50 @@ class TestWorkflowDispatcher:
                 mock_runner.assert_not_called()
                 mock_run.assert_not_called()
 
+    @patch('workflows_manager.dispatcher.Validator.validate', return_value=True)
+    def test_run_shared_execution_plans(self, _, test_configuration: configuration.Configuration):
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('noop_logger')
+        workflow_dispatcher.configuration = test_configuration
+        workflow_dispatcher.workflow_name = WORKFLOW_NAME
+        workflow_dispatcher.parameters = PARAMETERS
+        workflow_dispatcher.status_file = None
+        workflow_dispatcher.execution_plans = {}
+        workflow_dispatcher.run()
+        execution_plan = workflow_dispatcher.execution_plans[WORKFLOW_NAME]
+        with patch('workflows_manager.actions.runner.ExecutionPlan') as mock_execution_plan:
+            workflow_dispatcher.run()
+        mock_execution_plan.assert_not_called()
+        assert workflow_dispatcher.execution_plans[WORKFLOW_NAME] is execution_plan
+
+    def test_run_batch(self, test_configuration: configuration.Configuration, tmp_path: Path):
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('noop_logger')
+        workflow_dispatcher.imports = []
+        workflow_dispatcher.configuration = test_configuration
+        workflow_dispatcher.parameters = {}
+        workflow_dispatcher.status_file = tmp_path.joinpath('summary.json')
+        workflow_dispatcher.batch_items = [
+            BatchItem(1, 'test-workflow', PARAMETERS),
+            BatchItem(2, 'test-workflow', status_file=tmp_path.joinpath('custom.json')),
+            BatchItem(3, WORKFLOW_NAME, PARAMETERS),
+            BatchItem(4, 'missing-workflow'),
+        ]
+        workflow_dispatcher.batch_concurrency = 2
+        workflow_dispatcher.batch_output_directory = tmp_path.joinpath('statuses')
+        assert workflow_dispatcher.run() is False
+        summary = json.loads(workflow_dispatcher.status_file.read_text())
+        assert [item['status'] for item in summary['items']] == ['success', 'invalid', 'failed', 'error']
+        assert summary['succeeded'] == 1
+        assert tmp_path.joinpath('statuses', '1-test-workflow.json').exists()
+        assert tmp_path.joinpath('statuses', '3-workflow.json').exists()
+        assert not tmp_path.joinpath('custom.json').exists()
+        assert set(workflow_dispatcher.execution_plans) == {'test-workflow', WORKFLOW_NAME}
+
     @patch('workflows_manager.dispatcher.ListWorkflows')
     def test_list(self, mock_list, test_configuration: configuration.Configuration):
         root_logger = logging.getLogger('workflows-manager')
-        workflow_dispatcher = WorkflowDispatcher()
+        workflow_dispatcher = create_workflow_dispatcher()
         workflow_dispatcher.logger = root_logger
         workflow_dispatcher.configuration = test_configuration
         workflow_dispatcher.workflow_name = WORKFLOW_NAME
@@ -113,6 +180,79 @@ class TestWorkflowDispatcher:
         mock_list.assert_called_once_with(root_logger.getChild('list'), test_configuration)
         mock_list.return_value.list.assert_called_once()
 
+    @pytest.mark.parametrize('action, result', [
+        ('validate', True),
+        ('run', False),
+    ], ids=[
+        'validate request',
+        'run request',
+    ])
+    def test_handle_request(self, test_configuration: configuration.Configuration, action: str, result: bool):
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('workflows-manager')
+        workflow_dispatcher.imports = [Path('/tmp/packages')]
+        workflow_dispatcher.configuration = test_configuration
+        workflow_dispatcher.workflow_name = None
+        workflow_dispatcher.parameters = {}
+        request_dispatchers = []
+
+        def dispatch(request_dispatcher: WorkflowDispatcher, request_action: DispatcherAction):
+            request_dispatchers.append(request_dispatcher)
+            assert request_action == DispatcherAction.from_str(action)
+            return result
+
+        with patch.object(WorkflowDispatcher, 'dispatch', autospec=True, side_effect=dispatch):
+            response = workflow_dispatcher.handle_request({'action': action, 'workflow_name': WORKFLOW_NAME,
+                                                           'parameters': PARAMETERS, 'status_file': '/tmp/s.json',
+                                                           'resume_file': '/tmp/previous.json'})
+        assert response == {'status': 'success', 'result': result}
+        request_dispatcher = request_dispatchers[0]
+        assert request_dispatcher is not workflow_dispatcher
+        assert request_dispatcher.configuration is test_configuration
+        assert request_dispatcher.imports == []
+        assert request_dispatcher.workflow_name == WORKFLOW_NAME
+        assert request_dispatcher.parameters == PARAMETERS
+        assert request_dispatcher.status_file == Path('/tmp/s.json')
+        assert request_dispatcher.resume_file == Path('/tmp/previous.json')
+        assert workflow_dispatcher.workflow_name is None
+        assert workflow_dispatcher.imports == [Path('/tmp/packages')]
+
+    def test_handle_request_list(self, test_configuration: configuration.Configuration):
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('workflows-manager')
+        workflow_dispatcher.configuration = test_configuration
+        response = workflow_dispatcher.handle_request({'action': 'list'})
+        assert response == {'status': 'success', 'result': test_configuration.workflows.names}
+
+    @pytest.mark.parametrize('request_data, expected_exception', [
+        ({'action': 'serve'}, UnknownOption),
+        ({'action': 'unknown'}, UnknownOption),
+        ({'action': 'run', 'workflow_name': 'missing-workflow'}, InvalidConfiguration),
+    ], ids=[
+        'serve request',
+        'unknown action',
+        'missing workflow',
+    ])
+    def test_handle_request_error(self, test_configuration: configuration.Configuration, request_data: dict,
+                                  expected_exception: type):
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('workflows-manager')
+        workflow_dispatcher.configuration = test_configuration
+        with pytest.raises(expected_exception):
+            workflow_dispatcher.handle_request(request_data)
+
+    @patch('workflows_manager.dispatcher.WorkflowServer')
+    def test_serve(self, mock_server):
+        mock_server.return_value.serve_forever.side_effect = KeyboardInterrupt
+        root_logger = logging.getLogger('workflows-manager')
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = root_logger
+        workflow_dispatcher.socket_path = Path('/tmp/workflows-manager.sock')
+        workflow_dispatcher.serve()
+        mock_server.assert_called_once_with(workflow_dispatcher.handle_request, Path('/tmp/workflows-manager.sock'),
+                                            root_logger.getChild('server'))
+        mock_server.return_value.serve_forever.assert_called_once()
+
     @pytest.mark.parametrize('action', [
         DispatcherAction.VALIDATE,
         DispatcherAction.RUN,
@@ -131,11 +271,12 @@ class TestWorkflowDispatcher:
                       test_configuration: configuration.Configuration,
                       action: DispatcherAction):
         root_logger = logging.getLogger('workflows-manager')
-        workflow_dispatcher = WorkflowDispatcher()
+        workflow_dispatcher = create_workflow_dispatcher()
         workflow_dispatcher.logger = root_logger
         workflow_dispatcher.configuration = test_configuration
         workflow_dispatcher.workflow_name = WORKFLOW_NAME
         workflow_dispatcher.status_file = Path('test.json')
+        workflow_dispatcher.disable_step_index = True
         workflow_dispatcher.imports = []
         missing_mock_path = MagicMock()
         missing_mock_path.exists.return_value = False
@@ -171,6 +312,90 @@ class TestWorkflowDispatcher:
             mock_list.assert_not_called()
 
 
+    @pytest.mark.parametrize('step_name, expected_modules', [
+        ('indexed-step', ['step_index_used']),
+        ('not-indexed-step', ['step_index_used', 'step_index_unused']),
+    ], ids=[
+        'indexed step',
+        'not indexed step',
+    ])
+    @patch.object(dispatcher.WorkflowDispatcher, 'validate')
+    def test_dispatch_step_index(self, _, tmp_path: Path, step_name: str, expected_modules: list):
+        package_path = tmp_path.joinpath('package')
+        package_path.mkdir()
+        package_path.joinpath('step_index_used.py').write_text(
+            'from workflows_manager import workflow\n\n\n'
+            '@workflow.steps.register(name=\'indexed-step\')\n'
+            'class IndexedStep(workflow.Step):\n'
+            '    def perform(self):\n'
+            '        pass\n')
+        package_path.joinpath('step_index_unused.py').write_text('VALUE = 1\n')
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('noop_logger')
+        workflow_dispatcher.configuration = Configuration.from_dict(
+            {'workflows': {WORKFLOW_NAME: {'steps': [{'name': 'step', 'step': step_name}]}}})
+        workflow_dispatcher.workflow_name = WORKFLOW_NAME
+        workflow_dispatcher.imports = [package_path]
+        workflow_dispatcher.cache_directory = tmp_path.joinpath('cache')
+        try:
+            workflow_dispatcher.dispatch(DispatcherAction.VALIDATE)
+            imported_modules = [module for module in ['step_index_used', 'step_index_unused'] if module in sys.modules]
+            assert imported_modules == expected_modules
+            assert 'indexed-step' in steps.steps_register
+        finally:
+            sys.path.remove(str(package_path))
+            steps.steps_register.pop('indexed-step', None)
+            sys.modules.pop('step_index_used', None)
+            sys.modules.pop('step_index_unused', None)
+
+    @patch('importlib.import_module')
+    def test_dispatch_import_patterns(self, mock_import_module: MagicMock, tmp_path: Path, caplog):
+        for relative_path in ['steps/step.py', 'tests/test_step.py', '.venv/module.py']:
+            tmp_path.joinpath(relative_path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.joinpath(relative_path).write_text('')
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('noop_logger')
+        workflow_dispatcher.imports = [tmp_path]
+        workflow_dispatcher.disable_step_index = True
+        workflow_dispatcher.import_exclude_patterns = dispatcher.DEFAULT_EXCLUDE_PATTERNS + ['tests']
+        workflow_dispatcher.import_workers = 2
+        workflow_dispatcher.import_timings = True
+        try:
+            with patch.object(dispatcher.WorkflowDispatcher, 'list'), caplog.at_level(logging.INFO, 'noop_logger'):
+                workflow_dispatcher.dispatch(DispatcherAction.LIST)
+        finally:
+            sys.path.remove(str(tmp_path))
+        mock_import_module.assert_called_once_with('steps.step')
+        assert 'Import timings (slowest first):' in caplog.messages
+
+    @patch('importlib.import_module')
+    def test_dispatch_entry_point_steps(self, mock_import_module: MagicMock):
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('noop_logger')
+        workflow_dispatcher.configuration = Configuration.from_dict(
+            {'workflows': {WORKFLOW_NAME: {'steps': [{'name': 'step', 'step': 'entry-point-step'}]}}})
+        workflow_dispatcher.workflow_name = WORKFLOW_NAME
+        workflow_dispatcher.imports = [Path('/missing')]
+        with patch.object(workflow.StepsRegister, 'entry_points', new_callable=PropertyMock) as mock_entry_points, \
+                patch.object(dispatcher.WorkflowDispatcher, 'validate'):
+            mock_entry_points.return_value = {'entry-point-step': MagicMock()}
+            workflow_dispatcher.dispatch(DispatcherAction.VALIDATE)
+        mock_import_module.assert_not_called()
+
+    @patch('importlib.import_module')
+    def test_dispatch_step_index_registered_steps(self, mock_import_module: MagicMock,
+                                                  test_configuration: configuration.Configuration):
+        workflow_dispatcher = create_workflow_dispatcher()
+        workflow_dispatcher.logger = logging.getLogger('noop_logger')
+        workflow_dispatcher.configuration = test_configuration
+        workflow_dispatcher.workflow_name = WORKFLOW_NAME
+        workflow_dispatcher.imports = [Path('/missing')]
+        with patch.object(dispatcher.WorkflowDispatcher, 'list'):
+            workflow_dispatcher.dispatch(DispatcherAction.LIST)
+        with patch.object(dispatcher.WorkflowDispatcher, 'validate'):
+            workflow_dispatcher.dispatch(DispatcherAction.VALIDATE)
+        mock_import_module.assert_not_called()
+
 def create_path_with_default_cwd(default_path: Path, original_new):
     def mock_path(cls, *args, **kwargs):
         if not args and not kwargs:
@@ -312,6 +537,269 @@ class TestWorkflowDispatcherBuilder:
         assert workflow_name == inspect.getattr_static(workflow_dispatcher_builder,
                                                        "_WorkflowDispatcherBuilder__workflow_name")
 
+    def test_max_workers(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.max_workers(4)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder, "_WorkflowDispatcherBuilder__max_workers") == 4
+
+    def test_max_workers_error(self):
+        with pytest.raises(InvalidParameter):
+            WorkflowDispatcherBuilder().max_workers(0)
+
+    def test_process_workers(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.process_workers(2)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder, "_WorkflowDispatcherBuilder__process_workers") == 2
+
+    def test_process_workers_error(self):
+        with pytest.raises(InvalidParameter):
+            WorkflowDispatcherBuilder().process_workers(0)
+
+    @pytest.mark.parametrize('default_executor, expected', [
+        (None, configuration.ExecutorType.THREAD),
+        ('thread', configuration.ExecutorType.THREAD),
+        ('process', configuration.ExecutorType.PROCESS),
+    ], ids=[
+        'default executor',
+        'thread executor',
+        'process executor',
+    ])
+    def test_default_executor(self, default_executor: Optional[str], expected: configuration.ExecutorType):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.default_executor(default_executor)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__default_executor") == expected
+
+    def test_cache_directory(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        cache_directory = Path('/tmp/cache')
+        returned_object = workflow_dispatcher_builder.cache_directory(cache_directory)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__cache_directory") == cache_directory
+
+    def test_disable_configuration_cache(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.disable_configuration_cache(True)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__disable_configuration_cache") is True
+
+    def test_lazy_configuration(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.lazy_configuration(True)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__lazy_configuration") is True
+
+    def test_disable_step_index(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.disable_step_index(True)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__disable_step_index") is True
+
+    @pytest.mark.parametrize('socket_path, expected', [
+        (None, None),
+        ('/tmp/workflows-manager.sock', Path('/tmp/workflows-manager.sock')),
+        (Path('/tmp/workflows-manager.sock'), Path('/tmp/workflows-manager.sock')),
+    ], ids=[
+        'default socket',
+        'string socket',
+        'path socket',
+    ])
+    def test_socket_path(self, socket_path, expected: Optional[Path]):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.socket_path(socket_path)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__socket_path") == expected
+
+    def test_batch_file(self, tmp_path: Path):
+        batch_file = tmp_path.joinpath('batch.jsonl')
+        batch_file.write_text('{"workflow_name": "first"}\n\n{"workflow_name": "second", "parameters": {"key": 1}}\n')
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.batch_file(batch_file)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder, "_WorkflowDispatcherBuilder__batch_items") == [
+            BatchItem(1, 'first'), BatchItem(3, 'second', {'key': 1})]
+
+    @pytest.mark.parametrize('batch_concurrency, expected', [
+        (None, 1),
+        (4, 4),
+    ], ids=[
+        'default concurrency',
+        'custom concurrency',
+    ])
+    def test_batch_concurrency(self, batch_concurrency: Optional[int], expected: int):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.batch_concurrency(batch_concurrency)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__batch_concurrency") == expected
+
+    def test_batch_concurrency_error(self):
+        with pytest.raises(InvalidParameter):
+            WorkflowDispatcherBuilder().batch_concurrency(0)
+
+    def test_batch_output_directory(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.batch_output_directory('statuses')
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__batch_output_directory") == Path(
+            'statuses').absolute()
+
+    @pytest.mark.parametrize('max_size, expected', [
+        (None, step_cache.DEFAULT_MAX_SIZE),
+        (1024, 1024),
+    ], ids=[
+        'default size',
+        'custom size',
+    ])
+    def test_step_cache_max_size(self, max_size: Optional[int], expected: int):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.step_cache_max_size(max_size)
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__step_cache_max_size") == expected
+
+    def test_step_cache_max_size_error(self):
+        with pytest.raises(InvalidParameter):
+            WorkflowDispatcherBuilder().step_cache_max_size(0)
+
+    def test_resume_file(self):
+        workflow_dispatcher_builder = WorkflowDispatcherBuilder()
+        returned_object = workflow_dispatcher_builder.resume_file('status.json')
+        assert returned_object == workflow_dispatcher_builder
+        assert inspect.getattr_static(workflow_dispatcher_builder,
+                                      "_WorkflowDispatcherBuilder__resume_file") == Path('status.json').absolute()
+
+    def test_import_workers_error(self):
+        with pytest.raises(InvalidParameter):
+            WorkflowDispatcherBuilder().import_workers(0)
+
+    @pytest.mark.parametrize('environment, disable_default_excludes, expected_include, expected_exclude', [
+        ({}, False, None, dispatcher.DEFAULT_EXCLUDE_PATTERNS + ['tests']),
+        ({dispatcher.MODULE_IMPORTS_INCLUDE_ENVIRONMENT_VARIABLE: f'steps/*{os.pathsep}main.py',
+          dispatcher.MODULE_IMPORTS_EXCLUDE_ENVIRONMENT_VARIABLE: 'docs'}, True, ['steps/*', 'main.py'],
+         ['docs', 'tests']),
+    ], ids=[
+        'default patterns',
+        'environment patterns',
+    ])
+    def test_build_import_options(self, tmp_path: Path, environment: Dict[str, str], disable_default_excludes: bool,
+                                  expected_include: Optional[list], expected_exclude: list):
+        configuration_file = tmp_path.joinpath('workflows.yaml')
+        configuration_file.write_text('workflows:\n  workflow:\n    steps:\n      - name: step\n        step: step-id\n')
+        with patch.dict('os.environ', environment):
+            workflow_dispatcher = (WorkflowDispatcherBuilder()
+                                   .logger(logging.getLogger('noop_logger'))
+                                   .disable_current_path_import(True)
+                                   .imports([])
+                                   .configuration_file(configuration_file)
+                                   .disable_configuration_cache(True)
+                                   .import_include([])
+                                   .import_exclude(['tests'])
+                                   .disable_default_import_excludes(disable_default_excludes)
+                                   .import_workers(4)
+                                   .import_timings(True)
+                                   .workflow_name('workflow')
+                                   .status_file(None)
+                                   .parameters({})
+                                   .build())
+        assert workflow_dispatcher.import_include_patterns == expected_include
+        assert workflow_dispatcher.import_exclude_patterns == expected_exclude
+        assert workflow_dispatcher.import_workers == 4
+        assert workflow_dispatcher.import_timings is True
+
+    def test_build_lazy_configuration(self, tmp_path: Path):
+        configuration_file = tmp_path.joinpath('workflows.yaml')
+        configuration_file.write_text('workflows:\n'
+                                      '  workflow:\n    steps:\n      - name: step\n        step: step-id\n'
+                                      '  invalid:\n    steps: []\n')
+        workflow_dispatcher = (WorkflowDispatcherBuilder()
+                               .logger(logging.getLogger('noop_logger'))
+                               .disable_current_path_import(True)
+                               .imports([])
+                               .configuration_file(configuration_file)
+                               .disable_configuration_cache(True)
+                               .lazy_configuration(True)
+                               .workflow_name('workflow')
+                               .status_file(None)
+                               .parameters({})
+                               .build())
+        workflows = workflow_dispatcher.configuration.workflows
+        assert workflows.lazy
+        assert workflows.elements == []
+        assert workflows['workflow'].steps[0].name == 'step'
+        with pytest.raises(InvalidConfiguration):
+            workflows['invalid']
+
+    @pytest.mark.parametrize('batch_content, resume_file, expected_exception', [
+        ('{"workflow_name": "workflow"}\n', None, None),
+        ('{"workflow_name": "missing"}\n', None, InvalidConfiguration),
+        ('{"workflow_name": "workflow"}\n', 'status.json', InvalidParameter),
+    ], ids=[
+        'existing workflow',
+        'missing workflow',
+        'resume file',
+    ])
+    def test_build_batch(self, tmp_path: Path, batch_content: str, resume_file: Optional[str],
+                         expected_exception: Optional[type]):
+        configuration_file = tmp_path.joinpath('workflows.yaml')
+        configuration_file.write_text('workflows:\n  workflow:\n    steps:\n      - name: step\n        step: step-id\n')
+        batch_file = tmp_path.joinpath('batch.jsonl')
+        batch_file.write_text(batch_content)
+        workflow_dispatcher_builder = (WorkflowDispatcherBuilder()
+                                       .logger(logging.getLogger('noop_logger'))
+                                       .disable_current_path_import(True)
+                                       .imports([])
+                                       .configuration_file(configuration_file)
+                                       .disable_configuration_cache(True)
+                                       .workflow_name('default')
+                                       .status_file(None)
+                                       .parameters({})
+                                       .batch_file(batch_file)
+                                       .batch_concurrency(2)
+                                       .resume_file(resume_file))
+        if expected_exception:
+            with pytest.raises(expected_exception):
+                workflow_dispatcher_builder.build()
+            return
+        workflow_dispatcher = workflow_dispatcher_builder.build()
+        assert workflow_dispatcher.workflow_name is None
+        assert [item.workflow_name for item in workflow_dispatcher.batch_items] == ['workflow']
+        assert workflow_dispatcher.batch_concurrency == 2
+
+    def test_build_configuration_cache(self, tmp_path: Path):
+        configuration_file = tmp_path.joinpath('workflows.yaml')
+        configuration_file.write_text('workflows:\n  workflow:\n    steps:\n      - name: step\n        step: step-id\n')
+
+        def build():
+            return (WorkflowDispatcherBuilder()
+                    .logger(logging.getLogger('noop_logger'))
+                    .disable_current_path_import(True)
+                    .imports([])
+                    .configuration_file(configuration_file)
+                    .cache_directory(tmp_path.joinpath('cache'))
+                    .workflow_name('workflow')
+                    .status_file(None)
+                    .parameters({})
+                    .build())
+
+        first_dispatcher = build()
+        with patch('workflows_manager.configuration.Configuration.from_yaml') as mock_from_yaml:
+            second_dispatcher = build()
+            mock_from_yaml.assert_not_called()
+        assert second_dispatcher.configuration == first_dispatcher.configuration
+        configuration_file.write_text('workflows:\n  workflow:\n    steps:\n      - name: changed\n        step: step-id\n')
+        third_dispatcher = build()
+        assert third_dispatcher.configuration.workflows['workflow'].steps[0].name == 'changed'
+
     def test_status_file(self):
         workflow_dispatcher_builder = WorkflowDispatcherBuilder()
         status_file = 'test.json'
@@ -344,7 +832,7 @@ class TestWorkflowDispatcherBuilder:
         ]
         workflows = [Workflow('workflow', Steps([NormalStep('example-step', id='step-id')]))]
         mock_workflow = MagicMock()
-        mock_workflow.workflows.elements = workflows
+        mock_workflow.workflows = Workflows(workflows)
         mock_configuration.from_json.return_value = mock_workflow
         mock_configuration.from_yaml.return_value = mock_workflow
         configuration_file = MagicMock()
@@ -356,6 +844,7 @@ class TestWorkflowDispatcherBuilder:
         workflow_dispatcher_builder._WorkflowDispatcherBuilder__imports = imports
         workflow_dispatcher_builder.logger(logger)
         workflow_dispatcher_builder.disable_current_path_import(disable_import)
+        workflow_dispatcher_builder.disable_configuration_cache(True)
         workflow_dispatcher_builder.status_file(status_file)
         workflow_dispatcher_builder.workflow_name(workflow_name)
         workflow_dispatcher_builder.parameters(PARAMETERS)
@@ -378,9 +867,9 @@ class TestWorkflowDispatcherBuilder:
             assert mock_dispatcher.status_file == status_file
             assert mock_dispatcher.workflow_name == workflow_name
             if configuration_format == ConfigurationFormat.JSON:
-                mock_configuration.from_json.assert_called_once_with(configuration_file)
+                mock_configuration.from_json.assert_called_once_with(configuration_file, lazy=False)
             elif configuration_format == ConfigurationFormat.YAML:
-                mock_configuration.from_yaml.assert_called_once_with(configuration_file)
+                mock_configuration.from_yaml.assert_called_once_with(configuration_file, lazy=False)
             mock_dispatcher.configuration.validate_all.assert_called_once()
 
     def test_build_error_unknown_option(self):
@@ -405,11 +894,12 @@ class TestWorkflowDispatcherBuilder:
         workflow_dispatcher_builder._WorkflowDispatcherBuilder__parameters = {}
         workflows = [Workflow('workflow', Steps([NormalStep('example-step', id='step-id')]))]
         mock_workflow = MagicMock()
-        mock_workflow.workflows.elements = workflows
+        mock_workflow.workflows = Workflows(workflows)
         mock_configuration.from_json.return_value = mock_workflow
         workflow_dispatcher_builder._WorkflowDispatcherBuilder__imports = []
         workflow_dispatcher_builder.logger(logger)
         workflow_dispatcher_builder.disable_current_path_import(True)
+        workflow_dispatcher_builder.disable_configuration_cache(True)
         with pytest.raises(InvalidConfiguration) as exception:
             workflow_dispatcher_builder.build()
             assert str(exception.value) == "Workflow 'undefined' is not defined in the configuration file"
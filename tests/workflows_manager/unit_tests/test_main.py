@@ -7,7 +7,35 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from workflows_manager import __version__
-from workflows_manager.main import DEFAULT_STATUS_CODE, main, main_cli
+from workflows_manager.main import DEFAULT_STATUS_CODE, DEFAULT_ERROR_STATUS_CODE, main, main_cli
+
+BUILDER_METHODS = [
+    'logger',
+    'disable_current_path_import',
+    'imports',
+    'configuration_file',
+    'workflow_name',
+    'status_file',
+    'parameters',
+    'max_workers',
+    'process_workers',
+    'step_cache_max_size',
+    'default_executor',
+    'cache_directory',
+    'disable_configuration_cache',
+    'lazy_configuration',
+    'disable_step_index',
+    'import_include',
+    'import_exclude',
+    'disable_default_import_excludes',
+    'import_workers',
+    'import_timings',
+    'socket_path',
+    'batch_file',
+    'batch_concurrency',
+    'batch_output_directory',
+    'resume_file',
+]
 
 
 class Test:
@@ -18,7 +46,10 @@ class Test:
         mock_logger = MagicMock()
         mock_get_logger.return_value = mock_logger
         mock_dispatcher = MagicMock()
-        mock_dispatcher_builder.return_value.logger.return_value.disable_current_path_import.return_value.imports.return_value.configuration_file.return_value.workflow_name.return_value.status_file.return_value.parameters.return_value.build.return_value = mock_dispatcher
+        mock_builder = mock_dispatcher_builder.return_value
+        for method_name in BUILDER_METHODS:
+            getattr(mock_builder, method_name).return_value = mock_builder
+        mock_builder.build.return_value = mock_dispatcher
 
         mock_action = MagicMock()
         mock_from_str.return_value = mock_action
@@ -42,6 +73,24 @@ class Test:
             float_parameter=[],
             list_parameter=[],
             dict_parameter=[],
+            max_workers=4,
+            process_workers=3,
+            step_cache_max_size=1024,
+            default_executor='process',
+            cache_directory='/tmp/cache',
+            disable_configuration_cache=True,
+            lazy_configuration=True,
+            disable_step_index=True,
+            import_include=['steps/*'],
+            import_exclude=['tests'],
+            disable_default_import_excludes=True,
+            import_workers=2,
+            import_timings=True,
+            socket=None,
+            batch='batch.jsonl',
+            batch_concurrency=2,
+            batch_output_directory='statuses',
+            resume=None,
         )
 
         result = main(arguments)
@@ -50,29 +99,138 @@ class Test:
         mock_logger.info.assert_any_call('Starting the workflow engine')
 
         mock_dispatcher_builder.assert_called_once()
-        logger_mock = mock_dispatcher_builder.return_value.logger
-        logger_mock.assert_called_once_with(mock_logger)
-        disable_current_path_import_mock = logger_mock.return_value.disable_current_path_import
-        disable_current_path_import_mock.assert_called_once_with(True)
-        imports_mock = disable_current_path_import_mock.return_value.imports
-        imports_mock.assert_called_once_with(['module1', 'module2'])
-        configuration_file_mock = imports_mock.return_value.configuration_file
-        configuration_file_mock.assert_called_once_with('config.yaml')
-        workflow_name_mock = configuration_file_mock.return_value.workflow_name
-        workflow_name_mock.assert_called_once_with('workflow1')
-        status_file_mock = workflow_name_mock.return_value.status_file
-        status_file_mock.assert_called_once_with('status.txt')
-        parameters_mock = status_file_mock.return_value.parameters
-        parameters_mock.assert_called_once_with({'key': 'value'})
-        build_mock = parameters_mock.return_value.build
-        build_mock.assert_called_once()
+        mock_builder.logger.assert_called_once_with(mock_logger)
+        mock_builder.disable_current_path_import.assert_called_once_with(True)
+        mock_builder.imports.assert_called_once_with(['module1', 'module2'])
+        mock_builder.configuration_file.assert_called_once_with('config.yaml')
+        mock_builder.workflow_name.assert_called_once_with('workflow1')
+        mock_builder.status_file.assert_called_once_with('status.txt')
+        mock_builder.parameters.assert_called_once_with({'key': 'value'})
+        mock_builder.max_workers.assert_called_once_with(4)
+        mock_builder.process_workers.assert_called_once_with(3)
+        mock_builder.step_cache_max_size.assert_called_once_with(1024)
+        mock_builder.default_executor.assert_called_once_with('process')
+        mock_builder.cache_directory.assert_called_once_with('/tmp/cache')
+        mock_builder.disable_configuration_cache.assert_called_once_with(True)
+        mock_builder.lazy_configuration.assert_called_once_with(True)
+        mock_builder.disable_step_index.assert_called_once_with(True)
+        mock_builder.import_include.assert_called_once_with(['steps/*'])
+        mock_builder.import_exclude.assert_called_once_with(['tests'])
+        mock_builder.disable_default_import_excludes.assert_called_once_with(True)
+        mock_builder.import_workers.assert_called_once_with(2)
+        mock_builder.import_timings.assert_called_once_with(True)
+        mock_builder.socket_path.assert_called_once_with(None)
+        mock_builder.batch_file.assert_called_once_with('batch.jsonl')
+        mock_builder.batch_concurrency.assert_called_once_with(2)
+        mock_builder.batch_output_directory.assert_called_once_with('statuses')
+        mock_builder.resume_file.assert_called_once_with(None)
+        mock_builder.build.assert_called_once()
 
         mock_from_str.assert_called_once_with('run')
         mock_dispatcher.dispatch.assert_called_once_with(mock_action)
+        mock_dispatcher.close.assert_called_once()
 
         mock_logger.info.assert_any_call('Stop the workflow engine.')
         assert result == DEFAULT_STATUS_CODE
 
+    @pytest.mark.parametrize('action, result, expected_stdout', [
+        ('run', True, ''),
+        ('list', ['first', 'second'], 'first\nsecond\n'),
+    ], ids=[
+        'run action',
+        'list action',
+    ])
+    @patch("workflows_manager.main.get_logger")
+    @patch("workflows_manager.main.WorkflowDispatcherBuilder")
+    @patch("workflows_manager.main.send_request")
+    def test_main_client(self, mock_send_request, mock_dispatcher_builder, _, action: str, result,
+                         expected_stdout: str):
+        mock_send_request.return_value = {'status': 'success', 'result': result}
+        arguments = Namespace(
+            log_level='info',
+            log_file=None,
+            console_log_format='text',
+            file_log_format='text',
+            action=action,
+            workflow_name='workflow1',
+            status_file='status.json',
+            resume='previous.json',
+            parameter=['key:str:value'],
+            socket='/tmp/workflows-manager.sock',
+        )
+        buffer = io.StringIO()
+
+        with contextlib.redirect_stdout(buffer):
+            result = main(arguments)
+
+        mock_dispatcher_builder.assert_not_called()
+        request, socket_path = mock_send_request.call_args.args
+        assert socket_path == '/tmp/workflows-manager.sock'
+        assert request['action'] == action
+        assert request['workflow_name'] == 'workflow1'
+        assert request['parameters'] == {'key': 'value'}
+        assert request['status_file'].endswith('status.json')
+        assert request['resume_file'].endswith('previous.json')
+        assert buffer.getvalue() == expected_stdout
+        assert result == DEFAULT_STATUS_CODE
+
+    @patch("workflows_manager.main.get_logger")
+    @patch("workflows_manager.main.send_request")
+    def test_main_client_error(self, mock_send_request, _):
+        mock_send_request.return_value = {'status': 'error', 'error': 'Workflow not found'}
+        arguments = Namespace(
+            log_level='info',
+            log_file=None,
+            console_log_format='text',
+            file_log_format='text',
+            action='validate',
+            socket='/tmp/workflows-manager.sock',
+        )
+
+        assert main(arguments) == DEFAULT_ERROR_STATUS_CODE
+
+    @pytest.mark.parametrize('disable_error_codes, expected_status_code', [
+        (False, DEFAULT_ERROR_STATUS_CODE),
+        (True, DEFAULT_STATUS_CODE),
+    ], ids=[
+        'error codes enabled',
+        'error codes disabled',
+    ])
+    @patch("workflows_manager.main.get_logger")
+    @patch("workflows_manager.main.send_request")
+    def test_main_client_run_failed(self, mock_send_request, mock_get_logger, disable_error_codes: bool,
+                                    expected_status_code: int):
+        mock_send_request.return_value = {'status': 'success', 'result': False}
+        arguments = Namespace(
+            log_level='info',
+            log_file=None,
+            console_log_format='text',
+            file_log_format='text',
+            action='run',
+            workflow_name='workflow1',
+            socket='/tmp/workflows-manager.sock',
+            disable_error_codes=disable_error_codes,
+        )
+
+        assert main(arguments) == expected_status_code
+        mock_get_logger.return_value.error.assert_called_once_with('Server failed to run the workflow')
+
+    @patch("workflows_manager.main.get_logger")
+    @patch("workflows_manager.main.send_request")
+    def test_main_client_batch(self, mock_send_request, _):
+        arguments = Namespace(
+            log_level='info',
+            log_file=None,
+            console_log_format='text',
+            file_log_format='text',
+            action='run',
+            batch='batch.jsonl',
+            socket='/tmp/workflows-manager.sock',
+        )
+
+        assert main(arguments) == DEFAULT_ERROR_STATUS_CODE
+        mock_send_request.assert_not_called()
+
     @pytest.mark.parametrize('logging_level', [
         'debug',
         'info',
@@ -92,7 +250,10 @@ class Test:
         mock_get_logger.return_value = mock_logger
         mock_dispatcher = MagicMock()
         mock_dispatcher.dispatch.side_effect = ValueError("Test error")
-        mock_dispatcher_builder.return_value.logger.return_value.disable_current_path_import.return_value.imports.return_value.configuration_file.return_value.workflow_name.return_value.status_file.return_value.parameters.return_value.build.return_value = mock_dispatcher
+        mock_builder = mock_dispatcher_builder.return_value
+        for method_name in BUILDER_METHODS:
+            getattr(mock_builder, method_name).return_value = mock_builder
+        mock_builder.build.return_value = mock_dispatcher
 
         arguments = Namespace(
             log_level=logging_level,
@@ -0,0 +1,114 @@
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from workflows_manager import server
+from workflows_manager.exceptions import UnknownOption
+from workflows_manager.server import WorkflowServer, send_request, get_default_socket_path, SOCKET_PERMISSIONS
+
+
+@pytest.fixture
+def socket_path():
+    # Unix domain socket paths are limited to ~100 characters, so the pytest tmp_path may be too long.
+    directory = tempfile.mkdtemp(dir='/tmp')
+    yield Path(directory, 'server.sock')
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def handle_request(request: dict) -> dict:
+    if request.get('action') == 'fail':
+        raise ValueError('Request failed')
+    return {'status': 'success', 'result': request}
+
+
+class TestServerFunctions:
+    @pytest.mark.parametrize('environment, expected', [
+        ({'WORKFLOWS_MANAGER_SOCKET': '/tmp/custom.sock', 'XDG_RUNTIME_DIR': '/run/user/1000'},
+         Path('/tmp/custom.sock')),
+        ({'XDG_RUNTIME_DIR': '/run/user/1000'}, Path('/run/user/1000/workflows-manager.sock')),
+    ], ids=[
+        'environment variable',
+        'runtime directory',
+    ])
+    def test_get_default_socket_path(self, environment: dict, expected: Path):
+        with patch.dict('os.environ', environment, clear=True):
+            assert get_default_socket_path() == expected
+
+    def test_get_default_socket_path_temporary_directory(self):
+        with patch.dict('os.environ', {}, clear=True), patch('tempfile.gettempdir', return_value='/tmp'):
+            socket_path = get_default_socket_path()
+        assert socket_path.parent == Path('/tmp')
+        assert socket_path.name.startswith('workflows-manager-')
+
+    def test_send_request_no_server(self, socket_path: Path):
+        with pytest.raises(OSError):
+            send_request({'action': 'list'}, socket_path)
+
+
+class TestWorkflowServer:
+    @pytest.fixture
+    def workflow_server(self, socket_path: Path):
+        workflow_server = WorkflowServer(handle_request, socket_path).start()
+        thread = threading.Thread(target=workflow_server.serve_forever)
+        thread.start()
+        yield workflow_server
+        workflow_server.shutdown()
+        thread.join()
+
+    def test_send_request(self, workflow_server: WorkflowServer):
+        response = send_request({'action': 'run', 'parameters': {'key': 'value'}}, workflow_server.socket_path)
+        assert response == {'status': 'success', 'result': {'action': 'run', 'parameters': {'key': 'value'}}}
+        assert workflow_server.socket_path.stat().st_mode & 0o777 == SOCKET_PERMISSIONS
+
+    def test_send_request_error(self, workflow_server: WorkflowServer):
+        response = send_request({'action': 'fail'}, workflow_server.socket_path)
+        assert response == {'status': 'error', 'error': 'Request failed'}
+
+    @pytest.mark.parametrize('data', [
+        b'not json\n',
+        b'["list"]\n',
+    ], ids=[
+        'invalid json',
+        'not an object',
+    ])
+    def test_invalid_request(self, workflow_server: WorkflowServer, data: bytes):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect(str(workflow_server.socket_path))
+            client_socket.sendall(data)
+            with client_socket.makefile('rb') as stream:
+                response = stream.readline()
+        assert b'"status": "error"' in response
+
+    def test_serve_forever_removes_socket(self, socket_path: Path):
+        workflow_server = WorkflowServer(handle_request, socket_path).start()
+        thread = threading.Thread(target=workflow_server.serve_forever)
+        thread.start()
+        workflow_server.shutdown()
+        thread.join()
+        assert not socket_path.exists()
+
+    def test_start_stale_socket(self, socket_path: Path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+            stale_socket.bind(str(socket_path))
+        assert socket_path.exists()
+        workflow_server = WorkflowServer(handle_request, socket_path).start()
+        thread = threading.Thread(target=workflow_server.serve_forever)
+        thread.start()
+        try:
+            assert send_request({'action': 'list'}, socket_path)['status'] == 'success'
+        finally:
+            workflow_server.shutdown()
+            thread.join()
+
+    def test_start_socket_in_use(self, workflow_server: WorkflowServer):
+        with pytest.raises(OSError, match='is used by another server'):
+            WorkflowServer(handle_request, workflow_server.socket_path).start()
+
+    def test_start_not_supported(self, socket_path: Path):
+        with patch.object(server.RequestServer, 'is_supported', False), pytest.raises(UnknownOption):
+            WorkflowServer(handle_request, socket_path).start()
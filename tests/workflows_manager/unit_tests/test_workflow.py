@@ -1,11 +1,17 @@
+import asyncio
+import inspect
 import logging
-from typing import Optional, List, Dict, Callable, Tuple
+import pickle
+from importlib import metadata
+from typing import Optional, List, Dict, Callable, Tuple, Type
+from unittest.mock import patch, MagicMock
 
 import pytest
 
 from workflows_manager.configuration import StepType
+from workflows_manager import workflow
 from workflows_manager.workflow import StepPath, StepInformation, StepStatus, StepsInformation, WorkflowContext, Step, \
-    Steps
+    Steps, get_entry_points
 
 
 @pytest.fixture
@@ -95,6 +101,27 @@ class TestStepPath:
         step_path = StepPath(None, StepType.NORMAL, 'step')
         assert step_path.__hash__() == hash((None, StepType.NORMAL, 'step'))
 
+    def test_hash_name_changed(self):
+        step_path = StepPath(None, StepType.NORMAL, 'step')
+        hash(step_path)
+        step_path.name = 'renamed'
+        assert hash(step_path) == hash((None, StepType.NORMAL, 'renamed'))
+
+    def test_reset_hash(self):
+        parent_path = StepPath(None, StepType.WORKFLOW, 'parent')
+        step_path = StepPath(parent_path, StepType.NORMAL, 'step')
+        hash(step_path)
+        parent_path.name = 'renamed'
+        step_path.reset_hash()
+        assert hash(step_path) == hash((StepPath(None, StepType.WORKFLOW, 'renamed'), StepType.NORMAL, 'step'))
+
+    def test_pickle(self):
+        step_path = StepPath(StepPath(None, StepType.WORKFLOW, 'parent'), StepType.NORMAL, 'step')
+        hash(step_path)
+        unpickled_step_path = pickle.loads(pickle.dumps(step_path))
+        assert unpickled_step_path == step_path
+        assert unpickled_step_path._StepPath__hash is None
+
     @pytest.mark.parametrize(
         'path1, path2, expected',
         [
@@ -133,6 +160,27 @@ class TestStepsInformation:
         assert steps_information.get_step_information(step_path) == StepInformation(path=step_path,
                                                                                     status=StepStatus.UNKNOWN)
 
+    def test_rename_step(self, steps_information: StepsInformation):
+        parallel_step_path = StepPath(StepPath(None, StepType.WORKFLOW, 'workflow_step'), StepType.PARALLEL,
+                                      'parallel_step')
+        parallel_step = steps_information.get_step_information(parallel_step_path)
+        parallel_child_step = parallel_step.children[0]
+        steps_information.rename_step(parallel_step.path, 'renamed_step')
+        renamed_step_path = StepPath(StepPath(None, StepType.WORKFLOW, 'workflow_step'), StepType.PARALLEL,
+                                     'renamed_step')
+        assert parallel_step.path.name == 'renamed_step'
+        assert steps_information.get_step_information(renamed_step_path) is parallel_step
+        assert steps_information.get_step_information(
+            StepPath(renamed_step_path, StepType.NORMAL, 'parallel_child_step')) is parallel_child_step
+        assert steps_information.get_step_information(parallel_step_path).status == StepStatus.UNKNOWN
+        assert len(steps_information.steps) == 4
+
+    def test_rename_step_not_found(self, steps_information: StepsInformation):
+        step_path = StepPath(None, StepType.NORMAL, 'missing_step')
+        steps_information.rename_step(step_path, 'renamed_step')
+        assert step_path.name == 'renamed_step'
+        assert len(steps_information.steps) == 4
+
     def test_first_step(self, steps_information: StepsInformation):
         assert steps_information.first_step == steps_information.steps[
             StepPath(None, StepType.WORKFLOW, 'workflow_step')]
@@ -190,6 +238,22 @@ class TestWorkflowContext:
         workflow_context.set('a', 2)
         assert workflow_context.get('a') == 2
 
+    def test_context_remove(self):
+        workflow_context = WorkflowContext({'a': 1, 'b': 2})
+        workflow_context.remove('a')
+        workflow_context.remove('missing')
+        assert workflow_context.parameters == {'b': 2}
+
+    def test_context_pop_changes(self):
+        workflow_context = WorkflowContext({'a': 1, 'b': 2})
+        assert workflow_context.pop_changes() == ({}, [])
+        workflow_context.set('c', 3)
+        workflow_context.remove('a')
+        workflow_context.set('a', 4)
+        workflow_context.remove('b')
+        assert workflow_context.pop_changes() == ({'c': 3, 'a': 4}, ['b'])
+        assert workflow_context.pop_changes() == ({}, [])
+
     def test_context_get_step_information(self, steps_information: StepsInformation,
                                           workflow_context: WorkflowContext):
         step_path = StepPath(None, StepType.WORKFLOW, 'workflow_step')
@@ -252,6 +316,13 @@ class NewStep(Step):
         return 'value'
 
 
+class NewAsyncStep(Step):
+    async def perform(self, fail: bool) -> str:
+        if fail:
+            raise Exception('Error')
+        return 'value'
+
+
 class NoopLogger(logging.Logger):
     def __init__(self, name):
         super().__init__(name)
@@ -259,13 +330,13 @@ class NoopLogger(logging.Logger):
 
 
 class TestSteps:
-    def create_wrapped_step(self) -> Tuple[Step, Callable[[bool], str]]:
+    def create_wrapped_step(self, step_class: Type[Step] = NewStep) -> Tuple[Step, Callable[[bool], str]]:
         step_path = StepPath(None, StepType.NORMAL, 'normal_step')
         step_information = StepInformation(step_path, StepStatus.NOT_STARTED)
         steps_information = StepsInformation()
         steps_information.steps[step_path] = step_information
         workflow_context = WorkflowContext(steps_information=steps_information)
-        new_instance = NewStep()
+        new_instance = step_class()
         new_instance.workflow_context = workflow_context
         new_instance.path = workflow_context.steps_information.first_step.path
         new_instance.logger = NoopLogger('test')
@@ -279,6 +350,54 @@ class TestSteps:
         steps.register('new-step')(NewStep)
         assert steps.steps_register['new-step'] is not None
 
+    def test_register_entry_point(self):
+        entry_point = MagicMock()
+        entry_point.load.return_value = NewStep
+        with patch.object(workflow, 'get_entry_points', return_value={'entry-point-step': entry_point}):
+            steps = Steps()
+            assert 'entry-point-step' in steps.steps_register
+            assert 'missing-step' not in steps.steps_register
+            entry_point.load.assert_not_called()
+            assert list(steps.steps_register) == []
+            step = steps.steps_register['entry-point-step']
+            assert isinstance(step, NewStep)
+            assert step.name == 'entry-point-step'
+            assert steps.steps_register.get('entry-point-step') is step
+            assert steps.get_instance('entry-point-step') is not step
+            assert steps.steps_register.get('missing-step') is None
+            with pytest.raises(KeyError):
+                steps.steps_register['missing-step']
+        entry_point.load.assert_called_once()
+
+    def test_register_entry_point_self_registered(self):
+        steps = Steps()
+
+        def load():
+            steps.register('entry-point-step')(NewStep)
+            return NewStep
+
+        entry_point = MagicMock()
+        entry_point.load.side_effect = load
+        with patch.object(workflow, 'get_entry_points', return_value={'entry-point-step': entry_point}):
+            step = steps.steps_register['entry-point-step']
+            assert steps.steps_register['entry-point-step'] is step
+
+    def test_get_entry_points(self):
+        entry_points = [
+            metadata.EntryPoint('step', 'package.first:Step', workflow.STEPS_ENTRY_POINT_GROUP),
+            metadata.EntryPoint('step', 'package.second:Step', workflow.STEPS_ENTRY_POINT_GROUP),
+            metadata.EntryPoint('other-step', 'package.first:OtherStep', workflow.STEPS_ENTRY_POINT_GROUP),
+        ]
+        all_entry_points = MagicMock()
+        all_entry_points.select.return_value = entry_points
+        with patch.object(metadata, 'entry_points', return_value=all_entry_points):
+            result = get_entry_points(workflow.STEPS_ENTRY_POINT_GROUP)
+        all_entry_points.select.assert_called_once_with(group=workflow.STEPS_ENTRY_POINT_GROUP)
+        assert {name: entry_point.value for name, entry_point in result.items()} == {
+            'step': 'package.first:Step', 'other-step': 'package.first:OtherStep'}
+        with patch.object(metadata, 'entry_points', return_value={workflow.STEPS_ENTRY_POINT_GROUP: entry_points}):
+            assert list(get_entry_points(workflow.STEPS_ENTRY_POINT_GROUP)) == ['step', 'other-step']
+
     def test_wrap_step(self):
         new_instance, step = self.create_wrapped_step()
         step(False)
@@ -295,3 +414,27 @@ class TestSteps:
             assert new_instance.information.status == StepStatus.FAILED
             assert new_instance.information.error == exception
             assert new_instance.information.return_value is None
+
+    def test_wrap_step_async(self):
+        new_instance, step = self.create_wrapped_step(NewAsyncStep)
+        assert inspect.iscoroutinefunction(step)
+        asyncio.run(step(False))
+        assert new_instance.information.return_value == 'value'
+        assert new_instance.information.status == StepStatus.SUCCESS
+
+    def test_wrap_step_async_error(self):
+        new_instance, step = self.create_wrapped_step(NewAsyncStep)
+        with pytest.raises(Exception) as exception:
+            asyncio.run(step(True))
+        assert new_instance.information.status == StepStatus.FAILED
+        assert new_instance.information.error == exception.value
+
+    def test_get_instance(self):
+        steps = Steps()
+        steps.register('new-step')(NewStep)
+        first_instance = steps.get_instance('new-step')
+        second_instance = steps.get_instance('new-step')
+        assert first_instance is not second_instance
+        assert first_instance is not steps.steps_register['new-step']
+        assert first_instance.name == 'new-step'
+        assert first_instance.perform.__wrapped__.__self__ is first_instance
@@ -0,0 +1,76 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from workflows_manager.utils import cache
+from workflows_manager.utils.cache import FileCache, atomic_write, get_content_key, get_default_cache_directory
+
+
+class TestCache:
+    def test_get_default_cache_directory_environment(self):
+        with patch.dict('os.environ', {cache.CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: '/tmp/cache'}):
+            assert get_default_cache_directory() == Path('/tmp/cache')
+
+    def test_get_default_cache_directory_xdg(self):
+        with patch.dict('os.environ', {cache.CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: '', 'XDG_CACHE_HOME': '/tmp/xdg'}):
+            assert get_default_cache_directory() == Path('/tmp/xdg/workflows-manager')
+
+    def test_get_content_key(self):
+        assert get_content_key(b'content') == get_content_key(b'content')
+        assert get_content_key(b'content') != get_content_key(b'changed')
+
+    def test_get_content_key_version(self):
+        key = get_content_key(b'content')
+        with patch.object(cache, '__version__', '0.0.0'):
+            assert get_content_key(b'content') != key
+
+    def test_atomic_write(self, tmp_path: Path):
+        file_path = tmp_path.joinpath('directory', 'file.txt')
+        with atomic_write(file_path, 'w', 'utf-8') as file:
+            file.write('first')
+        with atomic_write(file_path, 'w', 'utf-8') as file:
+            file.write('second')
+            assert file_path.read_text(encoding='utf-8') == 'first'
+        assert file_path.read_text(encoding='utf-8') == 'second'
+        assert list(file_path.parent.iterdir()) == [file_path]
+
+    def test_atomic_write_error(self, tmp_path: Path):
+        file_path = tmp_path.joinpath('file.bin')
+        file_path.write_bytes(b'original')
+        with pytest.raises(ValueError):
+            with atomic_write(file_path) as file:
+                file.write(b'partial')
+                raise ValueError('error')
+        assert list(tmp_path.iterdir()) == [file_path]
+        assert file_path.read_bytes() == b'original'
+
+
+class TestFileCache:
+    def test_store_and_load(self, tmp_path: Path):
+        file_cache = FileCache('namespace', tmp_path)
+        file_cache.store('source.yaml', 'key', {'value': 1})
+        assert file_cache.load('source.yaml', 'key') == {'value': 1}
+        assert [cache_file.suffix for cache_file in file_cache.directory.iterdir()] == [cache.CACHE_FILE_SUFFIX]
+
+    def test_load_different_key(self, tmp_path: Path):
+        file_cache = FileCache('namespace', tmp_path)
+        file_cache.store('source.yaml', 'key', {'value': 1})
+        assert file_cache.load('source.yaml', 'other-key') is None
+
+    def test_load_missing(self, tmp_path: Path):
+        file_cache = FileCache('namespace', tmp_path)
+        assert file_cache.load('source.yaml', 'key') is None
+
+    def test_load_corrupted(self, tmp_path: Path):
+        file_cache = FileCache('namespace', tmp_path)
+        file_cache.store('source.yaml', 'key', {'value': 1})
+        for cache_file in file_cache.directory.iterdir():
+            cache_file.write_bytes(b'corrupted')
+        assert file_cache.load('source.yaml', 'key') is None
+
+    def test_store_error(self, tmp_path: Path):
+        file_cache = FileCache('namespace', tmp_path)
+        file_cache.store('source.yaml', 'key', lambda: None)
+        assert file_cache.load('source.yaml', 'key') is None
+        assert list(file_cache.directory.iterdir()) == []
@@ -0,0 +1,35 @@
+import asyncio
+import threading
+
+import pytest
+
+from workflows_manager.utils.event_loop import EventLoopThread, THREAD_NAME
+
+
+class TestEventLoopThread:
+    def test_run(self):
+        async def coroutine():
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+        event_loop = EventLoopThread()
+        try:
+            assert event_loop.run(coroutine()) == THREAD_NAME
+            assert event_loop.run(coroutine()) == THREAD_NAME
+        finally:
+            event_loop.shutdown()
+
+    def test_run_error(self):
+        async def coroutine():
+            raise ValueError('error')
+
+        event_loop = EventLoopThread()
+        try:
+            with pytest.raises(ValueError):
+                event_loop.run(coroutine())
+        finally:
+            event_loop.shutdown()
+
+    def test_shutdown_not_started(self):
+        event_loop = EventLoopThread()
+        event_loop.shutdown()
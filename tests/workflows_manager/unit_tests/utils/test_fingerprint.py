@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from workflows_manager.utils.fingerprint import FingerprintDatabase, expand_patterns, get_file_fingerprint, \
+    is_file_unchanged
+
+
+class TestFingerprintFunctions:
+    def test_expand_patterns(self, tmp_path: Path):
+        tmp_path.joinpath('src', 'package').mkdir(parents=True)
+        for name in ('src/first.py', 'src/package/second.py', 'src/readme.md'):
+            tmp_path.joinpath(name).write_text(name)
+        assert expand_patterns([str(tmp_path.joinpath('src', '**', '*.py')), str(tmp_path.joinpath('src', '*.py'))]) \
+               == [str(tmp_path.joinpath('src', 'first.py')), str(tmp_path.joinpath('src', 'package', 'second.py'))]
+        assert expand_patterns([str(tmp_path.joinpath('src', '*.txt'))]) is None
+
+    @pytest.mark.parametrize('content, modification_time_offset, expected', [
+        ('content', 0, True),
+        ('content', 10 ** 9, True),
+        ('changed', 10 ** 9, False),
+        ('longer content', 0, False),
+    ], ids=[
+        'unchanged file',
+        'touched file',
+        'changed content',
+        'changed size',
+    ])
+    def test_is_file_unchanged(self, tmp_path: Path, content: str, modification_time_offset: int, expected: bool):
+        path = tmp_path.joinpath('file.txt')
+        path.write_text('content')
+        fingerprint = get_file_fingerprint(path)
+        path.write_text(content)
+        os.utime(path, ns=(fingerprint[0] + modification_time_offset,) * 2)
+        assert is_file_unchanged(path, fingerprint) is expected
+
+    def test_is_file_unchanged_missing(self, tmp_path: Path):
+        assert is_file_unchanged(tmp_path.joinpath('missing.txt'), [0, 0, '']) is False
+
+
+class TestFingerprintDatabase:
+    def test_get_key(self):
+        key = FingerprintDatabase.get_key('step', {'key': 1}, ['*.py'], ['build'])
+        assert key == FingerprintDatabase.get_key('step', {'key': 1}, ['*.py'], ['build'])
+        assert key != FingerprintDatabase.get_key('step', {'key': 2}, ['*.py'], ['build'])
+
+    def test_is_up_to_date(self, tmp_path: Path):
+        database = FingerprintDatabase(tmp_path.joinpath('cache'))
+        inputs, outputs = [str(tmp_path.joinpath('*.in'))], [str(tmp_path.joinpath('*.out'))]
+        tmp_path.joinpath('first.in').write_text('input')
+        tmp_path.joinpath('first.out').write_text('output')
+        assert not database.is_up_to_date('key', inputs, outputs)
+        database.record('key', inputs, outputs)
+        assert database.is_up_to_date('key', inputs, outputs)
+        tmp_path.joinpath('second.in').write_text('input')
+        assert not database.is_up_to_date('key', inputs, outputs)
+        database.record('key', inputs, outputs)
+        tmp_path.joinpath('first.out').write_text('changed')
+        assert not database.is_up_to_date('key', inputs, outputs)
+
+    def test_record_missing_outputs(self, tmp_path: Path):
+        database = FingerprintDatabase(tmp_path.joinpath('cache'))
+        tmp_path.joinpath('first.in').write_text('input')
+        database.record('key', [str(tmp_path.joinpath('*.in'))], [str(tmp_path.joinpath('*.out'))])
+        assert not tmp_path.joinpath('cache', 'fingerprints', 'key.json').exists()
@@ -0,0 +1,115 @@
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from workflows_manager.utils.module_loader import ModuleLoader, DEFAULT_EXCLUDE_PATTERNS, add_import_path, \
+    collect_module_files, get_combined_patterns, get_module_name, matches_patterns
+
+
+class TestModuleLoaderFunctions:
+    @pytest.mark.parametrize('relative_path, patterns, expected', [
+        ('steps/module.py', ['steps/*'], True),
+        ('steps/module.py', ['module.py'], True),
+        ('steps/module.py', ['test_*.py'], False),
+        ('package/node_modules', DEFAULT_EXCLUDE_PATTERNS, True),
+        ('package.egg-info', DEFAULT_EXCLUDE_PATTERNS, True),
+        ('steps', [], False),
+    ], ids=[
+        'relative path',
+        'name',
+        'no match',
+        'nested default exclude',
+        'default exclude glob',
+        'no patterns',
+    ])
+    def test_matches_patterns(self, relative_path: str, patterns: list, expected: bool):
+        assert matches_patterns(relative_path, patterns) == expected
+
+    def test_get_module_name(self):
+        assert get_module_name('steps/module.py') == 'steps.module'
+        assert get_module_name('module.py') == 'module'
+
+    def test_collect_module_files(self, tmp_path: Path):
+        for relative_path in ['main.py', 'steps/step.py', 'steps/readme.md', 'tests/test_step.py',
+                              '.venv/lib/module.py', 'build/lib/module.py']:
+            tmp_path.joinpath(relative_path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.joinpath(relative_path).write_text('')
+        assert sorted(collect_module_files(tmp_path)) == ['.venv/lib/module.py', 'build/lib/module.py', 'main.py',
+                                                          'steps/step.py', 'tests/test_step.py']
+        assert sorted(collect_module_files(tmp_path, exclude_patterns=DEFAULT_EXCLUDE_PATTERNS + ['tests'])) == [
+            'main.py', 'steps/step.py']
+        assert collect_module_files(tmp_path, ['steps/*'], DEFAULT_EXCLUDE_PATTERNS) == ['steps/step.py']
+
+    def test_collect_module_files_excluded_directory(self, tmp_path: Path):
+        tmp_path.joinpath('node_modules', 'package').mkdir(parents=True)
+        tmp_path.joinpath('node_modules', 'package', 'module.py').write_text('')
+        assert collect_module_files(tmp_path, exclude_patterns=['node_modules']) == []
+
+    def test_get_combined_patterns(self):
+        with patch.dict(os.environ, {'PATTERNS': os.path.pathsep.join(['steps/*', 'tests'])}):
+            assert get_combined_patterns('PATTERNS', ['tests', 'docs']) == ['steps/*', 'tests', 'docs']
+
+    def test_add_import_path(self, tmp_path: Path):
+        logger = logging.getLogger('module_loader_logger')
+        tmp_path.joinpath('module.py').write_text('')
+        assert not add_import_path(tmp_path.joinpath('missing'), logger)
+        assert not add_import_path(tmp_path.joinpath('module.py'), logger)
+        try:
+            assert add_import_path(tmp_path, logger)
+            assert str(tmp_path) in sys.path
+        finally:
+            sys.path.remove(str(tmp_path))
+
+
+class TestModuleLoader:
+    def test_import_modules(self):
+        module_loader = ModuleLoader()
+        with patch('importlib.import_module') as mock_import_module:
+            module_loader.import_modules(['first', 'second.module'])
+        assert [call.args[0] for call in mock_import_module.call_args_list] == ['first', 'second.module']
+        assert sorted(module_loader.timings) == ['first', 'second.module']
+
+    def test_import_modules_concurrently(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+        order = []
+
+        def import_module(module: str):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+                order.append(module)
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        module_loader = ModuleLoader(max_workers=2)
+        with patch('importlib.import_module', side_effect=import_module):
+            module_loader.import_modules(['first.a', 'second', 'first.b'])
+        assert peak[0] == 2
+        assert order.index('first.a') < order.index('first.b')
+
+    def test_import_modules_concurrently_error(self):
+        error = ImportError('error')
+        module_loader = ModuleLoader(max_workers=2)
+        with patch('importlib.import_module', side_effect=[error, None]), pytest.raises(ImportError):
+            module_loader.import_modules(['first', 'second'])
+
+    def test_import_modules_error(self):
+        module_loader = ModuleLoader()
+        with pytest.raises(ModuleNotFoundError):
+            module_loader.import_modules(['workflows_manager_missing_module'])
+        assert 'workflows_manager_missing_module' not in sys.modules
+
+    def test_report(self):
+        module_loader = ModuleLoader()
+        module_loader.timings = {'fast': 0.001, 'slow': 1.5, 'medium': 0.25}
+        assert module_loader.report() == ['1.500s slow', '0.250s medium', '0.001s fast']
+        assert module_loader.report(1) == ['1.500s slow']
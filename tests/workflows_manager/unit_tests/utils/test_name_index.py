@@ -0,0 +1,99 @@
+import copy
+import pickle
+from dataclasses import dataclass
+
+import pytest
+
+from workflows_manager.utils.name_index import NameIndex, VersionedList
+
+
+@dataclass
+class Element:
+    name: str
+
+
+class TestVersionedList:
+    @pytest.mark.parametrize('modify', [
+        lambda elements: elements.append(Element('new')),
+        lambda elements: elements.extend([Element('new')]),
+        lambda elements: elements.insert(0, Element('new')),
+        lambda elements: elements.pop(),
+        lambda elements: elements.remove(elements[0]),
+        lambda elements: elements.clear(),
+        lambda elements: elements.sort(key=lambda element: element.name),
+        lambda elements: elements.reverse(),
+        lambda elements: elements.__setitem__(0, Element('new')),
+        lambda elements: elements.__delitem__(0),
+        lambda elements: elements.__iadd__([Element('new')]),
+        lambda elements: elements.__imul__(2),
+    ], ids=['append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse', 'setitem', 'delitem', 'iadd',
+            'imul'])
+    def test_modification(self, modify):
+        elements = VersionedList([Element('first'), Element('second')])
+        assert elements.version == 0
+        modify(elements)
+        assert elements.version == 1
+
+    def test_copy(self):
+        elements = VersionedList([Element('first')])
+        elements.append(Element('second'))
+        for copied_elements in (pickle.loads(pickle.dumps(elements)), copy.deepcopy(elements)):
+            assert isinstance(copied_elements, VersionedList)
+            assert copied_elements == elements
+            assert copied_elements.version == elements.version
+
+
+class TestNameIndex:
+    def test_get(self):
+        elements = VersionedList([Element('first'), Element('second'), Element('first')])
+        index = NameIndex()
+        assert index.get(elements, 'first') is elements[0]
+        assert index.get(elements, 'second') is elements[1]
+        assert index.get(elements, 'missing') is None
+
+    def test_get_without_rebuild(self):
+        elements = VersionedList([Element('first')])
+        index = NameIndex()
+        index.get(elements, 'first')
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(index, 'rebuild', lambda _: pytest.fail('The index has been rebuilt.'))
+            assert index.get(elements, 'missing') is None
+            index.append(elements, Element('second'))
+            assert index.get(elements, 'second') is elements[1]
+
+    def test_get_modified_elements(self):
+        elements = VersionedList([Element('first'), Element('second')])
+        index = NameIndex()
+        assert index.get(elements, 'second') is elements[1]
+        del elements[0]
+        assert index.get(elements, 'first') is None
+        assert index.get(elements, 'second') is elements[0]
+        elements[0] = Element('replaced')
+        assert index.get(elements, 'replaced') is elements[0]
+        other_elements = VersionedList([Element('other')])
+        assert index.get(other_elements, 'other') is other_elements[0]
+        assert index.get(other_elements, 'replaced') is None
+
+    def test_get_renamed_element(self):
+        elements = VersionedList([Element('first')])
+        index = NameIndex()
+        assert index.get(elements, 'first') is elements[0]
+        elements[0].name = 'renamed'
+        assert index.get(elements, 'first') is None
+        assert index.get(elements, 'renamed') is elements[0]
+
+    def test_append(self):
+        elements = VersionedList([Element('first')])
+        index = NameIndex()
+        index.append(elements, Element('second'))
+        index.append(elements, Element('first'))
+        assert index.get(elements, 'second') is elements[1]
+        assert index.get(elements, 'first') is elements[0]
+
+    def test_pickle(self):
+        elements = VersionedList([Element('first')])
+        index = NameIndex()
+        index.get(elements, 'first')
+        restored_index = pickle.loads(pickle.dumps(index))
+        with restored_index.lock:
+            assert restored_index.get(elements, 'first') is elements[0]
@@ -0,0 +1,253 @@
+import asyncio
+import contextvars
+import gzip
+import io
+import logging
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from workflows_manager.utils.output_capture import CaptureBuffer, FileDescriptorCapture, OutputCapture, OutputRouter, \
+    StreamBuffer
+
+
+class TestOutputRouter:
+    def test_write_original_stream(self):
+        stream = io.StringIO()
+        router = OutputRouter('stdout', stream)
+        router.write('text')
+        assert stream.getvalue() == 'text'
+        assert router.getvalue() == 'text'
+
+
+class TestCaptureBuffer:
+    @pytest.mark.parametrize('head, tail, expected', [
+        (None, None, '0123456789'),
+        (3, 2, '012\n... [5 characters omitted] ...\n89'),
+        (3, None, '012\n... [7 characters omitted] ...\n'),
+        (None, 4, '\n... [6 characters omitted] ...\n6789'),
+        (6, 4, '0123456789'),
+    ], ids=[
+        'whole output',
+        'head and tail',
+        'head only',
+        'tail only',
+        'output within limits',
+    ])
+    def test_getvalue(self, head: Optional[int], tail: Optional[int], expected: str):
+        buffer = CaptureBuffer()
+        buffer.write('01234')
+        buffer.write('56789')
+        assert buffer.size == 10
+        assert buffer.getvalue(head, tail) == expected
+        buffer.close()
+
+    def test_spill_to_disk(self, tmp_path: Path):
+        buffer = CaptureBuffer(max_memory_size=16)
+        lines = [f'line {index}\n' for index in range(1000)]
+        for line in lines:
+            buffer.write(line)
+        assert buffer.getvalue(7, 9) == f'line 0\n\n... [{buffer.size - 16} characters omitted] ...\nline 999\n'
+        buffer.archive(tmp_path.joinpath('output', 'stdout.gz'))
+        with gzip.open(tmp_path.joinpath('output', 'stdout.gz'), 'rt', encoding='utf-8') as file:
+            assert file.read() == ''.join(lines)
+        buffer.close()
+
+
+class TestStreamBuffer:
+    @pytest.mark.parametrize('ring_size, expected', [
+        (None, '\n... [23 characters omitted] ...\n'),
+        (8, '\n... [15 characters omitted] ...\nird\nlast'),
+        (100, 'first\nsecond\nthird\nlast'),
+    ], ids=[
+        'no ring buffer',
+        'ring buffer',
+        'output within ring buffer',
+    ])
+    def test_write(self, caplog, ring_size: Optional[int], expected: str):
+        buffer = StreamBuffer(logging.getLogger('stream_logger'), logging.WARNING, ring_size)
+        with caplog.at_level(logging.INFO, 'stream_logger'):
+            buffer.write('first\nsec')
+            assert caplog.messages == ['first']
+            buffer.write('ond\nthird\n')
+            buffer.write('last')
+            buffer.flush()
+            assert caplog.messages == ['first', 'second', 'third']
+            assert buffer.getvalue() == expected
+            buffer.close()
+        assert caplog.messages == ['first', 'second', 'third', 'last']
+        assert {record.levelno for record in caplog.records} == {logging.WARNING}
+
+    @pytest.mark.parametrize('ring_size, head, tail, expected', [
+        (8, 3, 4, 'fir\n... [16 characters omitted] ...\nlast'),
+        (8, 3, None, 'fir\n... [20 characters omitted] ...\n'),
+        (8, None, 4, '\n... [19 characters omitted] ...\nlast'),
+        (8, 20, 20, 'first\nse\n... [7 characters omitted] ...\nird\nlast'),
+        (16, 12, 12, 'first\nsecond\nthird\nlast'),
+        (100, 3, 4, 'fir\n... [16 characters omitted] ...\nlast'),
+        (100, 20, 20, 'first\nsecond\nthird\nlast'),
+    ], ids=[
+        'head and tail',
+        'head only',
+        'tail only',
+        'limits above ring buffer',
+        'overlapping head and tail',
+        'output within ring buffer',
+        'output within limits',
+    ])
+    def test_getvalue(self, ring_size: int, head: Optional[int], tail: Optional[int], expected: str):
+        buffer = StreamBuffer(logging.getLogger('stream_logger'), ring_size=ring_size)
+        buffer.write('first\nsec')
+        buffer.write('ond\nthird\n')
+        buffer.write('last')
+        assert buffer.getvalue(head, tail) == expected
+        buffer.close()
+
+    def test_write_from_handler(self):
+        buffer = StreamBuffer(logging.getLogger('stream_handler_logger'), ring_size=100)
+
+        class Handler(logging.Handler):
+            def emit(self, record: logging.LogRecord):
+                buffer.write(f'log: {record.getMessage()}\n')
+
+        handler = Handler()
+        buffer.logger.addHandler(handler)
+        buffer.logger.setLevel(logging.INFO)
+        try:
+            buffer.write('line\n')
+        finally:
+            buffer.logger.removeHandler(handler)
+        assert buffer.getvalue() == 'line\nlog: line\n'
+
+
+class TestOutputCapture:
+    def test_stream(self, caplog):
+        output_capture = OutputCapture(True, True, logger=logging.getLogger('stream_logger'), ring_size=4)
+        with caplog.at_level(logging.INFO, 'stream_logger'), output_capture:
+            print('stdout line')
+            print('stderr line', file=sys.stderr)
+        assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+            (logging.INFO, 'stdout line'), (logging.WARNING, 'stderr line')]
+        assert output_capture.stdout.getvalue() == '\n... [8 characters omitted] ...\nine\n'
+        output_capture.close()
+
+    def test_from_output(self):
+        output_capture = OutputCapture.from_output('stdout', None)
+        assert output_capture.stdout.getvalue() == 'stdout'
+        assert output_capture.stderr is None
+        output_capture.close()
+
+    def test_capture(self):
+        original_stdout = io.StringIO()
+        original_stderr = io.StringIO()
+        with patch.object(sys, 'stdout', original_stdout), patch.object(sys, 'stderr', original_stderr):
+            with OutputCapture(True, False) as output_capture:
+                assert isinstance(sys.stdout, OutputRouter)
+                print('captured')
+                print('not captured', file=sys.stderr)
+            print('after capture')
+            assert sys.stdout is original_stdout
+            assert sys.stderr is original_stderr
+        assert output_capture.stdout.getvalue() == 'captured\n'
+        assert output_capture.stderr is None
+        assert original_stdout.getvalue() == 'after capture\n'
+        assert original_stderr.getvalue() == 'not captured\n'
+
+    def test_capture_disabled(self):
+        original_stdout = sys.stdout
+        with OutputCapture(False, False):
+            assert sys.stdout is original_stdout
+
+    def test_capture_threads(self):
+        barrier = threading.Barrier(4, timeout=5)
+        captures = [OutputCapture(True, True) for _ in range(4)]
+
+        def run(index: int):
+            with captures[index]:
+                for line in range(3):
+                    print(f'{index}-{line}')
+                    print(f'error-{index}', file=sys.stderr)
+                    barrier.wait()
+
+        original_stdout = sys.stdout
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for index, output_capture in enumerate(captures):
+            assert output_capture.stdout.getvalue() == f'{index}-0\n{index}-1\n{index}-2\n'
+            assert output_capture.stderr.getvalue() == f'error-{index}\n' * 3
+        assert sys.stdout is original_stdout
+
+    def test_capture_uncaptured_thread(self):
+        original_stdout = io.StringIO()
+        started = threading.Event()
+        printed = threading.Event()
+
+        def run_uncaptured():
+            started.wait(5)
+            print('uncaptured')
+            printed.set()
+
+        with patch.object(sys, 'stdout', original_stdout):
+            thread = threading.Thread(target=run_uncaptured)
+            thread.start()
+            with OutputCapture(True, False) as output_capture:
+                started.set()
+                printed.wait(5)
+                print('captured')
+            thread.join()
+        assert output_capture.stdout.getvalue() == 'captured\n'
+        assert original_stdout.getvalue() == 'uncaptured\n'
+
+    def test_capture_child_thread(self):
+        original_stdout = io.StringIO()
+        with patch.object(sys, 'stdout', original_stdout):
+            with OutputCapture(True, False) as output_capture:
+                threads = [threading.Thread(target=contextvars.copy_context().run, args=(print, 'in-context')),
+                           threading.Thread(target=print, args=('out-of-context',))]
+                for thread in threads:
+                    thread.start()
+                    thread.join()
+        assert output_capture.stdout.getvalue() == 'in-context\n'
+        assert original_stdout.getvalue() == 'out-of-context\n'
+
+    def test_capture_tasks(self):
+        async def perform(index: int):
+            for line in range(3):
+                print(f'{index}-{line}')
+                await asyncio.sleep(0)
+            return index
+
+        async def gather(captures):
+            return await asyncio.gather(*[output_capture.run(perform(index))
+                                          for index, output_capture in enumerate(captures)])
+
+        captures = [OutputCapture(True, False) for _ in range(3)]
+        assert asyncio.run(gather(captures)) == [0, 1, 2]
+        for index, output_capture in enumerate(captures):
+            assert output_capture.stdout.getvalue() == f'{index}-0\n{index}-1\n{index}-2\n'
+
+
+class TestFileDescriptorCapture:
+    def test_capture(self):
+        with FileDescriptorCapture(True, False) as output_capture:
+            os.write(1, b'descriptor\n')
+            subprocess.run([sys.executable, '-c', 'print("subprocess")'], check=True)
+        os.write(1, b'not captured\n')
+        assert output_capture.stdout.getvalue() == 'descriptor\nsubprocess\n'
+        assert output_capture.stderr is None
+        output_capture.close()
+
+    def test_capture_invalid_bytes(self):
+        with FileDescriptorCapture(False, True) as output_capture:
+            os.write(2, b'invalid \xff\n')
+        assert output_capture.stderr.getvalue() == 'invalid \ufffd\n'
+        output_capture.close()
@@ -0,0 +1,114 @@
+import json
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+
+from workflows_manager import configuration
+from workflows_manager.actions.plan import ExecutionPlan
+from workflows_manager.utils.status_journal import StatusJournal, get_journal_path, read_journal, write_status_file
+from workflows_manager.workflow import StepStatus, WorkflowContext
+
+
+def create_plan() -> ExecutionPlan:
+    return ExecutionPlan(configuration.Configuration.from_dict({'workflows': {'workflow': {'steps': [
+        {'name': 'first', 'step': 'step'},
+        {'name': 'parallel', 'parallels': [{'name': 'child-1', 'step': 'step'}, {'name': 'child-2', 'step': 'step'}]},
+    ]}}}), 'workflow')
+
+
+class TestStatusJournalFunctions:
+    def test_get_journal_path(self):
+        assert get_journal_path(Path('statuses', 'status.json')) == Path('statuses', 'status-journal.ndjson')
+
+    def test_write_status_file(self, tmp_path: Path):
+        status_file = tmp_path.joinpath('status.json')
+        status_file.write_text('previous')
+        write_status_file(status_file, {'steps': []})
+        assert json.loads(status_file.read_text()) == {'steps': []}
+        assert [path.name for path in tmp_path.iterdir()] == ['status.json']
+
+    def test_read_journal_error(self, tmp_path: Path):
+        journal_file = tmp_path.joinpath('status-journal.ndjson')
+        journal_file.write_text('{"event": "step_started", "step": 0}\n')
+        with pytest.raises(ValueError):
+            read_journal(journal_file)
+
+
+class TestStatusJournal:
+    def test_record(self, tmp_path: Path):
+        statuses, steps = create_plan().create_steps_information()
+        journal = StatusJournal(tmp_path.joinpath('status-journal.ndjson'))
+        journal.open('workflow', statuses)
+        first, parallel = steps
+        first.status = StepStatus.RUNNING
+        journal.record(first)
+        first.status = StepStatus.SUCCESS
+        first.return_value = 1
+        journal.record(first)
+        parallel.children[1].status = StepStatus.FAILED
+        parallel.children[1].error = Exception('error')
+        journal.record(parallel.children[1])
+        journal.close(False, {'key': 'value'})
+        events = [json.loads(line) for line in journal.path.read_text().splitlines()]
+        assert [(event['event'], event.get('step')) for event in events] == [
+            ('workflow_started', None), ('step_started', 0), ('step_finished', 0), ('step_failed', 3),
+            ('workflow_finished', None)]
+        assert journal.status == {**statuses.to_dict(), 'context': {'key': 'value'}}
+        assert read_journal(journal.path) == journal.status
+
+    def test_record_context(self, tmp_path: Path, caplog):
+        statuses, steps = create_plan().create_steps_information()
+        journal = StatusJournal(tmp_path.joinpath('status-journal.ndjson'), logging.getLogger('journal_logger'))
+        workflow_context = WorkflowContext({'initial': 1}, statuses)
+        journal.open('workflow', statuses, workflow_context.parameters)
+        first, parallel = steps
+        first.status = StepStatus.RUNNING
+        workflow_context.set('ignored', 'running')
+        journal.record(first, workflow_context)
+        workflow_context.remove('ignored')
+        first.status = StepStatus.SUCCESS
+        with caplog.at_level(logging.WARNING, 'journal_logger'):
+            workflow_context.set('token', 'secret')
+            workflow_context.set('lock', threading.Lock())
+            journal.record(first, workflow_context)
+            workflow_context.remove('initial')
+            workflow_context.set('lock', threading.Lock())
+            workflow_context.set('items', [1])
+            parallel.children[0].status = StepStatus.SUCCESS
+            journal.record(parallel.children[0], workflow_context)
+        assert [record.getMessage().split(',')[0] for record in caplog.records] == [
+            "Workflow context value 'lock' is not written to the status"]
+        events = [json.loads(line) for line in journal.path.read_text().splitlines()]
+        assert [(event.get('context_updates'), event.get('context_removals')) for event in events] == [
+            ({'initial': 1}, None), (None, None), ({'token': 'secret'}, None), ({'items': [1]}, ['initial'])]
+        assert read_journal(journal.path)['context'] == {'token': 'secret', 'items': [1]}
+        workflow_context.get('items').append(2)
+        journal.close(True, workflow_context.parameters)
+        assert journal.status['context'] == {'token': 'secret', 'items': [1, 2]}
+        assert read_journal(journal.path) == journal.status
+
+    def test_record_context_unchanged(self, tmp_path: Path):
+        statuses, steps = create_plan().create_steps_information()
+        journal = StatusJournal(tmp_path.joinpath('status-journal.ndjson'))
+        workflow_context = WorkflowContext({'token': 'secret'}, statuses)
+        journal.open('workflow', statuses, workflow_context.parameters)
+        workflow_context.set('token', 'secret')
+        steps[0].status = StepStatus.SUCCESS
+        journal.record(steps[0], workflow_context)
+        journal.close(True, workflow_context.parameters)
+        events = [json.loads(line) for line in journal.path.read_text().splitlines()]
+        assert [event.get('context_updates') for event in events] == [{'token': 'secret'}, None, None]
+
+    def test_read_journal_interrupted(self, tmp_path: Path):
+        statuses, steps = create_plan().create_steps_information()
+        journal = StatusJournal(tmp_path.joinpath('status-journal.ndjson'))
+        journal.open('workflow', statuses)
+        steps[0].status = StepStatus.SUCCESS
+        journal.record(steps[0])
+        with journal.path.open('a') as file:
+            file.write('{"event": "step_fin')
+        status = read_journal(journal.path)
+        assert [step['status'] for step in status['steps']] == ['success', 'not_started']
+        journal.close(True, {})
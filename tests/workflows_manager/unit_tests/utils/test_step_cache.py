@@ -0,0 +1,110 @@
+import os
+import time
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from workflows_manager.utils import step_cache as step_cache_module
+from workflows_manager.utils.step_cache import RecordingWorkflowContext, StepCache, StepCacheEntry, \
+    get_code_fingerprint
+from workflows_manager.workflow import WorkflowContext
+
+
+class TestStepCacheFunctions:
+    def test_get_code_fingerprint(self):
+        class FirstStep:
+            pass
+
+        class SecondStep:
+            value = 1
+
+        assert get_code_fingerprint(FirstStep) == get_code_fingerprint(FirstStep)
+        assert get_code_fingerprint(FirstStep) != get_code_fingerprint(SecondStep)
+
+
+class TestRecordingWorkflowContext:
+    def test_set(self):
+        workflow_context = WorkflowContext({'existing': 1})
+        recording_context = RecordingWorkflowContext(workflow_context)
+        recording_context.set('key', 'value')
+        assert recording_context.get('existing') == 1
+        assert recording_context.context_updates == {'key': 'value'}
+        assert workflow_context.parameters == {'existing': 1, 'key': 'value'}
+        assert recording_context.steps_information is workflow_context.steps_information
+
+    def test_remove(self):
+        workflow_context = WorkflowContext({'existing': 1})
+        recording_context = RecordingWorkflowContext(workflow_context)
+        recording_context.set('key', 'value')
+        recording_context.remove('key')
+        recording_context.remove('existing')
+        assert recording_context.context_updates == {}
+        assert recording_context.context_removals == ['key', 'existing']
+        assert workflow_context.parameters == {}
+
+
+class TestStepCache:
+    def test_get_key(self):
+        key = StepCache.get_key('step', {'first': 1, 'second': [1, 2]}, 'fingerprint')
+        assert key == StepCache.get_key('step', {'second': [1, 2], 'first': 1}, 'fingerprint')
+        assert key != StepCache.get_key('step', {'first': 2, 'second': [1, 2]}, 'fingerprint')
+        assert key != StepCache.get_key('step', {'first': 1, 'second': [1, 2]}, 'other')
+
+    def test_get_key_format_version(self):
+        key = StepCache.get_key('step', {'first': 1}, 'fingerprint')
+        with patch.object(step_cache_module, 'STEP_CACHE_FORMAT_VERSION', 1):
+            assert StepCache.get_key('step', {'first': 1}, 'fingerprint') != key
+
+    @pytest.mark.parametrize('ttl, age, expected_hit', [
+        (None, 3600, True),
+        (60, 10, True),
+        (60, 120, False),
+    ], ids=[
+        'no ttl',
+        'valid entry',
+        'expired entry',
+    ])
+    def test_load(self, tmp_path: Path, ttl: Optional[float], age: float, expected_hit: bool):
+        step_cache = StepCache(tmp_path)
+        step_cache.store('key', StepCacheEntry('value', 'stdout', None, {'key': 1}, time.time() - age))
+        entry = step_cache.load('key', ttl)
+        if expected_hit:
+            assert entry.return_value == 'value'
+            assert entry.context_updates == {'key': 1}
+        else:
+            assert entry is None
+            assert not tmp_path.joinpath('steps', 'key.pickle').exists()
+
+    def test_load_missing(self, tmp_path: Path):
+        assert StepCache(tmp_path).load('missing') is None
+
+    def test_store_evict(self, tmp_path: Path):
+        step_cache = StepCache(tmp_path)
+        step_cache.store('first', StepCacheEntry('x' * 100))
+        entry_size = tmp_path.joinpath('steps', 'first.pickle').stat().st_size
+        step_cache.max_size = entry_size * 2
+        step_cache.store('second', StepCacheEntry('y' * 100))
+        for index, name in enumerate(('first', 'second')):
+            timestamp = time.time() - 100 + index
+            os.utime(tmp_path.joinpath('steps', f'{name}.pickle'), (timestamp, timestamp))
+        assert step_cache.load('first') is not None
+        step_cache.store('third', StepCacheEntry('z' * 100))
+        assert sorted(path.name for path in tmp_path.joinpath('steps').iterdir()) == ['first.pickle', 'third.pickle']
+
+    def test_store_estimated_size(self, tmp_path: Path):
+        step_cache = StepCache(tmp_path)
+        with patch.object(Path, 'glob', autospec=True, side_effect=Path.glob) as glob:
+            for name in ('first', 'second', 'first'):
+                step_cache.store(name, StepCacheEntry('x' * 100))
+            assert glob.call_count == 1
+            step_cache.max_size = tmp_path.joinpath('steps', 'first.pickle').stat().st_size
+            step_cache.store('third', StepCacheEntry('z' * 100))
+            assert glob.call_count == 2
+        assert [path.name for path in tmp_path.joinpath('steps').iterdir()] == ['third.pickle']
+
+    def test_store_error(self, tmp_path: Path):
+        step_cache = StepCache(tmp_path)
+        step_cache.store('key', StepCacheEntry(lambda: None))
+        assert list(tmp_path.joinpath('steps').iterdir()) == []
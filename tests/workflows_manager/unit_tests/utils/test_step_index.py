@@ -0,0 +1,77 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from workflows_manager.utils import step_index
+from workflows_manager.utils.step_index import StepIndex, IndexEntry, find_registered_steps
+
+
+class TestStepIndexFunctions:
+    @pytest.mark.parametrize('source, expected', [
+        ('VALUE = 1\n', []),
+        ('@steps.register(name="first")\nclass First:\n    pass\n', ['first']),
+        ('@register("first")\nclass First:\n    pass\n\n\nsteps.register(name="second")(Second)\n',
+         ['first', 'second']),
+        ('NAME = "step"\n\n\n@steps.register(name=NAME)\nclass Step:\n    pass\n', None),
+        ('atexit.register(function)\n', None),
+    ], ids=[
+        'no steps',
+        'decorator',
+        'multiple registrations',
+        'dynamic name',
+        'other register method',
+    ])
+    def test_find_registered_steps(self, source: str, expected):
+        assert find_registered_steps(source) == expected
+
+
+class TestStepIndex:
+    @pytest.fixture
+    def package_path(self, tmp_path: Path) -> Path:
+        package_path = tmp_path.joinpath('package')
+        package_path.joinpath('steps').mkdir(parents=True)
+        package_path.joinpath('steps', 'first.py').write_text('@steps.register(name="first")\nclass First:\n    pass\n')
+        package_path.joinpath('steps', 'second.py').write_text('@steps.register(name="second")\nclass S:\n    pass\n')
+        package_path.joinpath('dynamic.py').write_text('steps.register(name=get_name())(Step)\n')
+        package_path.joinpath('invalid.py').write_text('steps.register(name="invalid"\n')
+        package_path.joinpath('readme.txt').write_text('steps.register(name="text")\n')
+        return package_path
+
+    def test_build(self, tmp_path: Path, package_path: Path):
+        index = StepIndex(package_path, tmp_path.joinpath('cache')).build()
+        assert sorted(index.entries) == ['dynamic.py', 'invalid.py', 'steps/first.py', 'steps/second.py']
+        assert index.entries['steps/first.py'].module == 'steps.first'
+        assert index.entries['steps/first.py'].steps == ['first']
+        assert index.entries['dynamic.py'].dynamic
+        assert index.entries['invalid.py'].dynamic
+
+    def test_build_cached(self, tmp_path: Path, package_path: Path):
+        StepIndex(package_path, tmp_path.joinpath('cache')).build()
+        with patch.object(step_index, 'find_registered_steps') as mock_find_registered_steps:
+            index = StepIndex(package_path, tmp_path.joinpath('cache')).build()
+        mock_find_registered_steps.assert_not_called()
+        assert index.entries['steps/second.py'].steps == ['second']
+
+    def test_build_modified(self, tmp_path: Path, package_path: Path):
+        StepIndex(package_path, tmp_path.joinpath('cache')).build()
+        package_path.joinpath('steps', 'second.py').write_text('@steps.register(name="renamed")\nclass S:\n    pass\n')
+        with patch.object(step_index, 'find_registered_steps', wraps=find_registered_steps) as mock_find_steps:
+            index = StepIndex(package_path, tmp_path.joinpath('cache')).build()
+        mock_find_steps.assert_called_once()
+        assert index.entries['steps/second.py'].steps == ['renamed']
+
+    def test_build_exclude_patterns(self, tmp_path: Path, package_path: Path):
+        index = StepIndex(package_path, tmp_path.joinpath('cache'), exclude_patterns=['steps', 'invalid.py']).build()
+        assert sorted(index.entries) == ['dynamic.py']
+
+    def test_find_modules(self, tmp_path: Path, package_path: Path):
+        index = StepIndex(package_path, tmp_path.joinpath('cache')).build()
+        modules, missing_steps = index.find_modules(['second', 'missing'])
+        assert sorted(modules) == ['dynamic', 'invalid', 'steps.second']
+        assert missing_steps == {'missing'}
+
+    def test_find_modules_empty(self):
+        index = StepIndex('/tmp/package')
+        index.entries = {'module.py': IndexEntry('module', 0, 0, ['step'])}
+        assert index.find_modules([]) == ([], set())
@@ -0,0 +1,117 @@
+import inspect
+from enum import Enum
+from pathlib import Path
+from typing import Annotated, Any, Callable, Dict, FrozenSet, List, Literal, NewType, Optional, Sequence, Set, \
+    Tuple, Type, TypeVar, Union
+
+import pytest
+
+from workflows_manager.utils.type_checker import get_type_checker, get_type_coercer
+
+UserId = NewType('UserId', int)
+T = TypeVar('T')
+
+
+class Mode(Enum):
+    FAST = 'fast'
+    SLOW = 'slow'
+
+
+class TestTypeChecker:
+    @pytest.mark.parametrize('annotation, valid_values, invalid_values', [
+        (inspect.Parameter.empty, [1, 'value', None], []),
+        (Any, [1, 'value', None], []),
+        (T, [1, 'value'], []),
+        ('ForwardReference', [1, 'value'], []),
+        (int, [1, True], [1.0, '1', None]),
+        (float, [1.0, 1], [True, '1.0']),
+        (None, [None], [0, '']),
+        (Optional[str], ['value', None], [1]),
+        (Union[int, List[str]], [1, ['value']], [[1], 'value']),
+        (Literal['fast', 1], ['fast', 1], ['slow', True, 1.0]),
+        (List[int], [[], [1, 2]], [[1, '2'], (1, 2), 'value']),
+        (List, [[], [1, 'value']], [(1,)]),
+        (Sequence[str], [['value'], ('value',)], ['value', [1]]),
+        (Set[int], [{1, 2}], [[1, 2], {'1'}]),
+        (Dict[str, int], [{}, {'key': 1}], [{'key': '1'}, {1: 1}, []]),
+        (Dict[str, Any], [{'key': [1]}], [[]]),
+        (Tuple[int, str], [(1, 'value')], [(1,), ('value', 1), [1, 'value']]),
+        (Tuple[int, ...], [(), (1, 2)], [(1, '2')]),
+        (Type[Exception], [ValueError], [ValueError(), int]),
+        (Callable[[int], str], [str, lambda value: value], ['value']),
+        (Annotated[int, 'positive'], [1], ['1']),
+        (UserId, [1], ['1']),
+        (Mode, [Mode.FAST], ['fast']),
+    ], ids=[
+        'empty', 'any', 'type variable', 'forward reference', 'integer', 'float', 'none', 'optional', 'union',
+        'literal', 'list', 'bare list', 'sequence', 'set', 'dictionary', 'dictionary of any', 'tuple',
+        'variadic tuple', 'type', 'callable', 'annotated', 'new type', 'enum',
+    ])
+    def test_get_type_checker(self, annotation: Any, valid_values: list, invalid_values: list):
+        checker = get_type_checker(annotation)
+        assert all(checker(value) for value in valid_values)
+        assert not any(checker(value) for value in invalid_values)
+
+    def test_get_type_checker_cached(self):
+        assert get_type_checker(List[int]) is get_type_checker(List[int])
+        assert get_type_checker(Dict[str, int]) is not get_type_checker(List[int])
+
+
+class TestTypeCoercer:
+    @pytest.mark.parametrize('annotation, value, expected', [
+        (str, 'value', 'value'),
+        (Any, 'value', 'value'),
+        (int, '1', 1),
+        (float, '1.5', 1.5),
+        (bool, 'Yes', True),
+        (bool, 'false', False),
+        (Optional[int], 'null', None),
+        (Optional[int], '1', 1),
+        (Union[int, bool], 'true', True),
+        (Literal['fast', 1, True], '1', 1),
+        (Literal['fast', 1, True], 'TRUE', True),
+        (List[int], '1,2', [1, 2]),
+        (List[int], '[1, "2"]', [1, 2]),
+        (List[str], '', []),
+        (list, 'first,second', ['first', 'second']),
+        (Set[int], '1,1,2', {1, 2}),
+        (FrozenSet[str], 'value', frozenset({'value'})),
+        (Tuple[int, str], '1,value', (1, 'value')),
+        (Tuple[int, ...], '1,2,3', (1, 2, 3)),
+        (Dict[str, int], '{"key": "1"}', {'key': 1}),
+        (dict, '{"key": [1]}', {'key': [1]}),
+        (Path, 'directory/file', Path('directory/file')),
+        (Mode, 'slow', Mode.SLOW),
+        (UserId, '1', 1),
+        (List[int], ['1', 2], [1, 2]),
+        (Dict[str, List[int]], {'key': '1,2'}, {'key': [1, 2]}),
+        (Union[int, List[int]], ['1'], [1]),
+    ], ids=[
+        'string', 'any', 'integer', 'float', 'true', 'false', 'none', 'optional', 'union', 'literal',
+        'boolean literal', 'list', 'json list', 'empty list', 'bare list', 'set', 'frozen set', 'tuple',
+        'variadic tuple', 'dictionary', 'bare dictionary', 'path', 'enum', 'new type', 'parsed list',
+        'parsed dictionary', 'union of parsed list',
+    ])
+    def test_get_type_coercer(self, annotation: Any, value: Any, expected: Any):
+        assert get_type_coercer(annotation)(value) == expected
+
+    @pytest.mark.parametrize('annotation, value', [
+        (int, 'one'),
+        (bool, 'maybe'),
+        (None, 'value'),
+        (Optional[int], 'value'),
+        (Literal['fast', 'slow'], 'medium'),
+        (List[int], '1,two'),
+        (List[int], '{"key": 1}'),
+        (Dict[str, int], '[1]'),
+        (Dict[str, int], '{"key": [1]}'),
+        (Mode, 'medium'),
+        (int, ['1']),
+        (List[int], {'key': '1'}),
+    ], ids=[
+        'integer', 'boolean', 'none', 'optional', 'literal', 'list', 'list from object', 'dictionary from array',
+        'dictionary value', 'enum', 'integer from list', 'list from dictionary',
+    ])
+    def test_get_type_coercer_error(self, annotation: Any, value: Any):
+        with pytest.raises(ValueError):
+            get_type_coercer(annotation)(value)
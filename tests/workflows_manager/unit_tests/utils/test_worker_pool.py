@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from workflows_manager.utils.worker_pool import WorkerPool
+
+
+class TestWorkerPool:
+    def test_run_all(self):
+        results = []
+        with WorkerPool(2) as pool:
+            exceptions = pool.run_all([lambda index=index: results.append(index) for index in range(10)])
+        assert sorted(results) == list(range(10))
+        assert exceptions == [None] * 10
+
+    def test_run_all_empty(self):
+        with WorkerPool(2) as pool:
+            assert pool.run_all([]) == []
+
+    def test_run_all_exceptions(self):
+        error = ValueError('error')
+
+        def failing_task():
+            raise error
+
+        with WorkerPool(2) as pool:
+            exceptions = pool.run_all([lambda: None, failing_task])
+        assert exceptions == [None, error]
+
+    @pytest.mark.parametrize('max_workers, limit, expected', [
+        (4, None, 4),
+        (4, 2, 2),
+        (1, None, 1),
+    ], ids=[
+        'pool size limit',
+        'per call limit',
+        'single worker',
+    ])
+    def test_run_all_concurrency(self, max_workers: int, limit: int, expected: int):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def task():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        with WorkerPool(max_workers) as pool:
+            pool.run_all([task] * 8, limit)
+        assert peak[0] == expected
+
+    def test_run_all_nested(self):
+        results = []
+        with WorkerPool(1) as pool:
+            def nested_task(index):
+                pool.run_all([lambda: results.append(index)] * 3)
+
+            pool.run_all([lambda index=index: nested_task(index) for index in range(4)])
+        assert len(results) == 12
+
+    def test_run_graph(self):
+        results = []
+        lock = threading.Lock()
+
+        def task(index):
+            time.sleep(0.01 * (4 - index))
+            with lock:
+                results.append(index)
+
+        with WorkerPool(4) as pool:
+            exceptions = pool.run_graph([lambda index=index: task(index) for index in range(4)],
+                                        [[], [0], [0], [1, 2]])
+        assert results[0] == 0
+        assert sorted(results[1:3]) == [1, 2]
+        assert results[3] == 3
+        assert exceptions == [None] * 4
+
+    def test_run_graph_no_barrier(self):
+        events = []
+        lock = threading.Lock()
+
+        def task(name, delay):
+            time.sleep(delay)
+            with lock:
+                events.append(name)
+
+        with WorkerPool(4) as pool:
+            pool.run_graph([lambda: task('slow', 0.2), lambda: task('fast', 0.01), lambda: task('after-fast', 0.01)],
+                           [[], [], [1]])
+        assert events == ['fast', 'after-fast', 'slow']
+
+    def test_run_graph_exception(self):
+        error = ValueError('error')
+        results = []
+
+        def failing_task():
+            raise error
+
+        with WorkerPool(2) as pool:
+            exceptions = pool.run_graph([failing_task, lambda: results.append(1)], [[], [0]])
+        assert exceptions == [error, None]
+        assert results == []
+
+    def test_run_graph_empty(self):
+        with WorkerPool(2) as pool:
+            assert pool.run_graph([], []) == []